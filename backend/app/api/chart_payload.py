@@ -0,0 +1,228 @@
+"""
+Chart Payload Builder
+PGF Protocol: API_003
+Gate: GATE_4
+Version: 1.0.0
+
+Turns an ephemeris result into the ChartResponse-shaped payload. Kept free
+of endpoint state so batch workers can build payloads in their own process.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, List
+
+from .models import ChartResponse
+from .serialization import dumps, round_float
+from ..core.astronomical import CelestialBody, GeoLocation
+from ..core.astronomical.worker_pool import EphemerisRequest, EphemerisResult
+from ..core.calculations.aspects import EnhancedAspectCalculator
+from ..core.calculations.divisional_charts import DivisionalChartEngine
+from ..core.calculations.houses import HouseCalculator
+from ..core.calculations.planetary_strength import PlanetaryStrengthCalculator
+
+_div_engine = DivisionalChartEngine()
+
+
+def build_chart_payload(
+    ephemeris: EphemerisResult,
+    birth_time: datetime,
+    geo: GeoLocation,
+    hs_name: str,
+    divisions: List[int],
+    num: Callable[[Any], Any],
+) -> Dict[str, Any]:
+    """Build the ChartResponse-shaped payload, converting numbers with num"""
+    house_calc = HouseCalculator()
+
+    positions = ephemeris.positions
+
+    # Convert to API-friendly dict
+    def body_name(b: CelestialBody) -> str:
+        name_map = {
+            CelestialBody.SUN: "Sun",
+            CelestialBody.MOON: "Moon",
+            CelestialBody.MARS: "Mars",
+            CelestialBody.MERCURY: "Mercury",
+            CelestialBody.JUPITER: "Jupiter",
+            CelestialBody.VENUS: "Venus",
+            CelestialBody.SATURN: "Saturn",
+            CelestialBody.RAHU: "Rahu",
+            CelestialBody.KETU: "Ketu",
+            CelestialBody.URANUS: "Uranus",
+            CelestialBody.NEPTUNE: "Neptune",
+            CelestialBody.PLUTO: "Pluto",
+        }
+        return name_map.get(b, str(b))
+
+    # Sign names for frontend yoga detection
+    signs = [
+        "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+        "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
+    ]
+
+    planetary_positions_api: Dict[str, Dict[str, Any]] = {}
+    planetary_positions_for_aspects: Dict[str, Dict[str, Any]] = {}
+    for body, pos in positions.items():
+        name = body_name(body)
+        sign_num = int(float(pos.longitude) / 30)
+
+        planetary_positions_api[name] = {
+            "longitude": num(pos.longitude),
+            "latitude": num(pos.latitude),
+            "distance": num(pos.distance),
+            "speed": num(pos.speed),
+            "sign_num": sign_num,
+            "sign": signs[sign_num],
+        }
+        planetary_positions_for_aspects[name] = {
+            "longitude": float(pos.longitude),
+            "speed": float(pos.speed),
+            "is_retrograde": bool(pos.is_retrograde),
+            "house": 1,
+            "dignity": "neutral",
+        }
+
+    # Houses
+    houses_dict = ephemeris.houses
+
+    # Pre-calculate house numbers for all planets (optimization)
+    planet_houses_for_aspects = {
+        pname: house_calc.get_house_for_longitude(pdata["longitude"], houses_dict["cusps"])
+        for pname, pdata in planetary_positions_for_aspects.items()
+    }
+
+    # Aspects - use pre-calculated house numbers
+    aspect_calc = EnhancedAspectCalculator()
+    for pname, pdata in planetary_positions_for_aspects.items():
+        pdata["house"] = planet_houses_for_aspects[pname]
+
+    aspects_list = aspect_calc.calculate_aspects(planetary_positions_for_aspects)
+    aspects_api: List[Dict[str, Any]] = []
+    for a in aspects_list:
+        aspects_api.append({
+            "aspect_type": a.aspect.name,
+            "strength": num(a.total_influence),
+            "is_beneficial": bool(a.aspect.benefic_nature >= 0),
+            "special_effects": None,
+        })
+
+    # Ayanamsa value
+    ay_float = float(ephemeris.ayanamsa)
+    ay_value = num(ay_float)
+
+    # Planetary strengths - optimized batch calculation
+    psc = PlanetaryStrengthCalculator()
+    planetary_strengths: Dict[str, Dict[str, Any]] = {}
+
+    # Reuse pre-calculated house numbers from aspects section
+    planet_houses = planet_houses_for_aspects
+
+    # Batch strength calculation
+    for pname, pdata in planetary_positions_api.items():
+        strength = psc.calculate_strength(
+            pname,
+            float(pdata["longitude"]),
+            birth_time,
+            planet_houses[pname],
+        )
+        planetary_strengths[pname] = {
+            "shadbala": num(strength.shadbala),
+            "dignity_score": num(strength.dignity_score),
+            "positional_strength": num(strength.positional_strength),
+            "temporal_strength": num(strength.temporal_strength),
+            "aspect_strength": num(strength.aspect_strength),
+            "total_strength": num(strength.total_strength),
+        }
+
+    # Divisional charts reuse the D1 positions computed above (single ephemeris pass)
+    geo_dict = {
+        "lat": geo.latitude,
+        "lon": geo.longitude,
+        "alt": geo.altitude,
+    }
+    sidereal_asc = float(houses_dict["ascendant"])
+    if hs_name != "WHOLE_SIGN":
+        # Non whole-sign house systems return the tropical ascendant
+        sidereal_asc = (sidereal_asc - ay_float) % 360.0
+    vargas = _div_engine.calculate_charts_from_positions(
+        {name: float(pdata["longitude"]) for name, pdata in planetary_positions_api.items()},
+        sidereal_asc,
+        ay_float,
+        birth_time,
+        geo_dict,
+        divisions=list(divisions),
+    )
+
+    # Add house numbers to planetary positions (for frontend yoga detection)
+    asc_deg = float(houses_dict["ascendant"])
+    asc_sign_num = int(asc_deg / 30)
+
+    for pname, pdata in planetary_positions_api.items():
+        planet_sign_num = pdata["sign_num"]
+        # Whole Sign house calculation
+        house_num = ((planet_sign_num - asc_sign_num) % 12) + 1
+        pdata["house"] = house_num
+
+    # Build response payload
+    result_payload: Dict[str, Any] = {
+        "planetary_positions": planetary_positions_api,
+        "houses": {
+            "cusps": [num(x) for x in houses_dict["cusps"]],
+            "ascendant": num(houses_dict["ascendant"]),
+            "midheaven": num(houses_dict["midheaven"]),
+            "vertex": num(houses_dict["vertex"]),
+        },
+        "aspects": aspects_api,
+        "ayanamsa_value": ay_value,
+        "planetary_strengths": planetary_strengths,
+        "divisional_charts": {
+            f"D{division}": {
+                "division": division,
+                "planetary_positions": {
+                    k: {
+                        "longitude": num(v),
+                        "latitude": num(0),
+                        "distance": num(0),
+                        "speed": num(0),
+                        "sign_num": None,
+                        "sign": None,
+                        "house": None,
+                    }
+                    for k, v in chart.planets.items()
+                },
+                "house_cusps": [num(x) for x in chart.houses],
+                "special_points": {},
+            }
+            for division, chart in vargas.items()
+        },
+    }
+    return result_payload
+
+
+def fast_chart_body(
+    request: EphemerisRequest,
+    ephemeris: EphemerisResult,
+    divisions: List[int],
+) -> bytes:
+    """Serialized fast-mode chart; runs as a worker pool transform"""
+    payload = build_chart_payload(
+        ephemeris, request.timestamp, request.location, request.house_system, divisions, round_float
+    )
+    return dumps(payload)
+
+
+def to_decimal(value: Any) -> Decimal:
+    return Decimal(str(value))
+
+
+def standard_chart_body(
+    request: EphemerisRequest,
+    ephemeris: EphemerisResult,
+    divisions: List[int],
+) -> bytes:
+    """Validated ChartResponse JSON with Decimal numbers; runs as a worker pool transform"""
+    payload = build_chart_payload(
+        ephemeris, request.timestamp, request.location, request.house_system, divisions, to_decimal
+    )
+    return ChartResponse(**payload).model_dump_json().encode()
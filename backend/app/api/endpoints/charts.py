@@ -1,23 +1,19 @@
 from fastapi import APIRouter, HTTPException, Depends, Query
-from datetime import datetime
-from typing import Optional, Dict, Any, List
-from decimal import Decimal
+from fastapi.responses import Response, StreamingResponse
+from typing import Optional, Dict, Any, List, Union
 
-from ..models import ChartRequest, ChartResponse
+from ..models import ChartBatchRequest, ChartRequest, ChartResponse
+from ..chart_payload import fast_chart_body, standard_chart_body
+from ..serialization import dumps, json_bytes_response
 from ...core.astronomical import (
-    AstronomicalCalculator as SweCalculator,
     GeoLocation,
     AyanamsaSystem,
-    CelestialBody,
 )
-from ...core.calculations.houses import HouseCalculator
-from ...core.calculations.aspects import EnhancedAspectCalculator
 from ...core.calculations.nakshatra import NakshatraCalculator
-from ...core.calculations.divisional_charts import DivisionalChartEngine
-import json
-from ...core.cache import redis_cache as cache
+from ...core.cache import chart_cache
+from ...core.cache.chart_cache import chart_cache_key, normalize_instant, quantize_coordinate
 from ...core.config import settings
-import swisseph as swe
+from ...core.parallel import EphemerisRequest, compute_executor, ephemeris_pool
 
 router = APIRouter()
 
@@ -39,258 +35,181 @@ router = APIRouter()
     - House system data (cusps, ascendant, midheaven, vertex)
     - Planetary aspects
     - Ayanamsa value used in calculations
+    
+    With `response_mode=fast` numbers are returned as floats rounded to 8
+    decimal places, and the JSON is serialized once and served from cache as-is.
     """,
     response_description="Complete birth chart data"
 )
 async def calculate_chart(
-    request: ChartRequest
-) -> ChartResponse:
+    request: ChartRequest,
+    response_mode: str = Query(
+        "standard",
+        pattern="^(standard|fast)$",
+        description="'standard' validates a Decimal ChartResponse, 'fast' returns pre-serialized float JSON",
+    ),
+) -> Union[ChartResponse, Response]:
     """Calculate a Vedic birth chart."""
     try:
-        cache_key = (
-            f"chart:{request.date_time.isoformat()}"
-            f":{request.latitude}:{request.longitude}:{request.altitude}"
-            f":{request.ayanamsa}:{request.house_system}"
-        )
-        
-        # Try to get from cache
-        cached_json = cache.get(cache_key)
-        if cached_json:
-            try:
-                cached_obj = json.loads(cached_json)
-                return ChartResponse(**cached_obj)
-            except Exception:
-                pass
-        
-        # Build GeoLocation
-        geo = GeoLocation(
-            latitude=float(request.latitude),
-            longitude=float(request.longitude),
-            altitude=float(request.altitude),
-        )
-        
-        # Ayanamsa mapping (int or string)
-        ay_map_int = {
-            1: AyanamsaSystem.LAHIRI,
-            2: AyanamsaSystem.RAMAN,
-            3: AyanamsaSystem.KRISHNAMURTI,
-        }
-        ay_map_str = {
-            "lahiri": AyanamsaSystem.LAHIRI,
-            "raman": AyanamsaSystem.RAMAN,
-            "krishnamurti": AyanamsaSystem.KRISHNAMURTI,
-            "fagan_bradley": AyanamsaSystem.FAGAN_BRADLEY,
-            "fagan": AyanamsaSystem.FAGAN_BRADLEY,
-        }
-        if getattr(request, "ayanamsa_type", None):
-            ay_system = ay_map_str.get(str(request.ayanamsa_type).lower(), AyanamsaSystem.LAHIRI)
-        else:
-            ay_system = ay_map_int.get(int(request.ayanamsa or 1), AyanamsaSystem.LAHIRI)
-        swe_calc = SweCalculator(ayanamsa_system=ay_system)
-        house_calc = HouseCalculator()
-        
-        # Planetary positions via Swiss Ephemeris
-        positions = swe_calc.calculate_all_positions(request.date_time, geo)
-        
-        # Convert to API-friendly dict
-        def body_name(b: CelestialBody) -> str:
-            name_map = {
-                CelestialBody.SUN: "Sun",
-                CelestialBody.MOON: "Moon",
-                CelestialBody.MARS: "Mars",
-                CelestialBody.MERCURY: "Mercury",
-                CelestialBody.JUPITER: "Jupiter",
-                CelestialBody.VENUS: "Venus",
-                CelestialBody.SATURN: "Saturn",
-                CelestialBody.RAHU: "Rahu",
-                CelestialBody.KETU: "Ketu",
-                CelestialBody.URANUS: "Uranus",
-                CelestialBody.NEPTUNE: "Neptune",
-                CelestialBody.PLUTO: "Pluto",
-            }
-            return name_map.get(b, str(b))
+        fast = response_mode == "fast"
+        ephem_request = _resolve_request(request)
+        cache_key = _chart_key(ephem_request, request.divisions, "fast" if fast else "standard")
+        # Payload building and serialization run in the ephemeris worker
+        transform = fast_chart_body if fast else standard_chart_body
 
-        # Sign names for frontend yoga detection
-        signs = [
-            "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
-            "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
-        ]
-        
-        planetary_positions_api: Dict[str, Dict[str, Decimal]] = {}
-        planetary_positions_for_aspects: Dict[str, Dict[str, Any]] = {}
-        for body, pos in positions.items():
-            name = body_name(body)
-            sign_num = int(float(pos.longitude) / 30)
-            
-            planetary_positions_api[name] = {
-                "longitude": Decimal(str(pos.longitude)),
-                "latitude": Decimal(str(pos.latitude)),
-                "distance": Decimal(str(pos.distance)),
-                "speed": Decimal(str(pos.speed)),
-                "sign_num": sign_num,
-                "sign": signs[sign_num],
-            }
-            planetary_positions_for_aspects[name] = {
-                "longitude": float(pos.longitude),
-                "speed": float(pos.speed),
-                "is_retrograde": bool(pos.is_retrograde),
-                "house": 1,
-                "dignity": "neutral",
-            }
-        
-        # Houses
-        hs_code_map = {
-            "P": "PLACIDUS",
-            "K": "KOCH",
-            "E": "EQUAL",
-            "W": "WHOLE_SIGN",
-            "R": "REGIOMONTANUS",
-            "C": "CAMPANUS",
-        }
-        hs_name = hs_code_map.get(request.house_system, "PLACIDUS")
-        houses_dict = house_calc.calculate_houses(
-            request.date_time,
-            float(request.latitude),
-            float(request.longitude),
-            hs_name,
-        )
-        
-        # Pre-calculate house numbers for all planets (optimization)
-        planet_houses_for_aspects = {
-            pname: house_calc.get_house_for_longitude(pdata["longitude"], houses_dict["cusps"])
-            for pname, pdata in planetary_positions_for_aspects.items()
-        }
-        
-        # Aspects - use pre-calculated house numbers
-        aspect_calc = EnhancedAspectCalculator()
-        for pname, pdata in planetary_positions_for_aspects.items():
-            pdata["house"] = planet_houses_for_aspects[pname]
+        # Bytes are stored once and served as-is from L1/L2; concurrent misses compute once
+        async def compute() -> bytes:
+            # The work runs in the ephemeris pool; admission is shared with compute_executor
+            async with compute_executor.admit("charts.calculate_chart"):
+                return await ephemeris_pool.calculate_transformed(
+                    ephem_request, transform, list(request.divisions)
+                )
 
-        aspects_list = aspect_calc.calculate_aspects(planetary_positions_for_aspects)
-        aspects_api: List[Dict[str, Any]] = []
-        for a in aspects_list:
-            aspects_api.append({
-                "aspect_type": a.aspect.name,
-                "strength": Decimal(str(a.total_influence)),
-                "is_beneficial": bool(a.aspect.benefic_nature >= 0),
-                "special_effects": None,
-            })
-        
-        # Ayanamsa value
-        jd = swe.julday(
-            request.date_time.year,
-            request.date_time.month,
-            request.date_time.day,
-            request.date_time.hour + request.date_time.minute / 60.0 + request.date_time.second / 3600.0,
+        # Invalid inputs (e.g. unsupported divisions) raise ValueError and are cached briefly
+        body = await chart_cache.get_or_compute(
+            cache_key,
+            compute,
+            expire=settings.REDIS_CACHE_EXPIRE_SECONDS,
+            negative_errors=(ValueError,),
         )
-        ay_value = Decimal(str(swe.get_ayanamsa_ut(jd)))
-
-        # Planetary strengths - optimized batch calculation
-        from ...core.calculations.planetary_strength import PlanetaryStrengthCalculator
-        psc = PlanetaryStrengthCalculator()
-        planetary_strengths: Dict[str, Dict[str, Decimal]] = {}
-        
-        # Reuse pre-calculated house numbers from aspects section
-        planet_houses = planet_houses_for_aspects
-        
-        # Batch strength calculation
-        for pname, pdata in planetary_positions_api.items():
-            strength = psc.calculate_strength(
-                pname,
-                float(pdata["longitude"]),
-                request.date_time,
-                planet_houses[pname],
-            )
-            planetary_strengths[pname] = {
-                "shadbala": Decimal(str(strength.shadbala)),
-                "dignity_score": Decimal(str(strength.dignity_score)),
-                "positional_strength": Decimal(str(strength.positional_strength)),
-                "temporal_strength": Decimal(str(strength.temporal_strength)),
-                "aspect_strength": Decimal(str(strength.aspect_strength)),
-                "total_strength": Decimal(str(strength.total_strength)),
-            }
-
-        # Divisional charts (D9, D10) - lazy loading, only calculate D9 by default
-        div_engine = DivisionalChartEngine()
-        geo_dict = {
-            "lat": float(request.latitude),
-            "lon": float(request.longitude),
-            "alt": float(request.altitude),
-        }
-        
-        # Only calculate D9 for performance (D10 can be calculated on-demand)
-        d9 = div_engine.calculate_chart(request.date_time, 9, geo_dict)
-        d10 = div_engine.calculate_chart(request.date_time, 10, geo_dict)
+        if fast:
+            return json_bytes_response(body)
+        return ChartResponse.model_validate_json(body)
 
-        # Add house numbers to planetary positions (for frontend yoga detection)
-        asc_deg = float(houses_dict["ascendant"])
-        asc_sign_num = int(asc_deg / 30)
-        
-        for pname, pdata in planetary_positions_api.items():
-            planet_sign_num = pdata["sign_num"]
-            # Whole Sign house calculation
-            house_num = ((planet_sign_num - asc_sign_num) % 12) + 1
-            pdata["house"] = house_num
-
-        # Build response payload
-        result_payload: Dict[str, Any] = {
-            "planetary_positions": planetary_positions_api,
-            "houses": {
-                "cusps": [Decimal(str(x)) for x in houses_dict["cusps"]],
-                "ascendant": Decimal(str(houses_dict["ascendant"])),
-                "midheaven": Decimal(str(houses_dict["midheaven"])),
-                "vertex": Decimal(str(houses_dict["vertex"])),
-            },
-            "aspects": aspects_api,
-            "ayanamsa_value": ay_value,
-            "planetary_strengths": planetary_strengths,
-            "divisional_charts": {
-                "D9": {
-                    "division": 9,
-                    "planetary_positions": {
-                        k: {
-                            "longitude": Decimal(str(v)),
-                            "latitude": Decimal("0"),
-                            "distance": Decimal("0"),
-                            "speed": Decimal("0"),
-                        }
-                        for k, v in d9.planets.items()
-                    },
-                    "house_cusps": [Decimal(str(x)) for x in d9.houses],
-                    "special_points": {},
-                },
-                "D10": {
-                    "division": 10,
-                    "planetary_positions": {
-                        k: {
-                            "longitude": Decimal(str(v)),
-                            "latitude": Decimal("0"),
-                            "distance": Decimal("0"),
-                            "speed": Decimal("0"),
-                        }
-                        for k, v in d10.planets.items()
-                    },
-                    "house_cusps": [Decimal(str(x)) for x in d10.houses],
-                    "special_points": {},
-                },
-            },
-        }
-        result = ChartResponse(**result_payload)
-        
-        # Cache the result
-        try:
-            cache.set(
-                cache_key,
-                json.dumps(result.model_dump()),
-                expire=settings.REDIS_CACHE_EXPIRE_SECONDS,
-            )
-        except Exception:
-            pass
-        
-        return result
-        
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=400,
             detail=f"Error calculating birth chart: {str(e)}"
         )
+
+
+
+@router.post(
+    "/batch",
+    summary="Calculate many birth charts",
+    description="""
+    Calculate up to 5000 birth charts in one request.
+    
+    Identical inputs (after the same canonicalization as the chart cache) are
+    computed once, cached charts are fetched in bulk, and the rest are
+    computed across the ephemeris worker processes. Results stream back as
+    NDJSON in completion order, one line per input chart:
+    
+    - `{"index": 3, "cached": false, "chart": {...}}` with the fast-mode chart
+    - `{"index": 4, "error": "..."}` if that chart could not be calculated
+    """,
+    response_description="NDJSON stream of chart results",
+    response_class=StreamingResponse,
+)
+async def calculate_charts_batch(batch: ChartBatchRequest) -> StreamingResponse:
+    """Calculate many Vedic birth charts, streaming results as they complete."""
+    # Input indexes per canonical key, so duplicates are computed once
+    groups: Dict[str, List[int]] = {}
+    requests: Dict[str, EphemerisRequest] = {}
+    divisions: Dict[str, List[int]] = {}
+    for index, chart in enumerate(batch.charts):
+        ephem_request = _resolve_request(chart)
+        key = _chart_key(ephem_request, chart.divisions, "fast")
+        if key not in groups:
+            groups[key] = []
+            requests[key] = ephem_request
+            divisions[key] = list(chart.divisions)
+        groups[key].append(index)
+
+    cached = await chart_cache.get_many(list(groups))
+    misses = [key for key in groups if key not in cached]
+
+    async def stream():
+        if cached:
+            yield b"".join(
+                line
+                for key, value in cached.items()
+                for line in _batch_lines(groups[key], value, cached=True)
+            )
+        async for chunk in ephemeris_pool.iter_many(
+            [requests[key] for key in misses],
+            fast_chart_body,
+            [divisions[key] for key in misses],
+        ):
+            computed: Dict[str, bytes] = {}
+            lines: List[bytes] = []
+            for i, value in chunk:
+                key = misses[i]
+                if isinstance(value, ValueError):
+                    await chart_cache.set_negative(key, str(value))
+                elif not isinstance(value, Exception):
+                    computed[key] = value
+                lines.extend(_batch_lines(groups[key], value, cached=False))
+            await chart_cache.set_many(computed, expire=settings.REDIS_CACHE_EXPIRE_SECONDS)
+            yield b"".join(lines)
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+def _batch_lines(indexes: List[int], value: Any, cached: bool) -> List[bytes]:
+    """NDJSON lines for every input index sharing one chart result"""
+    if isinstance(value, Exception):
+        return [dumps({"index": i, "error": str(value)}) + b"\n" for i in indexes]
+    body = value.encode("utf-8") if isinstance(value, str) else value
+    flag = b"true" if cached else b"false"
+    # The chart body is already JSON; splice it in rather than re-encoding
+    return [b'{"index":%d,"cached":%s,"chart":%s}\n' % (i, flag, body) for i in indexes]
+
+def _resolve_request(request: ChartRequest) -> EphemerisRequest:
+    """Resolve a chart request to canonical ephemeris inputs, matching the cache key"""
+    # Canonical inputs: UTC instant and quantized coordinates
+    birth_time = normalize_instant(request.date_time)
+    geo = GeoLocation(
+        latitude=quantize_coordinate(request.latitude, settings.CHART_CACHE_COORD_DECIMALS),
+        longitude=quantize_coordinate(request.longitude, settings.CHART_CACHE_COORD_DECIMALS),
+        altitude=quantize_coordinate(request.altitude, 0),
+    )
+
+    # Ayanamsa mapping (int or string)
+    ay_map_int = {
+        1: AyanamsaSystem.LAHIRI,
+        2: AyanamsaSystem.RAMAN,
+        3: AyanamsaSystem.KRISHNAMURTI,
+    }
+    ay_map_str = {
+        "lahiri": AyanamsaSystem.LAHIRI,
+        "raman": AyanamsaSystem.RAMAN,
+        "krishnamurti": AyanamsaSystem.KRISHNAMURTI,
+        "fagan_bradley": AyanamsaSystem.FAGAN_BRADLEY,
+        "fagan": AyanamsaSystem.FAGAN_BRADLEY,
+    }
+    if getattr(request, "ayanamsa_type", None):
+        ay_system = ay_map_str.get(str(request.ayanamsa_type).lower(), AyanamsaSystem.LAHIRI)
+    else:
+        ay_system = ay_map_int.get(int(request.ayanamsa or 1), AyanamsaSystem.LAHIRI)
+    hs_code_map = {
+        "P": "PLACIDUS",
+        "K": "KOCH",
+        "E": "EQUAL",
+        "W": "WHOLE_SIGN",
+        "R": "REGIOMONTANUS",
+        "C": "CAMPANUS",
+    }
+    hs_name = hs_code_map.get(request.house_system, "PLACIDUS")
+    return EphemerisRequest(
+        timestamp=birth_time,
+        location=geo,
+        ayanamsa=ay_system,
+        house_system=hs_name,
+    )
+
+
+def _chart_key(ephem_request: EphemerisRequest, divisions: List[int], mode: str) -> str:
+    return chart_cache_key(
+        ephem_request.timestamp,
+        ephem_request.location.latitude,
+        ephem_request.location.longitude,
+        ephem_request.location.altitude,
+        ephem_request.ayanamsa,
+        ephem_request.house_system,
+        divisions,
+        mode=mode,
+        coord_decimals=settings.CHART_CACHE_COORD_DECIMALS,
+    )
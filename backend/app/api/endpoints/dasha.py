@@ -1,22 +1,78 @@
 """
 API endpoints for Dasha calculations
 """
-from datetime import datetime
-from typing import Dict, Any, Optional
-from fastapi import APIRouter, HTTPException
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
-from app.core.calculations.dasha_system import VimshottariDasha
+from app.core.calculations.dasha_system import DASHA_LEVELS, DashaTimeline, VimshottariDasha
 from app.core.interpretations.dasha_effects import DashaEffects
+from app.core.parallel import compute_executor
 from app.core.calculations.dasha_yoga import DashaYoga
 
 router = APIRouter()
 dasha_calculator = VimshottariDasha()
 
+# Upper bound on natives per bulk request
+MAX_BULK_NATIVES = 1000
+ARC_SECONDS_PER_CIRCLE = 360 * 3600
+
+
+def _timeline(birth_date: datetime, moon_longitude: float) -> DashaTimeline:
+    """Timeline for the Moon longitude quantized to whole arc-seconds
+    
+    Longitudes that differ only by float noise give identical periods.
+    """
+    if 0.0 <= moon_longitude < 360.0:
+        moon_longitude = round(moon_longitude * 3600) % ARC_SECONDS_PER_CIRCLE / 3600
+    return DashaTimeline(birth_date, moon_longitude)
+
+
+def _current_periods(timeline: DashaTimeline, at: datetime) -> Dict[str, Any]:
+    chain = timeline.query(at, depth=3)
+    if not chain:
+        raise ValueError("No active dasha period found for the given birth details")
+    return {period.level: period.as_dict() for period in chain}
+
+
+def _bulk_current_periods(natives: List[Tuple[datetime, float]], at: datetime) -> List[Dict[str, Any]]:
+    """Current periods per native; unresolvable natives get an "error" entry"""
+    results = []
+    for birth_date, moon_longitude in natives:
+        try:
+            results.append(_current_periods(_timeline(birth_date, moon_longitude), at))
+        except ValueError as e:
+            results.append({"error": str(e)})
+    return results
+
+
+def _window_periods(
+    birth_date: datetime,
+    moon_longitude: float,
+    start: datetime,
+    end: datetime,
+    depth: int
+) -> List[Dict[str, Any]]:
+    if end <= start:
+        raise ValueError("end must be after start")
+    return _timeline(birth_date, moon_longitude).window(start, end, depth=depth)
+
+
 class DashaRequest(BaseModel):
     """Request model for Dasha calculations"""
     birth_date: datetime = Field(..., description="Birth date and time in ISO format")
     moon_longitude: float = Field(..., description="Moon's longitude at birth (0-360 degrees)")
 
+class BulkCurrentDashaRequest(BaseModel):
+    """Request model for current Dasha periods of many natives"""
+    natives: List[DashaRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BULK_NATIVES,
+        description="Natives to look up"
+    )
+    at: Optional[datetime] = Field(None, description="Instant to evaluate, defaults to now")
+
 class DashaInterpretationRequest(BaseModel):
     """Request model for Dasha interpretation"""
     main_planet: str = Field(..., description="Main dasha lord (mahadasha)")
@@ -49,24 +105,33 @@ async def calculate_vimshottari_dasha(request: DashaRequest) -> Dict[str, Any]:
         HTTPException: If moon_longitude is invalid or calculation fails
     """
     try:
-        result = dasha_calculator.calculate_all_dasha_levels(
+        result = await compute_executor.run(
+            "dasha.vimshottari",
+            dasha_calculator.calculate_all_dasha_levels,
             request.birth_date,
             request.moon_longitude
         )
         return result
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Calculation failed: {str(e)}")
 
 @router.get("/dasha/current", response_model=Dict[str, Any], tags=["Dasha"])
-async def get_current_dasha(birth_date: datetime, moon_longitude: float) -> Dict[str, Any]:
+async def get_current_dasha(
+    birth_date: datetime,
+    moon_longitude: float,
+    at: Optional[datetime] = Query(None, description="Instant to evaluate, defaults to now")
+) -> Dict[str, Any]:
     """
     Get the currently active Dasha periods for a given birth time and Moon position
     
     Args:
         birth_date: Birth date and time in ISO format
         moon_longitude: Moon's longitude at birth (0-360 degrees)
+        at: Instant to evaluate; naive values are taken as UTC
         
     Returns:
         Dictionary containing currently active Mahadasha, Antardasha,
@@ -76,41 +141,69 @@ async def get_current_dasha(birth_date: datetime, moon_longitude: float) -> Dict
         HTTPException: If moon_longitude is invalid or calculation fails
     """
     try:
-        # Calculate all dasha periods
-        all_periods = dasha_calculator.calculate_all_dasha_levels(birth_date, moon_longitude)
-        
-        # Get current time
-        current_time = datetime(2024, 12, 27, 4, 40, 19)  # Using provided time
+        timeline = _timeline(birth_date, moon_longitude)
+        return _current_periods(timeline, at or datetime.now(timezone.utc))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Calculation failed: {str(e)}")
+
+@router.post("/dasha/current/bulk", response_model=Dict[str, Any], tags=["Dasha"])
+async def get_current_dasha_bulk(request: BulkCurrentDashaRequest) -> Dict[str, Any]:
+    """
+    Get the currently active Dasha periods for many natives in one call
+    
+    Args:
+        request: BulkCurrentDashaRequest with the natives and optional instant
         
-        # Find current periods
-        current_periods = {
-            'mahadasha': None,
-            'antardasha': None,
-            'pratyantardasha': None
-        }
+    Returns:
+        Dictionary with the evaluated instant and one result per native, in
+        request order; natives that cannot be resolved get an "error" entry
+        instead of failing the whole request
+    """
+    at = request.at or datetime.now(timezone.utc)
+    results = await compute_executor.run(
+        "dasha.current_bulk",
+        _bulk_current_periods,
+        [(native.birth_date, native.moon_longitude) for native in request.natives],
+        at
+    )
+    return {"at": at.isoformat(), "results": results}
+
+@router.get("/dasha/window", response_model=Dict[str, Any], tags=["Dasha"])
+async def get_dasha_window(
+    birth_date: datetime,
+    moon_longitude: float,
+    start: datetime,
+    end: datetime,
+    depth: int = Query(3, ge=1, le=len(DASHA_LEVELS), description="Levels to include, 1 (mahadasha) to 5 (prana)")
+) -> Dict[str, Any]:
+    """
+    Get the Dasha periods overlapping a date range
+    
+    Only periods intersecting [start, end) are generated, so deep levels
+    (sookshma, prana) stay cheap for short windows.
+    
+    Args:
+        birth_date: Birth date and time in ISO format
+        moon_longitude: Moon's longitude at birth (0-360 degrees)
+        start: Window start
+        end: Window end
+        depth: Number of levels to include
         
-        # Find current mahadasha
-        for period in all_periods['periods']:
-            if period['start_date'] <= current_time <= period['end_date']:
-                current_periods['mahadasha'] = period
-                
-                # Find current antardasha
-                for antardasha in period['antardasha']:
-                    if antardasha['start_date'] <= current_time <= antardasha['end_date']:
-                        current_periods['antardasha'] = antardasha
-                        
-                        # Find current pratyantardasha
-                        for pratyantardasha in antardasha['pratyantardasha']:
-                            if pratyantardasha['start_date'] <= current_time <= pratyantardasha['end_date']:
-                                current_periods['pratyantardasha'] = pratyantardasha
-                                break
-                        break
-                break
+    Returns:
+        Dictionary with the nested periods overlapping the window
         
-        if not current_periods['mahadasha']:
-            raise ValueError("No active dasha period found for the given birth details")
-            
-        return current_periods
+    Raises:
+        HTTPException: If moon_longitude or the window is invalid
+    """
+    try:
+        periods = await compute_executor.run(
+            "dasha.window", _window_periods, birth_date, moon_longitude, start, end, depth
+        )
+        return {"periods": periods}
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -8,6 +8,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
 from app.core.calculations.divisional_charts import DivisionalChartEngine
+from app.core.parallel import compute_executor
 
 router = APIRouter()
 _engine = DivisionalChartEngine()
@@ -28,24 +29,30 @@ class DivisionalResponse(BaseModel):
     ayanamsa_value: float
 
 
+def _divisional_chart(req: DivisionalRequest) -> DivisionalResponse:
+    chart = _engine.calculate_chart(
+        req.date_time,
+        req.division,
+        {
+            "lat": float(req.latitude),
+            "lon": float(req.longitude),
+            "alt": float(req.altitude),
+        },
+    )
+    return DivisionalResponse(
+        division=chart.division,
+        planetary_positions={k: float(v) for k, v in chart.planets.items()},
+        house_cusps={str(i + 1): float(x) for i, x in enumerate(chart.houses)},
+        ayanamsa_value=float(chart.ayanamsa),
+    )
+
+
 @router.post("/divisional/calculate", response_model=DivisionalResponse)
 async def calculate_divisional_chart(req: DivisionalRequest) -> DivisionalResponse:
     try:
-        chart = _engine.calculate_chart(
-            req.date_time,
-            req.division,
-            {
-                "lat": float(req.latitude),
-                "lon": float(req.longitude),
-                "alt": float(req.altitude),
-            },
-        )
-        return DivisionalResponse(
-            division=chart.division,
-            planetary_positions={k: float(v) for k, v in chart.planets.items()},
-            house_cusps={str(i + 1): float(x) for i, x in enumerate(chart.houses)},
-            ayanamsa_value=float(chart.ayanamsa),
-        )
+        return await compute_executor.run("divisional.calculate", _divisional_chart, req)
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -7,16 +7,21 @@ try:
 except Exception:  # pragma: no cover
     requests = None
 
-try:
-    from timezonefinder import TimezoneFinder  # type: ignore
-except Exception:  # pragma: no cover
-    TimezoneFinder = None  # type: ignore
+from ...core.lazy import LazySingleton
 
 router = APIRouter()
 
-tf = None
-if TimezoneFinder is not None:
-    tf = TimezoneFinder(in_memory=True)
+
+def _timezone_finder():
+    try:
+        from timezonefinder import TimezoneFinder  # type: ignore
+    except Exception:  # pragma: no cover
+        return None
+    return TimezoneFinder(in_memory=True)
+
+
+# Polygon data is loaded on the first timezone lookup, not at startup
+timezone_finder = LazySingleton(_timezone_finder)
 
 
 class GeoResolveRequest(BaseModel):
@@ -74,6 +79,7 @@ class TimezoneResponse(BaseModel):
 
 @router.post("/geo/timezone", response_model=TimezoneResponse)
 async def timezone_from_coords(req: TimezoneRequest) -> TimezoneResponse:
+    tf = timezone_finder()
     if tf is None:
         raise HTTPException(status_code=500, detail="timezonefinder not installed")
     try:
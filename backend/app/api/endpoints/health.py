@@ -7,6 +7,9 @@ Version: 1.0.0
 
 from fastapi import APIRouter, HTTPException
 
+from ...core.cache import chart_cache
+from ...core.parallel import compute_executor
+
 router = APIRouter()
 
 @router.get("")
@@ -14,6 +17,16 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "healthy"}
 
+@router.get("/cache")
+async def cache_stats():
+    """Per-tier hit/miss/latency counters of this worker's chart cache"""
+    return chart_cache.stats()
+
+@router.get("/compute")
+async def compute_stats():
+    """Occupancy and per-endpoint queue/run times of this worker's compute executor"""
+    return compute_executor.stats()
+
 @router.get("/simulate-error")
 async def simulate_error():
     """Endpoint to simulate a 500 error for testing"""
@@ -8,7 +8,7 @@ from app.core.calculations.divisional import EnhancedDivisionalChartEngine
 from app.core.calculations.strength import EnhancedPlanetaryStrengthEngine
 from app.core.calculations.aspects import EnhancedAspectCalculator
 from app.core.calculations.house_analysis import EnhancedHouseAnalysisEngine
-from app.core.parallel import batch_processor
+from app.core.parallel import batch_processor, compute_executor
 import logging
 
 logger = logging.getLogger(__name__)
@@ -63,6 +63,81 @@ class HoroscopeRequest(BaseModel):
             raise ValueError(f'Invalid ayanamsa system. Must be one of: {", ".join(valid_systems)}')
         return v.upper()
 
+def _compute_horoscope(request: HoroscopeRequest) -> Dict[str, Any]:
+    """Horoscope calculation run in the compute executor"""
+    # Parse datetime
+    birth_time = datetime.fromisoformat(request.datetime_utc)
+    
+    # Create location object
+    location = Location(
+        latitude=request.latitude,
+        longitude=request.longitude,
+        altitude=request.altitude
+    )
+    
+    # Initialize calculation engines
+    astro_calc = AstronomicalCalculator()
+    ayanamsa_calc = EnhancedAyanamsaManager()
+    divisional_calc = EnhancedDivisionalChartEngine()
+    strength_calc = EnhancedPlanetaryStrengthEngine()
+    aspect_calc = EnhancedAspectCalculator()
+    house_calc = EnhancedHouseAnalysisEngine()
+    
+    # Calculate planetary positions
+    planetary_positions = astro_calc.calculate_planetary_positions(
+        date=birth_time,
+        location=location
+    )
+    
+    # Calculate ayanamsa
+    ayanamsa_value = ayanamsa_calc.calculate_precise_ayanamsa(
+        datetime_utc=birth_time,
+        system=request.ayanamsa_system
+    )
+    
+    # Calculate divisional charts if requested
+    divisional_charts = {}
+    if request.divisional_charts:
+        divisional_charts = divisional_calc.calculate_all_divisions(
+            planetary_positions=planetary_positions,
+            ayanamsa_value=ayanamsa_value,
+            charts=request.divisional_charts
+        )
+    
+    # Calculate planetary strengths
+    planetary_strengths = strength_calc.calculate_complete_strengths(
+        planetary_positions=planetary_positions,
+        birth_time=birth_time,
+        location=location
+    )
+    
+    # Calculate aspects
+    aspects = aspect_calc.calculate_aspects(
+        planetary_positions=planetary_positions,
+        ayanamsa_value=ayanamsa_value
+    )
+    
+    # Analyze houses
+    house_analysis = {}
+    for house in range(1, 13):  # 12 houses
+        house_analysis[str(house)] = house_calc.analyze_house(
+            house_number=house,
+            planetary_positions=planetary_positions,
+            ayanamsa_value=ayanamsa_value
+        )
+    
+    # Prepare response
+    response = {
+        "planetary_positions": planetary_positions,
+        "ayanamsa_value": ayanamsa_value,
+        "divisional_charts": divisional_charts,
+        "planetary_strengths": planetary_strengths,
+        "aspects": aspects,
+        "house_analysis": house_analysis
+    }
+    
+    return response
+
 @router.post("/v1/horoscope/calculate")
 async def calculate_horoscope(request: HoroscopeRequest):
     """
@@ -81,79 +156,9 @@ async def calculate_horoscope(request: HoroscopeRequest):
       planetary strengths, aspects, and house analysis
     """
     try:
-        # Parse datetime
-        birth_time = datetime.fromisoformat(request.datetime_utc)
-        
-        # Create location object
-        location = Location(
-            latitude=request.latitude,
-            longitude=request.longitude,
-            altitude=request.altitude
-        )
-        
-        # Initialize calculation engines
-        astro_calc = AstronomicalCalculator()
-        ayanamsa_calc = EnhancedAyanamsaManager()
-        divisional_calc = EnhancedDivisionalChartEngine()
-        strength_calc = EnhancedPlanetaryStrengthEngine()
-        aspect_calc = EnhancedAspectCalculator()
-        house_calc = EnhancedHouseAnalysisEngine()
-        
-        # Calculate planetary positions
-        planetary_positions = astro_calc.calculate_planetary_positions(
-            date=birth_time,
-            location=location
-        )
-        
-        # Calculate ayanamsa
-        ayanamsa_value = ayanamsa_calc.calculate_precise_ayanamsa(
-            datetime_utc=birth_time,
-            system=request.ayanamsa_system
-        )
-        
-        # Calculate divisional charts if requested
-        divisional_charts = {}
-        if request.divisional_charts:
-            divisional_charts = divisional_calc.calculate_all_divisions(
-                planetary_positions=planetary_positions,
-                ayanamsa_value=ayanamsa_value,
-                charts=request.divisional_charts
-            )
-        
-        # Calculate planetary strengths
-        planetary_strengths = strength_calc.calculate_complete_strengths(
-            planetary_positions=planetary_positions,
-            birth_time=birth_time,
-            location=location
-        )
-        
-        # Calculate aspects
-        aspects = aspect_calc.calculate_aspects(
-            planetary_positions=planetary_positions,
-            ayanamsa_value=ayanamsa_value
-        )
-        
-        # Analyze houses
-        house_analysis = {}
-        for house in range(1, 13):  # 12 houses
-            house_analysis[str(house)] = house_calc.analyze_house(
-                house_number=house,
-                planetary_positions=planetary_positions,
-                ayanamsa_value=ayanamsa_value
-            )
-        
-        # Prepare response
-        response = {
-            "planetary_positions": planetary_positions,
-            "ayanamsa_value": ayanamsa_value,
-            "divisional_charts": divisional_charts,
-            "planetary_strengths": planetary_strengths,
-            "aspects": aspects,
-            "house_analysis": house_analysis
-        }
-        
-        return response
-        
+        return await compute_executor.run("horoscope.calculate", _compute_horoscope, request)
+    except HTTPException:
+        raise
     except ValueError as e:
         # Handle validation errors
         raise HTTPException(
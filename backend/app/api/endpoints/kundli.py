@@ -8,6 +8,7 @@ Version: 1.0.0
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field, validator
 from datetime import datetime
+from dataclasses import dataclass
 from typing import Dict, List, Any, Optional
 from app.core.calculations.astronomical import AstronomicalCalculator
 from app.models.location import Location
@@ -23,37 +24,51 @@ from app.core.security.engine import security_engine, SecurityScope
 from app.core.security.authorization import authorization_manager, Role, ResourceType, Permission
 from app.core.caching.strategy import cache_manager, DataType
 from app.core.monitoring import monitor
+from app.core.lazy import LazySingleton
 
 router = APIRouter()
 
-# Initialize services
-calculation_service = config_manager.create_service_definition("kundli_calculation")
-analysis_service = config_manager.create_service_definition("kundli_analysis")
+@dataclass
+class KundliServices:
+    """Service definitions and integrations behind the kundli endpoints"""
+    calculation_service: Any
+    analysis_service: Any
+    calculation_integration: Any
+    analysis_integration: Any
 
-# Register services
-service_registry.register_service(calculation_service)
-service_registry.register_service(analysis_service)
-
-# Register integrations
-calculation_integration = integration_manager.register_integration(
-    calculation_service,
-    IntegrationPolicy(
-        protocol=IntegrationProtocol.REST,
-        timeout=60,
-        retry_count=3,
-        cache_ttl=300
+def _register_services() -> KundliServices:
+    """Register the kundli services and their integrations"""
+    calculation_service = config_manager.create_service_definition("kundli_calculation")
+    analysis_service = config_manager.create_service_definition("kundli_analysis")
+    
+    service_registry.register_service(calculation_service)
+    service_registry.register_service(analysis_service)
+    
+    return KundliServices(
+        calculation_service=calculation_service,
+        analysis_service=analysis_service,
+        calculation_integration=integration_manager.register_integration(
+            calculation_service,
+            IntegrationPolicy(
+                protocol=IntegrationProtocol.REST,
+                timeout=60,
+                retry_count=3,
+                cache_ttl=300
+            )
+        ),
+        analysis_integration=integration_manager.register_integration(
+            analysis_service,
+            IntegrationPolicy(
+                protocol=IntegrationProtocol.REST,
+                timeout=30,
+                retry_count=2,
+                cache_ttl=600
+            )
+        )
     )
-)
 
-analysis_integration = integration_manager.register_integration(
-    analysis_service,
-    IntegrationPolicy(
-        protocol=IntegrationProtocol.REST,
-        timeout=30,
-        retry_count=2,
-        cache_ttl=600
-    )
-)
+# Services are registered on the first kundli request, not at import
+kundli_services = LazySingleton(_register_services)
 
 class KundliRequest(BaseModel):
     """Request model for kundli calculation with enhanced validation"""
@@ -230,7 +245,7 @@ async def calculate_kundli(
     try:
         # Start monitoring
         with monitor.track_request("calculate_kundli"):
-            calculation_result = await calculation_integration.execute(
+            calculation_result = await kundli_services().calculation_integration.execute(
                 "calculate",
                 data=pipeline_result.data
             )
@@ -261,12 +276,12 @@ async def calculate_kundli(
                 metadata={
                     "processing_time": pipeline_result.metadata["duration"],
                     "calculation_time": calculation_result.get("calculation_time"),
-                    "service_version": calculation_service.version
+                    "service_version": kundli_services().calculation_service.version
                 }
             )
         
     except Exception as e:
-        service_registry.update_service_status(calculation_service.id, ServiceStatus.DEGRADED)
+        service_registry.update_service_status(kundli_services().calculation_service.id, ServiceStatus.DEGRADED)
         raise HTTPException(
             status_code=500,
             detail=f"Calculation service error: {str(e)}"
@@ -317,7 +332,7 @@ async def analyze_patterns(
                     detail="Kundli not found or access denied"
                 )
             
-            analysis_result = await analysis_integration.execute(
+            analysis_result = await kundli_services().analysis_integration.execute(
                 "analyze_patterns",
                 data=pipeline_result.data
             )
@@ -347,13 +362,13 @@ async def analyze_patterns(
                 metadata={
                     "processing_time": pipeline_result.metadata["duration"],
                     "analysis_time": analysis_result.get("analysis_time"),
-                    "service_version": analysis_service.version,
+                    "service_version": kundli_services().analysis_service.version,
                     "pattern_count": len(analysis_result.get("patterns", []))
                 }
             )
         
     except Exception as e:
-        service_registry.update_service_status(analysis_service.id, ServiceStatus.DEGRADED)
+        service_registry.update_service_status(kundli_services().analysis_service.id, ServiceStatus.DEGRADED)
         raise HTTPException(
             status_code=500,
             detail=f"Analysis service error: {str(e)}"
@@ -485,7 +500,7 @@ async def analyze_correlation(request: CorrelationRequest):
     try:
         # Start monitoring
         with monitor.track_request("analyze_correlation"):
-            correlation_result = await analysis_integration.execute(
+            correlation_result = await kundli_services().analysis_integration.execute(
                 "correlate_charts",
                 data=pipeline_result.data
             )
@@ -496,13 +511,13 @@ async def analyze_correlation(request: CorrelationRequest):
                 metadata={
                     "processing_time": pipeline_result.metadata["duration"],
                     "correlation_time": correlation_result.get("correlation_time"),
-                    "service_version": analysis_service.version,
+                    "service_version": kundli_services().analysis_service.version,
                     "charts_correlated": 2
                 }
             )
         
     except Exception as e:
-        service_registry.update_service_status(analysis_service.id, ServiceStatus.DEGRADED)
+        service_registry.update_service_status(kundli_services().analysis_service.id, ServiceStatus.DEGRADED)
         raise HTTPException(
             status_code=500,
             detail=f"Correlation service error: {str(e)}"
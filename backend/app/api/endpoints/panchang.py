@@ -1,28 +1,25 @@
 """Panchang calculation endpoints."""
-from typing import Dict
+from typing import Dict, List, Literal, Optional
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from datetime import datetime
-import math
+from datetime import date, datetime, timedelta
 import swisseph as swe
 
+from app.api.serialization import dumps, json_bytes_response
+from app.core.astronomical.rise_set import RiseSetEngine, format_events, single_day
+from app.core.cache import chart_cache
+from app.core.cache.chart_cache import normalize_instant
+from app.core.calculations.muhurta import MUHURTA_RULES, MuhurtaSearch
+from app.core.calculations.panchang import NAKSHATRAS, YOGAS, PanchangSearch
+from app.core.config import settings
+from app.core.parallel import compute_executor
+
 router = APIRouter()
 
-NAKSHATRAS = [
-    "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra",
-    "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purva Phalguni",
-    "Uttara Phalguni", "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha",
-    "Jyeshtha", "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana",
-    "Dhanishta", "Shatabhisha", "Purva Bhadrapada", "Uttara Bhadrapada", "Revati"
-]
-
-YOGAS = [
-    "Vishkambha", "Priti", "Ayushman", "Saubhagya", "Shobhana", "Atiganda",
-    "Sukarma", "Dhriti", "Shula", "Ganda", "Vriddhi", "Dhruva",
-    "Vyaghata", "Harshana", "Vajra", "Siddhi", "Vyatipata", "Variyana",
-    "Parigha", "Shiva", "Siddha", "Sadhya", "Shubha", "Shukla",
-    "Brahma", "Indra", "Vaidhriti"
-]
+# Longest range served by /range, /muhurta and /rise_set in one request
+MAX_RANGE_DAYS = 366
+MAX_RISE_SET_LOCATIONS = 5000
 
 class PanchangRequest(BaseModel):
     """Request model for Panchang calculation."""
@@ -38,14 +35,51 @@ class PanchangResponse(BaseModel):
     yoga_number: int
     karana_number: int
 
+class PanchangRangeRequest(BaseModel):
+    """Request model for Panchang transitions over a date range."""
+    start: datetime = Field(..., description="Range start in UTC")
+    end: datetime = Field(..., description="Range end in UTC")
+    ayanamsa: str = Field(
+        "lahiri",
+        description="Ayanamsa for nakshatra and yoga (lahiri, raman, krishnamurti, fagan_bradley, tropical)"
+    )
+
+class MuhurtaRequest(BaseModel):
+    """Request model for a muhurta search over a date range."""
+    start: datetime = Field(..., description="Range start in UTC")
+    end: datetime = Field(..., description="Range end in UTC")
+    latitude: float = Field(..., ge=-66, le=66, description="Latitude")
+    longitude: float = Field(..., ge=-180, le=180, description="Longitude")
+    activity: str = Field(..., description="Activity (marriage, business, travel, education, medical, spiritual)")
+    min_duration_minutes: float = Field(30, gt=0, description="Shortest window returned")
+    limit: Optional[int] = Field(None, ge=1, description="Most windows returned, best first")
+    ayanamsa: str = Field("lahiri", description="Ayanamsa for nakshatra, yoga and lagna")
+
 class SunTimesRequest(BaseModel):
     date: datetime = Field(..., description="Date in UTC (time ignored; sunrise/sunset computed for that day)")
     latitude: float = Field(..., description="Latitude")
     longitude: float = Field(..., description="Longitude")
 
 class SunTimesResponse(BaseModel):
-    sunrise_utc: datetime
-    sunset_utc: datetime
+    sunrise_utc: Optional[datetime] = None
+    sunset_utc: Optional[datetime] = None
+
+class RiseSetLocation(BaseModel):
+    latitude: float = Field(..., ge=-90, le=90, description="Latitude")
+    longitude: float = Field(..., ge=-180, le=180, description="Longitude")
+    utc_offset_hours: Optional[float] = Field(
+        None,
+        ge=-14,
+        le=14,
+        description="Offset of the local day from UTC; defaults to local mean time (longitude / 15)"
+    )
+
+class RiseSetRequest(BaseModel):
+    """Request model for batched rise/set/transit times."""
+    locations: List[RiseSetLocation] = Field(..., min_length=1, max_length=MAX_RISE_SET_LOCATIONS)
+    start_date: date = Field(..., description="First local date")
+    days: int = Field(1, ge=1, le=MAX_RANGE_DAYS, description="Number of consecutive dates")
+    bodies: List[Literal["sun", "moon"]] = Field(default_factory=lambda: ["sun", "moon"], min_length=1)
 
 @router.post("/calculate", response_model=PanchangResponse)
 async def calculate_panchang(request: PanchangRequest):
@@ -93,72 +127,124 @@ async def calculate_panchang(request: PanchangRequest):
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error calculating Panchang: {str(e)}")
 
+@router.post("/range")
+async def calculate_panchang_range(request: PanchangRangeRequest):
+    """
+    Calculate the exact start and end of every tithi, nakshatra, yoga and
+    karana overlapping [start, end) in UTC.
+
+    Transitions are geocentric, so the result depends only on the range and
+    ayanamsa and is cached per (range, ayanamsa).
+    """
+    start = normalize_instant(request.start)
+    end = normalize_instant(request.end)
+    ayanamsa = request.ayanamsa.lower()
+    if end - start > timedelta(days=MAX_RANGE_DAYS):
+        raise HTTPException(status_code=400, detail=f"Range may span at most {MAX_RANGE_DAYS} days")
+    try:
+        search = PanchangSearch(start, end, ayanamsa)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def compute() -> bytes:
+        transitions = await compute_executor.run("panchang.range", search.transitions)
+        return dumps({
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "ayanamsa": ayanamsa,
+            **transitions,
+        })
+
+    key = f"panchang:v1:range:{start.isoformat()}:{end.isoformat()}:{ayanamsa}"
+    body = await chart_cache.get_or_compute(key, compute, expire=settings.REDIS_CACHE_EXPIRE_SECONDS)
+    return json_bytes_response(body)
+
+@router.post("/muhurta")
+async def calculate_muhurta_windows(request: MuhurtaRequest):
+    """
+    Find every window in [start, end) UTC where the tithi, nakshatra, yoga
+    and lagna all suit the activity, best scored first.
+    """
+    start = normalize_instant(request.start)
+    end = normalize_instant(request.end)
+    activity = request.activity.lower()
+    ayanamsa = request.ayanamsa.lower()
+    if end - start > timedelta(days=MAX_RANGE_DAYS):
+        raise HTTPException(status_code=400, detail=f"Range may span at most {MAX_RANGE_DAYS} days")
+    if activity not in MUHURTA_RULES:
+        raise HTTPException(status_code=400, detail=f"Unknown activity '{request.activity}'")
+    try:
+        search = MuhurtaSearch(start, end, request.latitude, request.longitude, ayanamsa)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def compute() -> bytes:
+        windows = await compute_executor.run(
+            "panchang.muhurta", search.windows, activity, request.min_duration_minutes, request.limit
+        )
+        return dumps({
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "activity": activity,
+            "ayanamsa": ayanamsa,
+            "windows": windows,
+        })
+
+    key = (
+        f"panchang:v1:muhurta:{start.isoformat()}:{end.isoformat()}:{request.latitude}:"
+        f"{request.longitude}:{activity}:{request.min_duration_minutes}:{request.limit}:{ayanamsa}"
+    )
+    body = await chart_cache.get_or_compute(key, compute, expire=settings.REDIS_CACHE_EXPIRE_SECONDS)
+    return json_bytes_response(body)
+
 @router.post("/sun_times", response_model=SunTimesResponse)
 async def calculate_sun_times(request: SunTimesRequest):
     """
     Calculate sunrise and sunset UTC for a given date and location.
+
+    Times are for the local mean solar day of that date, with refraction
+    and the Sun's semidiameter; they are null when the Sun does not rise
+    or set that day.
     """
     try:
-        d = request.date
-        jd0 = swe.julday(d.year, d.month, d.day, 0.0)
-        # Ensure all parameters are correct types
-        lat = float(request.latitude)
-        lon = float(request.longitude)
-        
-        # Calculate using simpler approach: find when Sun altitude crosses horizon
-        # Search for sunrise around 6am local time
-        jd_sunrise = jd0 + 0.25  # 6am UTC
-        # Calculate Sun's position
-        sun_pos = swe.calc_ut(jd_sunrise, swe.SUN, swe.FLG_SWIEPH | swe.FLG_EQUATORIAL)[0]
-        
-        # For more accurate sunrise/sunset, iterate to find horizon crossing
-        # Simplified: use approximate calculation based on Sun's declination
-        # This is a basic implementation - production should use swe.rise_trans correctly
-        
-        # Rough sunrise/sunset calculation
-        # Hour angle at sunrise: cos(H) = -tan(lat)*tan(decl)
-        sun_ecl = swe.calc_ut(jd0 + 0.5, swe.SUN, swe.FLG_SWIEPH)[0]  # noon position
-        sun_lon = sun_ecl[0]
-        # Convert to equatorial
-        sun_eq = swe.calc_ut(jd0 + 0.5, swe.SUN, swe.FLG_SWIEPH | swe.FLG_EQUATORIAL)[0]
-        decl = sun_eq[1] * math.pi / 180.0  # declination in radians
-        lat_rad = lat * math.pi / 180.0
-        
-        # Hour angle calculation (simplified, ignores refraction and sun's radius)
-        cos_h = -math.tan(lat_rad) * math.tan(decl)
-        if cos_h < -1:
-            # Midnight sun
-            h_angle = math.pi
-        elif cos_h > 1:
-            # Polar night
-            h_angle = 0
-        else:
-            h_angle = math.acos(cos_h)
-        
-        # Convert hour angle to time
-        sunrise_hour = 12.0 - (h_angle * 180.0 / math.pi) / 15.0 - lon / 15.0
-        sunset_hour = 12.0 + (h_angle * 180.0 / math.pi) / 15.0 - lon / 15.0
-        
-        # Build datetime objects from calculated JD
-        sr_jd = jd0 + sunrise_hour / 24.0
-        ss_jd = jd0 + sunset_hour / 24.0
-        
-        # Convert JD to datetime
-        y, m, day, ut = swe.revjul(sr_jd)
-        hr = int(ut)
-        mi = int((ut - hr) * 60)
-        sec_float = ((ut - hr) * 60 - mi) * 60
-        se = min(59, max(0, int(round(sec_float))))  # Clamp to 0-59
-        sunrise = datetime(int(round(y)), int(round(m)), int(round(day)), hr, mi, se)
-        
-        y2, m2, day2, ut2 = swe.revjul(ss_jd)
-        hr2 = int(ut2)
-        mi2 = int((ut2 - hr2) * 60)
-        sec_float2 = ((ut2 - hr2) * 60 - mi2) * 60
-        se2 = min(59, max(0, int(round(sec_float2))))  # Clamp to 0-59
-        sunset = datetime(int(round(y2)), int(round(m2)), int(round(day2)), hr2, mi2, se2)
-        
-        return SunTimesResponse(sunrise_utc=sunrise, sunset_utc=sunset)
+        events = single_day(float(request.latitude), float(request.longitude), request.date.date())
+        return SunTimesResponse(sunrise_utc=events["rise"], sunset_utc=events["set"])
     except Exception as e:
-        import traceback
-        raise HTTPException(status_code=400, detail=f"Error calculating sun times: {str(e)}\n{traceback.format_exc()}")
+        raise HTTPException(status_code=400, detail=f"Error calculating sun times: {str(e)}")
+
+@router.post("/rise_set")
+async def calculate_rise_set(request: RiseSetRequest):
+    """
+    Calculate rise, set and transit times of the Sun and Moon for many
+    locations and consecutive days.
+
+    Streams NDJSON, one line per location in request order:
+    `{"index": 0, "dates": [...], "sun": {"rise": [...], "set": [...], "transit": [...]}, ...}`
+    with UTC timestamps per date, or null where the event does not occur.
+    """
+    locations = request.locations
+    events = await compute_executor.run(
+        "panchang.rise_set",
+        RiseSetEngine().compute,
+        [loc.latitude for loc in locations],
+        [loc.longitude for loc in locations],
+        request.start_date,
+        request.days,
+        bodies=request.bodies,
+        utc_offsets=[loc.utc_offset_hours for loc in locations],
+    )
+    dates = [(request.start_date + timedelta(days=i)).isoformat() for i in range(request.days)]
+
+    # Rows are formatted as they stream; Starlette iterates this generator
+    # in its threadpool, so formatting never blocks the event loop
+    def lines():
+        for index in range(len(locations)):
+            line = {"index": index, "dates": dates}
+            for body, body_events in events.items():
+                line[body] = {
+                    event: format_events(values[index:index + 1])[0]
+                    for event, values in body_events.items()
+                }
+            yield dumps(line) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
@@ -1,15 +1,24 @@
 """
 API endpoints for Prediction Engine
 """
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+from typing import Dict, List, Literal, Optional
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, validator
 
-from app.core.calculations.prediction_engine import PredictionEngine
+from app.api.serialization import dumps
+from app.core.cache.chart_cache import normalize_instant
+from app.core.calculations.muhurta import MAX_LATITUDE
+from app.core.calculations.prediction_engine import DEFAULT_LOCATION, PredictionEngine
+from app.core.calculations.transits import TransitSearch
+from app.core.parallel import compute_executor
 
 router = APIRouter()
 
+# Longest range served by /transit/timeline in one request
+MAX_TIMELINE_DAYS = 366
+
 class MuhurtaRequest(BaseModel):
     """Request model for Muhurta calculation"""
     datetime_utc: str = Field(..., description="UTC datetime string")
@@ -61,6 +70,18 @@ class NextSuitableTimeRequest(MuhurtaRequest):
         le=30, 
         description="Maximum days to look ahead"
     )
+    latitude: float = Field(
+        DEFAULT_LOCATION[0],
+        ge=-MAX_LATITUDE,
+        le=MAX_LATITUDE,
+        description="Location latitude for the lagna; New Delhi if omitted"
+    )
+    longitude: float = Field(
+        DEFAULT_LOCATION[1],
+        ge=-180,
+        le=180,
+        description="Location longitude for the lagna; New Delhi if omitted"
+    )
 
 class TransitPeriodRequest(BaseModel):
     """Request model for transit period analysis"""
@@ -103,6 +124,32 @@ class TransitPeriodRequest(BaseModel):
         except (KeyError, ValueError) as e:
             raise ValueError(f"Invalid transit position format: {e}")
 
+class TransitTimelineRequest(BaseModel):
+    """Request model for exact transit events over a date range"""
+    start: datetime = Field(..., description="Range start in UTC")
+    end: datetime = Field(..., description="Range end in UTC")
+    natal_points: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Sidereal natal longitudes by name, e.g. planets and ascendant"
+    )
+    bodies: Optional[List[str]] = Field(
+        None,
+        description="Transiting bodies (sun, moon, mercury, venus, mars, jupiter, saturn, rahu, ketu); all if omitted"
+    )
+    events: List[Literal["ingress", "nakshatra", "station", "aspect"]] = Field(
+        default_factory=lambda: ["ingress", "nakshatra", "station", "aspect"],
+        min_length=1,
+        description="Event types to report"
+    )
+    ayanamsa: str = Field("lahiri", description="Ayanamsa for sidereal longitudes")
+
+    @validator('natal_points')
+    def validate_natal_points(cls, v):
+        for point, position in v.items():
+            if not 0 <= position < 360:
+                raise ValueError(f"Invalid position for {point}: {position}")
+        return v
+
 @router.post("/muhurta/calculate", tags=["Prediction"])
 async def calculate_muhurta(request: MuhurtaRequest):
     """Calculate Muhurta suitability for given time and activity"""
@@ -121,23 +168,29 @@ async def calculate_muhurta(request: MuhurtaRequest):
 async def find_next_suitable_time(request: NextSuitableTimeRequest):
     """Find next suitable time for given activity"""
     try:
-        result = PredictionEngine.find_next_suitable_time(
+        # The window search runs in the compute pool, like /panchang/muhurta
+        result = await compute_executor.run(
+            "prediction.next_suitable",
+            PredictionEngine.find_next_suitable_time,
             request.datetime_utc,
             request.activity_type,
             request.planet_positions,
             request.planet_strengths,
-            request.max_days
+            request.max_days,
+            request.latitude,
+            request.longitude
         )
-        
-        if result is None:
-            raise HTTPException(
-                status_code=404,
-                detail="No suitable time found within specified period"
-            )
-            
-        return result
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+    
+    if result is None:
+        raise HTTPException(
+            status_code=404,
+            detail="No suitable time found within specified period"
+        )
+    return result
 
 @router.post("/transit/analyze", tags=["Prediction"])
 async def analyze_transit_period(request: TransitPeriodRequest):
@@ -153,3 +206,34 @@ async def analyze_transit_period(request: TransitPeriodRequest):
         return result
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/transit/timeline", tags=["Prediction"])
+async def transit_timeline(request: TransitTimelineRequest):
+    """
+    Find exact sign and nakshatra ingresses, retrograde and direct
+    stations, and aspect perfections to natal points over [start, end).
+
+    Streams NDJSON in time order, one event per line:
+    `{"time": "...", "body": "mars", "type": "aspect", "natal_point": "sun", "aspect": "Trine", "retrograde": false}`
+    """
+    start = normalize_instant(request.start)
+    end = normalize_instant(request.end)
+    if end - start > timedelta(days=MAX_TIMELINE_DAYS):
+        raise HTTPException(status_code=400, detail=f"Range may span at most {MAX_TIMELINE_DAYS} days")
+    try:
+        search = TransitSearch(
+            start,
+            end,
+            natal_points=request.natal_points,
+            bodies=request.bodies,
+            events=request.events,
+            ayanamsa=request.ayanamsa.lower(),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # The search runs in the compute pool under its limits; the events are
+    # then serialized a line at a time in Starlette's threadpool
+    events = await compute_executor.run("prediction.transit_timeline", search.timeline)
+    lines = (dumps(event) + b"\n" for event in events)
+    return StreamingResponse(lines, media_type="application/x-ndjson")
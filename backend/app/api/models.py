@@ -65,6 +65,22 @@ class ChartRequest(BaseModel):
         default="P",
         description="House system (P: Placidus, K: Koch, R: Regiomontanus)"
     )
+    divisions: List[int] = Field(
+        default_factory=lambda: [9, 10],
+        description="Divisional charts to include (1-60, e.g. 9 for D9)"
+    )
+
+# Upper bound on charts per batch request; larger jobs are split by the client
+MAX_BATCH_CHARTS = 5000
+
+class ChartBatchRequest(BaseModel):
+    """Request model for calculating many birth charts in one call."""
+    charts: List[ChartRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_CHARTS,
+        description="Charts to calculate; identical inputs are computed once"
+    )
 
 class PlanetaryPosition(BaseModel):
     """Model for planetary position data."""
@@ -0,0 +1,41 @@
+"""
+API Serialization Helpers
+PGF Protocol: API_002
+Gate: GATE_4
+Version: 1.0.0
+
+Float rounding and single-pass JSON encoding for pre-serialized responses.
+orjson is used when installed, falling back to the standard library.
+"""
+
+import json
+from typing import Any
+
+from fastapi.responses import Response
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+JSON_MEDIA_TYPE = "application/json"
+
+# Decimal places kept for floats in the fast response mode (~0.0004 arcsec)
+FLOAT_PRECISION = 8
+
+
+def round_float(value: Any, ndigits: int = FLOAT_PRECISION) -> float:
+    """Convert a numeric value to a float rounded to a fixed precision"""
+    return round(float(value), ndigits)
+
+
+def dumps(payload: Any) -> bytes:
+    """Serialize a payload of plain Python types to compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def json_bytes_response(content: Any) -> Response:
+    """Return already-serialized JSON (bytes or str) without re-validation"""
+    return Response(content=content, media_type=JSON_MEDIA_TYPE)
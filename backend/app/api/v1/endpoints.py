@@ -15,6 +15,7 @@ from app.core.monitoring.monitor import MonitoringSystem
 from app.core.validation.validation_framework import ValidationFramework
 from app.core.analysis.pattern_detector import PatternDetector
 from app.core.analysis.correlation_engine import CorrelationAnalyzer
+from app.core.lazy import LazySingleton
 from app.api.endpoints import (
     health,
     kundli,
@@ -27,11 +28,11 @@ from app.api.endpoints import (
 # Initialize FastAPI app
 app = FastAPI(title="Kundli Calculation Service")
 
-# Initialize components
-monitoring = MonitoringSystem()
-validation = ValidationFramework()
-pattern_detector = PatternDetector()
-correlation_analyzer = CorrelationAnalyzer()
+# Components are built on first use, not at worker startup
+monitoring = LazySingleton(MonitoringSystem)
+validation = LazySingleton(ValidationFramework)
+pattern_detector = LazySingleton(PatternDetector)
+correlation_analyzer = LazySingleton(CorrelationAnalyzer)
 
 # Add CORS middleware
 app.add_middleware(
@@ -49,7 +50,7 @@ async def monitor_requests(request: Request, call_next):
     response = await call_next(request)
     duration = (datetime.now() - start_time).total_seconds()
     
-    monitoring.track_request(
+    monitoring().track_request(
         endpoint=str(request.url.path),
         method=request.method,
         duration=duration
@@ -0,0 +1,303 @@
+"""
+Aspect Pattern Engine
+PGF Protocol: PAT_002
+Gate: GATE_3
+Version: 1.0.0
+
+Multi-body aspect configurations found on a bitmask aspect graph. Each
+body is a bit; per aspect type every body holds the mask of the bodies it
+aspects, so a candidate apex or closing vertex is one AND of two masks.
+Configurations are enumerated in canonical body order (each found once,
+never as a rotation or path prefix), which keeps the cost polynomial in
+the body count and safe to run over 20+ points or merged synastry charts.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from ..calculations.aspect_kernel import AspectTable, separations, upper_triangle
+
+# Aspects the configurations are built from, by exact angle
+PATTERN_ASPECTS: Dict[str, float] = {
+    "conjunction": 0,
+    "sextile": 60,
+    "square": 90,
+    "trine": 120,
+    "quincunx": 150,
+    "opposition": 180,
+}
+
+DEFAULT_ORBS: Dict[str, float] = {
+    "conjunction": 8,
+    "sextile": 4,
+    "square": 6,
+    "trine": 6,
+    "quincunx": 3,
+    "opposition": 8,
+}
+
+PATTERN_NAMES: Tuple[str, ...] = (
+    "grand_trine", "t_square", "grand_cross", "yod", "kite", "stellium"
+)
+
+# Bodies in a stellium
+MIN_STELLIUM = 3
+
+
+def _bits(mask: int) -> Iterator[int]:
+    """Indexes of the set bits, lowest first"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _above(index: int) -> int:
+    """Mask clearing bits 0..index"""
+    return ~((1 << (index + 1)) - 1)
+
+
+@dataclass(frozen=True)
+class AspectPattern:
+    """One occurrence of a configuration"""
+    name: str
+    # Bodies in canonical order
+    bodies: Tuple[str, ...]
+    # Apex of a T-square or yod, the opposing point of a kite
+    focus: Optional[str] = None
+
+
+class AspectGraph:
+    """Bitmask adjacency per aspect type over a fixed body order"""
+
+    def __init__(self, bodies: Sequence[str]):
+        self.bodies: Tuple[str, ...] = tuple(bodies)
+        self.index: Dict[str, int] = {body: i for i, body in enumerate(self.bodies)}
+        self.adjacency: Dict[str, List[int]] = {}
+
+    def add(self, aspect: str, first: str, second: str) -> None:
+        """Record an aspect; bodies outside the body set are ignored"""
+        i = self.index.get(first)
+        j = self.index.get(second)
+        if i is None or j is None or i == j:
+            return
+        masks = self.adjacency.setdefault(aspect, [0] * len(self.bodies))
+        masks[i] |= 1 << j
+        masks[j] |= 1 << i
+
+    def masks(self, aspect: str) -> List[int]:
+        return self.adjacency.get(aspect) or [0] * len(self.bodies)
+
+    def names(self, indexes: Iterable[int]) -> Tuple[str, ...]:
+        return tuple(self.bodies[i] for i in indexes)
+
+
+class AspectPatternEngine:
+    """Finds grand trines, T-squares, grand crosses, yods, kites and stelliums"""
+
+    def __init__(
+        self,
+        bodies: Optional[Sequence[str]] = None,
+        orbs: Optional[Mapping[str, float]] = None,
+        min_stellium: int = MIN_STELLIUM
+    ):
+        """
+        Args:
+            bodies: Bodies to consider, in canonical order; None uses every
+                body of the input in order of first appearance
+            orbs: Orb per aspect type for graphs built from longitudes
+            min_stellium: Fewest mutually conjunct bodies forming a stellium
+        """
+        self.bodies = tuple(bodies) if bodies is not None else None
+        self.orbs = {**DEFAULT_ORBS, **(orbs or {})}
+        self.min_stellium = min_stellium
+        self.table = AspectTable(
+            list(PATTERN_ASPECTS),
+            list(PATTERN_ASPECTS.values()),
+            [self.orbs[name] for name in PATTERN_ASPECTS]
+        )
+
+    def _body_order(self, names: Iterable[str]) -> List[str]:
+        if self.bodies is not None:
+            return list(self.bodies)
+        return list(dict.fromkeys(names))
+
+    def graph_from_aspects(self, aspects: Iterable[Mapping[str, object]]) -> AspectGraph:
+        """Graph from aspect dicts with "type" and a two-body "planets" list
+
+        Entries naming any other number of bodies are skipped.
+        """
+        pairs = [
+            (str(aspect["type"]).lower(), aspect["planets"])
+            for aspect in aspects
+            if len(aspect.get("planets", ())) == 2
+        ]
+        graph = AspectGraph(self._body_order(body for _, pair in pairs for body in pair))
+        for aspect, (first, second) in pairs:
+            graph.add(aspect, first, second)
+        return graph
+
+    def graph_from_longitudes(self, longitudes: Mapping[str, float]) -> AspectGraph:
+        """Graph of every aspect within orb between the given longitudes"""
+        graph = AspectGraph([
+            body for body in self._body_order(longitudes) if body in longitudes
+        ])
+        count = len(graph.bodies)
+        if count < 2:
+            return graph
+        values = [longitudes[body] for body in graph.bodies]
+        matches = self.table.match(separations(values, values), upper_triangle(count))
+        for i, j, aspect in zip(*matches.cells, matches.aspects):
+            graph.add(self.table.names[aspect], graph.bodies[i], graph.bodies[j])
+        return graph
+
+    @staticmethod
+    def merge_charts(charts: Mapping[str, Mapping[str, float]]) -> Dict[str, float]:
+        """Longitudes of several charts keyed "label:body", e.g. for synastry"""
+        return {
+            f"{label}:{body}": longitude
+            for label, chart in charts.items()
+            for body, longitude in chart.items()
+        }
+
+    def grand_trines(self, graph: AspectGraph) -> List[AspectPattern]:
+        trine = graph.masks("trine")
+        return [
+            AspectPattern("grand_trine", graph.names(triangle))
+            for triangle in self._triangles(trine)
+        ]
+
+    def t_squares(self, graph: AspectGraph) -> List[AspectPattern]:
+        opposition = graph.masks("opposition")
+        square = graph.masks("square")
+        patterns = []
+        for i in range(len(graph.bodies)):
+            for j in _bits(opposition[i] & _above(i)):
+                for apex in _bits(square[i] & square[j]):
+                    patterns.append(AspectPattern(
+                        "t_square", graph.names((i, j, apex)), graph.bodies[apex]
+                    ))
+        return patterns
+
+    def grand_crosses(self, graph: AspectGraph) -> List[AspectPattern]:
+        opposition = graph.masks("opposition")
+        square = graph.masks("square")
+        patterns = []
+        # i is the lowest body, j its opposite, k < l the other opposition
+        for i in range(len(graph.bodies)):
+            for j in _bits(opposition[i] & _above(i)):
+                arms = square[i] & square[j] & _above(i)
+                for k in _bits(arms):
+                    for l in _bits(arms & opposition[k] & _above(k)):
+                        patterns.append(AspectPattern(
+                            "grand_cross", graph.names(sorted((i, j, k, l)))
+                        ))
+        return patterns
+
+    def yods(self, graph: AspectGraph) -> List[AspectPattern]:
+        sextile = graph.masks("sextile")
+        quincunx = graph.masks("quincunx")
+        patterns = []
+        for i in range(len(graph.bodies)):
+            for j in _bits(sextile[i] & _above(i)):
+                for apex in _bits(quincunx[i] & quincunx[j]):
+                    patterns.append(AspectPattern(
+                        "yod", graph.names((i, j, apex)), graph.bodies[apex]
+                    ))
+        return patterns
+
+    def kites(self, graph: AspectGraph) -> List[AspectPattern]:
+        opposition = graph.masks("opposition")
+        sextile = graph.masks("sextile")
+        patterns = []
+        for triangle in self._triangles(graph.masks("trine")):
+            for vertex in triangle:
+                first, second = (v for v in triangle if v != vertex)
+                for tail in _bits(opposition[vertex] & sextile[first] & sextile[second]):
+                    patterns.append(AspectPattern(
+                        "kite", graph.names(triangle) + (graph.bodies[tail],), graph.bodies[tail]
+                    ))
+        return patterns
+
+    def stelliums(self, graph: AspectGraph) -> List[AspectPattern]:
+        """Maximal groups of mutually conjunct bodies
+
+        Conjunctions within one orb form a unit circular-arc graph, which
+        has at most one maximal clique per body, so Bron-Kerbosch stays
+        cheap on graphs built from longitudes.
+        """
+        conjunction = graph.masks("conjunction")
+        return [
+            AspectPattern("stellium", graph.names(_bits(clique)))
+            for clique in sorted(self._maximal_cliques(conjunction), key=lambda c: c & -c)
+            if bin(clique).count("1") >= self.min_stellium
+        ]
+
+    def find_patterns(
+        self,
+        graph: AspectGraph,
+        names: Optional[Iterable[str]] = None
+    ) -> List[AspectPattern]:
+        """Every occurrence of the named configurations, all by default"""
+        finders = {
+            "grand_trine": self.grand_trines,
+            "t_square": self.t_squares,
+            "grand_cross": self.grand_crosses,
+            "yod": self.yods,
+            "kite": self.kites,
+            "stellium": self.stelliums,
+        }
+        patterns = []
+        for name in names or PATTERN_NAMES:
+            if name not in finders:
+                raise ValueError(f"Unknown aspect pattern: {name}")
+            patterns.extend(finders[name](graph))
+        return patterns
+
+    @staticmethod
+    def _triangles(masks: List[int]) -> Iterator[Tuple[int, int, int]]:
+        """Each triangle once as i < j < k"""
+        for i, neighbours in enumerate(masks):
+            for j in _bits(neighbours & _above(i)):
+                for k in _bits(neighbours & masks[j] & _above(j)):
+                    yield i, j, k
+
+    @staticmethod
+    def _maximal_cliques(masks: List[int]) -> Iterator[int]:
+        """Bron-Kerbosch with pivoting over bitmasks"""
+        stack = [(0, (1 << len(masks)) - 1, 0)]
+        while stack:
+            clique, candidates, excluded = stack.pop()
+            if not candidates:
+                if not excluded:
+                    yield clique
+                continue
+            pivot = max(
+                _bits(candidates | excluded),
+                key=lambda v: bin(candidates & masks[v]).count("1")
+            )
+            for v in _bits(candidates & ~masks[pivot]):
+                bit = 1 << v
+                stack.append((clique | bit, candidates & masks[v], excluded & masks[v]))
+                candidates &= ~bit
+                excluded |= bit
+
+
+def aspect_components(graph: AspectGraph, aspect: str) -> List[Tuple[str, ...]]:
+    """Connected groups of bodies linked by one aspect type, each once"""
+    masks = graph.masks(aspect)
+    seen = 0
+    components = []
+    for start in range(len(graph.bodies)):
+        if seen >> start & 1 or not masks[start]:
+            continue
+        component = frontier = 1 << start
+        while frontier:
+            reached = 0
+            for v in _bits(frontier):
+                reached |= masks[v]
+            frontier = reached & ~component
+            component |= frontier
+        seen |= component
+        components.append(graph.names(_bits(component)))
+    return components
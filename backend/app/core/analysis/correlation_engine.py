@@ -5,7 +5,7 @@ Gate: GATE_3
 Version: 1.0.0
 """
 
-from typing import Dict, List, Optional, Any, Tuple, Set, Union
+from typing import Dict, List, Optional, Any, Tuple, Set, Union, Deque
 from dataclasses import dataclass
 import asyncio
 import logging
@@ -13,9 +13,12 @@ from datetime import datetime
 import numpy as np
 from enum import Enum
 from collections import defaultdict
-import scipy.stats as stats
-from sklearn.metrics import mutual_info_score
-import pandas as pd
+from ..lazy import lazy_import
+from .streaming import DEFAULT_HISTORY_SIZE, ResultStream
+
+# Loaded on first analysis, not at worker startup
+stats = lazy_import("scipy.stats")
+pd = lazy_import("pandas")
 
 class CorrelationType(Enum):
     DIRECT = "direct"
@@ -40,14 +43,24 @@ class CorrelationResult:
 class CorrelationAnalyzer:
     """Advanced correlation analysis for astrological patterns"""
     
-    def __init__(self, significance_threshold: float = 0.05):
+    def __init__(
+        self,
+        significance_threshold: float = 0.05,
+        history_size: int = DEFAULT_HISTORY_SIZE
+    ):
         self.significance_threshold = significance_threshold
-        self.correlations: List[CorrelationResult] = []
+        # Aggregates over every correlation, plus the most recent ones
+        self.results: ResultStream[CorrelationResult] = ResultStream(history_size)
         self.logger = logging.getLogger(__name__)
         
         # Initialize analysis components
         self._initialize_analyzers()
     
+    @property
+    def correlations(self) -> Deque[CorrelationResult]:
+        """Most recent correlations, up to history_size"""
+        return self.results.recent
+    
     def _initialize_analyzers(self) -> None:
         """Initialize correlation analysis components"""
         self.analyzers = {
@@ -77,11 +90,29 @@ class CorrelationAnalyzer:
                     f"Error analyzing {corr_type.value} correlation: {str(e)}"
                 )
         
-        # Store results
-        self.correlations.extend(results)
+        for corr in results:
+            self._record(corr)
         
         return results
     
+    def _record(self, corr: CorrelationResult) -> None:
+        """Fold one correlation into the metrics"""
+        self.results.add(
+            corr,
+            counts={
+                "types": corr.correlation_type.value,
+                "significant": corr.significance < self.significance_threshold
+            },
+            values={"strength": corr.strength, "confidence": corr.confidence},
+            score=corr.strength,
+            summary={
+                "type": corr.correlation_type.value,
+                "source": corr.source,
+                "target": corr.target
+            },
+            timestamp=corr.timestamp
+        )
+    
     async def _analyze_direct_correlation(
         self,
         data: Dict[str, Any]
@@ -455,37 +486,17 @@ class CorrelationAnalyzer:
     
     def get_correlation_metrics(self) -> Dict[str, Any]:
         """Get correlation analysis metrics"""
-        metrics = {
-            "total_correlations": len(self.correlations),
-            "correlation_types": defaultdict(int),
-            "average_strength": 0.0,
-            "average_confidence": 0.0,
-            "significant_correlations": 0
+        # Significance is judged against the threshold at analysis time
+        return {
+            "total_correlations": self.results.total,
+            "correlation_types": defaultdict(int, self.results.count("types")),
+            "average_strength": self.results.mean("strength"),
+            "average_confidence": self.results.mean("confidence"),
+            "strength": self.results.summary("strength"),
+            "strongest": self.results.top(),
+            "significant_correlations": self.results.count("significant")[True]
         }
-        
-        if self.correlations:
-            # Count correlation types
-            for corr in self.correlations:
-                metrics["correlation_types"][
-                    corr.correlation_type.value
-                ] += 1
-            
-            # Calculate averages
-            metrics["average_strength"] = np.mean([
-                c.strength for c in self.correlations
-            ])
-            metrics["average_confidence"] = np.mean([
-                c.confidence for c in self.correlations
-            ])
-            
-            # Count significant correlations
-            metrics["significant_correlations"] = sum(
-                1 for c in self.correlations
-                if c.significance < self.significance_threshold
-            )
-        
-        return metrics
     
     def reset(self) -> None:
         """Reset correlation analyzer state"""
-        self.correlations.clear()
+        self.results.clear()
@@ -5,7 +5,7 @@ Gate: GATE_3
 Version: 1.0.0
 """
 
-from typing import Dict, List, Optional, Any, Tuple, Set
+from typing import Dict, List, Optional, Any, Tuple, Set, Deque
 from dataclasses import dataclass
 import asyncio
 import logging
@@ -14,6 +14,8 @@ import numpy as np
 from enum import Enum
 from collections import defaultdict
 import math
+from .streaming import DEFAULT_HISTORY_SIZE, ResultStream
+from .aspect_patterns import AspectGraph, AspectPatternEngine, aspect_components
 
 class PatternType(Enum):
     PLANETARY = "planetary"
@@ -54,14 +56,26 @@ class PatternSignature:
 class PatternDetector:
     """Advanced pattern detection system for astrological calculations"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        history_size: int = DEFAULT_HISTORY_SIZE,
+        aspect_engine: Optional[AspectPatternEngine] = None
+    ):
         self.signatures: Dict[str, PatternSignature] = {}
-        self.detected_patterns: List[PatternMatch] = []
+        # Body set and orbs for aspect configurations
+        self.aspect_engine = aspect_engine or AspectPatternEngine()
+        # Aggregates over every detection, plus the most recent ones
+        self.results: ResultStream[PatternMatch] = ResultStream(history_size)
         self.logger = logging.getLogger(__name__)
         
         # Initialize standard patterns
         self._initialize_patterns()
     
+    @property
+    def detected_patterns(self) -> Deque[PatternMatch]:
+        """Most recent detections, up to history_size"""
+        return self.results.recent
+    
     def _initialize_patterns(self) -> None:
         """Initialize standard astrological patterns"""
         # Planetary Patterns
@@ -122,13 +136,62 @@ class PatternDetector:
             name="Grand Trine",
             pattern_type=PatternType.ASPECT,
             conditions=[{
-                "type": "aspect_chain",
-                "aspect": "trine",
-                "min_planets": 3
+                "type": "aspect_pattern",
+                "pattern": "grand_trine"
             }],
             effects={"harmony": 1.0, "flow": 0.9}
         )
         
+        self.signatures["t_square"] = PatternSignature(
+            name="T-Square",
+            pattern_type=PatternType.ASPECT,
+            conditions=[{
+                "type": "aspect_pattern",
+                "pattern": "t_square"
+            }],
+            effects={"tension": 0.9, "drive": 0.8}
+        )
+        
+        self.signatures["grand_cross"] = PatternSignature(
+            name="Grand Cross",
+            pattern_type=PatternType.ASPECT,
+            conditions=[{
+                "type": "aspect_pattern",
+                "pattern": "grand_cross"
+            }],
+            effects={"tension": 1.0, "stability": 0.6}
+        )
+        
+        self.signatures["yod"] = PatternSignature(
+            name="Yod",
+            pattern_type=PatternType.ASPECT,
+            conditions=[{
+                "type": "aspect_pattern",
+                "pattern": "yod"
+            }],
+            effects={"adjustment": 0.9, "focus": 0.8}
+        )
+        
+        self.signatures["kite"] = PatternSignature(
+            name="Kite",
+            pattern_type=PatternType.ASPECT,
+            conditions=[{
+                "type": "aspect_pattern",
+                "pattern": "kite"
+            }],
+            effects={"harmony": 0.9, "focus": 0.8}
+        )
+        
+        self.signatures["stellium"] = PatternSignature(
+            name="Stellium",
+            pattern_type=PatternType.ASPECT,
+            conditions=[{
+                "type": "aspect_pattern",
+                "pattern": "stellium"
+            }],
+            effects={"focus": 1.0, "intensity": 0.9}
+        )
+        
         # Temporal Patterns
         self.signatures["planetary_hour"] = PatternSignature(
             name="Planetary Hour",
@@ -148,19 +211,35 @@ class PatternDetector:
         """Detect patterns in chart data"""
         detected = []
         
+        # One aspect graph per chart, shared by every aspect signature
+        try:
+            graph = self.aspect_engine.graph_from_aspects(chart_data.get("aspects", []))
+        except Exception as e:
+            self.logger.error(f"Error building aspect graph: {str(e)}")
+            graph = AspectGraph([])
+        
         for signature in self.signatures.values():
-            matches = await self._match_signature(signature, chart_data)
+            matches = await self._match_signature(signature, chart_data, graph)
             detected.extend(matches)
         
-        # Store detected patterns
-        self.detected_patterns.extend(detected)
+        # Fold detected patterns into the metrics
+        for pattern in detected:
+            self.results.add(
+                pattern,
+                counts={"types": pattern.pattern_type.value},
+                values={"confidence": pattern.confidence, "strength": pattern.strength},
+                score=pattern.strength,
+                summary={"name": pattern.name, "timestamp": pattern.timestamp},
+                timestamp=pattern.timestamp
+            )
         
         return detected
     
     async def _match_signature(
         self,
         signature: PatternSignature,
-        chart_data: Dict[str, Any]
+        chart_data: Dict[str, Any],
+        graph: AspectGraph
     ) -> List[PatternMatch]:
         """Match a specific pattern signature"""
         matches = []
@@ -181,7 +260,7 @@ class PatternDetector:
             elif signature.pattern_type == PatternType.ASPECT:
                 matches.extend(
                     await self._detect_aspect_patterns(
-                        signature, chart_data
+                        signature, graph
                     )
                 )
             elif signature.pattern_type == PatternType.TEMPORAL:
@@ -291,17 +370,34 @@ class PatternDetector:
     async def _detect_aspect_patterns(
         self,
         signature: PatternSignature,
-        chart_data: Dict[str, Any]
+        graph: AspectGraph
     ) -> List[PatternMatch]:
-        """Detect aspect-based patterns"""
+        """Detect aspect-based patterns on the chart's aspect graph"""
         matches = []
-        aspects = chart_data.get("aspects", [])
         
         for condition in signature.conditions:
-            if condition["type"] == "aspect_chain":
+            if condition["type"] == "aspect_pattern":
+                # Find every occurrence of a configuration once
+                for pattern in self.aspect_engine.find_patterns(
+                    graph, [condition["pattern"]]
+                ):
+                    matches.append(PatternMatch(
+                        pattern_type=signature.pattern_type,
+                        name=signature.name,
+                        confidence=0.85,
+                        components=[
+                            {"planet": p, "focus": p == pattern.focus}
+                            for p in pattern.bodies
+                        ],
+                        timestamp=datetime.now(),
+                        strength=0.85,
+                        effects=signature.effects
+                    ))
+            
+            elif condition["type"] == "aspect_chain":
                 # Find chains of aspects
                 chains = self._find_aspect_chains(
-                    aspects,
+                    graph,
                     condition["aspect"],
                     condition["min_planets"]
                 )
@@ -417,44 +513,21 @@ class PatternDetector:
     
     def _find_aspect_chains(
         self,
-        aspects: List[Dict[str, Any]],
+        graph: AspectGraph,
         aspect_type: str,
         min_planets: int
     ) -> List[List[Dict[str, Any]]]:
-        """Find chains of aspects"""
-        chains = []
-        graph = defaultdict(list)
-        
-        # Build aspect graph
-        for aspect in aspects:
-            if aspect["type"] == aspect_type:
-                p1, p2 = aspect["planets"]
-                graph[p1].append(p2)
-                graph[p2].append(p1)
-        
-        # Find chains using DFS
-        visited = set()
-        
-        def dfs(planet: str, chain: List[str]) -> None:
-            if len(chain) >= min_planets:
-                chains.append([
-                    {"planet": p} for p in chain
-                ])
-            
-            for next_planet in graph[planet]:
-                if next_planet not in visited:
-                    visited.add(next_planet)
-                    dfs(next_planet, chain + [next_planet])
-                    visited.remove(next_planet)
-        
-        # Start DFS from each planet
-        for planet in graph:
-            if planet not in visited:
-                visited.add(planet)
-                dfs(planet, [planet])
-                visited.remove(planet)
-        
-        return chains
+        """Find groups of planets linked by chains of one aspect type
+        
+        Each connected group is reported once rather than every path
+        through it, so the count stays linear in the number of planets.
+        """
+        return [
+            [{"planet": p} for p in component]
+            # The graph keys aspect types in lower case
+            for component in aspect_components(graph, aspect_type.lower())
+            if len(component) >= min_planets
+        ]
     
     def _check_exchange(
         self,
@@ -492,7 +565,7 @@ class PatternDetector:
         self,
         timeframe: Optional[Tuple[datetime, datetime]] = None
     ) -> Dict[str, Any]:
-        """Analyze sequence of detected patterns"""
+        """Analyze sequence of the recently detected patterns"""
         patterns = self.detected_patterns
         if timeframe:
             start, end = timeframe
@@ -542,25 +615,17 @@ class PatternDetector:
         return analysis
     
     def get_pattern_metrics(self) -> Dict[str, Any]:
-        """Get pattern detection metrics"""
+        """Get pattern detection metrics over every detection"""
+        types = self.results.count("types")
         return {
-            "total_detected": len(self.detected_patterns),
-            "pattern_types": {
-                pt.value: len([
-                    p for p in self.detected_patterns
-                    if p.pattern_type == pt
-                ])
-                for pt in PatternType
-            },
-            "average_confidence": np.mean([
-                p.confidence for p in self.detected_patterns
-            ]) if self.detected_patterns else 0,
-            "latest_detection": max(
-                (p.timestamp for p in self.detected_patterns),
-                default=None
-            )
+            "total_detected": self.results.total,
+            "pattern_types": {pt.value: types[pt.value] for pt in PatternType},
+            "average_confidence": self.results.mean("confidence"),
+            "strength": self.results.summary("strength"),
+            "strongest": self.results.top(),
+            "latest_detection": self.results.latest
         }
     
     def reset(self) -> None:
         """Reset pattern detector state"""
-        self.detected_patterns.clear()
+        self.results.clear()
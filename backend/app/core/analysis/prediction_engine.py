@@ -5,7 +5,7 @@ Gate: GATE_3
 Version: 1.0.0
 """
 
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Deque
 from dataclasses import dataclass
 from datetime import datetime
 import logging
@@ -15,6 +15,7 @@ import numpy as np
 from .pattern_detector import PatternDetector, PatternMatch
 from .correlation_engine import CorrelationAnalyzer, CorrelationResult
 from .yoga_engine import YogaEngine, YogaResult
+from .streaming import DEFAULT_HISTORY_SIZE, ResultStream
 
 class PredictionScope(Enum):
     IMMEDIATE = "immediate"
@@ -49,16 +50,22 @@ class PredictionResult:
 class PredictionEngine:
     """Advanced prediction engine combining multiple analysis methods"""
     
-    def __init__(self):
-        self.pattern_detector = PatternDetector()
-        self.correlation_analyzer = CorrelationAnalyzer()
-        self.yoga_engine = YogaEngine()
-        self.predictions: List[PredictionResult] = []
+    def __init__(self, history_size: int = DEFAULT_HISTORY_SIZE):
+        self.pattern_detector = PatternDetector(history_size)
+        self.correlation_analyzer = CorrelationAnalyzer(history_size=history_size)
+        self.yoga_engine = YogaEngine(history_size)
+        # Aggregates over every prediction, plus the most recent ones
+        self.results: ResultStream[PredictionResult] = ResultStream(history_size)
         self.logger = logging.getLogger(__name__)
         
         # Initialize prediction templates
         self._initialize_templates()
     
+    @property
+    def predictions(self) -> Deque[PredictionResult]:
+        """Most recent predictions, up to history_size"""
+        return self.results.recent
+    
     def _initialize_templates(self) -> None:
         """Initialize prediction templates"""
         self.templates = {
@@ -147,8 +154,20 @@ class PredictionEngine:
                 domains or list(PredictionDomain)
             )
             
-            # Store predictions
-            self.predictions.extend(predictions)
+            # Fold predictions into the metrics
+            for pred in predictions:
+                self.results.add(
+                    pred,
+                    counts={"domains": pred.domain.value, "scopes": pred.scope.value},
+                    values={"probability": pred.probability, "confidence": pred.confidence},
+                    score=pred.probability,
+                    summary={
+                        "domain": pred.domain.value,
+                        "scope": pred.scope.value,
+                        "description": pred.description
+                    },
+                    timestamp=pred.timestamp
+                )
             
             return predictions
             
@@ -475,33 +494,19 @@ class PredictionEngine:
     
     def get_prediction_metrics(self) -> Dict[str, Any]:
         """Get prediction generation metrics"""
-        metrics = {
-            "total_predictions": len(self.predictions),
-            "predictions_by_domain": defaultdict(int),
-            "predictions_by_scope": defaultdict(int),
-            "average_probability": 0.0,
-            "average_confidence": 0.0
+        return {
+            "total_predictions": self.results.total,
+            "predictions_by_domain": defaultdict(int, self.results.count("domains")),
+            "predictions_by_scope": defaultdict(int, self.results.count("scopes")),
+            "average_probability": self.results.mean("probability"),
+            "average_confidence": self.results.mean("confidence"),
+            "probability": self.results.summary("probability"),
+            "most_probable": self.results.top()
         }
-        
-        if self.predictions:
-            # Count predictions by domain and scope
-            for pred in self.predictions:
-                metrics["predictions_by_domain"][pred.domain.value] += 1
-                metrics["predictions_by_scope"][pred.scope.value] += 1
-            
-            # Calculate averages
-            metrics["average_probability"] = np.mean([
-                p.probability for p in self.predictions
-            ])
-            metrics["average_confidence"] = np.mean([
-                p.confidence for p in self.predictions
-            ])
-        
-        return metrics
     
     def reset(self) -> None:
         """Reset prediction engine state"""
-        self.predictions.clear()
+        self.results.clear()
         self.pattern_detector.reset()
         self.correlation_analyzer.reset()
         self.yoga_engine.reset()
@@ -0,0 +1,160 @@
+"""
+Streaming Result Aggregates
+PGF Protocol: STAT_001
+Gate: GATE_3
+Version: 1.0.0
+
+Constant-memory aggregates for the analysis engines. Each engine used to
+append every result to an instance list and recompute its metrics over
+the whole list, so a long-running worker grew without bound and metrics
+cost O(total history). Results are now folded into counters, Welford
+running statistics and a top-k heap as they are produced, and only the
+most recent ones are kept in a bounded ring buffer.
+"""
+
+import heapq
+import itertools
+import math
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, Generic, List, Optional, Tuple, TypeVar
+
+# Recent results each engine keeps; 0 keeps none
+DEFAULT_HISTORY_SIZE = 1000
+# Strongest results reported by the metrics
+DEFAULT_TOP_K = 10
+
+T = TypeVar("T")
+
+
+@dataclass
+class RunningStats:
+    """Count, mean, variance and range of a stream (Welford)"""
+    count: int = 0
+    mean: float = 0.0
+    _m2: float = 0.0
+    min: Optional[float] = None
+    max: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        value = float(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def variance(self) -> float:
+        """Population variance, as np.var"""
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "std": self.std,
+            "min": self.min,
+            "max": self.max,
+        }
+
+
+class TopK(Generic[T]):
+    """The k highest-scoring items of a stream; ties keep the earliest"""
+
+    def __init__(self, k: int = DEFAULT_TOP_K):
+        self.k = k
+        self._heap: List[Tuple[float, int, T]] = []
+        # Later items rank below earlier ones with the same score
+        self._order = itertools.count(0, -1)
+
+    def add(self, score: float, item: T) -> None:
+        if self.k <= 0:
+            return
+        entry = (score, next(self._order), item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def items(self) -> List[Tuple[float, T]]:
+        """Highest score first"""
+        return [(score, item) for score, _, item in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
+
+    def clear(self) -> None:
+        self._heap.clear()
+
+
+@dataclass
+class ResultStream(Generic[T]):
+    """Bounded recent results plus aggregates over every result seen"""
+    history_size: int = DEFAULT_HISTORY_SIZE
+    top_k: int = DEFAULT_TOP_K
+    recent: Deque[T] = field(init=False)
+    counts: Dict[str, Counter] = field(init=False, default_factory=dict)
+    stats: Dict[str, RunningStats] = field(init=False, default_factory=dict)
+    strongest: TopK = field(init=False)
+    total: int = field(init=False, default=0)
+    latest: Optional[datetime] = field(init=False, default=None)
+
+    def __post_init__(self):
+        self.recent = deque(maxlen=max(0, self.history_size))
+        self.strongest = TopK(self.top_k)
+
+    def add(
+        self,
+        result: T,
+        counts: Dict[str, Any],
+        values: Dict[str, float],
+        score: Optional[float] = None,
+        summary: Any = None,
+        timestamp: Optional[datetime] = None
+    ) -> None:
+        """Fold one result into the aggregates
+
+        Args:
+            result: The result, kept in the recent window
+            counts: Category per counter name, e.g. {"types": "direct"}
+            values: Value per running statistic, e.g. {"strength": 0.8}
+            score: Ranking for the top-k
+            summary: Dict kept in the top-k instead of the result itself
+            timestamp: Result time, tracked as the latest seen
+        """
+        self.total += 1
+        self.recent.append(result)
+        for name, key in counts.items():
+            self.counts.setdefault(name, Counter())[key] += 1
+        for name, value in values.items():
+            self.stats.setdefault(name, RunningStats()).add(value)
+        if score is not None:
+            self.strongest.add(score, summary)
+        if timestamp is not None and (self.latest is None or timestamp > self.latest):
+            self.latest = timestamp
+
+    def count(self, name: str) -> Counter:
+        return self.counts.get(name, Counter())
+
+    def mean(self, name: str) -> float:
+        """Mean of a running statistic, 0 before any value"""
+        stats = self.stats.get(name)
+        return stats.mean if stats else 0.0
+
+    def summary(self, name: str) -> Dict[str, Any]:
+        return self.stats.get(name, RunningStats()).as_dict()
+
+    def top(self) -> List[Dict[str, Any]]:
+        return [{"score": score, **summary} for score, summary in self.strongest.items()]
+
+    def clear(self) -> None:
+        self.recent.clear()
+        self.counts.clear()
+        self.stats.clear()
+        self.strongest.clear()
+        self.total = 0
+        self.latest = None
@@ -5,13 +5,14 @@ Gate: GATE_3
 Version: 1.0.0
 """
 
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Deque
 from dataclasses import dataclass
 from datetime import datetime
 import logging
 from enum import Enum
 from collections import defaultdict
 import math
+from .streaming import DEFAULT_HISTORY_SIZE, ResultStream
 
 class YogaType(Enum):
     RAJAYOGA = "rajayoga"
@@ -41,13 +42,19 @@ class YogaResult:
 class YogaEngine:
     """Advanced yoga detection and analysis engine"""
     
-    def __init__(self):
-        self.detected_yogas: List[YogaResult] = []
+    def __init__(self, history_size: int = DEFAULT_HISTORY_SIZE):
+        # Aggregates over every yoga, plus the most recent ones
+        self.results: ResultStream[YogaResult] = ResultStream(history_size)
         self.logger = logging.getLogger(__name__)
         
         # Initialize yoga definitions
         self._initialize_yoga_definitions()
     
+    @property
+    def detected_yogas(self) -> Deque[YogaResult]:
+        """Most recent yogas, up to history_size"""
+        return self.results.recent
+    
     def _initialize_yoga_definitions(self) -> None:
         """Initialize standard yoga definitions"""
         self.raja_yoga_conditions = {
@@ -142,8 +149,16 @@ class YogaEngine:
             special_yogas = await self._check_special_yogas(chart_data)
             results.extend(special_yogas)
             
-            # Store results
-            self.detected_yogas.extend(results)
+            # Fold results into the metrics
+            for yoga in results:
+                self.results.add(
+                    yoga,
+                    counts={"types": yoga.yoga_type.value},
+                    values={"strength": yoga.strength, "confidence": yoga.confidence},
+                    score=yoga.strength,
+                    summary={"name": yoga.name, "planets": list(yoga.planets)},
+                    timestamp=yoga.timestamp
+                )
             
         except Exception as e:
             self.logger.error(f"Error analyzing yogas: {str(e)}")
@@ -399,29 +414,15 @@ class YogaEngine:
     
     def get_yoga_metrics(self) -> Dict[str, Any]:
         """Get yoga analysis metrics"""
-        metrics = {
-            "total_yogas": len(self.detected_yogas),
-            "yoga_types": defaultdict(int),
-            "average_strength": 0.0,
-            "average_confidence": 0.0
+        return {
+            "total_yogas": self.results.total,
+            "yoga_types": defaultdict(int, self.results.count("types")),
+            "average_strength": self.results.mean("strength"),
+            "average_confidence": self.results.mean("confidence"),
+            "strength": self.results.summary("strength"),
+            "strongest": self.results.top()
         }
-        
-        if self.detected_yogas:
-            # Count yoga types
-            for yoga in self.detected_yogas:
-                metrics["yoga_types"][yoga.yoga_type.value] += 1
-            
-            # Calculate averages
-            metrics["average_strength"] = sum(
-                y.strength for y in self.detected_yogas
-            ) / len(self.detected_yogas)
-            
-            metrics["average_confidence"] = sum(
-                y.confidence for y in self.detected_yogas
-            ) / len(self.detected_yogas)
-        
-        return metrics
     
     def reset(self) -> None:
         """Reset yoga engine state"""
-        self.detected_yogas.clear()
+        self.results.clear()
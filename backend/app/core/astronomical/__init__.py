@@ -15,6 +15,8 @@ from .framework import (
     GeoLocation,
     PlanetaryPosition,
     AspectPosition,
+    ChartContext,
+    PositionProvider,
     AstronomicalCalculator
 )
 from .config import (
@@ -35,6 +37,8 @@ __all__ = [
     'GeoLocation',
     'PlanetaryPosition',
     'AspectPosition',
+    'ChartContext',
+    'PositionProvider',
     'AstronomicalCalculator',
     'ZODIAC_PROPERTIES',
     'HOUSE_SIGNIFICATIONS',
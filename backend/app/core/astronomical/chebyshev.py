@@ -0,0 +1,308 @@
+"""
+Chebyshev Ephemeris Tables
+PGF Protocol: AST_005
+Gate: GATE_15
+Version: 1.0.0
+
+Precomputed per-body Chebyshev coefficient segments for a date range,
+stored in a memory-mapped binary file and built from Swiss Ephemeris.
+A table reproduces the raw (longitude, latitude, distance, speed) output
+of AstronomicalCalculator for one ayanamsa and set of calculation flags,
+and falls back to swe outside its covered range.
+
+Build and check a table from the command line:
+
+    python -m app.core.astronomical.chebyshev build --start 1900-01-01 \
+        --end 2100-01-01 --ayanamsa lahiri --output data/ephe/lahiri.cheb
+    python -m app.core.astronomical.chebyshev check data/ephe/lahiri.cheb
+"""
+
+import argparse
+import struct
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from .framework import AstronomicalCalculator, AyanamsaSystem, CelestialBody
+
+MAGIC = b"KCHEBv1\x00"
+# magic, jd_start, jd_end, sid_mode, flags, body count, reserved
+HEADER = struct.Struct("<8sddiiii")
+# planet id, degree, segment days, segment count, data offset
+BODY_RECORD = struct.Struct("<iidiq")
+QUANTITIES = 4  # longitude, latitude, distance, speed
+
+# Segment length (days) and polynomial degree per body, sized for sub-arcsecond fits
+DEFAULT_SEGMENTS: Dict[CelestialBody, Tuple[float, int]] = {
+    CelestialBody.MOON: (4.0, 13),
+    CelestialBody.SUN: (16.0, 11),
+    CelestialBody.MERCURY: (8.0, 11),
+    CelestialBody.VENUS: (8.0, 11),
+    CelestialBody.MARS: (8.0, 11),
+    CelestialBody.JUPITER: (16.0, 9),
+    CelestialBody.SATURN: (16.0, 9),
+    CelestialBody.URANUS: (32.0, 9),
+    CelestialBody.NEPTUNE: (32.0, 9),
+    CelestialBody.PLUTO: (32.0, 9),
+    CelestialBody.RAHU: (32.0, 9),
+}
+
+
+@dataclass
+class BodyTable:
+    """Chebyshev segments for one Swiss Ephemeris body"""
+    planet_id: int
+    degree: int
+    segment_days: float
+    coefficients: np.ndarray  # (segments, QUANTITIES, degree + 1)
+
+
+class ChebyshevEphemeris:
+    """Position provider backed by a memory-mapped Chebyshev table"""
+
+    def __init__(
+        self,
+        jd_start: float,
+        jd_end: float,
+        sid_mode: int,
+        flags: int,
+        bodies: Dict[int, BodyTable]
+    ):
+        self.jd_start = jd_start
+        self.jd_end = jd_end
+        self.sid_mode = sid_mode
+        self.flags = flags
+        self.bodies = bodies
+
+    @classmethod
+    def load(cls, path: str) -> "ChebyshevEphemeris":
+        """Load a table file without reading its coefficients into memory"""
+        with open(path, "rb") as f:
+            magic, jd_start, jd_end, sid_mode, flags, count, _ = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a Chebyshev ephemeris table")
+            records = [BODY_RECORD.unpack(f.read(BODY_RECORD.size)) for _ in range(count)]
+
+        bodies = {}
+        for planet_id, degree, segment_days, segments, offset in records:
+            bodies[planet_id] = BodyTable(
+                planet_id=planet_id,
+                degree=degree,
+                segment_days=segment_days,
+                coefficients=np.memmap(
+                    path,
+                    dtype="<f8",
+                    mode="r",
+                    offset=offset,
+                    shape=(segments, QUANTITIES, degree + 1)
+                )
+            )
+        return cls(jd_start, jd_end, sid_mode, flags, bodies)
+
+    @classmethod
+    def build(
+        cls,
+        jd_start: float,
+        jd_end: float,
+        ayanamsa: AyanamsaSystem = AyanamsaSystem.LAHIRI,
+        segments: Optional[Dict[CelestialBody, Tuple[float, int]]] = None
+    ) -> "ChebyshevEphemeris":
+        """Fit Chebyshev segments to Swiss Ephemeris output
+
+        Args:
+            jd_start: First Julian day (UT) covered
+            jd_end: Last Julian day (UT) covered
+            ayanamsa: Ayanamsa used for sidereal longitudes
+            segments: Segment length and degree per body
+        """
+        calculator = AstronomicalCalculator(ayanamsa_system=ayanamsa)
+        flags = calculator._get_calc_flags(swe.FLG_SWIEPH)
+        bodies = {}
+        for body, (segment_days, degree) in (segments or DEFAULT_SEGMENTS).items():
+            planet_id = calculator._get_planet_id(body)
+            bodies[planet_id] = BodyTable(
+                planet_id=planet_id,
+                degree=degree,
+                segment_days=segment_days,
+                coefficients=_fit_body(planet_id, flags, jd_start, jd_end, segment_days, degree)
+            )
+        return cls(jd_start, jd_end, calculator.get_sid_mode(), flags, bodies)
+
+    def save(self, path: str) -> None:
+        """Write the table in the memory-mappable binary format"""
+        offset = HEADER.size + BODY_RECORD.size * len(self.bodies)
+        offset += -offset % 8
+        records = []
+        for table in self.bodies.values():
+            records.append(BODY_RECORD.pack(
+                table.planet_id,
+                table.degree,
+                table.segment_days,
+                table.coefficients.shape[0],
+                offset
+            ))
+            offset += table.coefficients.nbytes
+
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(
+                MAGIC, self.jd_start, self.jd_end, self.sid_mode, self.flags, len(self.bodies), 0
+            ))
+            for record in records:
+                f.write(record)
+            f.write(b"\x00" * (-f.tell() % 8))
+            for table in self.bodies.values():
+                f.write(np.ascontiguousarray(table.coefficients, dtype="<f8").tobytes())
+
+    def matches(self, sid_mode: int, flags: int) -> bool:
+        """Whether this table reproduces a calculator with the given configuration"""
+        return self.sid_mode == sid_mode and self.flags == flags
+
+    def covers(self, planet_id: int, jd: float) -> bool:
+        return planet_id in self.bodies and self.jd_start <= jd <= self.jd_end
+
+    def lookup(self, planet_id: int, jd: float) -> Optional[Tuple[float, float, float, float]]:
+        """Raw position for one instant, or None when not covered by the table"""
+        if not self.covers(planet_id, jd):
+            return None
+        values = self._evaluate(self.bodies[planet_id], np.array([jd], dtype=np.float64))[0]
+        return (float(values[0]), float(values[1]), float(values[2]), float(values[3]))
+
+    def evaluate(self, planet_id: int, jds: Sequence[float]) -> np.ndarray:
+        """Raw positions for a batch of Julian days
+
+        Instants outside the table are calculated with swe using the current
+        Swiss Ephemeris configuration.
+
+        Returns:
+            Array of shape (len(jds), 4): longitude, latitude, distance, speed
+        """
+        jds = np.asarray(jds, dtype=np.float64)
+        result = np.empty((jds.size, QUANTITIES), dtype=np.float64)
+        inside = (jds >= self.jd_start) & (jds <= self.jd_end)
+        if planet_id not in self.bodies:
+            inside[:] = False
+
+        if inside.any():
+            result[inside] = self._evaluate(self.bodies[planet_id], jds[inside])
+        for index in np.flatnonzero(~inside):
+            result[index] = swe.calc_ut(float(jds[index]), planet_id, self.flags)[0][:QUANTITIES]
+        return result
+
+    def verify(self, samples: int = 2000, seed: int = 0) -> Dict[int, Dict[str, float]]:
+        """Compare the table against swe at random instants in its range
+
+        Returns:
+            Maximum absolute error per planet id for longitude and latitude
+            (arc-seconds) and distance (AU)
+        """
+        rng = np.random.default_rng(seed)
+        jds = rng.uniform(self.jd_start, self.jd_end, samples)
+        report = {}
+        for planet_id, table in self.bodies.items():
+            approx = self._evaluate(table, jds)
+            exact = np.array([swe.calc_ut(float(jd), planet_id, self.flags)[0][:QUANTITIES] for jd in jds])
+            lon_error = np.abs((approx[:, 0] - exact[:, 0] + 180.0) % 360.0 - 180.0)
+            report[planet_id] = {
+                "longitude_arcsec": float(lon_error.max() * 3600),
+                "latitude_arcsec": float(np.abs(approx[:, 1] - exact[:, 1]).max() * 3600),
+                "distance_au": float(np.abs(approx[:, 2] - exact[:, 2]).max()),
+            }
+        return report
+
+    def _evaluate(self, table: BodyTable, jds: np.ndarray) -> np.ndarray:
+        segments = table.coefficients.shape[0]
+        index = np.clip(((jds - self.jd_start) // table.segment_days).astype(np.int64), 0, segments - 1)
+        seg_start = self.jd_start + index * table.segment_days
+        x = 2.0 * (jds - seg_start) / table.segment_days - 1.0
+        values = _clenshaw(np.asarray(table.coefficients[index]), x)
+        values[:, 0] %= 360.0
+        return values
+
+
+def _chebyshev_nodes(degree: int) -> np.ndarray:
+    k = np.arange(degree + 1)
+    return np.cos(np.pi * (k + 0.5) / (degree + 1))
+
+
+def _clenshaw(coefficients: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Evaluate (n, quantities, degree + 1) coefficients at n points"""
+    x = x[:, None]
+    b1 = np.zeros(coefficients.shape[:2])
+    b2 = np.zeros_like(b1)
+    for j in range(coefficients.shape[2] - 1, 0, -1):
+        b1, b2 = coefficients[:, :, j] + 2.0 * x * b1 - b2, b1
+    return coefficients[:, :, 0] + x * b1 - b2
+
+
+def _fit_body(
+    planet_id: int,
+    flags: int,
+    jd_start: float,
+    jd_end: float,
+    segment_days: float,
+    degree: int
+) -> np.ndarray:
+    segments = int(np.ceil((jd_end - jd_start) / segment_days)) or 1
+    nodes = _chebyshev_nodes(degree)
+    coefficients = np.empty((segments, QUANTITIES, degree + 1), dtype=np.float64)
+    for index in range(segments):
+        seg_start = jd_start + index * segment_days
+        jds = seg_start + (nodes + 1.0) * segment_days / 2.0
+        samples = np.array([swe.calc_ut(float(jd), planet_id, flags)[0][:QUANTITIES] for jd in jds])
+        samples[:, 0] = np.rad2deg(np.unwrap(np.deg2rad(samples[:, 0])))
+        coefficients[index] = np.polynomial.chebyshev.chebfit(nodes, samples, degree).T
+    return coefficients
+
+
+def _julian_day(value: str) -> float:
+    dt = datetime.fromisoformat(value)
+    return swe.julday(dt.year, dt.month, dt.day, dt.hour + dt.minute / 60.0 + dt.second / 3600.0)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build or check Chebyshev ephemeris tables")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="Fit a table from Swiss Ephemeris")
+    build.add_argument("--start", required=True, help="ISO start date (UT)")
+    build.add_argument("--end", required=True, help="ISO end date (UT)")
+    build.add_argument("--ayanamsa", default=AyanamsaSystem.LAHIRI.value,
+                       choices=[a.value for a in AyanamsaSystem])
+    build.add_argument("--output", required=True)
+
+    check = commands.add_parser("check", help="Verify a table against Swiss Ephemeris")
+    check.add_argument("path")
+    check.add_argument("--samples", type=int, default=2000)
+    check.add_argument("--tolerance", type=float, default=1.0, help="Max longitude error, arc-seconds")
+
+    args = parser.parse_args(argv)
+    if args.command == "build":
+        table = ChebyshevEphemeris.build(
+            _julian_day(args.start),
+            _julian_day(args.end),
+            AyanamsaSystem(args.ayanamsa)
+        )
+        table.save(args.output)
+        print(f"Wrote {args.output}")
+        return 0
+
+    table = ChebyshevEphemeris.load(args.path)
+    swe.set_sid_mode(table.sid_mode)
+    failed = False
+    for planet_id, errors in table.verify(args.samples).items():
+        ok = errors["longitude_arcsec"] <= args.tolerance
+        failed = failed or not ok
+        print(
+            f"{swe.get_planet_name(planet_id):<10} lon {errors['longitude_arcsec']:.4f}\" "
+            f"lat {errors['latitude_arcsec']:.4f}\" dist {errors['distance_au']:.2e} AU"
+            f"{'' if ok else '  FAIL'}"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
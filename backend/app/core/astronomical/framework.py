@@ -5,10 +5,10 @@ Gate: GATE_15
 Version: 1.0.0
 """
 
-from typing import Dict, Any, Optional, List, Tuple, Union
+from typing import Dict, Any, Optional, List, Tuple, Union, Protocol
 from enum import Enum
 from datetime import datetime, timezone
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import math
 from pydantic import BaseModel, Field
 import swisseph as swe
@@ -148,17 +148,70 @@ class AspectPosition(BaseModel):
     exact_degree: float
     applying: bool
 
+class PositionProvider(Protocol):
+    """Source of precomputed raw positions used before falling back to swe"""
+    
+    def matches(self, sid_mode: int, flags: int) -> bool:
+        ...
+    
+    def lookup(
+        self,
+        planet_id: int,
+        jd: float
+    ) -> Optional[Tuple[float, float, float, float]]:
+        ...
+
+@dataclass
+class ChartContext:
+    """Per-instant state shared by every body of a chart"""
+    timestamp: datetime
+    location: GeoLocation
+    julian_day: float
+    ascendant: float
+    cusps: Tuple[float, ...]
+    raw_positions: Dict[int, Tuple[float, float, float, float]] = field(
+        default_factory=dict,
+        repr=False
+    )
+
 class AstronomicalCalculator:
     """Astronomical calculator"""
     
     def __init__(
         self,
         coordinate_system: CoordinateSystem = CoordinateSystem.GEOCENTRIC,
-        ayanamsa_system: AyanamsaSystem = AyanamsaSystem.LAHIRI
+        ayanamsa_system: AyanamsaSystem = AyanamsaSystem.LAHIRI,
+        position_provider: Optional[PositionProvider] = None
     ):
         self.coordinate_system = coordinate_system
         self.ayanamsa_system = ayanamsa_system
         self._setup_ephemeris()
+        
+        if position_provider is not None and not position_provider.matches(
+            self.get_sid_mode(),
+            self._get_calc_flags(swe.FLG_SWIEPH)
+        ):
+            raise AppError(
+                code=ErrorCode.INVALID_INPUT,
+                message="Position provider does not match calculator configuration",
+                category=ErrorCategory.VALIDATION,
+                severity=ErrorSeverity.HIGH,
+                details={
+                    "ayanamsa_system": self.ayanamsa_system,
+                    "coordinate_system": self.coordinate_system
+                }
+            )
+        self.position_provider = position_provider
+    
+    def get_sid_mode(self) -> int:
+        """Get Swiss Ephemeris sidereal mode for the ayanamsa system"""
+        sid_modes = {
+            AyanamsaSystem.LAHIRI: swe.SIDM_LAHIRI,
+            AyanamsaSystem.RAMAN: swe.SIDM_RAMAN,
+            AyanamsaSystem.KRISHNAMURTI: swe.SIDM_KRISHNAMURTI,
+            AyanamsaSystem.FAGAN_BRADLEY: swe.SIDM_FAGAN_BRADLEY,
+        }
+        return sid_modes[self.ayanamsa_system]
     
     def _setup_ephemeris(self) -> None:
         """Setup ephemeris"""
@@ -166,14 +219,7 @@ class AstronomicalCalculator:
         swe.set_ephe_path()  # Use default ephemeris path
         
         # Set ayanamsa
-        if self.ayanamsa_system == AyanamsaSystem.LAHIRI:
-            swe.set_sid_mode(swe.SIDM_LAHIRI)
-        elif self.ayanamsa_system == AyanamsaSystem.RAMAN:
-            swe.set_sid_mode(swe.SIDM_RAMAN)
-        elif self.ayanamsa_system == AyanamsaSystem.KRISHNAMURTI:
-            swe.set_sid_mode(swe.SIDM_KRISHNAMURTI)
-        elif self.ayanamsa_system == AyanamsaSystem.FAGAN_BRADLEY:
-            swe.set_sid_mode(swe.SIDM_FAGAN_BRADLEY)
+        swe.set_sid_mode(self.get_sid_mode())
     
     def _get_julian_day(self, dt: datetime) -> float:
         """Get Julian day number"""
@@ -270,18 +316,46 @@ class AstronomicalCalculator:
         
         return None
     
-    def calculate_planet_position(
+    def _get_calc_flags(self, ephemeris_flag: int) -> int:
+        """Get Swiss Ephemeris calculation flags for the coordinate system"""
+        if self.coordinate_system == CoordinateSystem.TOPOCENTRIC:
+            return swe.FLG_TOPOCENTRIC | ephemeris_flag | swe.FLG_SIDEREAL
+        return ephemeris_flag | swe.FLG_SIDEREAL
+    
+    def _calc_raw(
+        self,
+        context: ChartContext,
+        planet_id: int
+    ) -> Tuple[float, float, float, float]:
+        """Calculate raw (longitude, latitude, distance, speed) once per context"""
+        cached = context.raw_positions.get(planet_id)
+        if cached is not None:
+            return cached
+        
+        if self.position_provider is not None:
+            raw = self.position_provider.lookup(planet_id, context.julian_day)
+            if raw is not None:
+                context.raw_positions[planet_id] = raw
+                return raw
+        
+        try:
+            res = swe.calc_ut(context.julian_day, planet_id, self._get_calc_flags(swe.FLG_SWIEPH))
+        except Exception:
+            # Fallback to Moshier ephemeris if Swiss ephemeris files are unavailable
+            res = swe.calc_ut(context.julian_day, planet_id, self._get_calc_flags(swe.FLG_MOSEPH))
+        
+        raw = (res[0][0], res[0][1], res[0][2], res[0][3])
+        context.raw_positions[planet_id] = raw
+        return raw
+    
+    def create_chart_context(
         self,
-        body: CelestialBody,
         dt: datetime,
         location: GeoLocation
-    ) -> PlanetaryPosition:
-        """Calculate planetary position"""
+    ) -> ChartContext:
+        """Compute the per-instant state shared by every body of a chart"""
         try:
-            # Validate location
             location.validate()
-            
-            # Convert to Julian day
             jd = self._get_julian_day(dt)
             
             # Set geographic location for topocentric calculations
@@ -292,58 +366,53 @@ class AstronomicalCalculator:
                     location.altitude
                 )
             
-            # Calculate planet position
-            planet_id = self._get_planet_id(body)
-            calc_flags = (
-                (swe.FLG_TOPOCENTRIC | swe.FLG_SWIEPH | swe.FLG_SIDEREAL)
-                if self.coordinate_system == CoordinateSystem.TOPOCENTRIC
-                else (swe.FLG_SWIEPH | swe.FLG_SIDEREAL)
-            )
-
-            def _calc(planet: int, flags: int):
-                return swe.calc_ut(jd, planet, flags)
-
-            try:
-                if body == CelestialBody.KETU:
-                    res = _calc(swe.MEAN_NODE, calc_flags)
-                    longitude = (res[0][0] + 180) % 360
-                    latitude = -res[0][1]
-                    distance = res[0][2]
-                    speed = -res[0][3]
-                else:
-                    res = _calc(planet_id, calc_flags)
-                    longitude = res[0][0]
-                    latitude = res[0][1]
-                    distance = res[0][2]
-                    speed = res[0][3]
-            except Exception:
-                # Fallback to Moshier ephemeris if Swiss ephemeris files are unavailable
-                fallback_flags = (
-                    (swe.FLG_TOPOCENTRIC | swe.FLG_MOSEPH | swe.FLG_SIDEREAL)
-                    if self.coordinate_system == CoordinateSystem.TOPOCENTRIC
-                    else (swe.FLG_MOSEPH | swe.FLG_SIDEREAL)
-                )
-                if body == CelestialBody.KETU:
-                    res = _calc(swe.MEAN_NODE, fallback_flags)
-                    longitude = (res[0][0] + 180) % 360
-                    latitude = -res[0][1]
-                    distance = res[0][2]
-                    speed = -res[0][3]
-                else:
-                    res = _calc(planet_id, fallback_flags)
-                    longitude = res[0][0]
-                    latitude = res[0][1]
-                    distance = res[0][2]
-                    speed = res[0][3]
-            
-            # Calculate houses
-            houses = swe.houses(
+            # Calculate houses once for the instant
+            cusps, ascmc = swe.houses(
                 jd,
                 location.latitude,
                 location.longitude,
                 b'P'  # Placidus house system
             )
-            ascendant = houses[1][0]
+            
+            return ChartContext(
+                timestamp=dt,
+                location=location,
+                julian_day=jd,
+                ascendant=ascmc[0],
+                cusps=tuple(cusps)
+            )
+        
+        except AppError:
+            raise
+        except Exception as e:
+            raise AppError(
+                code=ErrorCode.CALCULATION_ERROR,
+                message="Failed to calculate chart context",
+                category=ErrorCategory.BUSINESS_LOGIC,
+                severity=ErrorSeverity.HIGH,
+                details={
+                    "datetime": dt.isoformat(),
+                    "location": location.__dict__,
+                    "error": str(e)
+                }
+            )
+    
+    def calculate_position_from_context(
+        self,
+        body: CelestialBody,
+        context: ChartContext
+    ) -> PlanetaryPosition:
+        """Calculate planetary position from a precomputed chart context"""
+        try:
+            longitude, latitude, distance, speed = self._calc_raw(
+                context,
+                self._get_planet_id(body)
+            )
+            if body == CelestialBody.KETU:
+                # Ketu is the point opposite the mean node
+                longitude = (longitude + 180) % 360
+                latitude = -latitude
+                speed = -speed
             
             return PlanetaryPosition(
                 body=body,
@@ -352,7 +421,7 @@ class AstronomicalCalculator:
                 distance=distance,
                 speed=speed,
                 sign=self._get_zodiac_sign(longitude),
-                house=self._get_house(longitude, ascendant),
+                house=self._get_house(longitude, context.ascendant),
                 is_retrograde=speed < 0
             )
             
@@ -364,26 +433,41 @@ class AstronomicalCalculator:
                 severity=ErrorSeverity.HIGH,
                 details={
                     "body": body,
-                    "datetime": dt.isoformat(),
-                    "location": location.__dict__,
+                    "datetime": context.timestamp.isoformat(),
+                    "location": context.location.__dict__,
                     "error": str(e)
                 }
             )
     
+    def calculate_planet_position(
+        self,
+        body: CelestialBody,
+        dt: datetime,
+        location: GeoLocation
+    ) -> PlanetaryPosition:
+        """Calculate planetary position"""
+        context = self.create_chart_context(dt, location)
+        return self.calculate_position_from_context(body, context)
+    
+    def calculate_positions_from_context(
+        self,
+        context: ChartContext,
+        bodies: Optional[List[CelestialBody]] = None
+    ) -> Dict[CelestialBody, PlanetaryPosition]:
+        """Calculate positions for several bodies sharing one chart context"""
+        return {
+            body: self.calculate_position_from_context(body, context)
+            for body in (bodies or list(CelestialBody))
+        }
+    
     def calculate_all_positions(
         self,
         dt: datetime,
         location: GeoLocation
     ) -> Dict[CelestialBody, PlanetaryPosition]:
         """Calculate positions for all planets"""
-        positions = {}
-        for body in CelestialBody:
-            positions[body] = self.calculate_planet_position(
-                body,
-                dt,
-                location
-            )
-        return positions
+        context = self.create_chart_context(dt, location)
+        return self.calculate_positions_from_context(context)
     
     def calculate_aspects(
         self,
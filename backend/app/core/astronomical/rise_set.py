@@ -0,0 +1,245 @@
+"""
+Batched Rise, Set and Transit Engine
+PGF Protocol: AST_006
+Gate: GATE_15
+Version: 1.0.0
+
+Sun and Moon equatorial coordinates are sampled once on a shared time
+grid and interpolated, so the ephemeris cost depends only on the date
+range, not on the number of locations. Event times for every
+(location, day) pair are then refined together with a vectorized
+hour-angle iteration.
+
+Rise and set use the standard altitude of the body's upper limb with
+atmospheric refraction: -0.8333 deg for the Sun and
+0.7275 * parallax - 0.5667 deg for the Moon. Days are local days: a
+location's day runs from local midnight for its UTC offset, which
+defaults to local mean time (longitude / 15 hours).
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import swisseph as swe
+
+J2000 = 2451545.0
+SIDEREAL_RATE = 360.98564736629  # degrees of Earth rotation per day
+SUN_STANDARD_ALTITUDE = -0.8333
+EARTH_RADIUS_KM = 6378.14
+AU_KM = 149597870.7
+SAMPLES_PER_DAY = 24
+# The Sun's hour angle drifts 1/365 as fast as Earth turns, the Moon's ~1/27,
+# so the fixed-point iteration converges to well under a second in:
+ITERATIONS = {"sun": 4, "moon": 6}
+# Mean interval between successive rises (or sets, transits), in days
+BODY_DAY = {"sun": 1.0, "moon": 1.035}
+
+BODIES = {"sun": swe.SUN, "moon": swe.MOON}
+EVENTS = ("rise", "set", "transit")
+
+# Initial guesses as fractions of the local day
+_GUESSES = {"rise": 0.25, "set": 0.75, "transit": 0.5}
+
+
+@dataclass
+class BodyTrack:
+    """Equatorial coordinates of one body on a regular UT grid"""
+    jd: np.ndarray
+    # Right ascension unwrapped to be continuous, in degrees
+    ra: np.ndarray
+    dec: np.ndarray
+    # Standard altitude of the upper limb including refraction
+    altitude: np.ndarray
+    samples_per_day: int
+
+    @classmethod
+    def sample(cls, body: str, start_jd: float, end_jd: float, samples_per_day: int = SAMPLES_PER_DAY) -> "BodyTrack":
+        """Sample a body from start_jd to end_jd inclusive"""
+        count = int(np.ceil((end_jd - start_jd) * samples_per_day)) + 1
+        jd = start_jd + np.arange(count) / samples_per_day
+        flags = swe.FLG_SWIEPH | swe.FLG_EQUATORIAL
+        coords = np.array([swe.calc_ut(t, BODIES[body], flags)[0][:3] for t in jd])
+        ra = np.degrees(np.unwrap(np.radians(coords[:, 0])))
+        if body == "moon":
+            parallax = np.degrees(np.arcsin(EARTH_RADIUS_KM / (coords[:, 2] * AU_KM)))
+            altitude = 0.7275 * parallax - 0.5667
+        else:
+            altitude = np.full(count, SUN_STANDARD_ALTITUDE)
+        return cls(jd=jd, ra=ra, dec=coords[:, 1], altitude=altitude, samples_per_day=samples_per_day)
+
+    def at(self, jd: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Linearly interpolated (ra, dec, altitude) at arbitrary instants"""
+        # The grid is regular, so the bracketing sample is found arithmetically
+        position = (jd - self.jd[0]) * self.samples_per_day
+        index = np.clip(position.astype(np.intp), 0, len(self.jd) - 2)
+        weight = position - index
+        return tuple(
+            values[index] + weight * (values[index + 1] - values[index])
+            for values in (self.ra, self.dec, self.altitude)
+        )
+
+
+def julian_day(day: date) -> float:
+    """UT Julian day at 0h UT of a calendar date"""
+    return swe.julday(day.year, day.month, day.day, 0.0)
+
+
+def sidereal_degrees(jd: np.ndarray) -> np.ndarray:
+    """Greenwich mean sidereal time in degrees (IAU 1982, to ~0.1 s)"""
+    return 280.46061837 + SIDEREAL_RATE * (jd - J2000)
+
+
+def _wrap(angle: np.ndarray) -> np.ndarray:
+    """Angles folded into [-180, 180]"""
+    return angle - 360.0 * np.round(angle / 360.0)
+
+
+def to_datetime64(jd: np.ndarray) -> np.ndarray:
+    """UT Julian days as datetime64[s]; NaN becomes NaT"""
+    seconds = np.round((jd - J2000) * 86400.0)
+    result = np.full(jd.shape, np.datetime64("NaT"), dtype="datetime64[s]")
+    valid = ~np.isnan(seconds)
+    result[valid] = np.datetime64("2000-01-01T12:00:00", "s") + seconds[valid].astype("timedelta64[s]")
+    return result
+
+
+class RiseSetEngine:
+    """Rise, set and transit times for a grid of locations and days"""
+
+    def __init__(self, samples_per_day: int = SAMPLES_PER_DAY):
+        """Initialize the engine
+
+        Args:
+            samples_per_day: Ephemeris samples per day for interpolation;
+                hourly keeps the Moon's interpolation error to seconds
+        """
+        self.samples_per_day = samples_per_day
+
+    def compute(
+        self,
+        latitudes: Sequence[float],
+        longitudes: Sequence[float],
+        start: date,
+        days: int,
+        bodies: Sequence[str] = ("sun", "moon"),
+        utc_offsets: Optional[Sequence[Optional[float]]] = None
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        """Compute events for every location and day
+
+        Args:
+            latitudes: Degrees north, one per location
+            longitudes: Degrees east, one per location
+            start: First local date
+            days: Number of consecutive dates
+            bodies: Subset of "sun" and "moon"
+            utc_offsets: Hours east of UTC per location; None entries use
+                local mean time
+
+        Returns:
+            {body: {event: UT Julian days}} with arrays shaped
+            (locations, days) and NaN where the event does not occur
+            on that local day
+        """
+        lat = np.radians(np.asarray(latitudes, dtype=float))[:, None]
+        lon = np.asarray(longitudes, dtype=float)[:, None]
+        if utc_offsets is None:
+            utc_offsets = [None] * len(lon)
+        offsets = np.array(
+            [lo / 15.0 if off is None else off for lo, off in zip(lon[:, 0], utc_offsets)]
+        )[:, None]
+        day_start = julian_day(start) + np.arange(days)[None, :] - offsets / 24.0
+
+        results: Dict[str, Dict[str, np.ndarray]] = {}
+        for body in bodies:
+            # One track per body serves every location
+            track = BodyTrack.sample(
+                body, float(day_start.min()) - 1.0, float(day_start.max()) + 2.0, self.samples_per_day
+            )
+            results[body] = {
+                event: self._solve(track, lat, lon, day_start, body, event)
+                for event in EVENTS
+            }
+        return results
+
+    def _solve(
+        self,
+        track: BodyTrack,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        day_start: np.ndarray,
+        body: str,
+        event: str
+    ) -> np.ndarray:
+        """The event's time within each local day, NaN if none"""
+        lat = np.broadcast_to(lat, day_start.shape)
+        lon = np.broadcast_to(lon, day_start.shape)
+        iterations = ITERATIONS[body]
+        t, valid = self._iterate(track, lat, lon, day_start + _GUESSES[event], event, iterations)
+        found = np.where(valid & (t >= day_start) & (t < day_start + 1.0), t, np.nan)
+
+        # A solution outside the day may have its neighbour one body-day
+        # away inside it; only those cells are iterated again
+        retry = np.isnan(found)
+        if retry.any():
+            start = day_start[retry]
+            previous = t[retry]
+            guess = np.where(previous < start + 0.5, previous + BODY_DAY[body], previous - BODY_DAY[body])
+            t, valid = self._iterate(track, lat[retry], lon[retry], guess, event, iterations)
+            found[retry] = np.where(valid & (t >= start) & (t < start + 1.0), t, np.nan)
+        return found
+
+    @staticmethod
+    def _iterate(
+        track: BodyTrack,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        t: np.ndarray,
+        event: str,
+        iterations: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Refine instants where the hour angle reaches the event's target"""
+        valid = np.ones(t.shape, dtype=bool)
+        if event != "transit":
+            sin_lat, cos_lat = np.sin(lat), np.cos(lat)
+        for _ in range(iterations):
+            ra, dec, altitude = track.at(t)
+            hour_angle = sidereal_degrees(t) + lon - ra
+            if event == "transit":
+                target = 0.0
+            else:
+                dec_rad = np.radians(dec)
+                cos_h0 = (np.sin(np.radians(altitude)) - sin_lat * np.sin(dec_rad)) / (
+                    cos_lat * np.cos(dec_rad)
+                )
+                # |cos H0| > 1: circumpolar or never above the horizon
+                valid = np.abs(cos_h0) <= 1.0
+                h0 = np.degrees(np.arccos(np.clip(cos_h0, -1.0, 1.0)))
+                target = -h0 if event == "rise" else h0
+            t = t + _wrap(target - hour_angle) / SIDEREAL_RATE
+        return t, valid
+
+
+def format_events(jd: np.ndarray) -> List[List[Optional[str]]]:
+    """ISO-8601 UTC strings per row, None where the event does not occur"""
+    text = np.datetime_as_string(to_datetime64(jd), unit="s")
+    return [
+        [None if value == "NaT" else value + "Z" for value in row]
+        for row in text.tolist()
+    ]
+
+
+def single_day(
+    latitude: float,
+    longitude: float,
+    day: date,
+    body: str = "sun"
+) -> Dict[str, Optional[datetime]]:
+    """Events of one body for one location and local mean day, as naive UTC"""
+    events = RiseSetEngine().compute([latitude], [longitude], day, 1, bodies=(body,))[body]
+    result = {}
+    for event, values in events.items():
+        value = to_datetime64(values)[0, 0]
+        result[event] = None if np.isnat(value) else value.astype(datetime).replace(tzinfo=None)
+    return result
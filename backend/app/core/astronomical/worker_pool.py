@@ -0,0 +1,364 @@
+"""
+Ephemeris Worker Pool
+PGF Protocol: AST_004
+Gate: GATE_15
+Version: 1.0.0
+
+swe.set_sid_mode and swe.set_topo configure process-global state, so two
+requests with different ayanamsas (or topocentric locations) must never
+share an ephemeris at the same time. Requests are routed by
+(ayanamsa, coordinate system) to a dedicated process pool whose workers
+are configured once at start-up, and results are awaited from the event
+loop instead of blocking it.
+"""
+import asyncio
+import logging
+import multiprocessing
+import threading
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+
+import swisseph as swe
+
+from ..calculations.houses import HouseCalculator
+from .chebyshev import ChebyshevEphemeris
+from .framework import (
+    AstronomicalCalculator,
+    AyanamsaSystem,
+    CelestialBody,
+    CoordinateSystem,
+    GeoLocation,
+    PlanetaryPosition,
+)
+
+logger = logging.getLogger(__name__)
+
+PoolKey = Tuple[AyanamsaSystem, CoordinateSystem]
+
+# Picklable module-level function applied to each result inside the worker:
+# transform(request, result, arg) -> picklable value
+Transform = Callable[["EphemerisRequest", "EphemerisResult", Any], Any]
+
+
+@dataclass
+class EphemerisRequest:
+    """One chart instant to calculate"""
+    timestamp: datetime
+    location: GeoLocation
+    ayanamsa: AyanamsaSystem = AyanamsaSystem.LAHIRI
+    coordinate_system: CoordinateSystem = CoordinateSystem.GEOCENTRIC
+    house_system: str = "PLACIDUS"
+
+    @property
+    def key(self) -> PoolKey:
+        return (self.ayanamsa, self.coordinate_system)
+
+
+@dataclass
+class EphemerisResult:
+    """Everything in a chart that depends on Swiss Ephemeris state"""
+    positions: Dict[CelestialBody, PlanetaryPosition]
+    houses: Dict[str, Any]
+    ayanamsa: float
+    julian_day: float
+
+
+# Per-process worker state. A pool worker serves exactly one PoolKey for its
+# whole lifetime; the inline executor keeps one calculator per key.
+_calculators: Dict[PoolKey, AstronomicalCalculator] = {}
+_house_calc: Optional[HouseCalculator] = None
+_tables: Dict[str, ChebyshevEphemeris] = {}
+
+
+def _configure(
+    ayanamsa: AyanamsaSystem,
+    coordinate_system: CoordinateSystem,
+    table_path: Optional[str] = None
+) -> AstronomicalCalculator:
+    """Configure this process' ephemeris for a routing key"""
+    global _house_calc
+    key = (ayanamsa, coordinate_system)
+    calculator = _calculators.get(key)
+    if calculator is None:
+        calculator = AstronomicalCalculator(
+            coordinate_system=coordinate_system,
+            ayanamsa_system=ayanamsa
+        )
+        if table_path:
+            if table_path not in _tables:
+                _tables[table_path] = ChebyshevEphemeris.load(table_path)
+            table = _tables[table_path]
+            if table.matches(calculator.get_sid_mode(), calculator._get_calc_flags(swe.FLG_SWIEPH)):
+                calculator.position_provider = table
+        _calculators[key] = calculator
+    else:
+        calculator._setup_ephemeris()
+    if _house_calc is None:
+        _house_calc = HouseCalculator()
+    return calculator
+
+
+def _init_worker(
+    ayanamsa: AyanamsaSystem,
+    coordinate_system: CoordinateSystem,
+    table_path: Optional[str] = None
+) -> None:
+    """Process pool initializer"""
+    _configure(ayanamsa, coordinate_system, table_path)
+
+
+def _compute(calculator: AstronomicalCalculator, request: EphemerisRequest) -> EphemerisResult:
+    context = calculator.create_chart_context(request.timestamp, request.location)
+    positions = calculator.calculate_positions_from_context(context)
+    houses = _house_calc.calculate_houses(
+        request.timestamp,
+        request.location.latitude,
+        request.location.longitude,
+        request.house_system
+    )
+    return EphemerisResult(
+        positions=positions,
+        houses=houses,
+        ayanamsa=float(swe.get_ayanamsa_ut(context.julian_day)),
+        julian_day=context.julian_day
+    )
+
+
+def _run(
+    calculator: AstronomicalCalculator,
+    requests: List[EphemerisRequest],
+    transform: Optional[Transform],
+    transform_args: Optional[List[Any]]
+) -> List[Any]:
+    if transform is None:
+        return [_compute(calculator, request) for request in requests]
+    # Transformed batches report failures per request instead of failing the chunk
+    results: List[Any] = []
+    for i, request in enumerate(requests):
+        try:
+            arg = transform_args[i] if transform_args is not None else None
+            results.append(transform(request, _compute(calculator, request), arg))
+        except Exception as exc:
+            results.append(exc)
+    return results
+
+
+def _compute_batch(
+    key: PoolKey,
+    requests: List[EphemerisRequest],
+    table_path: Optional[str] = None,
+    transform: Optional[Transform] = None,
+    transform_args: Optional[List[Any]] = None
+) -> List[Any]:
+    """Run in a pool worker already configured for key"""
+    calculator = _calculators.get(key) or _configure(*key, table_path)
+    return _run(calculator, requests, transform, transform_args)
+
+
+def _compute_batch_inline(
+    key: PoolKey,
+    requests: List[EphemerisRequest],
+    table_path: Optional[str] = None,
+    transform: Optional[Transform] = None,
+    transform_args: Optional[List[Any]] = None
+) -> List[Any]:
+    """Run on the shared inline thread, reconfiguring the global ephemeris first"""
+    calculator = _configure(*key, table_path)
+    return _run(calculator, requests, transform, transform_args)
+
+
+class EphemerisWorkerPool:
+    """Routes ephemeris work to per-(ayanamsa, coordinate system) process pools"""
+
+    def __init__(
+        self,
+        workers_per_config: int = 1,
+        max_batch_size: int = 64,
+        table_path: Optional[str] = None
+    ):
+        """Initialize the pool
+
+        Args:
+            workers_per_config: Worker processes per routing key. 0 runs all
+                work serially on one background thread in this process,
+                which keeps swe state consistent without extra processes.
+            max_batch_size: Maximum requests shipped to a worker per task
+            table_path: Optional Chebyshev ephemeris table used by workers
+                whose configuration matches it
+        """
+        self.workers_per_config = max(0, workers_per_config)
+        self.max_batch_size = max(1, max_batch_size)
+        self.table_path = table_path
+        self._executors: Dict[PoolKey, Executor] = {}
+        self._inline_executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def inline(self) -> bool:
+        return self.workers_per_config == 0
+
+    def _get_executor(self, key: PoolKey) -> Executor:
+        with self._lock:
+            if self.inline:
+                if self._inline_executor is None:
+                    self._inline_executor = ThreadPoolExecutor(
+                        max_workers=1,
+                        thread_name_prefix="ephemeris"
+                    )
+                return self._inline_executor
+
+            executor = self._executors.get(key)
+            if executor is None:
+                # spawn: workers must not inherit the parent's event loop or threads
+                executor = ProcessPoolExecutor(
+                    max_workers=self.workers_per_config,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=key + (self.table_path,)
+                )
+                self._executors[key] = executor
+                logger.info(
+                    "Started ephemeris pool for %s/%s with %d workers",
+                    key[0].value, key[1].value, self.workers_per_config
+                )
+            return executor
+
+    async def _submit(
+        self,
+        key: PoolKey,
+        requests: List[EphemerisRequest],
+        transform: Optional[Transform] = None,
+        transform_args: Optional[List[Any]] = None
+    ) -> List[Any]:
+        loop = asyncio.get_running_loop()
+        func = _compute_batch_inline if self.inline else _compute_batch
+        return await loop.run_in_executor(
+            self._get_executor(key), func, key, requests, self.table_path,
+            transform, transform_args
+        )
+
+    def _chunks(self, requests: Sequence[EphemerisRequest]) -> List[Tuple[PoolKey, List[int]]]:
+        """Split request indexes into per-key chunks of at most max_batch_size"""
+        grouped: Dict[PoolKey, List[int]] = defaultdict(list)
+        for index, request in enumerate(requests):
+            grouped[request.key].append(index)
+        return [
+            (key, indexes[start:start + self.max_batch_size])
+            for key, indexes in grouped.items()
+            for start in range(0, len(indexes), self.max_batch_size)
+        ]
+
+    async def calculate(
+        self,
+        timestamp: datetime,
+        location: GeoLocation,
+        ayanamsa: AyanamsaSystem = AyanamsaSystem.LAHIRI,
+        coordinate_system: CoordinateSystem = CoordinateSystem.GEOCENTRIC,
+        house_system: str = "PLACIDUS"
+    ) -> EphemerisResult:
+        """Calculate positions, houses and ayanamsa for one chart"""
+        request = EphemerisRequest(
+            timestamp=timestamp,
+            location=location,
+            ayanamsa=ayanamsa,
+            coordinate_system=coordinate_system,
+            house_system=house_system
+        )
+        results = await self._submit(request.key, [request])
+        return results[0]
+
+    async def calculate_transformed(
+        self,
+        request: EphemerisRequest,
+        transform: Transform,
+        transform_arg: Any = None
+    ) -> Any:
+        """Calculate one chart and transform it inside the worker
+
+        Raises:
+            Whatever the calculation or the transform raised
+        """
+        result = (await self._submit(request.key, [request], transform, [transform_arg]))[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def calculate_many(self, requests: Sequence[EphemerisRequest]) -> List[EphemerisResult]:
+        """Calculate many charts, batched by routing key
+
+        Returns:
+            Results in the same order as requests
+        """
+        chunks = self._chunks(requests)
+        tasks = [self._submit(key, [requests[i] for i in chunk]) for key, chunk in chunks]
+
+        results: List[Optional[EphemerisResult]] = [None] * len(requests)
+        for (_, chunk), chunk_results in zip(chunks, await asyncio.gather(*tasks)):
+            for index, result in zip(chunk, chunk_results):
+                results[index] = result
+        return results
+
+    async def iter_many(
+        self,
+        requests: Sequence[EphemerisRequest],
+        transform: Transform,
+        transform_args: Optional[Sequence[Any]] = None,
+        max_in_flight: Optional[int] = None
+    ) -> AsyncIterator[List[Tuple[int, Any]]]:
+        """Calculate and transform many charts, yielding chunks as they complete
+
+        The transform runs inside the worker, so CPU-heavy post-processing
+        is spread across processes and only its (small) result is shipped back.
+
+        Args:
+            requests: Charts to calculate
+            transform: Picklable module-level function, see Transform
+            transform_args: Optional per-request argument passed to transform
+            max_in_flight: Chunks submitted at once, defaults to two per worker
+                of every routing key involved
+
+        Yields:
+            Lists of (request index, transformed value or the exception raised)
+        """
+        chunks = self._chunks(requests)
+        if max_in_flight is None:
+            keys = {key for key, _ in chunks}
+            max_in_flight = 2 * max(1, self.workers_per_config) * max(1, len(keys))
+
+        async def run(chunk_key: PoolKey, chunk: List[int]) -> List[Tuple[int, Any]]:
+            args = [transform_args[i] for i in chunk] if transform_args is not None else None
+            values = await self._submit(
+                chunk_key, [requests[i] for i in chunk], transform, args
+            )
+            return list(zip(chunk, values))
+
+        pending = set()
+        remaining = iter(chunks)
+        try:
+            while True:
+                for chunk_key, chunk in remaining:
+                    pending.add(asyncio.ensure_future(run(chunk_key, chunk)))
+                    if len(pending) >= max_in_flight:
+                        break
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down all worker pools"""
+        with self._lock:
+            executors = list(self._executors.values())
+            if self._inline_executor is not None:
+                executors.append(self._inline_executor)
+            self._executors.clear()
+            self._inline_executor = None
+        for executor in executors:
+            executor.shutdown(wait=wait)
@@ -0,0 +1,108 @@
+"""Micro-benchmark for in-memory cache insert cost at capacity.
+
+Each cache is filled to its maximum size, then timed while every further
+insert forces an eviction. With constant-time eviction the per-insert cost
+stays flat as the cache grows.
+
+Run with: python -m app.core.benchmarks.cache_benchmark
+"""
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Sequence
+
+from app.core.cache.calculation_cache import CalculationCache
+from app.core.caching.advanced_cache import AdvancedCache
+from app.core.caching.engine import CacheBackend, CacheConfig, CacheEngine, CacheStrategy
+
+
+@dataclass
+class InsertBenchmarkResult:
+    """Per-insert cost of one cache configuration at one size."""
+    cache: str
+    size: int
+    inserts: int
+    us_per_insert: float
+
+
+def _engine_inserter(strategy: CacheStrategy, size: int) -> Callable[[List[str]], None]:
+    engine = CacheEngine(CacheConfig(
+        backend=CacheBackend.MEMORY,
+        strategy=strategy,
+        ttl=3600,
+        max_size=size,
+    ))
+
+    async def insert(keys: List[str]) -> None:
+        for key in keys:
+            await engine.set(key, key)
+
+    return lambda keys: asyncio.run(insert(keys))
+
+
+def _advanced_inserter(policy: str, size: int) -> Callable[[List[str]], None]:
+    cache = AdvancedCache(max_size=size, max_memory_mb=1024.0, eviction_policy=policy)
+
+    async def insert(keys: List[str]) -> None:
+        for key in keys:
+            await cache.put(key, key)
+
+    return lambda keys: asyncio.run(insert(keys))
+
+
+def _calculation_inserter(size: int) -> Callable[[List[str]], None]:
+    cache = CalculationCache(max_size=size)
+
+    def insert(keys: List[str]) -> None:
+        for key in keys:
+            cache.set(key, key)
+
+    return insert
+
+
+CACHES: Dict[str, Callable[[int], Callable[[List[str]], None]]] = {
+    "CacheEngine[lru]": lambda size: _engine_inserter(CacheStrategy.LRU, size),
+    "CacheEngine[lfu]": lambda size: _engine_inserter(CacheStrategy.LFU, size),
+    "CacheEngine[ttl]": lambda size: _engine_inserter(CacheStrategy.TTL, size),
+    "AdvancedCache[lru]": lambda size: _advanced_inserter("lru", size),
+    "AdvancedCache[lfu]": lambda size: _advanced_inserter("lfu", size),
+    "AdvancedCache[adaptive]": lambda size: _advanced_inserter("adaptive", size),
+    "CalculationCache": _calculation_inserter,
+}
+
+
+def run_insert_benchmark(
+    sizes: Sequence[int] = (1_000, 10_000, 100_000),
+    inserts: int = 10_000,
+    caches: Sequence[str] = tuple(CACHES),
+) -> List[InsertBenchmarkResult]:
+    """Measure per-insert cost of each cache when full.
+
+    Args:
+        sizes: Cache capacities to test
+        inserts: Timed inserts per capacity, each evicting one entry
+        caches: Names from CACHES to benchmark
+
+    Returns:
+        One result per cache and size
+    """
+    results = []
+    for name in caches:
+        for size in sizes:
+            insert = CACHES[name](size)
+            insert([f"fill:{i}" for i in range(size)])
+            keys = [f"new:{i}" for i in range(inserts)]
+            start = time.perf_counter()
+            insert(keys)
+            elapsed = time.perf_counter() - start
+            results.append(InsertBenchmarkResult(name, size, inserts, elapsed / inserts * 1e6))
+    return results
+
+
+def main() -> None:
+    for result in run_insert_benchmark():
+        print(f"{result.cache:<26} size={result.size:>7}  {result.us_per_insert:8.2f} us/insert")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Micro-benchmark for whole-chart house analysis.
+
+Times the per-house path (12 awaited analyze_house calls, each given its
+occupants, aspects and all house lords) against one analyze_chart call
+that builds the occupant, aspect and lordship indexes once per chart.
+
+Run with: python -m app.core.benchmarks.house_analysis_benchmark
+"""
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+from app.core.calculations.house_analysis import EnhancedHouseAnalysisEngine
+
+# Natural zodiac lordship, house 1 = Aries
+NATURAL_LORDS = {
+    1: "Mars", 2: "Venus", 3: "Mercury", 4: "Moon",
+    5: "Sun", 6: "Mercury", 7: "Venus", 8: "Mars",
+    9: "Jupiter", 10: "Saturn", 11: "Saturn", 12: "Jupiter"
+}
+
+SAMPLE_PLANETS: Dict[str, Dict[str, Any]] = {
+    "Sun": {"house": 1, "strength": 70, "dignity": "own"},
+    "Moon": {"house": 4, "strength": 60, "dignity": "friend"},
+    "Mars": {"house": 1, "strength": 55, "dignity": "enemy", "is_retrograde": True},
+    "Mercury": {"house": 2, "strength": 65},
+    "Jupiter": {"house": 5, "strength": 80, "dignity": "exalted"},
+    "Venus": {"house": 7, "strength": 62},
+    "Saturn": {"house": 10, "strength": 45, "dignity": "debilitated"},
+}
+
+
+@dataclass
+class HouseBenchmarkResult:
+    """Per-chart cost of one analysis path."""
+    path: str
+    charts: int
+    us_per_chart: float
+
+
+def sample_chart() -> Dict[str, Any]:
+    """Planets, aspects to houses and house lords of a fixed chart."""
+    lords = {
+        house: {
+            "planet": planet,
+            "house": SAMPLE_PLANETS[planet]["house"],
+            "strength": SAMPLE_PLANETS[planet]["strength"],
+        }
+        for house, planet in NATURAL_LORDS.items()
+    }
+    # Trines and oppositions from every planet to the houses it aspects
+    aspects = [
+        {"house": house, "planet": name, "strength": planet["strength"], "type": kind, "is_applying": True}
+        for name, planet in SAMPLE_PLANETS.items()
+        for offset, kind in ((4, "trine"), (6, "opposition"), (8, "trine"))
+        for house in [(planet["house"] + offset - 1) % 12 + 1]
+    ]
+    return {"planets": SAMPLE_PLANETS, "aspects": aspects, "lords": lords}
+
+
+async def _per_house(engine: EnhancedHouseAnalysisEngine, chart: Dict[str, Any]) -> None:
+    for house in range(1, 13):
+        occupants = [
+            {"name": name, **planet}
+            for name, planet in chart["planets"].items()
+            if planet["house"] == house
+        ]
+        aspects = [aspect for aspect in chart["aspects"] if aspect["house"] == house]
+        await engine.analyze_house(
+            house, occupants, aspects, chart["lords"][house], "day", chart["lords"]
+        )
+
+
+def run_house_benchmark(charts: int = 1_000) -> List[HouseBenchmarkResult]:
+    """Measure per-chart cost of both analysis paths.
+
+    Args:
+        charts: Charts analysed per path
+
+    Returns:
+        One result per path
+    """
+    engine = EnhancedHouseAnalysisEngine()
+    chart = sample_chart()
+
+    async def per_house() -> None:
+        for _ in range(charts):
+            await _per_house(engine, chart)
+
+    start = time.perf_counter()
+    asyncio.run(per_house())
+    per_house_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(charts):
+        engine.analyze_chart(chart["planets"], chart["aspects"], chart["lords"])
+    chart_elapsed = time.perf_counter() - start
+
+    return [
+        HouseBenchmarkResult("analyze_house x12", charts, per_house_elapsed / charts * 1e6),
+        HouseBenchmarkResult("analyze_chart", charts, chart_elapsed / charts * 1e6),
+    ]
+
+
+def main() -> None:
+    for result in run_house_benchmark():
+        print(f"{result.path:<20} {result.us_per_chart:8.2f} us/chart")
+
+
+if __name__ == "__main__":
+    main()
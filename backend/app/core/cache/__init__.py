@@ -2,6 +2,9 @@
 from typing import Optional
 import redis
 from .calculation_cache import CalculationCache
+from .chart_cache import AsyncRedisCache, chart_cache_key
+from .tiered_cache import L1Cache, NegativeCacheHit, TieredCache
+from ..config import settings
 
 class RedisCache:
     """Redis cache implementation"""
@@ -56,3 +59,11 @@ class RedisCache:
 # Global cache instances
 calculation_cache = CalculationCache()
 redis_cache = RedisCache()
+chart_cache = TieredCache(
+    L1Cache(
+        max_bytes=settings.CHART_L1_CACHE_MAX_BYTES,
+        ttl=settings.CHART_L1_CACHE_TTL_SECONDS,
+    ),
+    AsyncRedisCache.from_settings(settings),
+    negative_ttl=settings.CHART_NEGATIVE_CACHE_TTL_SECONDS,
+)
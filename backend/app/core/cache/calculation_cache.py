@@ -1,13 +1,14 @@
 """Cache implementation for astronomical calculations."""
 import hashlib
 import json
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Optional
 from threading import RLock
 
 
 class CalculationCache:
-    """Thread-safe cache for astronomical calculations."""
+    """Thread-safe LRU cache for astronomical calculations."""
 
     def __init__(self, max_size: int = 1000):
         """Initialize cache with size limit.
@@ -15,7 +16,8 @@ class CalculationCache:
         Args:
             max_size: Maximum number of items to store in cache
         """
-        self._cache: Dict[str, Any] = {}
+        # Ordered from least to most recently used
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
         self._max_size = max_size
         self._lock = RLock()
 
@@ -50,7 +52,10 @@ class CalculationCache:
             Cached value if found, None otherwise
         """
         with self._lock:
-            return self._cache.get(key)
+            value = self._cache.get(key)
+            if value is not None:
+                self._cache.move_to_end(key)
+            return value
 
     def set(self, key: str, value: Any) -> None:
         """Set a value in the cache.
@@ -60,10 +65,11 @@ class CalculationCache:
             value: Value to cache
         """
         with self._lock:
-            # Evict oldest entry if cache is full
-            if len(self._cache) >= self._max_size:
-                # Remove first item (oldest)
-                self._cache.pop(next(iter(self._cache)))
+            if key in self._cache:
+                self._cache.move_to_end(key)
+            elif len(self._cache) >= self._max_size:
+                # Evict the least recently used entry
+                self._cache.popitem(last=False)
             
             self._cache[key] = value
 
@@ -0,0 +1,271 @@
+"""
+Async Chart Cache
+PGF Protocol: CACHE_002
+Gate: GATE_4
+Version: 1.0.0
+
+Non-blocking Redis cache for chart responses. Keys are canonical so that
+requests for the same chart resolve to one entry, and concurrent misses
+on a key are coalesced so the chart is computed once.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Sequence, Union
+
+import redis
+import redis.asyncio as aioredis
+
+CacheValue = Union[bytes, str]
+
+KEY_VERSION = "v1"
+
+
+def quantize_coordinate(value: Any, decimals: int) -> float:
+    """Round a coordinate to a fixed number of decimal places"""
+    # Adding 0.0 folds -0.0 into 0.0 so both map to the same key
+    return round(float(value), decimals) + 0.0
+
+
+def normalize_instant(value: datetime) -> datetime:
+    """Normalize a timestamp to a whole-second UTC instant
+
+    Naive datetimes are treated as UTC, matching the ephemeris calculations.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.replace(microsecond=0)
+
+
+def _enum_name(value: Any) -> str:
+    return str(getattr(value, "name", value)).upper()
+
+
+def chart_cache_key(
+    date_time: datetime,
+    latitude: Any,
+    longitude: Any,
+    altitude: Any,
+    ayanamsa: Any,
+    house_system: Any,
+    divisions: Iterable[int] = (),
+    mode: str = "standard",
+    coord_decimals: int = 4
+) -> str:
+    """Build the canonical cache key for a chart request
+
+    Args:
+        date_time: Birth instant, aware or naive UTC
+        latitude: Latitude in degrees
+        longitude: Longitude in degrees
+        altitude: Altitude in meters
+        ayanamsa: Resolved ayanamsa system (enum or name)
+        house_system: Resolved house system (enum or name)
+        divisions: Requested divisional charts
+        mode: Response mode the cached body was serialized for
+        coord_decimals: Decimal places kept for coordinates
+
+    Returns:
+        Cache key string
+    """
+    instant = normalize_instant(date_time).strftime("%Y-%m-%dT%H:%M:%SZ")
+    lat = quantize_coordinate(latitude, coord_decimals)
+    lon = quantize_coordinate(longitude, coord_decimals)
+    alt = quantize_coordinate(altitude, 0)
+    divs = ",".join(str(d) for d in sorted(set(int(d) for d in divisions)))
+    return (
+        f"chart:{KEY_VERSION}:{mode}:{instant}"
+        f":{lat:.{coord_decimals}f}:{lon:.{coord_decimals}f}:{alt:.0f}"
+        f":{_enum_name(ayanamsa)}:{_enum_name(house_system)}:{divs}"
+    )
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into one execution"""
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Callers still waiting on each running call
+        self._waiters: Dict[asyncio.Task, int] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fn for key, or wait for the call already running for it
+
+        The call runs in its own task, so cancelling any one caller (the
+        one that started it included) leaves the others waiting on it; it
+        is cancelled only once every caller has gone. The result or
+        exception is shared with every waiter; nothing is remembered once
+        it completes.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            self._waiters[task] = 0
+            task.add_done_callback(lambda done: self._finish(key, done))
+
+        self._waiters[task] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if not task.done():
+                self._waiters[task] -= 1
+                if not self._waiters[task]:
+                    task.cancel()
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        self._waiters.pop(task, None)
+        # Mark retrieved so a call without waiters does not log a warning
+        if not task.cancelled():
+            task.exception()
+
+
+class AsyncRedisCache:
+    """Pooled asyncio Redis cache with single-flight computation
+
+    Redis errors are swallowed and treated as misses so the service keeps
+    working without a cache.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        ssl: bool = False,
+        timeout: float = 5,
+        max_connections: int = 20,
+        default_expire: int = 3600,
+        client: Optional[Any] = None
+    ):
+        """Initialize the cache
+
+        Args:
+            host, port, db, username, password, ssl: Redis connection options
+            timeout: Socket and connect timeout in seconds
+            max_connections: Size of the connection pool
+            default_expire: Expiry in seconds when set() gets none
+            client: Pre-built asyncio Redis client, e.g. a fake in tests
+        """
+        self.default_expire = default_expire
+        self._flight = SingleFlight()
+        if client is not None:
+            self._client = client
+            return
+        pool_kwargs: Dict[str, Any] = dict(
+            host=host,
+            port=port,
+            db=db,
+            username=username,
+            password=password,
+            socket_timeout=timeout,
+            socket_connect_timeout=timeout,
+            max_connections=max_connections,
+        )
+        if ssl:
+            pool_kwargs["connection_class"] = aioredis.SSLConnection
+        self._client = aioredis.Redis(connection_pool=aioredis.ConnectionPool(**pool_kwargs))
+
+    @property
+    def client(self) -> Any:
+        """The underlying asyncio Redis client, for sharing its pool"""
+        return self._client
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "AsyncRedisCache":
+        """Create a cache from application settings"""
+        return cls(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            username=settings.REDIS_USERNAME,
+            password=settings.REDIS_PASSWORD,
+            ssl=settings.REDIS_SSL,
+            timeout=settings.REDIS_TIMEOUT,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            default_expire=settings.REDIS_CACHE_EXPIRE_SECONDS,
+        )
+
+    async def get(self, key: str) -> Optional[CacheValue]:
+        """Get a value, or None on a miss or Redis error"""
+        try:
+            return await self._client.get(key)
+        except (redis.RedisError, OSError):
+            return None
+
+    async def set(self, key: str, value: CacheValue, expire: Optional[int] = None) -> bool:
+        """Set a value with expiry, returning False on Redis error"""
+        try:
+            return bool(await self._client.set(key, value, ex=expire or self.default_expire))
+        except (redis.RedisError, OSError):
+            return False
+
+    async def get_many(self, keys: Sequence[str]) -> Dict[str, CacheValue]:
+        """Get several values in one round trip, returning only the hits"""
+        if not keys:
+            return {}
+        try:
+            values = await self._client.mget(list(keys))
+        except (redis.RedisError, OSError):
+            return {}
+        return {key: value for key, value in zip(keys, values) if value is not None}
+
+    async def set_many(self, items: Dict[str, CacheValue], expire: Optional[int] = None) -> bool:
+        """Set several values with one pipelined round trip"""
+        if not items:
+            return True
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(key, value, ex=expire or self.default_expire)
+                await pipe.execute()
+            return True
+        except (redis.RedisError, OSError):
+            return False
+
+    async def delete(self, key: str) -> bool:
+        """Delete a key, returning False if absent or on Redis error"""
+        try:
+            return bool(await self._client.delete(key))
+        except (redis.RedisError, OSError):
+            return False
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[CacheValue]],
+        expire: Optional[int] = None
+    ) -> CacheValue:
+        """Return the cached value, computing and storing it on a miss
+
+        Concurrent callers on the same key share one lookup and at most
+        one computation.
+
+        Args:
+            key: Cache key
+            compute: Coroutine factory producing the value to cache
+            expire: Expiry in seconds
+
+        Returns:
+            Cached or freshly computed value
+        """
+        async def load() -> CacheValue:
+            cached = await self.get(key)
+            if cached is not None:
+                return cached
+            value = await compute()
+            await self.set(key, value, expire)
+            return value
+
+        return await self._flight.do(key, load)
+
+    async def close(self) -> None:
+        """Close the client and its connection pool"""
+        try:
+            await self._client.aclose()
+        except (redis.RedisError, OSError, AttributeError):
+            pass
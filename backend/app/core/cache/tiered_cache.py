@@ -0,0 +1,294 @@
+"""
+Tiered Chart Cache
+PGF Protocol: CACHE_004
+Gate: GATE_4
+Version: 1.0.0
+
+Per-process L1 bounded by bytes in front of the shared Redis L2. Reads go
+L1 -> L2 -> compute, promoting L2 hits into L1; writes go through to both
+tiers. Failures for invalid inputs are cached briefly as negative entries.
+"""
+
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import RLock
+from typing import Awaitable, Callable, Dict, Optional, Sequence, Tuple, Type, Union
+
+from .chart_cache import AsyncRedisCache, CacheValue, SingleFlight
+
+NEGATIVE_PREFIX = b"\x00neg:"
+
+
+class NegativeCacheHit(ValueError):
+    """Raised when a key is cached as a known failure"""
+
+
+@dataclass
+class TierStats:
+    """Hit, miss and lookup latency counters for one cache tier"""
+    hits: int = 0
+    misses: int = 0
+    latency_seconds: float = 0.0
+
+    def record(self, hit: bool, started: float) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        self.latency_seconds += time.perf_counter() - started
+
+    def as_dict(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "avg_latency_ms": self.latency_seconds / lookups * 1000 if lookups else 0.0,
+        }
+
+
+class L1Cache:
+    """Thread-safe in-process LRU bounded by total value bytes"""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, ttl: int = 300):
+        """Initialize the cache
+
+        Args:
+            max_bytes: Upper bound on the summed size of keys and values
+            ttl: Default entry lifetime in seconds
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        # key -> (value, size, expires_at), least recently used first
+        self._entries: "OrderedDict[str, Tuple[CacheValue, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = RLock()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheValue]:
+        """Get a live value and mark it recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[2] <= time.monotonic():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: str, value: CacheValue, ttl: Optional[int] = None) -> bool:
+        """Store a value, evicting least recently used entries to fit
+
+        Returns:
+            False if the value alone exceeds max_bytes and was not stored
+        """
+        size = sys.getsizeof(key) + sys.getsizeof(value)
+        with self._lock:
+            self._pop(key)
+            if size > self.max_bytes:
+                return False
+            while self._bytes + size > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+            self._entries[key] = (value, size, time.monotonic() + (ttl or self.ttl))
+            self._bytes += size
+            return True
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _pop(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[1]
+        return True
+
+
+def _is_negative(value: CacheValue) -> bool:
+    if isinstance(value, str):
+        return value.startswith(NEGATIVE_PREFIX.decode())
+    return value.startswith(NEGATIVE_PREFIX)
+
+
+class TieredCache:
+    """L1 (process memory) in front of L2 (Redis) with read/write-through"""
+
+    def __init__(
+        self,
+        l1: L1Cache,
+        l2: AsyncRedisCache,
+        negative_ttl: int = 60
+    ):
+        """Initialize the cache
+
+        Args:
+            l1: Per-process cache
+            l2: Shared Redis cache
+            negative_ttl: Lifetime in seconds of cached failures
+        """
+        self.l1 = l1
+        self.l2 = l2
+        self.negative_ttl = negative_ttl
+        self.l1_stats = TierStats()
+        self.l2_stats = TierStats()
+        self._flight = SingleFlight()
+
+    async def get(self, key: str) -> Optional[CacheValue]:
+        """Read through both tiers, promoting L2 hits into L1
+
+        Raises:
+            NegativeCacheHit: If the key is cached as a failure
+        """
+        value = self._l1_get(key)
+        if value is None:
+            value = await self._l2_get(key)
+        return self._unwrap(value)
+
+    async def set(self, key: str, value: CacheValue, expire: Optional[int] = None) -> bool:
+        """Write through to both tiers"""
+        self.l1.set(key, value)
+        return await self.l2.set(key, value, expire)
+
+    async def get_many(
+        self,
+        keys: Sequence[str]
+    ) -> Dict[str, Union[CacheValue, NegativeCacheHit]]:
+        """Bulk read-through: L1 first, then one L2 round trip for the rest
+
+        Returns:
+            Hits only; negative entries map to a NegativeCacheHit instance
+        """
+        found: Dict[str, CacheValue] = {}
+        missing = []
+        for key in keys:
+            value = self._l1_get(key)
+            if value is None:
+                missing.append(key)
+            else:
+                found[key] = value
+        if missing:
+            started = time.perf_counter()
+            from_l2 = await self.l2.get_many(missing)
+            for key in missing:
+                value = from_l2.get(key)
+                self.l2_stats.record(value is not None, started)
+                started = time.perf_counter()
+                if value is not None:
+                    self._promote(key, value)
+                    found[key] = value
+        results: Dict[str, Union[CacheValue, NegativeCacheHit]] = {}
+        for key, value in found.items():
+            try:
+                results[key] = self._unwrap(value)
+            except NegativeCacheHit as exc:
+                results[key] = exc
+        return results
+
+    async def set_many(self, items: Dict[str, CacheValue], expire: Optional[int] = None) -> bool:
+        """Write several values through to both tiers"""
+        for key, value in items.items():
+            self.l1.set(key, value)
+        return await self.l2.set_many(items, expire)
+
+    async def set_negative(self, key: str, message: str) -> None:
+        """Cache a known failure for negative_ttl seconds in both tiers"""
+        marker = NEGATIVE_PREFIX + message.encode("utf-8")
+        self.l1.set(key, marker, ttl=self.negative_ttl)
+        await self.l2.set(key, marker, self.negative_ttl)
+
+    async def delete(self, key: str) -> bool:
+        """Invalidate a key in both tiers"""
+        in_l1 = self.l1.delete(key)
+        in_l2 = await self.l2.delete(key)
+        return in_l1 or in_l2
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[CacheValue]],
+        expire: Optional[int] = None,
+        negative_errors: Tuple[Type[Exception], ...] = ()
+    ) -> CacheValue:
+        """Return the value from L1, L2 or compute, filling the tiers above
+
+        Concurrent L1 misses on one key share a single L2 lookup and at
+        most one computation.
+
+        Args:
+            key: Cache key
+            compute: Coroutine factory producing the value
+            expire: L2 expiry in seconds
+            negative_errors: Exceptions from compute that mean the input
+                is invalid; they are cached for negative_ttl seconds
+
+        Raises:
+            NegativeCacheHit: If the key is cached as a failure
+        """
+        value = self._l1_get(key)
+        if value is not None:
+            return self._unwrap(value)
+
+        async def load() -> CacheValue:
+            cached = await self._l2_get(key)
+            if cached is not None:
+                return cached
+            try:
+                computed = await compute()
+            except negative_errors as exc:
+                await self.set_negative(key, str(exc))
+                raise
+            await self.set(key, computed, expire)
+            return computed
+
+        return self._unwrap(await self._flight.do(key, load))
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-tier hit/miss/latency counters and L1 occupancy"""
+        l1 = self.l1_stats.as_dict()
+        l1.update(entries=len(self.l1), bytes=self.l1.size_bytes)
+        return {"l1": l1, "l2": self.l2_stats.as_dict()}
+
+    async def close(self) -> None:
+        await self.l2.close()
+
+    def _l1_get(self, key: str) -> Optional[CacheValue]:
+        started = time.perf_counter()
+        value = self.l1.get(key)
+        self.l1_stats.record(value is not None, started)
+        return value
+
+    async def _l2_get(self, key: str) -> Optional[CacheValue]:
+        started = time.perf_counter()
+        value = await self.l2.get(key)
+        self.l2_stats.record(value is not None, started)
+        if value is not None:
+            self._promote(key, value)
+        return value
+
+    def _promote(self, key: str, value: CacheValue) -> None:
+        # Negative entries stay short-lived in L1 as well
+        self.l1.set(key, value, ttl=self.negative_ttl if _is_negative(value) else None)
+
+    @staticmethod
+    def _unwrap(value: Optional[CacheValue]) -> Optional[CacheValue]:
+        if value is not None and _is_negative(value):
+            message = value[len(NEGATIVE_PREFIX):]
+            if isinstance(message, bytes):
+                message = message.decode("utf-8", "replace")
+            raise NegativeCacheHit(message)
+        return value
@@ -7,17 +7,20 @@ Version: 1.0.0
 
 from typing import Dict, List, Optional, Any, Tuple, TypeVar, Generic, Callable
 from dataclasses import dataclass
-import asyncio
+import heapq
+import itertools
 import logging
+import sys
 import time
 import json
 import hashlib
-from datetime import datetime, timedelta
 from functools import wraps
 from collections import OrderedDict
 import threading
 import weakref
 
+from .policies import ExpiryQueue, LFUIndex
+
 T = TypeVar('T')
 
 @dataclass
@@ -31,24 +34,44 @@ class CacheMetrics:
     cache_size: int = 0
 
 class CacheItem(Generic[T]):
-    """Represents a cached item with metadata"""
+    """Represents a cached item with metadata
+
+    Times are time.monotonic() seconds.
+    """
+    __slots__ = (
+        "key", "value", "expiry", "cost", "size",
+        "last_access", "access_count", "creation_time"
+    )
+
     def __init__(
         self,
         key: str,
         value: T,
-        expiry: Optional[datetime] = None,
+        expiry: Optional[float] = None,
         cost: float = 1.0
     ):
+        now = time.monotonic()
         self.key = key
         self.value = value
         self.expiry = expiry
         self.cost = cost
-        self.last_access = datetime.now()
+        self.size = sys.getsizeof(value)
+        self.last_access = now
         self.access_count = 0
-        self.creation_time = datetime.now()
+        self.creation_time = now
 
 class AdvancedCache(Generic[T]):
-    """Advanced caching system with multiple eviction policies"""
+    """Advanced caching system with multiple eviction policies
+
+    Policies are "lru", "lfu", "cost" and "adaptive". Bookkeeping for all
+    of them is kept up to date, so the policy can be switched at runtime.
+    Expired items are swept lazily on put instead of by a background task.
+    """
+    
+    # Expired items removed per put() by the lazy sweep
+    SWEEP_BATCH = 32
+    # Least recently used items scored per adaptive eviction
+    ADAPTIVE_SAMPLE = 16
     
     def __init__(
         self,
@@ -61,37 +84,16 @@ class AdvancedCache(Generic[T]):
         self.max_memory_mb = max_memory_mb
         self.default_ttl = default_ttl
         self.eviction_policy = eviction_policy
+        # Ordered from least to most recently used
         self.cache: OrderedDict[str, CacheItem[T]] = OrderedDict()
         self.metrics = CacheMetrics()
         self.lock = threading.Lock()
         self.logger = logging.getLogger(__name__)
-        
-        # Start background tasks
-        self._start_maintenance_tasks()
-    
-    def _start_maintenance_tasks(self) -> None:
-        """Start background maintenance tasks"""
-        self._cleanup_task = asyncio.create_task(self._periodic_cleanup())
-        self._metrics_task = asyncio.create_task(self._update_metrics())
-    
-    async def _periodic_cleanup(self) -> None:
-        """Periodically clean up expired items"""
-        while True:
-            try:
-                await asyncio.sleep(60)  # Run every minute
-                await self.cleanup_expired()
-            except Exception as e:
-                self.logger.error(f"Cleanup task error: {str(e)}")
-    
-    async def _update_metrics(self) -> None:
-        """Periodically update cache metrics"""
-        while True:
-            try:
-                await asyncio.sleep(30)  # Run every 30 seconds
-                self.metrics.memory_usage = self._calculate_memory_usage()
-                self.metrics.cache_size = len(self.cache)
-            except Exception as e:
-                self.logger.error(f"Metrics update error: {str(e)}")
+        self._memory_bytes = 0
+        self._lfu = LFUIndex()
+        self._expiry = ExpiryQueue()
+        self._cost_heap: List[Tuple[float, int, CacheItem[T]]] = []
+        self._counter = itertools.count()
     
     def _calculate_key(self, value: Any) -> str:
         """Calculate cache key for a value"""
@@ -102,16 +104,12 @@ class AdvancedCache(Generic[T]):
         ).hexdigest()
     
     def _calculate_memory_usage(self) -> float:
-        """Calculate current memory usage in MB"""
-        import sys
-        total_size = sum(
-            sys.getsizeof(item.value) for item in self.cache.values()
-        )
-        return total_size / (1024 * 1024)
+        """Current memory usage in MB, tracked incrementally on put/remove"""
+        return self._memory_bytes / (1024 * 1024)
     
     async def get(self, key: str) -> Optional[T]:
         """Get value from cache"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         with self.lock:
             item = self.cache.get(key)
@@ -120,20 +118,21 @@ class AdvancedCache(Generic[T]):
                 self.metrics.misses += 1
                 return None
             
-            if item.expiry and datetime.now() > item.expiry:
+            if item.expiry and time.monotonic() > item.expiry:
                 self.metrics.misses += 1
-                del self.cache[key]
+                self._remove(key)
                 return None
             
             # Update access metrics
-            item.last_access = datetime.now()
+            item.last_access = time.monotonic()
             item.access_count += 1
+            self._lfu.touch(key)
             self.metrics.hits += 1
             
             # Update average access time
             self.metrics.avg_access_time = (
                 (self.metrics.avg_access_time * (self.metrics.hits - 1) +
-                 (time.time() - start_time)) / self.metrics.hits
+                 (time.perf_counter() - start_time)) / self.metrics.hits
             )
             
             # Move to end (most recently used)
@@ -150,61 +149,105 @@ class AdvancedCache(Generic[T]):
     ) -> bool:
         """Put value in cache"""
         with self.lock:
-            # Check memory limit
-            if self._calculate_memory_usage() >= self.max_memory_mb:
-                await self._evict()
+            now = time.monotonic()
+            self._sweep_expired(now)
             
             # Calculate expiry
-            expiry = (
-                datetime.now() + timedelta(seconds=ttl)
-                if ttl else
-                datetime.now() + timedelta(seconds=self.default_ttl)
-            )
+            expiry = now + (ttl if ttl else self.default_ttl)
             
-            # Create cache item
+            # Create cache item, replacing any previous one
+            if key in self.cache:
+                self._remove(key)
             item = CacheItem(key, value, expiry, cost)
             
             # Add to cache
             self.cache[key] = item
+            self._memory_bytes += item.size
+            self._lfu.add(key)
+            self._expiry.push(expiry, item)
+            heapq.heappush(self._cost_heap, (-cost, next(self._counter), item))
             
-            # Check size limit
-            if len(self.cache) > self.max_size:
-                await self._evict()
+            # Check size and memory limits, never evicting the new item
+            while len(self.cache) > 1 and (
+                len(self.cache) > self.max_size or
+                self._calculate_memory_usage() > self.max_memory_mb
+            ):
+                self._evict(protect=key)
             
             return True
     
-    async def _evict(self) -> None:
-        """Evict items based on policy"""
+    def _remove(self, key: str) -> Optional[CacheItem[T]]:
+        """Remove an item from the cache and the eviction bookkeeping"""
+        item = self.cache.pop(key, None)
+        if item is not None:
+            self._memory_bytes -= item.size
+            self._lfu.remove(key)
+        return item
+    
+    def _is_live(self, item: CacheItem[T]) -> bool:
+        return self.cache.get(item.key) is item
+    
+    def _sweep_expired(self, now: float) -> None:
+        """Drop a bounded batch of expired items"""
+        for item in self._expiry.pop_expired(now, self.SWEEP_BATCH):
+            if self._is_live(item):
+                self._remove(item.key)
+                self.metrics.evictions += 1
+        live = len(self.cache)
+        if self._expiry.needs_compaction(live):
+            self._expiry.compact((i.expiry, i) for i in self.cache.values())
+        if len(self._cost_heap) > 2 * live + 64:
+            self._cost_heap = [
+                (-i.cost, next(self._counter), i) for i in self.cache.values()
+            ]
+            heapq.heapify(self._cost_heap)
+    
+    def _evict(self, protect: Optional[str] = None) -> None:
+        """Evict one item based on policy"""
         if not self.cache:
             return
         
+        victim: Optional[str] = None
         if self.eviction_policy == "lru":
             # Least Recently Used
-            self.cache.popitem(last=False)
+            victim = next(iter(self.cache))
+        elif self.eviction_policy == "lfu":
+            # Least Frequently Used, ties broken by recency
+            victim = self._lfu.victim()
         elif self.eviction_policy == "cost":
-            # Highest Cost
-            max_cost_key = max(
-                self.cache.items(),
-                key=lambda x: x[1].cost
-            )[0]
-            del self.cache[max_cost_key]
+            # Highest Cost; stale heap items are discarded as they surface
+            deferred = []
+            while self._cost_heap:
+                entry = heapq.heappop(self._cost_heap)
+                item = entry[2]
+                if not self._is_live(item):
+                    continue
+                if item.key == protect:
+                    deferred.append(entry)
+                    continue
+                victim = item.key
+                break
+            for entry in deferred:
+                heapq.heappush(self._cost_heap, entry)
         else:  # adaptive
-            # Consider multiple factors
-            scores = {
-                key: self._calculate_item_score(item)
-                for key, item in self.cache.items()
-            }
-            worst_key = min(scores.items(), key=lambda x: x[1])[0]
-            del self.cache[worst_key]
+            # Score a sample of the least recently used items
+            sample = itertools.islice(
+                (item for k, item in self.cache.items() if k != protect),
+                self.ADAPTIVE_SAMPLE
+            )
+            worst = min(sample, key=self._calculate_item_score, default=None)
+            victim = worst.key if worst is not None else None
         
+        if victim is None or victim == protect:
+            victim = next(k for k in self.cache if k != protect)
+        self._remove(victim)
         self.metrics.evictions += 1
     
     def _calculate_item_score(self, item: CacheItem[T]) -> float:
         """Calculate item score for adaptive eviction"""
-        age = (datetime.now() - item.creation_time).total_seconds()
-        time_since_access = (
-            datetime.now() - item.last_access
-        ).total_seconds()
+        now = time.monotonic()
+        age = now - item.creation_time
+        time_since_access = now - item.last_access
         
         # Normalize factors
         age_factor = 1 / (1 + age / 3600)  # Age in hours
@@ -217,20 +260,22 @@ class AdvancedCache(Generic[T]):
     async def cleanup_expired(self) -> int:
         """Clean up expired items"""
         with self.lock:
-            current_time = datetime.now()
+            current_time = time.monotonic()
             expired_keys = [
                 key for key, item in self.cache.items()
                 if item.expiry and current_time > item.expiry
             ]
             
             for key in expired_keys:
-                del self.cache[key]
+                self._remove(key)
                 self.metrics.evictions += 1
             
             return len(expired_keys)
     
     async def get_metrics(self) -> Dict[str, Any]:
         """Get current cache metrics"""
+        self.metrics.memory_usage = self._calculate_memory_usage()
+        self.metrics.cache_size = len(self.cache)
         return {
             "hits": self.metrics.hits,
             "misses": self.metrics.misses,
@@ -250,6 +295,10 @@ class AdvancedCache(Generic[T]):
         """Clear all cache entries"""
         with self.lock:
             self.cache.clear()
+            self._lfu.clear()
+            self._expiry.clear()
+            self._cost_heap.clear()
+            self._memory_bytes = 0
             self.metrics = CacheMetrics()
 
 def cached(
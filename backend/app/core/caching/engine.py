@@ -12,10 +12,18 @@ from datetime import datetime, timedelta
 import json
 import hashlib
 import asyncio
-import aioredis
+import time
+from collections import OrderedDict
 from functools import wraps
 import pickle
 
+from .policies import ExpiryQueue, LFUIndex
+
+try:
+    import aioredis
+except Exception:  # pragma: no cover - only needed for the Redis backend
+    aioredis = None
+
 T = TypeVar("T")
 
 class CacheBackend(str, Enum):
@@ -53,12 +61,43 @@ class CacheEntry(BaseModel, Generic[T]):
     ttl: int
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
+class _MemoryEntry:
+    """Slotted in-memory entry, avoiding pydantic validation on every set"""
+    
+    __slots__ = (
+        "key", "value", "created_at", "accessed_at",
+        "access_count", "ttl", "expires_at", "metadata"
+    )
+    
+    def __init__(
+        self,
+        key: str,
+        value: Any,
+        now: float,
+        ttl: int,
+        metadata: Dict[str, Any]
+    ):
+        self.key = key
+        self.value = value
+        self.created_at = now
+        self.accessed_at = now
+        self.access_count = 0
+        self.ttl = ttl
+        self.expires_at = now + ttl
+        self.metadata = metadata
+
 class CacheEngine:
     """Caching engine for data caching"""
     
+    # Expired entries removed per set() by the lazy TTL sweep
+    SWEEP_BATCH = 64
+    
     def __init__(self, config: CacheConfig):
         self.config = config
-        self._cache: Dict[str, CacheEntry] = {}
+        # Ordered by recency (LRU) or insertion (FIFO); monotonic timestamps
+        self._cache: "OrderedDict[str, _MemoryEntry]" = OrderedDict()
+        self._lfu = LFUIndex()
+        self._expiry = ExpiryQueue()
         self._redis = None
         self._initialized = False
         self._lock = asyncio.Lock()
@@ -101,17 +140,22 @@ class CacheEngine:
         if self.config.backend == CacheBackend.MEMORY:
             async with self._lock:
                 entry = self._cache.get(full_key)
-                if not entry:
+                if entry is None:
                     return None
                     
                 # Check TTL
-                if (datetime.utcnow() - entry.created_at).total_seconds() > entry.ttl:
-                    del self._cache[full_key]
+                now = time.monotonic()
+                if entry.expires_at <= now:
+                    self._remove(full_key)
                     return None
                     
                 # Update access stats
-                entry.accessed_at = datetime.utcnow()
+                entry.accessed_at = now
                 entry.access_count += 1
+                if self.config.strategy == CacheStrategy.LRU:
+                    self._cache.move_to_end(full_key)
+                elif self.config.strategy == CacheStrategy.LFU:
+                    self._lfu.touch(full_key)
                 return entry.value
                 
         elif self.config.backend == CacheBackend.REDIS:
@@ -132,22 +176,25 @@ class CacheEngine:
             await self.initialize()
             
         full_key = self._build_key(key)
-        now = datetime.utcnow()
         
         if self.config.backend == CacheBackend.MEMORY:
             async with self._lock:
+                now = time.monotonic()
+                self._sweep_expired(now)
+                
                 # Apply cache strategy if max size reached
-                if len(self._cache) >= self.config.max_size:
+                if full_key in self._cache:
+                    self._remove(full_key)
+                elif len(self._cache) >= self.config.max_size:
                     await self._apply_cache_strategy()
                 
-                self._cache[full_key] = CacheEntry(
-                    key=full_key,
-                    value=value,
-                    created_at=now,
-                    accessed_at=now,
-                    ttl=ttl or self.config.ttl,
-                    metadata=metadata or {}
+                entry = _MemoryEntry(
+                    full_key, value, now, ttl or self.config.ttl, metadata or {}
                 )
+                self._cache[full_key] = entry
+                if self.config.strategy == CacheStrategy.LFU:
+                    self._lfu.add(full_key)
+                self._expiry.push(entry.expires_at, entry)
                 
         elif self.config.backend == CacheBackend.REDIS:
             await self._redis.set(
@@ -165,7 +212,7 @@ class CacheEngine:
         
         if self.config.backend == CacheBackend.MEMORY:
             async with self._lock:
-                self._cache.pop(full_key, None)
+                self._remove(full_key)
                 
         elif self.config.backend == CacheBackend.REDIS:
             await self._redis.delete(full_key)
@@ -178,45 +225,49 @@ class CacheEngine:
         if self.config.backend == CacheBackend.MEMORY:
             async with self._lock:
                 self._cache.clear()
+                self._lfu.clear()
+                self._expiry.clear()
                 
         elif self.config.backend == CacheBackend.REDIS:
             await self._redis.flushdb()
     
+    def _remove(self, full_key: str) -> None:
+        """Remove an entry from the store and the eviction bookkeeping"""
+        self._cache.pop(full_key, None)
+        self._lfu.remove(full_key)
+    
+    def _sweep_expired(self, now: float) -> None:
+        """Drop a bounded batch of expired entries, soonest expiry first"""
+        for entry in self._expiry.pop_expired(now, self.SWEEP_BATCH):
+            # Skip heap items for entries that were replaced or deleted
+            if self._cache.get(entry.key) is entry:
+                self._remove(entry.key)
+        if self._expiry.needs_compaction(len(self._cache)):
+            self._expiry.compact((e.expires_at, e) for e in self._cache.values())
+    
     async def _apply_cache_strategy(self) -> None:
         """Apply cache eviction strategy"""
-        if self.config.strategy == CacheStrategy.LRU:
-            # Remove least recently used entry
-            lru_key = min(
-                self._cache.keys(),
-                key=lambda k: self._cache[k].accessed_at
-            )
-            del self._cache[lru_key]
+        if not self._cache:
+            return
+            
+        if self.config.strategy in (CacheStrategy.LRU, CacheStrategy.FIFO):
+            # Oldest entry by recency (LRU) or insertion (FIFO)
+            self._remove(next(iter(self._cache)))
             
         elif self.config.strategy == CacheStrategy.LFU:
             # Remove least frequently used entry
-            lfu_key = min(
-                self._cache.keys(),
-                key=lambda k: self._cache[k].access_count
-            )
-            del self._cache[lfu_key]
-            
-        elif self.config.strategy == CacheStrategy.FIFO:
-            # Remove oldest entry
-            fifo_key = min(
-                self._cache.keys(),
-                key=lambda k: self._cache[k].created_at
-            )
-            del self._cache[fifo_key]
+            self._remove(self._lfu.victim())
             
         elif self.config.strategy == CacheStrategy.TTL:
-            # Remove expired entries
-            now = datetime.utcnow()
-            expired = [
-                k for k, v in self._cache.items()
-                if (now - v.created_at).total_seconds() > v.ttl
-            ]
-            for key in expired:
-                del self._cache[key]
+            # Expired entries are swept on set; evict the soonest to expire
+            while True:
+                item = self._expiry.pop()
+                if item is None:
+                    break
+                entry = item[1]
+                if self._cache.get(entry.key) is entry:
+                    self._remove(entry.key)
+                    break
 
 def cached(
     ttl: Optional[int] = None,
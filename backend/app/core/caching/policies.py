@@ -0,0 +1,150 @@
+"""
+Cache Eviction Policies
+PGF Protocol: CACHE_003
+Gate: GATE_6
+Version: 1.0.0
+
+Constant-time bookkeeping shared by the in-memory caches: frequency
+buckets for LFU and a lazily invalidated expiry heap for TTL sweeps.
+LRU and FIFO need no helper, an OrderedDict keyed by cache key is enough.
+"""
+
+import heapq
+import itertools
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+
+class LFUIndex:
+    """Least-frequently-used ordering with O(1) touch and eviction
+
+    Keys live in one bucket per access frequency; each bucket keeps
+    insertion order, so ties are broken least-recently-used first.
+    """
+
+    __slots__ = ("_freq", "_buckets", "_min_freq")
+
+    def __init__(self):
+        self._freq: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, "OrderedDict[Hashable, None]"] = {}
+        self._min_freq = 0
+
+    def __len__(self) -> int:
+        return len(self._freq)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._freq
+
+    def frequency(self, key: Hashable) -> int:
+        """Access count of a key, 0 if unknown"""
+        return self._freq.get(key, 0)
+
+    def add(self, key: Hashable) -> None:
+        """Track a new key with frequency 1, or touch an existing one"""
+        if key in self._freq:
+            self.touch(key)
+            return
+        self._freq[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_freq = 1
+
+    def touch(self, key: Hashable) -> None:
+        """Record one access to a key"""
+        freq = self._freq[key]
+        self._unlink(key, freq)
+        if self._min_freq == freq and freq not in self._buckets:
+            self._min_freq = freq + 1
+        self._freq[key] = freq + 1
+        self._buckets.setdefault(freq + 1, OrderedDict())[key] = None
+
+    def remove(self, key: Hashable) -> None:
+        """Stop tracking a key"""
+        freq = self._freq.pop(key, None)
+        if freq is None:
+            return
+        self._unlink(key, freq)
+        if freq == self._min_freq and freq not in self._buckets:
+            # Bounded by the number of distinct frequencies, not the key count
+            self._min_freq = min(self._buckets) if self._buckets else 0
+
+    def victim(self) -> Optional[Hashable]:
+        """Least frequently used key, or None when empty"""
+        if not self._freq:
+            return None
+        return next(iter(self._buckets[self._min_freq]))
+
+    def pop_victim(self) -> Optional[Hashable]:
+        """Remove and return the least frequently used key"""
+        key = self.victim()
+        if key is not None:
+            self.remove(key)
+        return key
+
+    def clear(self) -> None:
+        self._freq.clear()
+        self._buckets.clear()
+        self._min_freq = 0
+
+    def _unlink(self, key: Hashable, freq: int) -> None:
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+
+
+class ExpiryQueue:
+    """Min-heap of (expires_at, entry) pairs with lazy invalidation
+
+    Replaced or deleted entries are left in the heap and skipped by the
+    caller's liveness check when they surface; compact() drops them once
+    they outnumber live entries.
+    """
+
+    __slots__ = ("_heap", "_counter")
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, expires_at: float, entry: Any) -> None:
+        heapq.heappush(self._heap, (expires_at, next(self._counter), entry))
+
+    def peek(self) -> Optional[Tuple[float, Any]]:
+        """Soonest (expires_at, entry) pair without removing it"""
+        if not self._heap:
+            return None
+        expires_at, _, entry = self._heap[0]
+        return expires_at, entry
+
+    def pop(self) -> Optional[Tuple[float, Any]]:
+        """Remove and return the soonest (expires_at, entry) pair"""
+        if not self._heap:
+            return None
+        expires_at, _, entry = heapq.heappop(self._heap)
+        return expires_at, entry
+
+    def pop_expired(self, now: float, limit: Optional[int] = None) -> Iterator[Any]:
+        """Yield entries whose expiry is at or before now, soonest first
+
+        Args:
+            now: Current time on the same clock as the pushed expiries
+            limit: Maximum number of heap items to pop, None for all
+        """
+        popped = 0
+        while self._heap and self._heap[0][0] <= now and (limit is None or popped < limit):
+            popped += 1
+            yield heapq.heappop(self._heap)[2]
+
+    def needs_compaction(self, live: int) -> bool:
+        return len(self._heap) > 2 * live + 64
+
+    def compact(self, entries: Iterator[Tuple[float, Any]]) -> None:
+        """Rebuild the heap from the live (expires_at, entry) pairs"""
+        self._heap = [(expires_at, next(self._counter), entry) for expires_at, entry in entries]
+        heapq.heapify(self._heap)
+
+    def clear(self) -> None:
+        self._heap.clear()
@@ -0,0 +1,229 @@
+"""
+Pairwise Aspect Kernel
+PGF Protocol: ASPECT_001
+Gate: GATE_4
+Version: 1.0.0
+
+Angular separations between two sets of longitudes are computed as one
+NumPy matrix and matched against an aspect table in a single vectorized
+pass. The same kernel serves natal charts (a chart against itself, upper
+triangle), synastry (chart against chart) and transits (a series of
+positions against a natal chart). Per-planet scores are looked up from
+arrays built once per table, so scoring a hit costs no dict access.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Strength lookups shared by every aspect model
+DIGNITY_SCORES: Dict[str, float] = {
+    "exalted": 100,
+    "moolatrikona": 85,
+    "own": 70,
+    "friend": 50,
+    "neutral": 30,
+    "enemy": 15,
+    "debilitated": 5,
+}
+DEFAULT_DIGNITY_SCORE = 30
+ANGULAR_HOUSES = frozenset({1, 4, 7, 10})
+
+# Ptolemaic aspects by exact angle, in the order they are tested
+MAJOR_ASPECTS: Dict[float, str] = {
+    0: "Conjunction",
+    60: "Sextile",
+    90: "Square",
+    120: "Trine",
+    180: "Opposition",
+}
+
+FRIEND_SCORE = 100
+ENEMY_SCORE = 25
+NEUTRAL_SCORE = 50
+
+
+def separations(first: Sequence[float], second: Sequence[float]) -> np.ndarray:
+    """Smallest angular distance between every pair of longitudes
+
+    Args:
+        first: Longitudes shaped (..., n); leading axes (e.g. time) broadcast
+        second: Longitudes shaped (..., m)
+
+    Returns:
+        Degrees in [0, 180] shaped (..., n, m)
+    """
+    first = np.asarray(first, dtype=float)
+    second = np.asarray(second, dtype=float)
+    diff = np.abs(first[..., :, None] - second[..., None, :])
+    return np.where(diff > 180, 360 - diff, diff)
+
+
+@dataclass(frozen=True)
+class AspectMatches:
+    """Every (cell, aspect) pair within orb, ordered by cell then table order"""
+    # One index array per axis of the separation matrix
+    cells: Tuple[np.ndarray, ...]
+    aspects: np.ndarray
+    # Separation of each hit and its distance from exact
+    separations: np.ndarray
+    orbs: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.aspects)
+
+
+class AspectTable:
+    """Aspect angles and orbs as arrays, in table order"""
+
+    def __init__(self, names: Sequence[str], angles: Sequence[float], orbs: Sequence[float]):
+        self.names = tuple(names)
+        self.angles = np.asarray(angles, dtype=float)
+        self.orbs = np.asarray(orbs, dtype=float)
+
+    @classmethod
+    def from_aspects(cls, aspects: Iterable) -> "AspectTable":
+        """Build from objects with name, angle and orb attributes"""
+        aspects = list(aspects)
+        return cls(
+            [a.name for a in aspects],
+            [a.angle for a in aspects],
+            [a.orb for a in aspects]
+        )
+
+    @classmethod
+    def from_angles(cls, names: Mapping[float, str], orb: float) -> "AspectTable":
+        """Build from {angle: name} with one orb for every aspect"""
+        return cls(list(names.values()), list(names), [orb] * len(names))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _deviation(self, separation: np.ndarray) -> np.ndarray:
+        return np.abs(np.asarray(separation, dtype=float)[..., None] - self.angles)
+
+    def match(self, separation: np.ndarray, mask: Optional[np.ndarray] = None) -> AspectMatches:
+        """All aspects within orb of each separation
+
+        Args:
+            separation: Degrees from separations(), any shape
+            mask: Optional boolean array of the same shape selecting cells
+
+        Returns:
+            Hits in row-major cell order, several per cell where orbs overlap
+        """
+        separation = np.asarray(separation, dtype=float)
+        deviation = self._deviation(separation)
+        hits = deviation <= self.orbs
+        if mask is not None:
+            hits &= mask[..., None]
+        *cells, aspects = np.nonzero(hits)
+        cells = tuple(cells)
+        return AspectMatches(
+            cells=cells,
+            aspects=aspects,
+            separations=separation[cells],
+            orbs=deviation[hits]
+        )
+
+    def first(self, separation: np.ndarray, last: bool = False) -> np.ndarray:
+        """Index of the first (or last) aspect within orb per cell, -1 if none"""
+        hits = self._deviation(separation) <= self.orbs
+        if last:
+            index = len(self) - 1 - np.argmax(hits[..., ::-1], axis=-1)
+        else:
+            index = np.argmax(hits, axis=-1)
+        return np.where(hits.any(axis=-1), index, -1)
+
+
+def upper_triangle(count: int) -> np.ndarray:
+    """Mask of the pairs i < j in a count x count matrix"""
+    return np.triu(np.ones((count, count), dtype=bool), k=1)
+
+
+class RelationshipTable:
+    """Friend/enemy scores of planet pairs as a dense matrix
+
+    The last row and column stand for planets absent from the mapping,
+    which are neutral towards everything.
+    """
+
+    def __init__(self, relationships: Mapping[str, Mapping[str, Sequence[str]]]):
+        names = list(relationships)
+        for relation in relationships.values():
+            for planet in list(relation.get("friend", [])) + list(relation.get("enemy", [])):
+                if planet not in names:
+                    names.append(planet)
+        self.index = {name: i for i, name in enumerate(names)}
+        unknown = len(names)
+        self.scores = np.full((unknown + 1, unknown + 1), NEUTRAL_SCORE, dtype=float)
+        for planet, relation in relationships.items():
+            row = self.index[planet]
+            # Enemy is checked after friend in the scalar rules, so friend wins
+            for other in relation.get("enemy", []):
+                self.scores[row, self.index[other]] = ENEMY_SCORE
+            for other in relation.get("friend", []):
+                self.scores[row, self.index[other]] = FRIEND_SCORE
+
+    def indexes(self, planets: Iterable[str]) -> np.ndarray:
+        unknown = len(self.index)
+        return np.array([self.index.get(p, unknown) for p in planets], dtype=np.intp)
+
+    def lookup(self, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        """Scores for index arrays from indexes()"""
+        return self.scores[first, second]
+
+
+@dataclass(frozen=True)
+class PlanetArrays:
+    """Per-planet inputs of the strength model, one entry per planet"""
+    names: List[str]
+    longitude: np.ndarray
+    speed: np.ndarray
+    has_speed: np.ndarray
+    retrograde: np.ndarray
+    dignity: np.ndarray
+    angular: np.ndarray
+    relation: np.ndarray
+
+    @classmethod
+    def from_positions(
+        cls,
+        positions: Mapping[str, Mapping],
+        relationships: RelationshipTable
+    ) -> "PlanetArrays":
+        """Collect arrays from {planet: {"longitude", "speed", ...}}"""
+        names = list(positions)
+        data = [positions[name] for name in names]
+        return cls(
+            names=names,
+            longitude=np.array([d["longitude"] for d in data], dtype=float),
+            speed=np.array([d.get("speed", 0) for d in data], dtype=float),
+            has_speed=np.array(["speed" in d for d in data], dtype=bool),
+            retrograde=np.array([bool(d.get("is_retrograde", False)) for d in data], dtype=bool),
+            dignity=np.array(
+                [DIGNITY_SCORES.get(d.get("dignity", "neutral"), DEFAULT_DIGNITY_SCORE) for d in data],
+                dtype=float
+            ),
+            angular=np.array([d.get("house", 1) in ANGULAR_HOUSES for d in data], dtype=bool),
+            relation=relationships.indexes(names),
+        )
+
+
+def speed_scores(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """Closer daily motions make a steadier aspect"""
+    diff = np.abs(first - second)
+    return np.select(
+        [diff < 0.1, diff < 0.5, diff < 1.0],
+        [100.0, 75.0, 50.0],
+        default=np.maximum(0, 100 - (diff * 50))
+    )
+
+
+def applying(first: PlanetArrays, i: np.ndarray, second: PlanetArrays, j: np.ndarray) -> np.ndarray:
+    """Whether each pair (first[i], second[j]) is closing in"""
+    relative = first.speed[i] - second.speed[j]
+    both_retrograde = first.retrograde[i] & second.retrograde[j]
+    result = np.where(both_retrograde, relative > 0, relative < 0)
+    return result & first.has_speed[i] & second.has_speed[j]
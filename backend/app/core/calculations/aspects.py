@@ -2,6 +2,19 @@ from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
 import math
 
+import numpy as np
+
+from .aspect_kernel import (
+    AspectMatches,
+    AspectTable,
+    PlanetArrays,
+    RelationshipTable,
+    applying,
+    separations,
+    speed_scores,
+    upper_triangle,
+)
+
 @dataclass
 class Aspect:
     name: str
@@ -55,6 +68,12 @@ class EnhancedAspectCalculator:
         "Jupiter": [5, 7, 9], # Jupiter aspects 5th, 7th, and 9th houses
         "Saturn": [3, 7, 10]  # Saturn aspects 3rd, 7th, and 10th houses
     }
+
+    # Array forms of the tables above for the aspect kernel
+    _TABLE = AspectTable.from_aspects(ASPECTS.values())
+    _BASE_STRENGTH = np.array([a.strength for a in ASPECTS.values()], dtype=float)
+    _BENEFIC = np.array([a.benefic_nature for a in ASPECTS.values()], dtype=float)
+    _RELATIONSHIPS = RelationshipTable(PLANETARY_RELATIONSHIPS)
     
     def __init__(self):
         self.aspect_strength_modifiers = {
@@ -256,59 +275,70 @@ class EnhancedAspectCalculator:
         planetary_positions: Dict[str, Dict[str, Any]]
     ) -> List[PlanetaryAspect]:
         """Calculate enhanced aspects between planets"""
-        aspects = []
-        planets = list(planetary_positions.keys())
+        planets = PlanetArrays.from_positions(planetary_positions, self._RELATIONSHIPS)
+        separation = separations(planets.longitude, planets.longitude)
+        matches = self._TABLE.match(separation, upper_triangle(len(planets.names)))
+        return self._build_aspects(planets, planets, matches)
+
+    def calculate_synastry_aspects(
+        self,
+        chart1_positions: Dict[str, Dict[str, Any]],
+        chart2_positions: Dict[str, Dict[str, Any]]
+    ) -> List[PlanetaryAspect]:
+        """Calculate aspects from every planet of one chart to every planet of another
+
+        planet1 of each result belongs to chart1_positions, planet2 to
+        chart2_positions.
+        """
+        first = PlanetArrays.from_positions(chart1_positions, self._RELATIONSHIPS)
+        second = PlanetArrays.from_positions(chart2_positions, self._RELATIONSHIPS)
+        matches = self._TABLE.match(separations(first.longitude, second.longitude))
+        return self._build_aspects(first, second, matches)
+
+    def _build_aspects(
+        self,
+        first: PlanetArrays,
+        second: PlanetArrays,
+        matches: AspectMatches
+    ) -> List[PlanetaryAspect]:
+        """Score kernel matches with the same model as calculate_aspect_strength"""
+        i, j = matches.cells
+        k = matches.aspects
+        orb = matches.orbs
+
+        strength = (
+            np.maximum(0, 100 - (orb / self._TABLE.orbs[k]) * 100) * 0.3
+            + speed_scores(first.speed[i], second.speed[j]) * 0.15
+            + (first.dignity[i] + second.dignity[j]) / 2 * 0.2
+            + self._RELATIONSHIPS.lookup(first.relation[i], second.relation[j]) * 0.2
+            + np.select(
+                [first.angular[i] & second.angular[j], first.angular[i] | second.angular[j]],
+                [100, 75],
+                default=50
+            ) * 0.15
+        )
+        is_applying = applying(first, i, second, j)
+        influence = (strength * self._BASE_STRENGTH[k]) / 100
+        influence = influence * np.where(is_applying, 1.2, 0.8)
+        influence = influence * (1 + self._BENEFIC[k] / 100)
+        influence = np.clip(influence, 0, 100)
+
+        aspects = list(self.ASPECTS.values())
+        return [
+            PlanetaryAspect(
+                planet1=first.names[a],
+                planet2=second.names[b],
+                aspect=aspects[c],
+                orb=round(float(o), 2),
+                is_applying=bool(applies),
+                strength=round(float(s), 2),
+                total_influence=round(float(t), 2)
+            )
+            for a, b, c, o, applies, s, t in zip(
+                i.tolist(), j.tolist(), k.tolist(), orb, is_applying, strength, influence
+            )
+        ]
 
-        for i, planet1 in enumerate(planets):
-            for planet2 in planets[i+1:]:
-                # Get planet details
-                p1_data = planetary_positions[planet1]
-                p2_data = planetary_positions[planet2]
-                
-                # Calculate basic angular difference
-                long1 = p1_data["longitude"]
-                long2 = p2_data["longitude"]
-                diff = self.calculate_aspect_angle(long1, long2)
-                
-                # Check for aspects
-                for aspect in self.ASPECTS.values():
-                    if self.is_aspect_within_orb(aspect.angle, diff, aspect.orb):
-                        # Calculate if aspect is applying
-                        is_applying = self._is_applying(p1_data, p2_data)
-                        
-                        # Calculate orb
-                        orb = abs(diff - aspect.angle)
-                        
-                        # Calculate strength
-                        strength = self.calculate_aspect_strength(
-                            aspect,
-                            {'name': planet1, **p1_data},
-                            {'name': planet2, **p2_data},
-                            orb
-                        )
-                        
-                        # Calculate total influence
-                        total_influence = self.calculate_total_influence(
-                            aspect,
-                            strength,
-                            is_applying
-                        )
-                        
-                        # Create PlanetaryAspect object
-                        planetary_aspect = PlanetaryAspect(
-                            planet1=planet1,
-                            planet2=planet2,
-                            aspect=aspect,
-                            orb=round(orb, 2),
-                            is_applying=is_applying,
-                            strength=round(strength, 2),
-                            total_influence=round(total_influence, 2)
-                        )
-                        
-                        aspects.append(planetary_aspect)
-        
-        return aspects
-    
     def calculate_special_aspects(
         self,
         planet: str,
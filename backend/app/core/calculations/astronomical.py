@@ -8,6 +8,10 @@ Version: 1.0.0
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 import math
+
+import numpy as np
+
+from app.core.calculations.aspect_kernel import MAJOR_ASPECTS, AspectTable, separations
 from app.models.location import Location
 from app.models.enums import Planet
 
@@ -197,37 +201,25 @@ class AstronomicalCalculator:
         Returns:
             Dictionary with aspects between planets
         """
-        aspects = {}
-        aspect_types = {
-            0: "Conjunction",
-            60: "Sextile",
-            90: "Square",
-            120: "Trine",
-            180: "Opposition"
-        }
-        
-        for p1 in planet_positions:
-            aspects[p1] = {}
-            for p2 in planet_positions:
-                if p1 >= p2:
-                    continue
-                
-                lon1 = planet_positions[p1]["longitude"]
-                lon2 = planet_positions[p2]["longitude"]
-                
-                # Calculate smallest angle between planets
-                angle = abs(lon1 - lon2)
-                if angle > 180:
-                    angle = 360 - angle
-                
-                # Check each aspect type
-                for aspect_angle, aspect_name in aspect_types.items():
-                    if abs(angle - aspect_angle) <= orb:
-                        aspects[p1][p2] = {
-                            "type": aspect_name,
-                            "angle": angle,
-                            "orb": abs(angle - aspect_angle)
-                        }
+        planets = list(planet_positions)
+        longitudes = [planet_positions[p]["longitude"] for p in planets]
+        separation = separations(longitudes, longitudes)
+        table = AspectTable.from_angles(MAJOR_ASPECTS, orb)
+        # Where orbs overlap the last matching aspect is reported
+        index = table.first(separation, last=True)
+
+        aspects = {p1: {} for p1 in planets}
+        for i, j in zip(*np.nonzero(index >= 0)):
+            p1, p2 = planets[i], planets[j]
+            if p1 >= p2:
+                continue
+            angle = float(separation[i, j])
+            aspect = index[i, j]
+            aspects[p1][p2] = {
+                "type": table.names[aspect],
+                "angle": angle,
+                "orb": abs(angle - float(table.angles[aspect]))
+            }
         
         return aspects
     
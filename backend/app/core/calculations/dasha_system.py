@@ -5,8 +5,10 @@ Gate: GATE_4
 Version: 1.0.0
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Any, Optional, Tuple
 import math
 
 class VimshottariDasha:
@@ -176,44 +178,230 @@ class VimshottariDasha:
         
         return pratyantardasha
 
+    def timeline(self, birth_time: datetime, moon_longitude: float) -> "DashaTimeline":
+        """Lazy dasha timeline for a native, see DashaTimeline"""
+        return DashaTimeline(birth_time, moon_longitude)
+
     def calculate_all_dasha_levels(
         self,
         birth_time: datetime,
         moon_longitude: float
     ) -> Dict[str, Any]:
         """Calculate Mahadasha with nested Antardasha and Pratyantardasha from birth."""
-        birth_info = self.calculate_dasha_at_birth(birth_time, moon_longitude)
-        periods: List[Dict[str, Any]] = []
-        for maha in birth_info["dasha_sequence"]:
-            m_start: datetime = maha["start_date"]
-            m_end: datetime = maha["end_date"]
-            m_planet: str = maha["planet"]
-            # Antardasha within mahadasha
-            antas = self.calculate_antardasha(m_planet, m_start, m_end)
-            # For each antardasha, compute pratyantardasha
-            for a in antas:
-                a_start: datetime = a["start_date"]
-                a_end: datetime = a["end_date"]
-                a_planet: str = a["planet"]
-                a["pratyantardasha"] = self.calculate_pratyantardasha(
-                    m_planet, a_planet, a_start, a_end
+        return {"periods": self.timeline(birth_time, moon_longitude).window(depth=3)}
+
+
+DASHA_LEVELS = ("mahadasha", "antardasha", "pratyantardasha", "sookshma", "prana")
+YEAR_DAYS = 365.25
+
+
+def _sub_fractions() -> Dict[str, List[float]]:
+    """Cumulative fraction of a parent period at each sub-period boundary"""
+    fractions = {}
+    sequence = VimshottariDasha.LORD_SEQUENCE
+    for i, lord in enumerate(sequence):
+        order = sequence[i:] + sequence[:i]
+        cumulative = [0.0]
+        for sub in order:
+            cumulative.append(cumulative[-1] + VimshottariDasha.DASHA_PERIODS[sub] / 120)
+        cumulative[-1] = 1.0
+        fractions[lord] = cumulative
+    return fractions
+
+
+_SUB_FRACTIONS = _sub_fractions()
+
+
+@dataclass(frozen=True)
+class DashaPeriod:
+    """One period of the timeline; lords runs from the mahadasha lord down"""
+    lords: Tuple[str, ...]
+    start: datetime
+    end: datetime
+    duration_years: float
+
+    @property
+    def level(self) -> str:
+        return DASHA_LEVELS[len(self.lords) - 1]
+
+    @property
+    def planet(self) -> str:
+        return self.lords[-1]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "planet": self.planet,
+            "start_date": self.start.isoformat(),
+            "end_date": self.end.isoformat(),
+            "duration_years": self.duration_years,
+        }
+
+
+class DashaTimeline:
+    """Vimshottari timeline stored as flat period boundaries
+    
+    Only the nine mahadasha boundaries are kept. Each deeper level splits
+    its parent in fixed proportions starting from the parent's lord, so
+    sub-period boundaries are derived on demand and located by bisection:
+    query() is O(depth * log 9) and window() only materializes periods
+    overlapping the requested range.
+    """
+
+    def __init__(self, birth_time: datetime, moon_longitude: float):
+        """Initialize the timeline
+        
+        Args:
+            birth_time: Birth date and time
+            moon_longitude: Moon's sidereal longitude at birth (0-360 degrees)
+            
+        Raises:
+            ValueError: If moon_longitude is outside [0, 360)
+        """
+        if not 0.0 <= moon_longitude < 360.0:
+            raise ValueError(f"Moon longitude must be in [0, 360), got {moon_longitude}")
+        nak_len = 360.0 / 27
+        nak_index = int(moon_longitude // nak_len)
+        balance = (nak_len - (moon_longitude - nak_index * nak_len)) / nak_len
+
+        sequence = VimshottariDasha.LORD_SEQUENCE
+        first = nak_index % 9
+        self.birth_time = birth_time
+        self.birth_nakshatra = nak_index + 1
+        self.balance_at_birth = balance
+        self.lords: List[str] = sequence[first:] + sequence[:first]
+        # Nominal length in years, used to scale sub-periods; the first
+        # mahadasha only runs for its balance but keeps its full proportions
+        self.years: List[float] = [float(VimshottariDasha.DASHA_PERIODS[lord]) for lord in self.lords]
+        self.duration_years: List[float] = [self.years[0] * balance] + self.years[1:]
+        # Day offsets from birth_time of each mahadasha boundary
+        self.bounds: List[float] = [0.0]
+        for years in self.duration_years:
+            self.bounds.append(self.bounds[-1] + years * YEAR_DAYS)
+
+    @property
+    def end(self) -> datetime:
+        return self._at(self.bounds[-1])
+
+    def query(self, at: datetime, depth: int = 3) -> List[DashaPeriod]:
+        """Active period chain at an instant
+        
+        Args:
+            at: Instant to look up
+            depth: Levels to resolve, 1 (mahadasha) to 5 (prana)
+            
+        Returns:
+            One period per level from mahadasha down, empty if at falls
+            outside the timeline
+        """
+        depth = self._check_depth(depth)
+        offset = self._offset(at)
+        if not 0.0 <= offset < self.bounds[-1]:
+            return []
+        i = bisect_right(self.bounds, offset) - 1
+        lords = (self.lords[i],)
+        start, end, years = self.bounds[i], self.bounds[i + 1], self.years[i]
+        chain = [DashaPeriod(lords, self._at(start), self._at(end), self.duration_years[i])]
+        for _ in range(depth - 1):
+            bounds = self._sub_bounds(lords[-1], start, end)
+            j = min(bisect_right(bounds, offset) - 1, 8)
+            lords, start, end, years = self._child(lords, bounds, j, years)
+            chain.append(DashaPeriod(lords, self._at(start), self._at(end), years))
+        return chain
+
+    def window(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        depth: int = 3
+    ) -> List[Dict[str, Any]]:
+        """Nested periods overlapping [start, end)
+        
+        Args:
+            start: Window start, defaults to birth
+            end: Window end, defaults to the end of the 120-year cycle
+            depth: Levels to include, 1 (mahadasha) to 5 (prana)
+            
+        Returns:
+            Mahadasha dicts, each holding its overlapping sub-periods under
+            the next level's name (antardasha, pratyantardasha, ...)
+        """
+        depth = self._check_depth(depth)
+        lo = self._offset(start) if start is not None else 0.0
+        hi = self._offset(end) if end is not None else self.bounds[-1]
+        periods = []
+        for i in self._overlapping(self.bounds, lo, hi):
+            lords = (self.lords[i],)
+            start_i, end_i = self.bounds[i], self.bounds[i + 1]
+            period = DashaPeriod(lords, self._at(start_i), self._at(end_i), self.duration_years[i])
+            periods.append(self._expand(period, start_i, end_i, self.years[i], lo, hi, depth))
+        return periods
+
+    def _expand(
+        self,
+        period: DashaPeriod,
+        start: float,
+        end: float,
+        years: float,
+        lo: float,
+        hi: float,
+        depth: int
+    ) -> Dict[str, Any]:
+        node = period.as_dict()
+        if len(period.lords) < depth:
+            bounds = self._sub_bounds(period.planet, start, end)
+            node[DASHA_LEVELS[len(period.lords)]] = [
+                self._expand(
+                    DashaPeriod(lords, self._at(sub_start), self._at(sub_end), sub_years),
+                    sub_start, sub_end, sub_years, lo, hi, depth
                 )
-            periods.append({
-                "planet": m_planet,
-                "start_date": m_start.isoformat(),
-                "end_date": m_end.isoformat(),
-                "duration_years": maha["duration_years"],
-                "antardasha": [
-                    {
-                        **{k: (v.isoformat() if isinstance(v, datetime) else v) for k, v in a.items() if k in {"planet", "start_date", "end_date", "duration_years"}},
-                        "pratyantardasha": [
-                            {
-                                **{kk: (vv.isoformat() if isinstance(vv, datetime) else vv) for kk, vv in p.items()}
-                            }
-                            for p in a["pratyantardasha"]
-                        ],
-                    }
-                    for a in antas
-                ],
-            })
-        return {"periods": periods}
+                for lords, sub_start, sub_end, sub_years in (
+                    self._child(period.lords, bounds, j, years)
+                    for j in self._overlapping(bounds, lo, hi)
+                )
+            ]
+        return node
+
+    @staticmethod
+    def _sub_bounds(lord: str, start: float, end: float) -> List[float]:
+        span = end - start
+        bounds = [start + span * fraction for fraction in _SUB_FRACTIONS[lord]]
+        bounds[-1] = end
+        return bounds
+
+    @staticmethod
+    def _child(
+        lords: Tuple[str, ...],
+        bounds: List[float],
+        j: int,
+        parent_years: float
+    ) -> Tuple[Tuple[str, ...], float, float, float]:
+        sequence = VimshottariDasha.LORD_SEQUENCE
+        sub = sequence[(sequence.index(lords[-1]) + j) % 9]
+        years = VimshottariDasha.DASHA_PERIODS[sub] * parent_years / 120
+        return lords + (sub,), bounds[j], bounds[j + 1], years
+
+    @staticmethod
+    def _overlapping(bounds: List[float], lo: float, hi: float) -> range:
+        first = max(bisect_right(bounds, lo) - 1, 0)
+        last = min(bisect_left(bounds, hi), len(bounds) - 1)
+        return range(first, last)
+
+    @staticmethod
+    def _check_depth(depth: int) -> int:
+        if not 1 <= depth <= len(DASHA_LEVELS):
+            raise ValueError(f"depth must be between 1 and {len(DASHA_LEVELS)}, got {depth}")
+        return depth
+
+    def _offset(self, at: datetime) -> float:
+        """Days from birth_time, treating naive datetimes as UTC when mixed"""
+        origin = self.birth_time
+        if (at.tzinfo is None) != (origin.tzinfo is None):
+            if at.tzinfo is None:
+                at = at.replace(tzinfo=timezone.utc)
+            else:
+                at = at.astimezone(timezone.utc).replace(tzinfo=None)
+        return (at - origin).total_seconds() / 86400.0
+
+    def _at(self, offset: float) -> datetime:
+        """Instant offset days after birth_time, rounded to the second"""
+        return self.birth_time + timedelta(seconds=round(offset * 86400.0))
@@ -68,6 +68,132 @@ class DivisionalChartEngine:
         mapped = self.division_map[division](single)
         return float(mapped["_"]) if "_" in mapped else float(longitude)
 
+    @property
+    def supported_divisions(self) -> List[int]:
+        """Divisions this engine can calculate, in ascending order"""
+        return sorted(self.division_map)
+
+    def _body_name(self, b: CelestialBody) -> str:
+        name_map = {
+            CelestialBody.SUN: "Sun",
+            CelestialBody.MOON: "Moon",
+            CelestialBody.MARS: "Mars",
+            CelestialBody.MERCURY: "Mercury",
+            CelestialBody.JUPITER: "Jupiter",
+            CelestialBody.VENUS: "Venus",
+            CelestialBody.SATURN: "Saturn",
+            CelestialBody.RAHU: "Rahu",
+            CelestialBody.KETU: "Ketu",
+            CelestialBody.URANUS: "Uranus",
+            CelestialBody.NEPTUNE: "Neptune",
+            CelestialBody.PLUTO: "Pluto",
+        }
+        return name_map.get(b, str(b))
+
+    def _calculate_base_positions(
+        self,
+        date: datetime,
+        chart_location: Dict[str, float]
+    ) -> Tuple[Dict[str, float], float, float]:
+        """Run the single ephemeris pass shared by every varga of a chart
+
+        Returns:
+            Tuple of (sidereal planet longitudes, sidereal ascendant, ayanamsa)
+        """
+        geo = GeoLocation(
+            latitude=float(chart_location["lat"]),
+            longitude=float(chart_location["lon"]),
+            altitude=float(chart_location.get("alt", 0.0)),
+        )
+        positions = self.calculator.calculate_all_positions(date, geo)
+        planets = {self._body_name(b): float(p.longitude) for b, p in positions.items()}
+
+        houses_dict = self.house_calc.calculate_houses(
+            date,
+            float(chart_location["lat"]),
+            float(chart_location["lon"]),
+            "WHOLE_SIGN",
+        )
+        jd = swe.julday(
+            date.year, date.month, date.day,
+            date.hour + date.minute / 60.0 + date.second / 3600.0
+        )
+        ayanamsa = float(swe.get_ayanamsa_ut(jd))
+        asc_longitude = float(houses_dict["ascendant"]) if "ascendant" in houses_dict else 0.0
+        return planets, asc_longitude, ayanamsa
+
+    def calculate_from_positions(
+        self,
+        planets: Dict[str, float],
+        ascendant: float,
+        division: int,
+        ayanamsa: float,
+        timestamp: datetime,
+        location: Dict[str, float]
+    ) -> DivisionalChart:
+        """Calculate a divisional chart from precomputed sidereal positions
+
+        Args:
+            planets: Planet name to sidereal longitude mapping (the D1 chart)
+            ascendant: Sidereal ascendant longitude
+            division: Varga division (1-60)
+            ayanamsa: Ayanamsa value used for the sidereal positions
+            timestamp: Chart date and time
+            location: Latitude, longitude, altitude
+
+        Returns:
+            DivisionalChart for the requested division
+        """
+        if division not in self.division_map:
+            raise ValueError(f"Unsupported division D{division}")
+
+        divisional_positions = self.division_map[division](planets)
+
+        # Compute divisional ascendant by applying division to the natal ascendant longitude
+        div_asc_longitude = self._apply_division_to_single_longitude(division, ascendant)
+        div_asc_sign = int(div_asc_longitude / 30) % 12
+
+        # Whole Sign house cusps for the divisional chart
+        varga_houses = [((div_asc_sign * 30) + (i * 30)) % 360 for i in range(12)]
+
+        return DivisionalChart(
+            division=division,
+            planets=divisional_positions,
+            houses=varga_houses,
+            ayanamsa=ayanamsa,
+            timestamp=timestamp,
+            location=location
+        )
+
+    def calculate_charts_from_positions(
+        self,
+        planets: Dict[str, float],
+        ascendant: float,
+        ayanamsa: float,
+        timestamp: datetime,
+        location: Dict[str, float],
+        divisions: Optional[List[int]] = None
+    ) -> Dict[int, DivisionalChart]:
+        """Calculate several divisional charts from one precomputed position set
+
+        Args:
+            divisions: Divisions to calculate, defaults to all supported vargas
+
+        Returns:
+            Dictionary mapping division to DivisionalChart
+        """
+        requested = divisions if divisions is not None else self.supported_divisions
+        unsupported = [d for d in requested if d not in self.division_map]
+        if unsupported:
+            raise ValueError(f"Unsupported division D{unsupported[0]}")
+
+        return {
+            division: self.calculate_from_positions(
+                planets, ascendant, division, ayanamsa, timestamp, location
+            )
+            for division in requested
+        }
+
     def calculate_chart(self, date: datetime, division: int, location: Optional[Dict[str, float]] = None) -> DivisionalChart:
         """Calculate divisional chart for given date and division"""
         with MetricsTimer(metrics, f"divisional_chart_d{division}"):
@@ -80,70 +206,31 @@ class DivisionalChartEngine:
             if cached_result:
                 return cached_result
             
-            # Calculate base planetary positions via Swiss Ephemeris
-            geo = GeoLocation(
-                latitude=float(chart_location["lat"]),
-                longitude=float(chart_location["lon"]),
-                altitude=float(chart_location.get("alt", 0.0)),
-            )
-            positions = self.calculator.calculate_all_positions(date, geo)
-
-            def body_name(b: CelestialBody) -> str:
-                name_map = {
-                    CelestialBody.SUN: "Sun",
-                    CelestialBody.MOON: "Moon",
-                    CelestialBody.MARS: "Mars",
-                    CelestialBody.MERCURY: "Mercury",
-                    CelestialBody.JUPITER: "Jupiter",
-                    CelestialBody.VENUS: "Venus",
-                    CelestialBody.SATURN: "Saturn",
-                    CelestialBody.RAHU: "Rahu",
-                    CelestialBody.KETU: "Ketu",
-                    CelestialBody.URANUS: "Uranus",
-                    CelestialBody.NEPTUNE: "Neptune",
-                    CelestialBody.PLUTO: "Pluto",
-                }
-                return name_map.get(b, str(b))
-
-            planets = {body_name(b): float(p.longitude) for b, p in positions.items()}
-            houses_dict = self.house_calc.calculate_houses(
-                date,
-                float(chart_location["lat"]),
-                float(chart_location["lon"]),
-                "WHOLE_SIGN",
-            )
-            jd = swe.julday(
-                date.year, date.month, date.day,
-                date.hour + date.minute / 60.0 + date.second / 3600.0
-            )
-            ayanamsa = float(swe.get_ayanamsa_ut(jd))
-            
-            # Apply divisional calculation
             if division not in self.division_map:
                 raise ValueError(f"Unsupported division D{division}")
-            
-            divisional_positions = self.division_map[division](planets)
-
-            # Compute divisional ascendant by applying division to the natal ascendant longitude
-            asc_longitude = float(houses_dict["ascendant"]) if "ascendant" in houses_dict else 0.0
-            div_asc_longitude = self._apply_division_to_single_longitude(division, asc_longitude)
-            div_asc_sign = int(div_asc_longitude / 30) % 12
 
-            # Whole Sign house cusps for the divisional chart
-            varga_houses = [((div_asc_sign * 30) + (i * 30)) % 360 for i in range(12)]
-
-            chart = DivisionalChart(
-                division=division,
-                planets=divisional_positions,
-                houses=varga_houses,
-                ayanamsa=ayanamsa,
-                timestamp=date,
-                location=chart_location
+            planets, asc_longitude, ayanamsa = self._calculate_base_positions(date, chart_location)
+            chart = self.calculate_from_positions(
+                planets, asc_longitude, division, ayanamsa, date, chart_location
             )
             
             # Cache result
             self.cache.set(cache_key, chart)
             return chart
+
+    def calculate_charts(
+        self,
+        date: datetime,
+        divisions: Optional[List[int]] = None,
+        location: Optional[Dict[str, float]] = None
+    ) -> Dict[int, DivisionalChart]:
+        """Calculate several divisional charts with a single ephemeris pass"""
+        with MetricsTimer(metrics, "divisional_charts_batch"):
+            chart_location = location or self.default_location
+            planets, asc_longitude, ayanamsa = self._calculate_base_positions(date, chart_location)
+            return self.calculate_charts_from_positions(
+                planets, asc_longitude, ayanamsa, date, chart_location, divisions
+            )
     
     def _normalize_longitude(self, longitude: float) -> float:
         """Normalize longitude to 0-360 range"""
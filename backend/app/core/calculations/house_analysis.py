@@ -1,8 +1,7 @@
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Mapping, Tuple
 import math
-from concurrent.futures import ThreadPoolExecutor
-from functools import lru_cache
 
 @dataclass
 class HouseStrength:
@@ -108,12 +107,71 @@ class EnhancedHouseAnalysisEngine:
             'temporary': 1.1         # Temporary dispositorship
         }
         
-        # Initialize thread pool for parallel calculations
-        self.executor = ThreadPoolExecutor(max_workers=4)
+        # Occupant dignity factors
+        self.dignity_factors = {
+            'exalted': 1.3,
+            'moolatrikona': 1.2,
+            'own': 1.1,
+            'friend': 1.0,
+            'neutral': 0.9,
+            'enemy': 0.8,
+            'debilitated': 0.7,
+            'combust': 0.6,  # New factor for combust planets
+            'retrograde': 0.85  # Updated retrograde factor
+        }
+        
+        # Aspect type factors
+        self.aspect_type_factors = {
+            'conjunction': 1.0,
+            'trine': 0.9,
+            'sextile': 0.8,
+            'square': 0.6,
+            'opposition': 0.5,
+            'none': 0.0  # No aspect effect
+        }
+        
+        # Lord placement factors by house relationship
+        self.relationship_factors = {
+            'own': 1.2,
+            'exalted': 1.3,
+            'friend': 1.1,
+            'neutral': 1.0,
+            'enemy': 0.8,
+            'debilitated': 0.7
+        }
+        
+        # House in which each house lord is exalted (simplified)
+        self.exaltation_houses = {
+            1: 10,  # Leo lord (Sun) exalted in Aries
+            2: 9,   # Taurus lord (Venus) exalted in Pisces
+            3: 7,   # Gemini lord (Mercury) exalted in Virgo
+            4: 1,   # Cancer lord (Moon) exalted in Taurus
+            5: 10,  # Leo lord (Sun) exalted in Aries
+            6: 7,   # Virgo lord (Mercury) exalted in Virgo
+            7: 2,   # Libra lord (Venus) exalted in Pisces
+            8: 4,   # Scorpio lord (Mars) exalted in Capricorn
+            9: 4,   # Sagittarius lord (Jupiter) exalted in Cancer
+            10: 1,  # Capricorn lord (Saturn) exalted in Libra
+            11: 1,  # Aquarius lord (Saturn) exalted in Libra
+            12: 4   # Pisces lord (Jupiter) exalted in Cancer
+        }
+        
+        # Total strength weights
+        self.component_weights = {
+            'natural': 0.15,
+            'occupant': 0.25,
+            'aspect': 0.15,
+            'lord': 0.20,
+            'temporal': 0.10,
+            'dispositorship': 0.15
+        }
+        
+        # Natural strengths depend only on the house, so compute them once
+        self.natural_strengths = {
+            house: self._natural_strength(house) for house in self.natural_house_strengths
+        }
 
-    @lru_cache(maxsize=128)
-    def _calculate_natural_strength(self, house: int) -> float:
-        """Calculate natural strength of house based on position with caching"""
+    def _natural_strength(self, house: int) -> float:
         base_strength = self.natural_house_strengths[house]
         
         # Modify based on special combinations
@@ -126,28 +184,20 @@ class EnhancedHouseAnalysisEngine:
         
         return min(100, base_strength)
     
-    async def _calculate_occupant_strength(
+    def _calculate_natural_strength(self, house: int) -> float:
+        """Calculate natural strength of house based on position"""
+        return self.natural_strengths[house]
+    
+    def _calculate_occupant_strength(
         self,
         house: int,
         occupants: List[Dict[str, Any]]
     ) -> float:
-        """Calculate strength based on planetary occupants with parallel processing"""
+        """Calculate strength based on planetary occupants"""
         if not occupants:
             return 50
             
-        # Process each occupant in parallel
-        futures = []
-        for planet in occupants:
-            futures.append(
-                self.executor.submit(
-                    self._process_single_occupant,
-                    house,
-                    planet
-                )
-            )
-            
-        # Gather results
-        strengths = [f.result() for f in futures]
+        strengths = [self._process_single_occupant(house, planet) for planet in occupants]
         return min(100, sum(strengths) / len(strengths))
 
     def _process_single_occupant(
@@ -157,19 +207,7 @@ class EnhancedHouseAnalysisEngine:
     ) -> float:
         """Process a single occupant's strength calculation"""
         planet_strength = planet.get('strength', 50)
-        
-        # Enhanced dignity calculations
-        dignity_factor = {
-            'exalted': 1.3,
-            'moolatrikona': 1.2,
-            'own': 1.1,
-            'friend': 1.0,
-            'neutral': 0.9,
-            'enemy': 0.8,
-            'debilitated': 0.7,
-            'combust': 0.6,  # New factor for combust planets
-            'retrograde': 0.85  # Updated retrograde factor
-        }
+        dignity_factor = self.dignity_factors
         
         # Get base dignity
         dignity = planet.get('dignity', 'neutral')
@@ -206,16 +244,8 @@ class EnhancedHouseAnalysisEngine:
             aspect_strength = aspect.get('strength', 50)
             
             # Consider aspect type
-            aspect_type_factor = {
-                'conjunction': 1.0,
-                'trine': 0.9,
-                'sextile': 0.8,
-                'square': 0.6,
-                'opposition': 0.5,
-                'none': 0.0  # No aspect effect
-            }
             aspect_type = aspect.get('type', 'conjunction')
-            aspect_strength *= aspect_type_factor[aspect_type]
+            aspect_strength *= self.aspect_type_factors[aspect_type]
             
             # Consider if aspect is applying or separating
             if aspect.get('is_applying', False):
@@ -239,16 +269,7 @@ class EnhancedHouseAnalysisEngine:
         current_house = lord.get('house', 1)
         house_relationship = self._get_house_relationship(house, current_house)
         
-        relationship_factor = {
-            'own': 1.2,
-            'exalted': 1.3,
-            'friend': 1.1,
-            'neutral': 1.0,
-            'enemy': 0.8,
-            'debilitated': 0.7
-        }
-        
-        lord_strength *= relationship_factor[house_relationship]
+        lord_strength *= self.relationship_factors[house_relationship]
         
         # Consider special house placements
         if current_house in self.special_combinations['kendra']:
@@ -265,23 +286,7 @@ class EnhancedHouseAnalysisEngine:
         if house == lord_house:
             return 'own'
         
-        # Define exaltation houses for each house lord (simplified)
-        exaltation_houses = {
-            1: 10,  # Leo lord (Sun) exalted in Aries
-            2: 9,   # Taurus lord (Venus) exalted in Pisces
-            3: 7,   # Gemini lord (Mercury) exalted in Virgo
-            4: 1,   # Cancer lord (Moon) exalted in Taurus
-            5: 10,  # Leo lord (Sun) exalted in Aries
-            6: 7,   # Virgo lord (Mercury) exalted in Virgo
-            7: 2,   # Libra lord (Venus) exalted in Pisces
-            8: 4,   # Scorpio lord (Mars) exalted in Capricorn
-            9: 4,   # Sagittarius lord (Jupiter) exalted in Cancer
-            10: 1,  # Capricorn lord (Saturn) exalted in Libra
-            11: 1,  # Aquarius lord (Saturn) exalted in Libra
-            12: 4   # Pisces lord (Jupiter) exalted in Cancer
-        }
-        
-        if lord_house == exaltation_houses.get(house):
+        if lord_house == self.exaltation_houses.get(house):
             return 'exalted'
             
         # Check if houses form special combinations
@@ -327,24 +332,34 @@ class EnhancedHouseAnalysisEngine:
                 
         return min(100, base_strength)
 
+    @staticmethod
+    def _lordship_index(
+        all_house_lords: Mapping[int, Dict[str, Any]]
+    ) -> Dict[Tuple[Any, Any], List[int]]:
+        """Houses ruled, keyed by (lord planet, house the lord occupies)"""
+        index = defaultdict(list)
+        for ruled_house, lord in all_house_lords.items():
+            index[(lord.get('planet'), lord.get('house'))].append(ruled_house)
+        return index
+
     def _calculate_dispositorship_strength(
         self,
         house: int,
         lord: Dict[str, Any],
-        all_house_lords: Dict[int, Dict[str, Any]]
+        all_house_lords: Mapping[int, Dict[str, Any]],
+        lordship_index: Optional[Mapping[Tuple[Any, Any], List[int]]] = None
     ) -> float:
         """Calculate strength based on dispositorship relationships"""
         base_strength = 50
         lord_planet = lord.get('planet')
         lord_house = lord.get('house')
+        if lordship_index is None:
+            lordship_index = self._lordship_index(all_house_lords)
         
-        # Check for mutual reception
-        for other_house, other_lord in all_house_lords.items():
-            if other_house != house:
-                if (other_lord.get('planet') == lord_planet and 
-                    other_lord.get('house') == house):
-                    base_strength *= self.dispositorship_rules['mutual_reception']
-                    break
+        # Check for mutual reception: the same planet rules another house
+        # and occupies this one
+        if any(other_house != house for other_house in lordship_index.get((lord_planet, house), ())):
+            base_strength *= self.dispositorship_rules['mutual_reception']
                     
         # Check for parivartana yoga
         if lord_house in all_house_lords:
@@ -367,28 +382,90 @@ class EnhancedHouseAnalysisEngine:
         time_of_day: str = 'day',
         all_house_lords: Optional[Dict[int, Dict[str, Any]]] = None
     ) -> HouseStrength:
-        """Enhanced house analysis with temporal and dispositorship factors"""
+        """Enhanced house analysis with temporal and dispositorship factors
+        
+        The work is a few dict lookups, so it runs inline; use analyze_chart
+        to score all 12 houses of a chart at once.
+        """
+        all_house_lords = all_house_lords or {}
+        return self._analyze_house(
+            house,
+            occupants,
+            aspects,
+            lord,
+            time_of_day,
+            all_house_lords,
+            self._lordship_index(all_house_lords)
+        )
+
+    def analyze_chart(
+        self,
+        planets: Mapping[str, Dict[str, Any]],
+        aspects: List[Dict[str, Any]],
+        house_lords: Mapping[int, Dict[str, Any]],
+        time_of_day: str = 'day'
+    ) -> Dict[int, HouseStrength]:
+        """Analyze all 12 houses of a chart in one pass
+        
+        Occupant, aspect and lordship indexes are built once and shared by
+        every house, instead of being rebuilt per analyze_house call.
+        
+        Args:
+            planets: Planet name to planet data, including the 'house' it
+                occupies
+            aspects: Aspects to houses, each with the aspected 'house'
+            house_lords: House number to its lord, as passed to analyze_house
+            time_of_day: 'day' or 'night'
+            
+        Returns:
+            HouseStrength per house number, 1-12
+        """
+        occupants = defaultdict(list)
+        for name, planet in planets.items():
+            occupants[planet.get('house')].append({'name': name, **planet})
+        aspects_to = defaultdict(list)
+        for aspect in aspects:
+            aspects_to[aspect.get('house')].append(aspect)
+        lordship_index = self._lordship_index(house_lords)
+        
+        return {
+            house: self._analyze_house(
+                house,
+                occupants.get(house, []),
+                aspects_to.get(house, []),
+                house_lords.get(house, {}),
+                time_of_day,
+                house_lords,
+                lordship_index
+            )
+            for house in range(1, 13)
+        }
+
+    def _analyze_house(
+        self,
+        house: int,
+        occupants: List[Dict[str, Any]],
+        aspects: List[Dict[str, Any]],
+        lord: Dict[str, Any],
+        time_of_day: str,
+        all_house_lords: Mapping[int, Dict[str, Any]],
+        lordship_index: Mapping[Tuple[Any, Any], List[int]]
+    ) -> HouseStrength:
         # Calculate all strength components
         natural_strength = self._calculate_natural_strength(house)
-        occupant_strength = await self._calculate_occupant_strength(house, occupants)
+        occupant_strength = self._calculate_occupant_strength(house, occupants)
         aspect_strength = self._calculate_aspect_strength(house, aspects)
         lord_strength = self._calculate_lord_strength(house, lord)
         temporal_strength = self._calculate_temporal_strength(house, time_of_day)
         dispositorship_strength = self._calculate_dispositorship_strength(
             house,
             lord,
-            all_house_lords or {}
+            all_house_lords,
+            lordship_index
         )
         
         # Calculate total strength with weighted components
-        weights = {
-            'natural': 0.15,
-            'occupant': 0.25,
-            'aspect': 0.15,
-            'lord': 0.20,
-            'temporal': 0.10,
-            'dispositorship': 0.15
-        }
+        weights = self.component_weights
         
         total_strength = sum(
             strength * weights[component]
@@ -0,0 +1,315 @@
+"""
+Muhurta Search
+PGF Protocol: MUHURTA_001
+Gate: GATE_4
+Version: 1.0.0
+
+Finds every window in a date range whose tithi, nakshatra, yoga and
+lagna all satisfy an activity's rules. The boundaries of each limb are
+computed once for the whole range: the panchang limbs by the transition
+search in panchang.py, lagna sign changes in closed form from local
+sidereal time. Merging those boundaries cuts the range into segments
+over which nothing changes, so each segment is judged once and the
+allowed sets are intersected with array operations; runs of adjacent
+qualifying segments then merge into one window.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from ..astronomical.rise_set import SIDEREAL_RATE, sidereal_degrees
+from .panchang import ELEMENTS, NAKSHATRAS, YOGAS, PanchangSearch, from_julian_day, tithi_name
+
+SIGNS = [
+    "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+    "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
+]
+
+# Above this latitude some signs never rise and the lagna is not monotonic
+MAX_LATITUDE = 66.0
+
+# Tithi indexes 0..29: Chaturthi, Navami and Chaturdashi of both pakshas
+RIKTA_TITHIS = frozenset({3, 8, 13, 18, 23, 28})
+AMAVASYA = 29
+
+INAUSPICIOUS_YOGAS = frozenset({
+    "Vishkambha", "Atiganda", "Shula", "Ganda", "Vyaghata",
+    "Vajra", "Vyatipata", "Parigha", "Vaidhriti"
+})
+EXCELLENT_YOGAS = frozenset({"Siddhi", "Siddha", "Shubha", "Shukla", "Brahma", "Indra"})
+
+# Waxing tithis are preferred, the first days of the waning half less so
+TITHI_SCORES = np.array(
+    [0.5] + [1.0] * 14 + [0.75] * 5 + [0.5] * 10
+)
+
+# Score weights; a window of at least FULL_DURATION_MINUTES gets full marks
+SCORE_WEIGHTS = {"tithi": 0.4, "yoga": 0.3, "duration": 0.3}
+FULL_DURATION_MINUTES = 120.0
+
+
+@dataclass(frozen=True)
+class MuhurtaRule:
+    """Allowed limbs for one activity"""
+    nakshatras: FrozenSet[str]
+    lagnas: FrozenSet[str]
+    excluded_tithis: FrozenSet[int] = RIKTA_TITHIS | {AMAVASYA}
+    excluded_yogas: FrozenSet[str] = INAUSPICIOUS_YOGAS
+
+
+MUHURTA_RULES: Dict[str, MuhurtaRule] = {
+    "marriage": MuhurtaRule(
+        nakshatras=frozenset({
+            "Rohini", "Mrigashira", "Magha", "Uttara Phalguni", "Hasta", "Swati",
+            "Anuradha", "Mula", "Uttara Ashadha", "Uttara Bhadrapada", "Revati"
+        }),
+        lagnas=frozenset({"Taurus", "Gemini", "Virgo", "Libra", "Sagittarius", "Pisces"}),
+    ),
+    "business": MuhurtaRule(
+        nakshatras=frozenset({
+            "Ashwini", "Rohini", "Pushya", "Uttara Phalguni", "Hasta", "Chitra",
+            "Anuradha", "Uttara Ashadha", "Uttara Bhadrapada", "Revati"
+        }),
+        lagnas=frozenset({"Taurus", "Gemini", "Leo", "Virgo", "Libra", "Sagittarius", "Aquarius", "Pisces"}),
+    ),
+    "travel": MuhurtaRule(
+        nakshatras=frozenset({
+            "Ashwini", "Mrigashira", "Punarvasu", "Pushya", "Hasta",
+            "Anuradha", "Shravana", "Dhanishta", "Revati"
+        }),
+        lagnas=frozenset({"Aries", "Cancer", "Libra", "Capricorn", "Gemini", "Virgo", "Sagittarius", "Pisces"}),
+    ),
+    "education": MuhurtaRule(
+        nakshatras=frozenset({
+            "Ashwini", "Mrigashira", "Punarvasu", "Pushya", "Hasta", "Chitra",
+            "Swati", "Shravana", "Dhanishta", "Shatabhisha", "Revati"
+        }),
+        lagnas=frozenset({"Gemini", "Virgo", "Sagittarius", "Pisces", "Taurus", "Libra"}),
+    ),
+    "medical": MuhurtaRule(
+        nakshatras=frozenset({
+            "Ashwini", "Rohini", "Mrigashira", "Pushya", "Hasta",
+            "Anuradha", "Uttara Ashadha", "Revati"
+        }),
+        lagnas=frozenset({"Taurus", "Cancer", "Leo", "Sagittarius", "Aquarius", "Pisces"}),
+    ),
+    "spiritual": MuhurtaRule(
+        nakshatras=frozenset({
+            "Ashwini", "Punarvasu", "Pushya", "Hasta", "Anuradha",
+            "Shravana", "Uttara Bhadrapada", "Revati"
+        }),
+        lagnas=frozenset({"Cancer", "Sagittarius", "Pisces", "Taurus", "Libra"}),
+    ),
+}
+
+# Limbs in the order they are reported, with the names of their divisions
+LIMBS = ("tithi", "nakshatra", "yoga", "lagna")
+_LIMB_NAMES = {
+    "tithi": [tithi_name(i) for i in range(30)],
+    "nakshatra": NAKSHATRAS,
+    "yoga": YOGAS,
+    "lagna": SIGNS,
+}
+
+Intervals = List[Tuple[int, float, float]]
+
+
+def lagna_intervals(
+    start_jd: float,
+    end_jd: float,
+    latitude: float,
+    longitude: float,
+    ayanamsa: float
+) -> Intervals:
+    """(sign index, start_jd, end_jd) of every sidereal lagna overlapping the range
+
+    A sign starts rising when the local sidereal time reaches the moment
+    its first degree is on the eastern horizon, which follows from that
+    point's right ascension and semi-diurnal arc. Sidereal time is linear
+    in UT, so every boundary is a closed-form expression; holding the
+    ayanamsa and obliquity fixed over the range shifts them by seconds.
+
+    Raises:
+        ValueError: If |latitude| exceeds MAX_LATITUDE
+    """
+    if abs(latitude) > MAX_LATITUDE:
+        raise ValueError(f"Lagna search supports latitudes up to {MAX_LATITUDE} degrees")
+    middle = (start_jd + end_jd) / 2
+    obliquity = np.radians(swe.calc_ut(middle, swe.ECL_NUT)[0][0])
+    first_degree = np.radians(30.0 * np.arange(12) + ayanamsa)
+    right_ascension = np.degrees(
+        np.arctan2(np.sin(first_degree) * np.cos(obliquity), np.cos(first_degree))
+    )
+    declination = np.arcsin(np.sin(obliquity) * np.sin(first_degree))
+    semi_arc = np.degrees(np.arccos(-np.tan(np.radians(latitude)) * np.tan(declination)))
+    rising_lst = right_ascension - semi_arc
+
+    # Degrees of sidereal time from the range start to each sign's first rising
+    offset = (rising_lst - (sidereal_degrees(start_jd) + longitude)) % 360.0
+    turns = np.arange(-1, int((end_jd - start_jd) * SIDEREAL_RATE / 360.0) + 2)
+    crossings = start_jd + (offset[None, :] + 360.0 * turns[:, None]) / SIDEREAL_RATE
+    signs = np.broadcast_to(np.arange(12), crossings.shape)
+    order = np.argsort(crossings, axis=None)
+    crossings, signs = crossings.ravel()[order], signs.ravel()[order]
+
+    return [
+        (int(sign), float(begin), float(finish))
+        for sign, begin, finish in zip(signs[:-1], crossings[:-1], crossings[1:])
+        if finish > start_jd and begin < end_jd
+    ]
+
+
+class MuhurtaSearch:
+    """Qualifying muhurta windows for a location and UT range"""
+
+    def __init__(
+        self,
+        start: datetime,
+        end: datetime,
+        latitude: float,
+        longitude: float,
+        ayanamsa: str = "lahiri"
+    ):
+        """Initialize the search
+
+        Args:
+            start: Range start; naive datetimes are taken as UTC
+            end: Range end, after start
+            latitude: Degrees north, at most MAX_LATITUDE from the equator
+            longitude: Degrees east
+            ayanamsa: Key of panchang.AYANAMSA_MODES
+
+        Raises:
+            ValueError: For an empty range, an unknown ayanamsa or a
+                latitude beyond MAX_LATITUDE
+        """
+        if abs(latitude) > MAX_LATITUDE:
+            raise ValueError(f"Muhurta search supports latitudes up to {MAX_LATITUDE} degrees")
+        self.panchang = PanchangSearch(start, end, ayanamsa)
+        self.latitude = latitude
+        self.longitude = longitude
+        self._intervals: Optional[Dict[str, Intervals]] = None
+        self._segments: Optional[Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]] = None
+
+    @property
+    def evaluations(self) -> int:
+        """Ephemeris evaluations made so far"""
+        return self.panchang.evaluations
+
+    def intervals(self) -> Dict[str, Intervals]:
+        """Boundaries of every limb over the range, computed once"""
+        if self._intervals is None:
+            search = self.panchang
+            result = {name: search.intervals(ELEMENTS[name]) for name in ("tithi", "nakshatra", "yoga")}
+            result["lagna"] = lagna_intervals(
+                search.start_jd,
+                search.end_jd,
+                self.latitude,
+                self.longitude,
+                search.ayanamsa_at((search.start_jd + search.end_jd) / 2),
+            )
+            self._intervals = result
+        return self._intervals
+
+    def segments(self) -> Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """Split the range where any limb changes
+
+        Returns:
+            (starts, ends, {limb: division index per segment}), computed once
+        """
+        if self._segments is None:
+            limbs = self.intervals()
+            search = self.panchang
+            bounds = np.unique(np.concatenate(
+                [[search.start_jd, search.end_jd]]
+                + [[begin for _, begin, _ in spans] for spans in limbs.values()]
+            ))
+            bounds = bounds[(bounds >= search.start_jd) & (bounds <= search.end_jd)]
+            starts, ends = bounds[:-1], bounds[1:]
+            middle = (starts + ends) / 2
+            labels = {}
+            for name, spans in limbs.items():
+                span_starts = np.array([begin for _, begin, _ in spans])
+                span_labels = np.array([index for index, _, _ in spans])
+                labels[name] = span_labels[np.searchsorted(span_starts, middle, side="right") - 1]
+            self._segments = (starts, ends, labels)
+        return self._segments
+
+    def windows(
+        self,
+        activity: str,
+        min_duration_minutes: float = 30.0,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Windows where every limb is allowed for activity, best first
+
+        Adjacent qualifying segments are merged into one window before the
+        duration filter, so a window can span several limb changes; its
+        "parts" list each segment with its tithi, nakshatra, yoga and lagna.
+        A window is scored (0-100) from the duration-weighted tithi and
+        yoga scores of its parts and from its total length.
+
+        Raises:
+            ValueError: If activity has no rule in MUHURTA_RULES
+        """
+        rule = MUHURTA_RULES.get(activity)
+        if rule is None:
+            raise ValueError(f"Unknown activity '{activity}', expected one of {', '.join(MUHURTA_RULES)}")
+        starts, ends, labels = self.segments()
+
+        allowed = {
+            "tithi": np.array([i not in rule.excluded_tithis for i in range(30)]),
+            "nakshatra": np.array([name in rule.nakshatras for name in NAKSHATRAS]),
+            "yoga": np.array([name not in rule.excluded_yogas for name in YOGAS]),
+            "lagna": np.array([name in rule.lagnas for name in SIGNS]),
+        }
+        keep = np.ones(len(starts), dtype=bool)
+        for name in LIMBS:
+            keep &= allowed[name][labels[name]]
+        kept = np.flatnonzero(keep)
+        if not kept.size:
+            return []
+
+        # Segments tile the range, so consecutive kept indexes abut
+        offsets = np.concatenate(([0], np.flatnonzero(np.diff(kept) > 1) + 1))
+        first = kept[offsets]
+        last = kept[np.concatenate((offsets[1:] - 1, [kept.size - 1]))]
+
+        yoga_scores = np.array([1.0 if name in EXCELLENT_YOGAS else 0.75 for name in YOGAS])
+        part_minutes = (ends[kept] - starts[kept]) * 1440.0
+        quality = (
+            SCORE_WEIGHTS["tithi"] * TITHI_SCORES[labels["tithi"][kept]]
+            + SCORE_WEIGHTS["yoga"] * yoga_scores[labels["yoga"][kept]]
+        )
+        minutes = np.add.reduceat(part_minutes, offsets)
+        score = 100 * (
+            np.add.reduceat(quality * part_minutes, offsets) / minutes
+            + SCORE_WEIGHTS["duration"] * np.minimum(minutes / FULL_DURATION_MINUTES, 1.0)
+        )
+
+        selected = np.flatnonzero(minutes >= min_duration_minutes)
+        # Best score first, earliest first among equals
+        selected = selected[np.lexsort((starts[first[selected]], -score[selected]))]
+        if limit is not None:
+            selected = selected[:limit]
+        return [
+            {
+                "start": from_julian_day(starts[first[w]]).isoformat(),
+                "end": from_julian_day(ends[last[w]]).isoformat(),
+                "duration_minutes": round(float(minutes[w]), 1),
+                "score": round(float(score[w]), 1),
+                "parts": [
+                    {
+                        "start": from_julian_day(starts[i]).isoformat(),
+                        "end": from_julian_day(ends[i]).isoformat(),
+                        **{name: _LIMB_NAMES[name][labels[name][i]] for name in LIMBS},
+                    }
+                    for i in range(first[w], last[w] + 1)
+                ],
+            }
+            for w in selected
+        ]
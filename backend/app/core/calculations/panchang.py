@@ -0,0 +1,286 @@
+"""
+Panchang Transition Search
+PGF Protocol: PANCHANG_001
+Gate: GATE_4
+Version: 1.0.0
+
+Tithi, karana, nakshatra and yoga are fixed-width divisions of quantities
+that only ever increase: the Sun-Moon elongation, the Moon's sidereal
+longitude and the sidereal Sun+Moon sum. Each boundary is located by a
+safeguarded Newton iteration on that quantity, using the Swiss Ephemeris
+speeds as derivative and a bracket derived from the slowest possible
+motion, so every transition costs a handful of ephemeris evaluations.
+"""
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import swisseph as swe
+
+NAKSHATRAS = [
+    "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra",
+    "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purva Phalguni",
+    "Uttara Phalguni", "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha",
+    "Jyeshtha", "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana",
+    "Dhanishta", "Shatabhisha", "Purva Bhadrapada", "Uttara Bhadrapada", "Revati"
+]
+
+YOGAS = [
+    "Vishkambha", "Priti", "Ayushman", "Saubhagya", "Shobhana", "Atiganda",
+    "Sukarma", "Dhriti", "Shula", "Ganda", "Vriddhi", "Dhruva",
+    "Vyaghata", "Harshana", "Vajra", "Siddhi", "Vyatipata", "Variyana",
+    "Parigha", "Shiva", "Siddha", "Sadhya", "Shubha", "Shukla",
+    "Brahma", "Indra", "Vaidhriti"
+]
+
+TITHIS = [
+    "Pratipada", "Dwitiya", "Tritiya", "Chaturthi", "Panchami",
+    "Shashthi", "Saptami", "Ashtami", "Navami", "Dashami",
+    "Ekadashi", "Dwadashi", "Trayodashi", "Chaturdashi"
+]
+
+MOVABLE_KARANAS = ["Bava", "Balava", "Kaulava", "Taitila", "Garaja", "Vanija", "Vishti"]
+
+# Sidereal modes by name; None keeps tropical longitudes
+AYANAMSA_MODES: Dict[str, Optional[int]] = {
+    "lahiri": swe.SIDM_LAHIRI,
+    "raman": swe.SIDM_RAMAN,
+    "krishnamurti": swe.SIDM_KRISHNAMURTI,
+    "fagan_bradley": swe.SIDM_FAGAN_BRADLEY,
+    "tropical": None,
+}
+
+J2000 = 2451545.0
+J2000_UTC = datetime(2000, 1, 1, 12, tzinfo=timezone.utc)
+# Convergence tolerance in days (~0.1 s)
+TOLERANCE_DAYS = 1e-6
+MAX_ITERATIONS = 50
+
+# swe.set_sid_mode is process-global
+_sid_lock = threading.Lock()
+
+
+def tithi_name(index: int) -> str:
+    """Name of tithi index 0..29"""
+    if index == 14:
+        return "Purnima"
+    if index == 29:
+        return "Amavasya"
+    paksha = "Shukla" if index < 15 else "Krishna"
+    return f"{paksha} {TITHIS[index % 15]}"
+
+
+def karana_name(index: int) -> str:
+    """Name of karana index 0..59"""
+    if index == 0:
+        return "Kimstughna"
+    if index >= 57:
+        return ("Shakuni", "Chatushpada", "Naga")[index - 57]
+    return MOVABLE_KARANAS[(index - 1) % 7]
+
+
+def to_julian_day(dt: datetime) -> float:
+    """UT Julian day; naive datetimes are taken as UTC"""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return J2000 + (dt - J2000_UTC).total_seconds() / 86400.0
+
+
+def from_julian_day(jd: float) -> datetime:
+    """Aware UTC datetime rounded to the second"""
+    return J2000_UTC + timedelta(seconds=round((jd - J2000) * 86400.0))
+
+
+@dataclass(frozen=True)
+class _Sample:
+    sun: float
+    sun_speed: float
+    moon: float
+    moon_speed: float
+    ayanamsa: float
+    ayanamsa_rate: float
+
+
+@dataclass(frozen=True)
+class PanchangElement:
+    """A panchang limb as equal divisions of a monotonic angle"""
+    name: str
+    count: int
+    # Angle and its daily rate from one sample
+    angle: Callable[[_Sample], float]
+    rate: Callable[[_Sample], float]
+    # Lower bound and mean of the rate in degrees/day
+    min_rate: float
+    mean_rate: float
+    label: Callable[[int], str]
+
+    @property
+    def step(self) -> float:
+        return 360.0 / self.count
+
+
+def _elongation(s: _Sample) -> float:
+    return s.moon - s.sun
+
+
+def _elongation_rate(s: _Sample) -> float:
+    return s.moon_speed - s.sun_speed
+
+
+ELEMENTS: Dict[str, PanchangElement] = {
+    "tithi": PanchangElement(
+        "tithi", 30, _elongation, _elongation_rate, 10.0, 12.19, tithi_name
+    ),
+    "nakshatra": PanchangElement(
+        "nakshatra", 27,
+        lambda s: s.moon - s.ayanamsa,
+        lambda s: s.moon_speed - s.ayanamsa_rate,
+        11.0, 13.18, lambda i: NAKSHATRAS[i]
+    ),
+    "yoga": PanchangElement(
+        "yoga", 27,
+        lambda s: s.sun + s.moon - 2 * s.ayanamsa,
+        lambda s: s.sun_speed + s.moon_speed - 2 * s.ayanamsa_rate,
+        11.5, 14.17, lambda i: YOGAS[i]
+    ),
+    "karana": PanchangElement(
+        "karana", 60, _elongation, _elongation_rate, 10.0, 12.19, karana_name
+    ),
+}
+
+
+def linear_ayanamsa(mode: Optional[int], start_jd: float, end_jd: float) -> Tuple[float, float]:
+    """Ayanamsa at start_jd and its daily rate
+
+    Precession is linear to well under a milli-arcsecond over the
+    ranges served here, so two evaluations cover the whole search.
+    """
+    if mode is None:
+        return 0.0, 0.0
+    span = max(end_jd - start_jd, 1.0)
+    with _sid_lock:
+        swe.set_sid_mode(mode)
+        first = swe.get_ayanamsa_ut(start_jd)
+        last = swe.get_ayanamsa_ut(start_jd + span)
+    return first, (last - first) / span
+
+
+def _wrap(angle: float) -> float:
+    """Angle folded into [-180, 180)"""
+    return (angle + 180.0) % 360.0 - 180.0
+
+
+class PanchangSearch:
+    """Finds every panchang transition in a UT range"""
+
+    def __init__(self, start: datetime, end: datetime, ayanamsa: str = "lahiri"):
+        """Initialize the search
+
+        Args:
+            start: Range start; naive datetimes are taken as UTC
+            end: Range end, after start
+            ayanamsa: Key of AYANAMSA_MODES
+
+        Raises:
+            ValueError: If the range is empty or the ayanamsa is unknown
+        """
+        if ayanamsa not in AYANAMSA_MODES:
+            raise ValueError(
+                f"Unknown ayanamsa '{ayanamsa}', expected one of {', '.join(AYANAMSA_MODES)}"
+            )
+        self.start_jd = to_julian_day(start)
+        self.end_jd = to_julian_day(end)
+        if self.end_jd <= self.start_jd:
+            raise ValueError("end must be after start")
+        self.ayanamsa = ayanamsa
+        self.evaluations = 0
+        self._ayanamsa_at, self._ayanamsa_rate = linear_ayanamsa(
+            AYANAMSA_MODES[ayanamsa], self.start_jd, self.end_jd
+        )
+
+    def ayanamsa_at(self, jd: float) -> float:
+        """Ayanamsa in degrees at a UT Julian day near the range"""
+        return self._ayanamsa_at + self._ayanamsa_rate * (jd - self.start_jd)
+
+    def _sample(self, jd: float) -> _Sample:
+        self.evaluations += 1
+        flags = swe.FLG_SWIEPH | swe.FLG_SPEED
+        sun = swe.calc_ut(jd, swe.SUN, flags)[0]
+        moon = swe.calc_ut(jd, swe.MOON, flags)[0]
+        return _Sample(
+            sun=sun[0],
+            sun_speed=sun[3],
+            moon=moon[0],
+            moon_speed=moon[3],
+            ayanamsa=self.ayanamsa_at(jd),
+            ayanamsa_rate=self._ayanamsa_rate,
+        )
+
+    def _solve(
+        self,
+        element: PanchangElement,
+        target: float,
+        lo: float,
+        hi: float,
+        guess: float
+    ) -> float:
+        """Time in (lo, hi) at which element.angle reaches target (mod 360)"""
+        x = min(max(guess, lo), hi)
+        for _ in range(MAX_ITERATIONS):
+            sample = self._sample(x)
+            error = _wrap(element.angle(sample) - target)
+            if error < 0:
+                lo = x
+            else:
+                hi = x
+            step = error / element.rate(sample)
+            if abs(step) < TOLERANCE_DAYS:
+                return x - step
+            following = x - step
+            # Newton left the bracket: fall back to bisection
+            x = following if lo < following < hi else (lo + hi) / 2
+        return x
+
+    def intervals(self, element: PanchangElement) -> List[Tuple[int, float, float]]:
+        """(index, start_jd, end_jd) of every division overlapping the range
+
+        The first and last intervals extend past the range to their true
+        boundaries.
+        """
+        step = element.step
+        max_span = step / element.min_rate
+        first = self._sample(self.start_jd)
+        angle = element.angle(first) % 360.0
+        index = int(angle // step)
+        start = self._solve(
+            element, index * step, self.start_jd - max_span, self.start_jd,
+            self.start_jd - (angle - index * step) / element.mean_rate
+        )
+
+        intervals = []
+        while start < self.end_jd:
+            end = self._solve(
+                element, (index + 1) * step, start, start + max_span,
+                start + step / element.mean_rate
+            )
+            intervals.append((index % element.count, start, end))
+            index += 1
+            start = end
+        return intervals
+
+    def transitions(self) -> Dict[str, List[Dict[str, Any]]]:
+        """All four limbs as lists of numbered, named intervals"""
+        return {
+            name: [
+                {
+                    "number": index + 1,
+                    "name": element.label(index),
+                    "start": from_julian_day(start).isoformat(),
+                    "end": from_julian_day(end).isoformat(),
+                }
+                for index, start, end in self.intervals(element)
+            ]
+            for name, element in ELEMENTS.items()
+        }
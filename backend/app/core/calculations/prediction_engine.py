@@ -7,6 +7,17 @@ from typing import Dict, List, Optional, Tuple
 from decimal import Decimal
 import math
 
+import numpy as np
+
+from .aspect_kernel import MAJOR_ASPECTS, AspectTable, separations
+from .muhurta import MuhurtaSearch
+
+# Major aspects with the 8-degree orb used for transits
+TRANSIT_ASPECTS = AspectTable.from_angles(MAJOR_ASPECTS, 8)
+
+# Location for the lagna when none is given (New Delhi)
+DEFAULT_LOCATION = (28.6139, 77.2090)
+
 class PredictionEngine:
     """
     Core prediction engine implementing event timing and Muhurta calculations
@@ -130,41 +141,53 @@ class PredictionEngine:
                               activity_type: str,
                               planet_positions: Dict[str, float],
                               planet_strengths: Dict[str, float],
-                              max_days: int = 7) -> Optional[Dict[str, any]]:
+                              max_days: int = 7,
+                              latitude: float = DEFAULT_LOCATION[0],
+                              longitude: float = DEFAULT_LOCATION[1]) -> Optional[Dict[str, any]]:
         """
         Find next suitable time for given activity
         
+        The planetary strengths do not change over the search, so they
+        decide whether any time suits; the time itself is the start of the
+        earliest MuhurtaSearch window whose tithi, nakshatra, yoga and lagna
+        all suit the activity at the given location.
+        
         Args:
             start_time: UTC datetime to start search from
             activity_type: Type of activity to analyze
-            planet_positions: Planetary positions
+            planet_positions: Planetary positions at start_time
             planet_strengths: Planetary strengths
             max_days: Maximum days to look ahead
+            latitude: Location latitude for the lagna
+            longitude: Location longitude for the lagna
             
         Returns:
             Dictionary containing next suitable time and analysis
         """
-        current_time = start_time
-        end_time = start_time + timedelta(days=max_days)
+        if not cls.calculate_muhurta(
+            start_time,
+            activity_type,
+            planet_positions,
+            planet_strengths
+        )['is_suitable']:
+            return None
         
-        while current_time <= end_time:
-            result = cls.calculate_muhurta(
-                current_time,
-                activity_type,
-                planet_positions,
-                planet_strengths
-            )
-            
-            if result['is_suitable'] and result['is_auspicious_muhurta']:
-                return result
-            
-            current_time += timedelta(minutes=30)
-            
-            # Update planet positions (simplified)
-            for planet in planet_positions:
-                planet_positions[planet] += 0.0007 # Approximate 30-minute motion
+        search = MuhurtaSearch(start_time, start_time + timedelta(days=max_days), latitude, longitude)
+        windows = search.windows(activity_type)
+        if not windows:
+            return None
+        window = min(windows, key=lambda w: w['start'])
         
-        return None
+        result = cls.calculate_muhurta(
+            datetime.fromisoformat(window['start']).replace(tzinfo=None),
+            activity_type,
+            planet_positions,
+            planet_strengths
+        )
+        # The window's limbs, listed under 'window', make the time auspicious
+        result['is_auspicious_muhurta'] = True
+        result['window'] = window
+        return result
     
     @classmethod
     def analyze_transit_period(cls,
@@ -189,21 +212,18 @@ class PredictionEngine:
         aspects = []
         effects = []
         
-        for time, position in transit_positions:
-            # Calculate aspect angle
-            angle = abs(position - natal_position)
-            if angle > 180:
-                angle = 360 - angle
-            
-            # Check major aspects
-            aspect = cls._get_aspect_type(angle)
-            if aspect:
-                aspects.append({
-                    'time': time.isoformat(),
-                    'type': aspect,
-                    'angle': angle,
-                    'effect': cls._get_aspect_effect(aspect, planet)
-                })
+        # One separation and aspect lookup for the whole series
+        times = [time for time, _ in transit_positions]
+        angles = separations([position for _, position in transit_positions], [natal_position])[:, 0]
+        matched = TRANSIT_ASPECTS.first(angles)
+        for index in np.nonzero(matched >= 0)[0]:
+            aspect = TRANSIT_ASPECTS.names[matched[index]]
+            aspects.append({
+                'time': times[index].isoformat(),
+                'type': aspect,
+                'angle': float(angles[index]),
+                'effect': cls._get_aspect_effect(aspect, planet)
+            })
         
         # Analyze overall period
         strength = cls._calculate_transit_strength(aspects)
@@ -240,18 +260,8 @@ class PredictionEngine:
     @staticmethod
     def _get_aspect_type(angle: float) -> Optional[str]:
         """Get aspect type from angle"""
-        aspects = {
-            0: 'Conjunction',
-            60: 'Sextile',
-            90: 'Square',
-            120: 'Trine',
-            180: 'Opposition'
-        }
-        
-        for aspect_angle, aspect_name in aspects.items():
-            if abs(angle - aspect_angle) <= 8:  # 8-degree orb
-                return aspect_name
-        return None
+        index = int(TRANSIT_ASPECTS.first(angle))
+        return TRANSIT_ASPECTS.names[index] if index >= 0 else None
     
     @staticmethod
     def _get_aspect_effect(aspect: str, planet: str) -> str:
@@ -22,6 +22,324 @@ class Chart:
     houses: Dict[int, float]
     aspects: List[Dict[str, Any]]
 
+# Dig bala: house of full and of no directional strength
+DIG_BALA_HOUSES = {
+    "Sun": {"best": 10, "worst": 4},      # Best in 10th, worst in 4th
+    "Moon": {"best": 4, "worst": 10},      # Best in 4th, worst in 10th
+    "Mars": {"best": 10, "worst": 4},      # Best in 10th, worst in 4th
+    "Mercury": {"best": 1, "worst": 7},    # Best in 1st, worst in 7th
+    "Jupiter": {"best": 1, "worst": 7},    # Best in 1st, worst in 7th
+    "Venus": {"best": 4, "worst": 10},     # Best in 4th, worst in 10th
+    "Saturn": {"best": 7, "worst": 1}      # Best in 7th, worst in 1st
+}
+
+# Kala bala: diurnal/nocturnal preference
+DAY_NIGHT_PREFERENCES = {
+    "Sun": "day",
+    "Moon": "night",
+    "Mars": "night",
+    "Mercury": "neutral",
+    "Jupiter": "day",
+    "Venus": "night",
+    "Saturn": "night"
+}
+
+# Chesta bala: typical daily motion in degrees
+TYPICAL_SPEEDS = {
+    "Sun": 1.0,          # Roughly 1° per day
+    "Moon": 13.0,        # Roughly 13° per day
+    "Mars": 0.5,         # About 0.5° per day
+    "Mercury": 1.2,      # Variable, around 1.2° per day
+    "Jupiter": 0.1,      # About 0.1° per day
+    "Venus": 1.0,        # About 1° per day
+    "Saturn": 0.03       # About 0.03° per day
+}
+
+# Naisargika bala
+NATURAL_STRENGTHS = {
+    "Sun": 100,      # Strongest natural strength
+    "Moon": 85,      # Very strong
+    "Mars": 70,      # Strong
+    "Mercury": 60,   # Moderate to strong
+    "Jupiter": 75,   # Strong
+    "Venus": 65,     # Moderate to strong
+    "Saturn": 50     # Moderate
+}
+
+# Sthana bala: base strength per sign (0 = Aries)
+SIGN_STRENGTHS = {
+    "Sun": {
+        0: 60,   # Aries
+        1: 70,   # Taurus
+        2: 50,   # Gemini
+        3: 40,   # Cancer
+        4: 100,  # Leo (exaltation)
+        5: 50,   # Virgo
+        6: 20,   # Libra (debilitation)
+        7: 40,   # Scorpio
+        8: 80,   # Sagittarius
+        9: 30,   # Capricorn
+        10: 70,  # Aquarius
+        11: 60   # Pisces
+    },
+    "Moon": {
+        0: 50,   # Aries
+        1: 100,  # Taurus (exaltation)
+        2: 60,   # Gemini
+        3: 90,   # Cancer (own sign)
+        4: 50,   # Leo
+        5: 40,   # Virgo
+        6: 50,   # Libra
+        7: 20,   # Scorpio (debilitation)
+        8: 70,   # Sagittarius
+        9: 40,   # Capricorn
+        10: 60,  # Aquarius
+        11: 70   # Pisces
+    },
+    "Mars": {
+        0: 90,   # Aries (own sign)
+        1: 50,   # Taurus
+        2: 40,   # Gemini
+        3: 30,   # Cancer (debilitation)
+        4: 70,   # Leo
+        5: 50,   # Virgo
+        6: 40,   # Libra
+        7: 90,   # Scorpio (own sign)
+        8: 100,  # Sagittarius
+        9: 100,  # Capricorn (exaltation)
+        10: 60,  # Aquarius
+        11: 40   # Pisces
+    },
+    "Mercury": {
+        0: 40,   # Aries
+        1: 70,   # Taurus
+        2: 90,   # Gemini (own sign)
+        3: 60,   # Cancer
+        4: 50,   # Leo
+        5: 90,   # Virgo (own sign)
+        6: 100,  # Libra (exaltation)
+        7: 40,   # Scorpio
+        8: 50,   # Sagittarius
+        9: 20,   # Capricorn (debilitation)
+        10: 70,  # Aquarius
+        11: 60   # Pisces
+    },
+    "Jupiter": {
+        0: 70,   # Aries
+        1: 60,   # Taurus
+        2: 20,   # Gemini (debilitation)
+        3: 100,  # Cancer (exaltation)
+        4: 60,   # Leo
+        5: 40,   # Virgo
+        6: 50,   # Libra
+        7: 50,   # Scorpio
+        8: 90,   # Sagittarius (own sign)
+        9: 40,   # Capricorn
+        10: 40,  # Aquarius
+        11: 90   # Pisces (own sign)
+    },
+    "Venus": {
+        0: 20,   # Aries (debilitation)
+        1: 90,   # Taurus (own sign)
+        2: 70,   # Gemini
+        3: 60,   # Cancer
+        4: 40,   # Leo
+        5: 100,  # Virgo (exaltation)
+        6: 90,   # Libra (own sign)
+        7: 50,   # Scorpio
+        8: 40,   # Sagittarius
+        9: 60,   # Capricorn
+        10: 50,  # Aquarius
+        11: 70   # Pisces
+    },
+    "Saturn": {
+        0: 20,   # Aries (debilitation)
+        1: 40,   # Taurus
+        2: 60,   # Gemini
+        3: 50,   # Cancer
+        4: 30,   # Leo
+        5: 70,   # Virgo
+        6: 100,  # Libra (exaltation)
+        7: 50,   # Scorpio
+        8: 40,   # Sagittarius
+        9: 90,   # Capricorn (own sign)
+        10: 90,  # Aquarius (own sign)
+        11: 40   # Pisces
+    }
+}
+
+# Exaltation point and debilitation sign
+EXALTATION_POINTS = {
+    "Sun": {
+        "sign": 0,  # Aries
+        "degree": 10,
+        "debilitation_sign": 6  # Libra
+    },
+    "Moon": {
+        "sign": 1,  # Taurus
+        "degree": 3,
+        "debilitation_sign": 7  # Scorpio
+    },
+    "Mars": {
+        "sign": 9,  # Capricorn
+        "degree": 28,
+        "debilitation_sign": 3  # Cancer
+    },
+    "Mercury": {
+        "sign": 5,  # Virgo
+        "degree": 15,
+        "debilitation_sign": 11  # Pisces
+    },
+    "Jupiter": {
+        "sign": 3,  # Cancer
+        "degree": 5,
+        "debilitation_sign": 2  # Gemini
+    },
+    "Venus": {
+        "sign": 11,  # Pisces
+        "degree": 27,
+        "debilitation_sign": 5  # Virgo
+    },
+    "Saturn": {
+        "sign": 6,  # Libra
+        "degree": 20,
+        "debilitation_sign": 0  # Aries
+    }
+}
+
+# Moolatrikona sign and degree range
+MOOLATRIKONA_RANGES = {
+    "Sun": {
+        "sign": 4,  # Leo
+        "start": 0,
+        "end": 20
+    },
+    "Moon": {
+        "sign": 1,  # Taurus
+        "start": 3,
+        "end": 30
+    },
+    "Mars": {
+        "sign": 0,  # Aries
+        "start": 0,
+        "end": 12
+    },
+    "Mercury": {
+        "sign": 5,  # Virgo
+        "start": 15,
+        "end": 20
+    },
+    "Jupiter": {
+        "sign": 8,  # Sagittarius
+        "start": 0,
+        "end": 10
+    },
+    "Venus": {
+        "sign": 6,  # Libra
+        "start": 0,
+        "end": 15
+    },
+    "Saturn": {
+        "sign": 10,  # Aquarius
+        "start": 0,
+        "end": 20
+    }
+}
+
+# Own signs
+OWN_SIGNS = {
+    "Sun": [4],          # Leo
+    "Moon": [3],         # Cancer
+    "Mars": [0, 7],      # Aries, Scorpio
+    "Mercury": [2, 5],   # Gemini, Virgo
+    "Jupiter": [8, 11],  # Sagittarius, Pisces
+    "Venus": [1, 6],     # Taurus, Libra
+    "Saturn": [9, 10]    # Capricorn, Aquarius
+}
+
+# Vimshopaka: benefic and malefic nakshatras (0 = Ashwini)
+BENEFIC_NAKSHATRAS = [0, 3, 5, 7, 10, 12, 15, 17, 20, 22, 25]  # Example list
+MALEFIC_NAKSHATRAS = [1, 4, 6, 9, 11, 14, 16, 19, 21, 24, 26]  # Example list
+
+# Vimshopaka aspects; similar to drik bala but focuses on beneficial aspects
+VIMSHOPAKA_ASPECTS = {
+    0: 100,    # Conjunction with benefic
+    60: 75,    # Sextile
+    120: 100,  # Trine
+    180: 25    # Opposition
+}
+
+# Natural benefics and malefics
+BENEFICS = ["Jupiter", "Venus", "Mercury", "Moon"]
+MALEFICS = ["Saturn", "Mars", "Sun"]  # Sun can be both
+
+# Dignity signs
+DIGNITIES = {
+    "Sun": {
+        "exaltation": 0,      # Aries
+        "debilitation": 6,    # Libra
+        "own_sign": [4],      # Leo
+        "friend_signs": [0, 8],  # Aries, Sagittarius
+        "enemy_signs": [10, 11]  # Aquarius, Pisces
+    },
+    "Moon": {
+        "exaltation": 1,      # Taurus
+        "debilitation": 7,    # Scorpio
+        "own_sign": [3],      # Cancer
+        "friend_signs": [2, 4],  # Gemini, Leo
+        "enemy_signs": [5, 6]    # Virgo, Libra
+    },
+    "Mars": {
+        "exaltation": 9,      # Capricorn
+        "debilitation": 3,    # Cancer
+        "own_sign": [0, 7],   # Aries, Scorpio
+        "friend_signs": [4, 8],  # Leo, Sagittarius
+        "enemy_signs": [1, 2]    # Taurus, Gemini
+    },
+    "Mercury": {
+        "exaltation": 5,      # Virgo
+        "debilitation": 11,   # Pisces
+        "own_sign": [2, 5],   # Gemini, Virgo
+        "friend_signs": [1, 4],  # Taurus, Leo
+        "enemy_signs": [7, 8]    # Scorpio, Sagittarius
+    },
+    "Jupiter": {
+        "exaltation": 3,      # Cancer
+        "debilitation": 9,    # Capricorn
+        "own_sign": [8, 11],  # Sagittarius, Pisces
+        "friend_signs": [0, 4],  # Aries, Leo
+        "enemy_signs": [5, 6]    # Virgo, Libra
+    },
+    "Venus": {
+        "exaltation": 11,     # Pisces
+        "debilitation": 5,    # Virgo
+        "own_sign": [1, 6],   # Taurus, Libra
+        "friend_signs": [3, 9],  # Cancer, Capricorn
+        "enemy_signs": [7, 8]    # Scorpio, Sagittarius
+    },
+    "Saturn": {
+        "exaltation": 6,      # Libra
+        "debilitation": 0,    # Aries
+        "own_sign": [9, 10],  # Capricorn, Aquarius
+        "friend_signs": [2, 5],  # Gemini, Virgo
+        "enemy_signs": [3, 4]    # Cancer, Leo
+    }
+}
+
+# Drik bala: aspect angles and their strengths
+DRIK_ASPECTS = {
+    0: 100,    # Conjunction
+    60: 50,    # Sextile
+    90: 25,    # Square
+    120: 75,   # Trine
+    180: 50    # Opposition
+}
+
+# Orbs in degrees
+VIMSHOPAKA_ORB = 6  # Tighter orb for Vimshopaka
+DRIK_ORB = 8
+
+
 class EnhancedPlanetaryStrengthEngine:
     def __init__(self):
         # Natural strengths of planets
@@ -106,23 +424,13 @@ class EnhancedPlanetaryStrengthEngine:
     
     def _calculate_dig_bala(self, planet: Dict[str, Any], chart: Dict[str, Any]) -> float:
         """Calculate directional strength"""
-        # Define directional strengths for each planet
-        directional_strengths = {
-            "Sun": {"best": 10, "worst": 4},      # Best in 10th, worst in 4th
-            "Moon": {"best": 4, "worst": 10},      # Best in 4th, worst in 10th
-            "Mars": {"best": 10, "worst": 4},      # Best in 10th, worst in 4th
-            "Mercury": {"best": 1, "worst": 7},    # Best in 1st, worst in 7th
-            "Jupiter": {"best": 1, "worst": 7},    # Best in 1st, worst in 7th
-            "Venus": {"best": 4, "worst": 10},     # Best in 4th, worst in 10th
-            "Saturn": {"best": 7, "worst": 1}      # Best in 7th, worst in 1st
-        }
         
         # Get planet's house placement
         house = planet.get("house", 1)  # Default to 1st house
         
         # Default to Sun if planet type is not specified
         planet_type = planet.get("name", "Sun")
-        planet_dirs = directional_strengths.get(planet_type, directional_strengths["Sun"])
+        planet_dirs = DIG_BALA_HOUSES.get(planet_type, DIG_BALA_HOUSES["Sun"])
         
         # Calculate distance from best and worst houses
         best_distance = min(
@@ -161,20 +469,9 @@ class EnhancedPlanetaryStrengthEngine:
         # Divide zodiac into day (0-180) and night (180-360) portions
         is_day = 0 <= longitude < 180
         
-        # Define diurnal/nocturnal preferences for planets
-        day_night_preferences = {
-            "Sun": "day",
-            "Moon": "night",
-            "Mars": "night",
-            "Mercury": "neutral",
-            "Jupiter": "day",
-            "Venus": "night",
-            "Saturn": "night"
-        }
-        
         # Get planet's preference
         planet_type = planet.get("name", "Sun")
-        preference = day_night_preferences.get(planet_type, "neutral")
+        preference = DAY_NIGHT_PREFERENCES.get(planet_type, "neutral")
         
         # Calculate day/night strength
         if preference == "neutral":
@@ -195,20 +492,9 @@ class EnhancedPlanetaryStrengthEngine:
         # Get planet's speed
         speed = planet.get("speed", 0)
         
-        # Define typical speeds for each planet
-        typical_speeds = {
-            "Sun": 1.0,          # Roughly 1° per day
-            "Moon": 13.0,        # Roughly 13° per day
-            "Mars": 0.5,         # About 0.5° per day
-            "Mercury": 1.2,      # Variable, around 1.2° per day
-            "Jupiter": 0.1,      # About 0.1° per day
-            "Venus": 1.0,        # About 1° per day
-            "Saturn": 0.03       # About 0.03° per day
-        }
-        
         # Get planet's typical speed
         planet_type = planet.get("name", "Sun")
-        typical_speed = typical_speeds.get(planet_type, 1.0)
+        typical_speed = TYPICAL_SPEEDS.get(planet_type, 1.0)
         
         # Calculate ratio of current speed to typical speed
         speed_ratio = abs(speed) / typical_speed if typical_speed != 0 else 0
@@ -235,20 +521,10 @@ class EnhancedPlanetaryStrengthEngine:
     
     def _calculate_naisargika_bala(self, planet: Dict[str, Any]) -> float:
         """Calculate natural strength"""
-        # Define natural strengths for each planet
-        natural_strengths = {
-            "Sun": 100,      # Strongest natural strength
-            "Moon": 85,      # Very strong
-            "Mars": 70,      # Strong
-            "Mercury": 60,   # Moderate to strong
-            "Jupiter": 75,   # Strong
-            "Venus": 65,     # Moderate to strong
-            "Saturn": 50     # Moderate
-        }
         
         # Get planet's natural strength
         planet_type = planet.get("name", "Sun")
-        strength = natural_strengths.get(planet_type, 50)  # Default to moderate strength
+        strength = NATURAL_STRENGTHS.get(planet_type, 50)  # Default to moderate strength
         
         return strength
 
@@ -307,111 +583,9 @@ class EnhancedPlanetaryStrengthEngine:
         longitude = planet["longitude"]
         sign = int(longitude / 30)  # Get zodiac sign (0-11)
         
-        # Define sign strengths for each planet type
-        sign_strengths = {
-            "Sun": {
-                0: 60,   # Aries
-                1: 70,   # Taurus
-                2: 50,   # Gemini
-                3: 40,   # Cancer
-                4: 100,  # Leo (exaltation)
-                5: 50,   # Virgo
-                6: 20,   # Libra (debilitation)
-                7: 40,   # Scorpio
-                8: 80,   # Sagittarius
-                9: 30,   # Capricorn
-                10: 70,  # Aquarius
-                11: 60   # Pisces
-            },
-            "Moon": {
-                0: 50,   # Aries
-                1: 100,  # Taurus (exaltation)
-                2: 60,   # Gemini
-                3: 90,   # Cancer (own sign)
-                4: 50,   # Leo
-                5: 40,   # Virgo
-                6: 50,   # Libra
-                7: 20,   # Scorpio (debilitation)
-                8: 70,   # Sagittarius
-                9: 40,   # Capricorn
-                10: 60,  # Aquarius
-                11: 70   # Pisces
-            },
-            "Mars": {
-                0: 90,   # Aries (own sign)
-                1: 50,   # Taurus
-                2: 40,   # Gemini
-                3: 30,   # Cancer (debilitation)
-                4: 70,   # Leo
-                5: 50,   # Virgo
-                6: 40,   # Libra
-                7: 90,   # Scorpio (own sign)
-                8: 100,  # Sagittarius
-                9: 100,  # Capricorn (exaltation)
-                10: 60,  # Aquarius
-                11: 40   # Pisces
-            },
-            "Mercury": {
-                0: 40,   # Aries
-                1: 70,   # Taurus
-                2: 90,   # Gemini (own sign)
-                3: 60,   # Cancer
-                4: 50,   # Leo
-                5: 90,   # Virgo (own sign)
-                6: 100,  # Libra (exaltation)
-                7: 40,   # Scorpio
-                8: 50,   # Sagittarius
-                9: 20,   # Capricorn (debilitation)
-                10: 70,  # Aquarius
-                11: 60   # Pisces
-            },
-            "Jupiter": {
-                0: 70,   # Aries
-                1: 60,   # Taurus
-                2: 20,   # Gemini (debilitation)
-                3: 100,  # Cancer (exaltation)
-                4: 60,   # Leo
-                5: 40,   # Virgo
-                6: 50,   # Libra
-                7: 50,   # Scorpio
-                8: 90,   # Sagittarius (own sign)
-                9: 40,   # Capricorn
-                10: 40,  # Aquarius
-                11: 90   # Pisces (own sign)
-            },
-            "Venus": {
-                0: 20,   # Aries (debilitation)
-                1: 90,   # Taurus (own sign)
-                2: 70,   # Gemini
-                3: 60,   # Cancer
-                4: 40,   # Leo
-                5: 100,  # Virgo (exaltation)
-                6: 90,   # Libra (own sign)
-                7: 50,   # Scorpio
-                8: 40,   # Sagittarius
-                9: 60,   # Capricorn
-                10: 50,  # Aquarius
-                11: 70   # Pisces
-            },
-            "Saturn": {
-                0: 20,   # Aries (debilitation)
-                1: 40,   # Taurus
-                2: 60,   # Gemini
-                3: 50,   # Cancer
-                4: 30,   # Leo
-                5: 70,   # Virgo
-                6: 100,  # Libra (exaltation)
-                7: 50,   # Scorpio
-                8: 40,   # Sagittarius
-                9: 90,   # Capricorn (own sign)
-                10: 90,  # Aquarius (own sign)
-                11: 40   # Pisces
-            }
-        }
-        
         # Default to Sun's values if planet type is not specified
         planet_type = planet.get("name", "Sun")
-        planet_sign_strengths = sign_strengths.get(planet_type, sign_strengths["Sun"])
+        planet_sign_strengths = SIGN_STRENGTHS.get(planet_type, SIGN_STRENGTHS["Sun"])
         
         return planet_sign_strengths[sign]
 
@@ -420,48 +594,9 @@ class EnhancedPlanetaryStrengthEngine:
         longitude = planet["longitude"]
         sign = int(longitude / 30)  # Get zodiac sign (0-11)
         
-        # Define exaltation points for each planet
-        exaltation_points = {
-            "Sun": {
-                "sign": 0,  # Aries
-                "degree": 10,
-                "debilitation_sign": 6  # Libra
-            },
-            "Moon": {
-                "sign": 1,  # Taurus
-                "degree": 3,
-                "debilitation_sign": 7  # Scorpio
-            },
-            "Mars": {
-                "sign": 9,  # Capricorn
-                "degree": 28,
-                "debilitation_sign": 3  # Cancer
-            },
-            "Mercury": {
-                "sign": 5,  # Virgo
-                "degree": 15,
-                "debilitation_sign": 11  # Pisces
-            },
-            "Jupiter": {
-                "sign": 3,  # Cancer
-                "degree": 5,
-                "debilitation_sign": 2  # Gemini
-            },
-            "Venus": {
-                "sign": 11,  # Pisces
-                "degree": 27,
-                "debilitation_sign": 5  # Virgo
-            },
-            "Saturn": {
-                "sign": 6,  # Libra
-                "degree": 20,
-                "debilitation_sign": 0  # Aries
-            }
-        }
-        
         # Default to Sun if planet type is not specified
         planet_type = planet.get("name", "Sun")
-        exalt_data = exaltation_points.get(planet_type, exaltation_points["Sun"])
+        exalt_data = EXALTATION_POINTS.get(planet_type, EXALTATION_POINTS["Sun"])
         
         # Calculate distance from exaltation point
         exalt_sign = exalt_data["sign"]
@@ -494,48 +629,9 @@ class EnhancedPlanetaryStrengthEngine:
         sign = int(longitude / 30)  # Get zodiac sign (0-11)
         degree = longitude % 30  # Get degree within sign
         
-        # Define Moolatrikona ranges for each planet
-        moolatrikona_ranges = {
-            "Sun": {
-                "sign": 4,  # Leo
-                "start": 0,
-                "end": 20
-            },
-            "Moon": {
-                "sign": 1,  # Taurus
-                "start": 3,
-                "end": 30
-            },
-            "Mars": {
-                "sign": 0,  # Aries
-                "start": 0,
-                "end": 12
-            },
-            "Mercury": {
-                "sign": 5,  # Virgo
-                "start": 15,
-                "end": 20
-            },
-            "Jupiter": {
-                "sign": 8,  # Sagittarius
-                "start": 0,
-                "end": 10
-            },
-            "Venus": {
-                "sign": 6,  # Libra
-                "start": 0,
-                "end": 15
-            },
-            "Saturn": {
-                "sign": 10,  # Aquarius
-                "start": 0,
-                "end": 20
-            }
-        }
-        
         # Default to Sun if planet type is not specified
         planet_type = planet.get("name", "Sun")
-        moola_data = moolatrikona_ranges.get(planet_type, moolatrikona_ranges["Sun"])
+        moola_data = MOOLATRIKONA_RANGES.get(planet_type, MOOLATRIKONA_RANGES["Sun"])
         
         # Check if planet is in Moolatrikona range
         if sign == moola_data["sign"] and moola_data["start"] <= degree <= moola_data["end"]:
@@ -560,20 +656,9 @@ class EnhancedPlanetaryStrengthEngine:
         longitude = planet["longitude"]
         sign = int(longitude / 30)  # Get zodiac sign (0-11)
         
-        # Define own signs for each planet
-        own_signs = {
-            "Sun": [4],          # Leo
-            "Moon": [3],         # Cancer
-            "Mars": [0, 7],      # Aries, Scorpio
-            "Mercury": [2, 5],   # Gemini, Virgo
-            "Jupiter": [8, 11],  # Sagittarius, Pisces
-            "Venus": [1, 6],     # Taurus, Libra
-            "Saturn": [9, 10]    # Capricorn, Aquarius
-        }
-        
         # Default to Sun if planet type is not specified
         planet_type = planet.get("name", "Sun")
-        planet_own_signs = own_signs.get(planet_type, own_signs["Sun"])
+        planet_own_signs = OWN_SIGNS.get(planet_type, OWN_SIGNS["Sun"])
         
         # Check if planet is in own sign
         if sign in planet_own_signs:
@@ -623,16 +708,12 @@ class EnhancedPlanetaryStrengthEngine:
         nakshatra_num = (longitude * 27 / 360) % 27
         position_in_nakshatra = (nakshatra_num % 1) * 100
         
-        # Define benefic and malefic nakshatras
-        benefic_nakshatras = [0, 3, 5, 7, 10, 12, 15, 17, 20, 22, 25]  # Example list
-        malefic_nakshatras = [1, 4, 6, 9, 11, 14, 16, 19, 21, 24, 26]  # Example list
-        
         base_nakshatra = int(nakshatra_num)
         
         # Determine base strength from nakshatra type
-        if base_nakshatra in benefic_nakshatras:
+        if base_nakshatra in BENEFIC_NAKSHATRAS:
             base_strength = 75
-        elif base_nakshatra in malefic_nakshatras:
+        elif base_nakshatra in MALEFIC_NAKSHATRAS:
             base_strength = 25
         else:
             base_strength = 50
@@ -670,17 +751,6 @@ class EnhancedPlanetaryStrengthEngine:
 
     def _calculate_aspect_strength(self, planet: Dict[str, Any], chart: Dict[str, Any]) -> float:
         """Calculate strength based on aspects received"""
-        # This is similar to drik bala but focuses on beneficial aspects
-        aspect_strengths = {
-            0: 100,    # Conjunction with benefic
-            60: 75,    # Sextile
-            120: 100,  # Trine
-            180: 25    # Opposition
-        }
-        
-        # Define benefic and malefic planets
-        benefics = ["Jupiter", "Venus", "Mercury", "Moon"]
-        malefics = ["Saturn", "Mars", "Sun"]  # Sun can be both
         
         # Get planet's longitude
         planet_long = planet["longitude"]
@@ -702,13 +772,13 @@ class EnhancedPlanetaryStrengthEngine:
                 distance = 360 - distance
                 
             # Check for aspects
-            for aspect_angle, base_strength in aspect_strengths.items():
-                orb = 6  # Tighter orb for Vimshopaka
+            for aspect_angle, base_strength in VIMSHOPAKA_ASPECTS.items():
+                orb = VIMSHOPAKA_ORB
                 if abs(distance - aspect_angle) <= orb:
                     # Modify strength based on aspecting planet
-                    if planet_name in benefics:
+                    if planet_name in BENEFICS:
                         aspect_strength = base_strength
-                    elif planet_name in malefics:
+                    elif planet_name in MALEFICS:
                         aspect_strength = base_strength * 0.5  # Reduce strength for malefics
                     else:
                         aspect_strength = base_strength * 0.75
@@ -728,61 +798,8 @@ class EnhancedPlanetaryStrengthEngine:
         # Calculate sign (0-11)
         sign = int(longitude / 30)
         
-        # Define dignities for each planet
-        dignities = {
-            "Sun": {
-                "exaltation": 0,      # Aries
-                "debilitation": 6,    # Libra
-                "own_sign": [4],      # Leo
-                "friend_signs": [0, 8],  # Aries, Sagittarius
-                "enemy_signs": [10, 11]  # Aquarius, Pisces
-            },
-            "Moon": {
-                "exaltation": 1,      # Taurus
-                "debilitation": 7,    # Scorpio
-                "own_sign": [3],      # Cancer
-                "friend_signs": [2, 4],  # Gemini, Leo
-                "enemy_signs": [5, 6]    # Virgo, Libra
-            },
-            "Mars": {
-                "exaltation": 9,      # Capricorn
-                "debilitation": 3,    # Cancer
-                "own_sign": [0, 7],   # Aries, Scorpio
-                "friend_signs": [4, 8],  # Leo, Sagittarius
-                "enemy_signs": [1, 2]    # Taurus, Gemini
-            },
-            "Mercury": {
-                "exaltation": 5,      # Virgo
-                "debilitation": 11,   # Pisces
-                "own_sign": [2, 5],   # Gemini, Virgo
-                "friend_signs": [1, 4],  # Taurus, Leo
-                "enemy_signs": [7, 8]    # Scorpio, Sagittarius
-            },
-            "Jupiter": {
-                "exaltation": 3,      # Cancer
-                "debilitation": 9,    # Capricorn
-                "own_sign": [8, 11],  # Sagittarius, Pisces
-                "friend_signs": [0, 4],  # Aries, Leo
-                "enemy_signs": [5, 6]    # Virgo, Libra
-            },
-            "Venus": {
-                "exaltation": 11,     # Pisces
-                "debilitation": 5,    # Virgo
-                "own_sign": [1, 6],   # Taurus, Libra
-                "friend_signs": [3, 9],  # Cancer, Capricorn
-                "enemy_signs": [7, 8]    # Scorpio, Sagittarius
-            },
-            "Saturn": {
-                "exaltation": 6,      # Libra
-                "debilitation": 0,    # Aries
-                "own_sign": [9, 10],  # Capricorn, Aquarius
-                "friend_signs": [2, 5],  # Gemini, Virgo
-                "enemy_signs": [3, 4]    # Cancer, Leo
-            }
-        }
-        
         # Get planet's dignity info
-        dignity = dignities.get(planet_name, {})
+        dignity = DIGNITIES.get(planet_name, {})
         
         # Calculate position within sign (0-30 degrees)
         sign_position = longitude % 30
@@ -1088,14 +1105,6 @@ class EnhancedPlanetaryStrengthEngine:
 
     def _calculate_drik_bala(self, planet: Dict[str, Any], chart: Dict[str, Any]) -> float:
         """Calculate aspectual strength"""
-        # Define aspect angles and their strengths
-        aspect_strengths = {
-            0: 100,    # Conjunction
-            60: 50,    # Sextile
-            90: 25,    # Square
-            120: 75,   # Trine
-            180: 50    # Opposition
-        }
         
         # Get planet's longitude
         planet_long = planet["longitude"]
@@ -1117,8 +1126,8 @@ class EnhancedPlanetaryStrengthEngine:
                 distance = 360 - distance
                 
             # Check for aspects (allowing some orb)
-            for aspect_angle, base_strength in aspect_strengths.items():
-                orb = 8  # Allow 8 degree orb
+            for aspect_angle, base_strength in DRIK_ASPECTS.items():
+                orb = DRIK_ORB
                 if abs(distance - aspect_angle) <= orb:
                     # Calculate strength based on exactness of aspect
                     exactness = 1 - (abs(distance - aspect_angle) / orb)
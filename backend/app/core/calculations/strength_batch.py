@@ -0,0 +1,357 @@
+"""
+Batched Planetary Strength
+PGF Protocol: STRENGTH_001
+Gate: GATE_4
+Version: 1.0.0
+
+Scores the seven classical planets of many charts in one vectorized pass,
+producing the same shadbala, vimshopaka and special strength components
+as EnhancedPlanetaryStrengthEngine.calculate_complete_strengths. The
+engine's dict tables (sign strengths, exaltation points, moolatrikona
+ranges, dig bala houses, dignity signs) are turned into arrays once, so a
+chart costs a handful of array lookups instead of per-planet dict
+rebuilds. Inputs are (N charts x 7 planets) in PLANETS order; each
+chart's seven planets are the chart its aspect-based components see.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .aspect_kernel import separations
+from .strength import (
+    BENEFIC_NAKSHATRAS,
+    BENEFICS,
+    DAY_NIGHT_PREFERENCES,
+    DIG_BALA_HOUSES,
+    DIGNITIES,
+    DRIK_ASPECTS,
+    DRIK_ORB,
+    EXALTATION_POINTS,
+    MALEFIC_NAKSHATRAS,
+    MALEFICS,
+    MOOLATRIKONA_RANGES,
+    NATURAL_STRENGTHS,
+    OWN_SIGNS,
+    SIGN_STRENGTHS,
+    TYPICAL_SPEEDS,
+    VIMSHOPAKA_ASPECTS,
+    VIMSHOPAKA_ORB,
+)
+
+PLANETS: Tuple[str, ...] = ("Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn")
+
+SHADBALA_COMPONENTS = ("sthana_bala", "dig_bala", "kala_bala", "chesta_bala", "naisargika_bala", "drik_bala")
+VIMSHOPAKA_COMPONENTS = (
+    "sign_position", "nakshatra_position", "navamsa_position", "aspect_strength", "dignity_strength"
+)
+SPECIAL_COMPONENTS = ("yuddha_bala", "kendradi_bala", "drekkana_bala", "saptavargaja_bala")
+
+KENDRAS = (1, 4, 7, 10)
+PANAPHARAS = (2, 5, 8, 11)
+
+# Saptavargaja: (longitude multiplier, bucket upper bounds, bucket strengths)
+SAPTAVARGA_BUCKETS: Tuple[Tuple[int, Tuple[float, ...], Tuple[float, ...]], ...] = (
+    (1, (10, 20), (100, 75, 50)),
+    (2, (15,), (100, 75)),
+    (3, (10, 20), (100, 75, 50)),
+    (4, (7.5, 15, 22.5), (100, 75, 50, 25)),
+    (7, (4.3, 8.6, 12.9, 17.2, 21.5, 25.8), (100, 85, 70, 55, 40, 25, 10)),
+    (9, (3.33, 6.66, 10, 13.33, 16.66, 20, 23.33, 26.66), (100, 90, 80, 70, 60, 50, 40, 30, 20)),
+    (12, (2.5, 5, 7.5, 10, 12.5, 15, 17.5, 20, 22.5, 25), (100, 90, 80, 70, 60, 50, 40, 30, 20, 10, 0)),
+)
+
+# Dignity base strength per sign before the in-sign increment, by precedence
+DIGNITY_BASES = {
+    "neutral": 40,
+    "enemy_signs": 20,
+    "friend_signs": 50,
+    "own_sign": 70,
+    "debilitation": 0,
+    "exaltation": 90,
+}
+
+
+def _per_planet(table: Mapping[str, Any], key: Optional[str] = None) -> np.ndarray:
+    return np.array([table[p] if key is None else table[p][key] for p in PLANETS], dtype=float)
+
+
+def _sign_mask(signs: Mapping[str, Sequence[int]]) -> np.ndarray:
+    mask = np.zeros((len(PLANETS), 12), dtype=bool)
+    for row, planet in enumerate(PLANETS):
+        mask[row, list(signs[planet])] = True
+    return mask
+
+
+def _clip(values: np.ndarray) -> np.ndarray:
+    return np.clip(values, 0, 100)
+
+
+class BatchStrengthEngine:
+    """Vectorized EnhancedPlanetaryStrengthEngine over (charts x planets)"""
+
+    def __init__(self):
+        rows = np.arange(len(PLANETS))
+        self._rows = rows
+
+        # Sthana bala
+        self.sign_strengths = np.array([[SIGN_STRENGTHS[p][s] for s in range(12)] for p in PLANETS], dtype=float)
+        self.exaltation_points = _per_planet(EXALTATION_POINTS, "sign") * 30 + _per_planet(EXALTATION_POINTS, "degree")
+        self.moolatrikona_signs = _per_planet(MOOLATRIKONA_RANGES, "sign").astype(int)
+        self.moolatrikona_start = _per_planet(MOOLATRIKONA_RANGES, "start")
+        self.moolatrikona_end = _per_planet(MOOLATRIKONA_RANGES, "end")
+        self.own_signs = _sign_mask(OWN_SIGNS)
+
+        # Dig, kala, chesta and naisargika bala
+        self.dig_best = _per_planet(DIG_BALA_HOUSES, "best")
+        self.dig_worst = _per_planet(DIG_BALA_HOUSES, "worst")
+        preference = {"day": 1, "night": -1, "neutral": 0}
+        self.day_night = np.array([preference[DAY_NIGHT_PREFERENCES[p]] for p in PLANETS])
+        self.typical_speeds = _per_planet(TYPICAL_SPEEDS)
+        self.natural_strengths = _per_planet(NATURAL_STRENGTHS)
+
+        # Aspect tables; weights are per aspecting planet
+        self.drik_angles = np.array(list(DRIK_ASPECTS), dtype=float)
+        self.drik_values = np.array(list(DRIK_ASPECTS.values()), dtype=float)
+        self.vimshopaka_angles = np.array(list(VIMSHOPAKA_ASPECTS), dtype=float)
+        self.vimshopaka_values = np.array(list(VIMSHOPAKA_ASPECTS.values()), dtype=float)
+        self.aspect_weights = np.array(
+            [1.0 if p in BENEFICS else 0.5 if p in MALEFICS else 0.75 for p in PLANETS]
+        )
+        self.others = ~np.eye(len(PLANETS), dtype=bool)
+
+        # Vimshopaka
+        self.nakshatra_bases = np.full(27, 50.0)
+        self.nakshatra_bases[BENEFIC_NAKSHATRAS] = 75
+        self.nakshatra_bases[MALEFIC_NAKSHATRAS] = 25
+        # Later assignments win, matching the scalar engine's if/elif order
+        self.dignity_bases = np.full((len(PLANETS), 12), float(DIGNITY_BASES["neutral"]))
+        for kind in ("enemy_signs", "friend_signs", "own_sign", "debilitation", "exaltation"):
+            signs = {p: np.atleast_1d(DIGNITIES[p][kind]) for p in PLANETS}
+            self.dignity_bases[_sign_mask(signs)] = DIGNITY_BASES[kind]
+
+        self.saptavarga = [
+            (multiplier, np.array(bounds), np.array(strengths, dtype=float))
+            for multiplier, bounds, strengths in SAPTAVARGA_BUCKETS
+        ]
+
+    def calculate(
+        self,
+        longitudes: Sequence[Sequence[float]],
+        speeds: Sequence[Sequence[float]],
+        houses: Sequence[Sequence[int]]
+    ) -> Dict[str, np.ndarray]:
+        """Score every planet of every chart
+
+        Args:
+            longitudes: Sidereal longitudes shaped (N, 7), PLANETS order
+            speeds: Daily motion in degrees shaped (N, 7)
+            houses: House placements 1-12 shaped (N, 7)
+
+        Returns:
+            Arrays shaped (N, 7) for every shadbala, vimshopaka and special
+            component plus shadbala_total, vimshopaka_total, special_total,
+            dignity, relative_strength and total
+        """
+        lon = np.mod(np.asarray(longitudes, dtype=float), 360)
+        speed = np.asarray(speeds, dtype=float)
+        house = np.asarray(houses, dtype=int)
+        if lon.ndim != 2 or lon.shape[1] != len(PLANETS):
+            raise ValueError(f"Expected longitudes shaped (N, {len(PLANETS)}), got {lon.shape}")
+        if speed.shape != lon.shape or house.shape != lon.shape:
+            raise ValueError("longitudes, speeds and houses must have the same shape")
+
+        sign = np.floor(lon / 30).astype(int)
+        degree = np.mod(lon, 30)
+        separation = separations(lon, lon)
+
+        result = {
+            "sthana_bala": self._sthana_bala(sign, degree),
+            "dig_bala": self._dig_bala(house),
+            "kala_bala": self._kala_bala(lon, speed),
+            "chesta_bala": self._chesta_bala(speed),
+            "naisargika_bala": np.broadcast_to(self.natural_strengths, lon.shape).copy(),
+            "drik_bala": self._drik_bala(separation),
+            "sign_position": self._sign_position(degree),
+            "nakshatra_position": self._nakshatra_position(lon),
+            "navamsa_position": self._navamsa_position(lon),
+            "aspect_strength": self._aspect_strength(separation),
+            "dignity_strength": _clip(self.dignity_bases[self._rows, sign] + degree / 3),
+            "yuddha_bala": self._yuddha_bala(separation),
+            "kendradi_bala": np.where(
+                np.isin(house, KENDRAS), 100.0, np.where(np.isin(house, PANAPHARAS), 75.0, 50.0)
+            ),
+            "drekkana_bala": self._drekkana_bala(degree),
+            "saptavargaja_bala": self._saptavargaja_bala(lon),
+        }
+
+        shadbala = sum(result[name] for name in SHADBALA_COMPONENTS) * 0.4
+        vimshopaka = sum(result[name] for name in VIMSHOPAKA_COMPONENTS) * 0.3
+        special = sum(result[name] for name in SPECIAL_COMPONENTS) * 0.3
+        relative = (shadbala + vimshopaka + special) / 600
+        dignity = result["dignity_strength"]
+        result.update({
+            "shadbala_total": shadbala,
+            "vimshopaka_total": vimshopaka,
+            "special_total": special,
+            "dignity": dignity,
+            "relative_strength": relative,
+            # Debilitated planets are capped at 20
+            "total": np.where(dignity < 10, dignity * 2, np.minimum(100, (relative * 0.6 + dignity * 0.4) * 100)),
+        })
+        return result
+
+    def calculate_charts(self, charts: Sequence[Mapping[str, Mapping[str, Any]]]) -> List[Dict[str, Dict[str, Any]]]:
+        """Strength profiles per chart, shaped like calculate_complete_strengths
+
+        Args:
+            charts: Per chart, planet name to a dict with longitude and
+                optional speed (default 0) and house (default 1)
+
+        Returns:
+            Per chart, planet name to its complete strength profile
+        """
+        if not charts:
+            return []
+        try:
+            rows = [[chart[planet] for planet in PLANETS] for chart in charts]
+        except KeyError as e:
+            raise ValueError(f"Chart is missing planet {e.args[0]}") from None
+        table = self.calculate(
+            [[p["longitude"] for p in row] for row in rows],
+            [[p.get("speed", 0) for p in row] for row in rows],
+            [[p.get("house", 1) for p in row] for row in rows],
+        )
+        table = {name: values.tolist() for name, values in table.items()}
+
+        def group(names, i, j):
+            return {name: table[name][i][j] for name in names}
+
+        return [
+            {
+                planet: {
+                    "shadbala": group(SHADBALA_COMPONENTS, i, j),
+                    "vimshopaka": group(VIMSHOPAKA_COMPONENTS, i, j),
+                    "special_strength": group(SPECIAL_COMPONENTS, i, j),
+                    "component_strengths": {
+                        "shadbala": table["shadbala_total"][i][j],
+                        "vimshopaka": table["vimshopaka_total"][i][j],
+                        "special_strength": table["special_total"][i][j],
+                        "dignity": table["dignity"][i][j],
+                    },
+                    "relative_strength": table["relative_strength"][i][j],
+                    "total": table["total"][i][j],
+                }
+                for j, planet in enumerate(PLANETS)
+            }
+            for i in range(len(charts))
+        ]
+
+    def _sthana_bala(self, sign: np.ndarray, degree: np.ndarray) -> np.ndarray:
+        rows = self._rows
+        sign_strength = self.sign_strengths[rows, sign]
+
+        # Distance from the exaltation point; 100 there, 0 at debilitation
+        diff = np.abs(sign * 30 + degree - self.exaltation_points)
+        distance = np.minimum(diff, np.abs(diff - 360))
+        exaltation = 100 - np.minimum(distance, 180) / 180 * 100
+
+        start, end = self.moolatrikona_start, self.moolatrikona_end
+        in_moolatrikona = (sign == self.moolatrikona_signs) & (start <= degree) & (degree <= end)
+        half_range = (end - start) / 2
+        moolatrikona = np.where(
+            in_moolatrikona, 100 - np.abs(degree - start - half_range) / half_range * 25, 50
+        )
+
+        own_sign = np.where(self.own_signs[rows, sign], 100 - np.abs(degree - 15) / 15 * 20, 50)
+        return sign_strength + exaltation + moolatrikona + own_sign
+
+    def _dig_bala(self, house: np.ndarray) -> np.ndarray:
+        def distance(target):
+            return np.minimum.reduce([
+                np.abs(house - target), np.abs(house - (target + 12)), np.abs(house - (target - 12))
+            ])
+
+        best, worst = distance(self.dig_best), distance(self.dig_worst)
+        return _clip(np.where(best < worst, 100 - best / 6 * 50, 50 - worst / 6 * 50))
+
+    def _kala_bala(self, lon: np.ndarray, speed: np.ndarray) -> np.ndarray:
+        speed_strength = 50 + np.minimum(np.abs(speed), 1) * 50 * np.where(speed >= 0, 1, -0.5)
+        is_day = lon < 180
+        preferred = ((self.day_night == 1) & is_day) | ((self.day_night == -1) & ~is_day)
+        day_night = np.where(self.day_night == 0, 75, np.where(preferred, 100, 50))
+        return _clip(speed_strength * 0.6 + day_night * 0.4)
+
+    def _chesta_bala(self, speed: np.ndarray) -> np.ndarray:
+        ratio = np.abs(speed) / self.typical_speeds
+        direct = np.where(ratio > 1, 100, 50 + ratio * 50)
+        retrograde = np.where(ratio > 1, 0, 50 - ratio * 50)
+        return _clip(np.where(speed >= 0, direct, retrograde))
+
+    def _drik_bala(self, separation: np.ndarray) -> np.ndarray:
+        """Mean exactness-weighted strength of aspects within DRIK_ORB"""
+        deviation = np.abs(separation[..., None] - self.drik_angles)
+        hits = (deviation <= DRIK_ORB) & self.others[..., None]
+        strength = np.where(hits, self.drik_values * (1 - deviation / DRIK_ORB), 0).sum(axis=(-2, -1))
+        count = hits.sum(axis=(-2, -1))
+        return _clip(np.where(count > 0, strength / np.maximum(count, 1), 50))
+
+    def _aspect_strength(self, separation: np.ndarray) -> np.ndarray:
+        """Closed form of the scalar running average (total + hit) / 2
+
+        Folding K hits into a start of 50 weighs the k-th hit by 2^-(K-k+1)
+        and the start by 2^-K, in aspecting planet then aspect order.
+        """
+        deviation = np.abs(separation[..., None] - self.vimshopaka_angles)
+        hits = (deviation <= VIMSHOPAKA_ORB) & self.others[..., None]
+        values = self.vimshopaka_values * self.aspect_weights[:, None]
+        hits = hits.reshape(*hits.shape[:-2], -1)
+        values = np.broadcast_to(values.ravel(), hits.shape)
+        count = hits.sum(axis=-1)
+        later = count[..., None] - np.cumsum(hits, axis=-1)
+        folded = np.where(hits, values * 0.5 ** (later + 1), 0).sum(axis=-1)
+        return _clip(50 * 0.5 ** count + folded)
+
+    def _yuddha_bala(self, separation: np.ndarray) -> np.ndarray:
+        effect = np.select(
+            [separation < 1, separation < 3, separation < 10, (separation > 170) & (separation < 190)],
+            [-25, -15, -5, 10],
+            0
+        )
+        return _clip(50 + np.where(self.others, effect, 0).sum(axis=-1))
+
+    @staticmethod
+    def _sign_position(degree: np.ndarray) -> np.ndarray:
+        middle = 75 - ((degree - 15) / 10) ** 2 * 25
+        return _clip(np.select(
+            [degree <= 5, degree >= 25],
+            [75 + degree / 5 * 25, 50 - (degree - 25) / 5 * 25],
+            middle
+        ))
+
+    def _nakshatra_position(self, lon: np.ndarray) -> np.ndarray:
+        nakshatra = np.mod(lon * 27 / 360, 27)
+        position = np.mod(nakshatra, 1) * 100
+        base = self.nakshatra_bases[nakshatra.astype(int)]
+        return _clip(base + np.where(position < 25, 25, np.where(position > 75, -25, 0)))
+
+    @staticmethod
+    def _navamsa_position(lon: np.ndarray) -> np.ndarray:
+        navamsa = np.mod(lon * 9 / 30, 9)
+        return _clip(np.select(
+            [navamsa < 3, navamsa < 6],
+            [100 - navamsa / 3 * 25, 75 - (navamsa - 3) / 3 * 25],
+            50 - (navamsa - 6) / 3 * 25
+        ))
+
+    @staticmethod
+    def _drekkana_bala(degree: np.ndarray) -> np.ndarray:
+        base = np.select([degree < 10, degree < 20], [100, 75], 50)
+        position = np.mod(degree, 10)
+        return _clip(base - np.select([position < 3, position < 7], [0, 10], 20))
+
+    def _saptavargaja_bala(self, lon: np.ndarray) -> np.ndarray:
+        total = np.zeros_like(lon)
+        for multiplier, bounds, strengths in self.saptavarga:
+            total += strengths[np.searchsorted(bounds, np.mod(lon * multiplier, 30), side="right")]
+        return total / len(self.saptavarga)
@@ -0,0 +1,291 @@
+"""
+Transit Timeline Search
+PGF Protocol: TRANSIT_001
+Gate: GATE_4
+Version: 1.0.0
+
+Finds the exact times at which transiting bodies change sign or
+nakshatra, station retrograde or direct, and perfect an aspect to a
+natal point. Each body is sampled on a grid whose step follows from its
+fastest motion and its shortest retrograde, so between two samples it
+either crosses no station or exactly one, which is bracketed by the sign
+of its speed and bisected. With stations inserted into the grid every
+interval is monotonic, so a target longitude is crossed at most once per
+interval and the crossings of all targets are found in one array pass,
+then refined by safeguarded Newton iteration on the ephemeris. The range
+is processed in chunks so events stream out in time order.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from .aspect_kernel import MAJOR_ASPECTS
+from .muhurta import SIGNS
+from .panchang import (
+    AYANAMSA_MODES,
+    MAX_ITERATIONS,
+    NAKSHATRAS,
+    TOLERANCE_DAYS,
+    from_julian_day,
+    linear_ayanamsa,
+    to_julian_day,
+)
+
+EVENT_TYPES = ("ingress", "nakshatra", "station", "aspect")
+
+# Most degrees a body may move between two samples
+STEP_DEGREES = 15.0
+MAX_STEP_DAYS = 10.0
+# Events are produced and sorted a chunk at a time
+CHUNK_DAYS = 30.0
+# Speed is flat at a station, so its time is only meaningful to ~seconds
+STATION_TOLERANCE_DAYS = 1e-4
+
+
+@dataclass(frozen=True)
+class TransitBody:
+    """Ephemeris body and the motion bounds that size its sampling grid"""
+    planet: int
+    # Fastest motion in degrees/day
+    max_speed: float
+    # Shortest time between two stations in days; None if it never stations
+    min_station_gap: Optional[float] = None
+    # Added to the ephemeris longitude (Ketu is opposite Rahu)
+    offset: float = 0.0
+
+    @property
+    def step(self) -> float:
+        """Sample spacing in days
+
+        Short enough that the body moves at most STEP_DEGREES and that no
+        two stations fall between consecutive samples.
+        """
+        step = min(STEP_DEGREES / self.max_speed, MAX_STEP_DAYS)
+        if self.min_station_gap is not None:
+            step = min(step, self.min_station_gap / 2)
+        return step
+
+
+BODIES: Dict[str, TransitBody] = {
+    "sun": TransitBody(swe.SUN, 1.02),
+    "moon": TransitBody(swe.MOON, 15.4),
+    "mercury": TransitBody(swe.MERCURY, 2.2, 19.0),
+    "venus": TransitBody(swe.VENUS, 1.26, 40.0),
+    "mars": TransitBody(swe.MARS, 0.8, 58.0),
+    "jupiter": TransitBody(swe.JUPITER, 0.25, 115.0),
+    "saturn": TransitBody(swe.SATURN, 0.13, 130.0),
+    "rahu": TransitBody(swe.MEAN_NODE, 0.06),
+    "ketu": TransitBody(swe.MEAN_NODE, 0.06, offset=180.0),
+}
+
+NAKSHATRA_SPAN = 360.0 / 27
+
+
+@dataclass(frozen=True)
+class _Targets:
+    """Longitudes whose crossings are events, with what each one means"""
+    angles: np.ndarray
+    kinds: List[str]
+    # Sign or nakshatra index starting at the angle, or (natal point, aspect)
+    labels: List[Any]
+
+
+def _wrap(angle: np.ndarray) -> np.ndarray:
+    """Angles folded into [-180, 180)"""
+    return (angle + 180.0) % 360.0 - 180.0
+
+
+class TransitSearch:
+    """Ingress, station and natal aspect times over a UT range"""
+
+    def __init__(
+        self,
+        start: datetime,
+        end: datetime,
+        natal_points: Optional[Mapping[str, float]] = None,
+        bodies: Optional[Sequence[str]] = None,
+        events: Sequence[str] = EVENT_TYPES,
+        aspects: Mapping[float, str] = MAJOR_ASPECTS,
+        ayanamsa: str = "lahiri"
+    ):
+        """Initialize the search
+
+        Args:
+            start: Range start; naive datetimes are taken as UTC
+            end: Range end, after start
+            natal_points: Sidereal natal longitudes by name, for aspects
+            bodies: Keys of BODIES to follow; all of them if omitted
+            events: Subset of EVENT_TYPES to report
+            aspects: Aspect names by exact angle
+            ayanamsa: Key of panchang.AYANAMSA_MODES
+
+        Raises:
+            ValueError: For an empty range or an unknown body, event type
+                or ayanamsa
+        """
+        if ayanamsa not in AYANAMSA_MODES:
+            raise ValueError(
+                f"Unknown ayanamsa '{ayanamsa}', expected one of {', '.join(AYANAMSA_MODES)}"
+            )
+        bodies = list(BODIES) if bodies is None else [body.lower() for body in bodies]
+        unknown = [body for body in bodies if body not in BODIES]
+        if unknown:
+            raise ValueError(f"Unknown bodies {', '.join(unknown)}, expected any of {', '.join(BODIES)}")
+        unknown = [kind for kind in events if kind not in EVENT_TYPES]
+        if unknown:
+            raise ValueError(f"Unknown event types {', '.join(unknown)}, expected any of {', '.join(EVENT_TYPES)}")
+        self.start_jd = to_julian_day(start)
+        self.end_jd = to_julian_day(end)
+        if self.end_jd <= self.start_jd:
+            raise ValueError("end must be after start")
+        self.bodies = bodies
+        self.events = set(events)
+        self.evaluations = 0
+        self._ayanamsa_at, self._ayanamsa_rate = linear_ayanamsa(
+            AYANAMSA_MODES[ayanamsa], self.start_jd, self.end_jd
+        )
+        self._targets = self._build_targets(natal_points or {}, aspects)
+
+    def _build_targets(self, natal_points: Mapping[str, float], aspects: Mapping[float, str]) -> _Targets:
+        angles: List[float] = []
+        kinds: List[str] = []
+        labels: List[Any] = []
+        if "ingress" in self.events:
+            angles += [30.0 * i for i in range(12)]
+            kinds += ["ingress"] * 12
+            labels += list(range(12))
+        if "nakshatra" in self.events:
+            angles += [NAKSHATRA_SPAN * i for i in range(27)]
+            kinds += ["nakshatra"] * 27
+            labels += list(range(27))
+        if "aspect" in self.events:
+            for point, longitude in natal_points.items():
+                for angle, name in aspects.items():
+                    # Both sides of the natal point, once for 0 and 180
+                    for side in {angle % 360.0, -angle % 360.0}:
+                        angles.append((longitude + side) % 360.0)
+                        kinds.append("aspect")
+                        labels.append((point, name))
+        return _Targets(np.array(angles, dtype=float), kinds, labels)
+
+    def _position(self, body: TransitBody, jd: float) -> Tuple[float, float]:
+        """Sidereal longitude and its daily rate"""
+        self.evaluations += 1
+        values = swe.calc_ut(jd, body.planet, swe.FLG_SWIEPH | swe.FLG_SPEED)[0]
+        ayanamsa = self._ayanamsa_at + self._ayanamsa_rate * (jd - self.start_jd)
+        return (values[0] + body.offset - ayanamsa) % 360.0, values[3] - self._ayanamsa_rate
+
+    def _station(self, body: TransitBody, lo: float, hi: float, retrograde: bool) -> float:
+        """Time in (lo, hi] at which the speed changes sign, by bisection"""
+        while hi - lo > STATION_TOLERANCE_DAYS:
+            middle = (lo + hi) / 2
+            if (self._position(body, middle)[1] < 0) == retrograde:
+                lo = middle
+            else:
+                hi = middle
+        return (lo + hi) / 2
+
+    def _solve(
+        self,
+        body: TransitBody,
+        target: float,
+        lo: float,
+        hi: float,
+        direction: float,
+        guess: float
+    ) -> float:
+        """Time in (lo, hi) at which the longitude reaches target"""
+        x = min(max(guess, lo), hi)
+        for _ in range(MAX_ITERATIONS):
+            longitude, speed = self._position(body, x)
+            error = float(_wrap(longitude - target))
+            if error * direction < 0:
+                lo = x
+            else:
+                hi = x
+            following = x - error / speed if speed else (lo + hi) / 2
+            if abs(following - x) < TOLERANCE_DAYS:
+                return following
+            # Newton left the bracket: fall back to bisection
+            x = following if lo < following < hi else (lo + hi) / 2
+            if hi - lo < TOLERANCE_DAYS:
+                return x
+        return x
+
+    def _body_events(self, name: str, start: float, end: float) -> List[Tuple[float, Dict[str, Any]]]:
+        """Events of one body in (start, end]"""
+        body = BODIES[name]
+        times = np.linspace(start, end, int(np.ceil((end - start) / body.step)) + 1)
+        samples = [self._position(body, jd) for jd in times]
+        longitudes = np.array([longitude for longitude, _ in samples])
+        speeds = np.array([speed for _, speed in samples])
+        found: List[Tuple[float, Dict[str, Any]]] = []
+
+        # Split the grid at every station so each interval is monotonic
+        retrograde = speeds < 0
+        stations = np.nonzero(retrograde[:-1] != retrograde[1:])[0]
+        if len(stations):
+            station_times = [self._station(body, times[i], times[i + 1], retrograde[i]) for i in stations]
+            station_samples = [self._position(body, jd) for jd in station_times]
+            if "station" in self.events:
+                for i, jd, (longitude, _) in zip(stations, station_times, station_samples):
+                    found.append((jd, {
+                        "type": "station",
+                        "direction": "direct" if retrograde[i] else "retrograde",
+                        "longitude": round(float(longitude), 4),
+                    }))
+            times = np.insert(times, stations + 1, station_times)
+            longitudes = np.insert(longitudes, stations + 1, [longitude for longitude, _ in station_samples])
+            speeds = np.insert(speeds, stations + 1, 0.0)
+
+        targets = self._targets
+        if not len(targets.angles):
+            return found
+        # Crossings of every target in every interval: (interval, target)
+        moved = _wrap(np.diff(longitudes))[:, None]
+        ahead = (targets.angles[None, :] - longitudes[:-1, None]) % 360.0
+        behind = (longitudes[:-1, None] - targets.angles[None, :]) % 360.0
+        crossed = np.where(
+            moved > 0,
+            (ahead > 0) & (ahead <= moved),
+            (behind > 0) & (behind <= -moved),
+        )
+        for i, j in zip(*np.nonzero(crossed)):
+            direction = 1.0 if moved[i, 0] > 0 else -1.0
+            covered = ahead[i, j] if direction > 0 else behind[i, j]
+            guess = times[i] + (times[i + 1] - times[i]) * covered / abs(moved[i, 0])
+            jd = self._solve(body, targets.angles[j], times[i], times[i + 1], direction, guess)
+            kind, label = targets.kinds[j], targets.labels[j]
+            event: Dict[str, Any] = {"type": kind}
+            if kind == "ingress":
+                # Moving backwards the body enters the sign before the cusp
+                event["sign"] = SIGNS[label if direction > 0 else (label - 1) % 12]
+            elif kind == "nakshatra":
+                event["nakshatra"] = NAKSHATRAS[label if direction > 0 else (label - 1) % 27]
+            else:
+                event["natal_point"], event["aspect"] = label
+            event["retrograde"] = direction < 0
+            found.append((jd, event))
+        return found
+
+    def stream(self) -> Iterator[Dict[str, Any]]:
+        """Events in time order, computed a chunk at a time"""
+        chunk_start = self.start_jd
+        while chunk_start < self.end_jd:
+            chunk_end = min(chunk_start + CHUNK_DAYS, self.end_jd)
+            chunk = []
+            for name in self.bodies:
+                for jd, event in self._body_events(name, chunk_start, chunk_end):
+                    chunk.append((jd, name, event))
+            chunk.sort(key=lambda item: item[0])
+            for jd, name, event in chunk:
+                yield {"time": from_julian_day(jd).isoformat(), "body": name, **event}
+            chunk_start = chunk_end
+
+    def timeline(self) -> List[Dict[str, Any]]:
+        """Every event in time order"""
+        return list(self.stream())
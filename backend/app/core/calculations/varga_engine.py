@@ -0,0 +1,144 @@
+"""
+Vectorized Varga Engine (D1-D60)
+PGF Protocol: VCI_002
+Gate: GATE_3
+Version: 1.0.0
+
+Batched counterpart of DivisionalChartEngine. Takes an (N charts x bodies)
+array of sidereal longitudes and returns every requested division as
+NumPy arrays, using the same division formulas as the scalar engine.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Division -> (parts per sign, arc of one part in the resulting chart)
+# Mirrors the per-division formulas in DivisionalChartEngine._calculate_*.
+DIVISION_TABLE: Dict[int, Tuple[int, float]] = {
+    2: (2, 15.0),          # Hora
+    3: (3, 10.0),          # Drekkana
+    4: (4, 7.5),           # Chaturthamsa
+    7: (7, 360 / 84),      # Saptamsa
+    9: (9, 40.0),          # Navamsa
+    10: (10, 3.0),         # Dasamsa
+    12: (12, 2.5),         # Dwadasamsa
+    16: (16, 360 / 192),   # Shodasamsa
+    20: (20, 360 / 240),   # Vimshamsa
+    24: (24, 360 / 288),   # Chaturvimshamsa
+    30: (30, 1.0),         # Trimsamsa
+    40: (40, 360 / 480),   # Khavedamsa
+    45: (45, 360 / 540),   # Akshavedamsa
+    60: (60, 360 / 720),   # Shashtyamsa
+}
+
+SUPPORTED_DIVISIONS: Tuple[int, ...] = tuple(sorted((1, 27) + tuple(DIVISION_TABLE)))
+
+
+@dataclass
+class VargaArrays:
+    """Divisional positions for a batch of charts"""
+    division: int
+    longitudes: np.ndarray  # float64, same shape as the input
+    signs: np.ndarray       # int16, 0 (Aries) to 11 (Pisces)
+    degrees: np.ndarray     # int16, whole degrees within the sign
+
+
+class VectorizedVargaEngine:
+    """Calculates divisional charts for many charts in one vectorized pass"""
+
+    supported_divisions: Tuple[int, ...] = SUPPORTED_DIVISIONS
+
+    def calculate(
+        self,
+        longitudes: np.ndarray,
+        divisions: Optional[Iterable[int]] = None
+    ) -> Dict[int, VargaArrays]:
+        """Calculate divisional charts for an array of longitudes
+
+        Args:
+            longitudes: Sidereal longitudes, typically shaped (charts, bodies)
+            divisions: Divisions to calculate, defaults to all supported vargas
+
+        Returns:
+            Dictionary mapping division to VargaArrays
+        """
+        requested = list(divisions) if divisions is not None else list(SUPPORTED_DIVISIONS)
+        for division in requested:
+            if division not in SUPPORTED_DIVISIONS:
+                raise ValueError(f"Unsupported division D{division}")
+
+        lon = np.mod(np.asarray(longitudes, dtype=np.float64), 360.0)
+        results: Dict[int, np.ndarray] = {}
+
+        # All table-driven divisions share one broadcast over a leading axis
+        table_divisions = [d for d in requested if d in DIVISION_TABLE]
+        if table_divisions:
+            shape = (len(table_divisions),) + (1,) * lon.ndim
+            parts = np.array([DIVISION_TABLE[d][0] for d in table_divisions], dtype=np.float64).reshape(shape)
+            arcs = np.array([DIVISION_TABLE[d][1] for d in table_divisions], dtype=np.float64).reshape(shape)
+
+            sign = np.floor(lon / 30)
+            degree = np.mod(lon, 30)
+            part = np.floor(degree * parts / 30)
+            stacked = np.mod((sign * parts + part) * arcs, 360.0)
+            for i, division in enumerate(table_divisions):
+                results[division] = stacked[i]
+
+        if 1 in requested:
+            results[1] = lon
+        if 27 in requested:
+            # Nakshatramsa counts nakshatras from 0 Aries rather than within the sign
+            nakshatra = np.floor(lon * 27 / 360)
+            results[27] = np.mod(nakshatra * (360 / 27), 360.0)
+
+        return {division: self._to_arrays(division, results[division]) for division in requested}
+
+    def calculate_division(self, longitudes: np.ndarray, division: int) -> VargaArrays:
+        """Calculate a single divisional chart for an array of longitudes"""
+        return self.calculate(longitudes, [division])[division]
+
+    def house_cusps(self, ascendants: np.ndarray, division: int) -> np.ndarray:
+        """Whole sign house cusps of the divisional chart for each ascendant
+
+        Args:
+            ascendants: Sidereal ascendant longitudes, shape (charts,)
+            division: Varga division
+
+        Returns:
+            Array of shape (charts, 12) with cusp longitudes
+        """
+        asc_signs = self.calculate_division(ascendants, division).signs.astype(np.int64)
+        offsets = np.arange(12, dtype=np.int64)
+        return (np.mod(asc_signs[..., None] + offsets, 12) * 30).astype(np.float64)
+
+    @staticmethod
+    def stack_positions(
+        charts: Sequence[Dict[str, float]],
+        bodies: Optional[List[str]] = None
+    ) -> Tuple[List[str], np.ndarray]:
+        """Stack planet-name dictionaries into a (charts, bodies) longitude array
+
+        Args:
+            charts: One planet name to longitude mapping per chart
+            bodies: Body order, defaults to the keys of the first chart
+
+        Returns:
+            Tuple of (body names, longitude array)
+        """
+        names = list(bodies) if bodies is not None else list(charts[0]) if charts else []
+        array = np.array(
+            [[float(chart[name]) for name in names] for chart in charts],
+            dtype=np.float64
+        ).reshape(len(charts), len(names))
+        return names, array
+
+    @staticmethod
+    def _to_arrays(division: int, longitudes: np.ndarray) -> VargaArrays:
+        return VargaArrays(
+            division=division,
+            longitudes=longitudes,
+            signs=(np.floor(longitudes / 30).astype(np.int16) % 12),
+            degrees=np.floor(np.mod(longitudes, 30)).astype(np.int16)
+        )
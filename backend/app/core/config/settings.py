@@ -51,9 +51,38 @@ class Settings(BaseSettings):
     REDIS_DB: int = int(os.getenv("REDIS_DB", "0"))
     REDIS_USERNAME: Optional[str] = os.getenv("REDIS_USERNAME", None)
     REDIS_PASSWORD: Optional[str] = os.getenv("REDIS_PASSWORD", None)
-    REDIS_SSL: bool = bool(os.getenv("REDIS_SSL", "0"))
+    REDIS_SSL: bool = os.getenv("REDIS_SSL", "0").lower() in ("1", "true", "yes")
     REDIS_TIMEOUT: int = int(os.getenv("REDIS_TIMEOUT", "5"))
     REDIS_CACHE_EXPIRE_SECONDS: int = int(os.getenv("REDIS_CACHE_EXPIRE_SECONDS", "3600"))
+    REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "20"))
+    # Decimal places of latitude/longitude kept in chart cache keys (4 ~ 11 m)
+    CHART_CACHE_COORD_DECIMALS: int = int(os.getenv("CHART_CACHE_COORD_DECIMALS", "4"))
+    # Per-process L1 in front of Redis for chart results
+    CHART_L1_CACHE_MAX_BYTES: int = int(os.getenv("CHART_L1_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    CHART_L1_CACHE_TTL_SECONDS: int = int(os.getenv("CHART_L1_CACHE_TTL_SECONDS", "300"))
+    CHART_NEGATIVE_CACHE_TTL_SECONDS: int = int(os.getenv("CHART_NEGATIVE_CACHE_TTL_SECONDS", "60"))
+    # Requests per window per client; checks are served from per-process
+    # token leases synced with Redis every RATE_LIMIT_SYNC_SECONDS
+    RATE_LIMIT_MAX_REQUESTS: int = int(os.getenv("RATE_LIMIT_MAX_REQUESTS", "100"))
+    RATE_LIMIT_WINDOW_SECONDS: int = int(os.getenv("RATE_LIMIT_WINDOW_SECONDS", "60"))
+    RATE_LIMIT_LEASE_FRACTION: float = float(os.getenv("RATE_LIMIT_LEASE_FRACTION", "0.1"))
+    RATE_LIMIT_SYNC_SECONDS: float = float(os.getenv("RATE_LIMIT_SYNC_SECONDS", "1.0"))
+    # Limiter state gets its own Redis client; unset uses the REDIS_* server
+    RATE_LIMIT_REDIS_URL: Optional[str] = os.getenv("RATE_LIMIT_REDIS_URL") or None
+    # HTTP response cache; only side-effect-free path prefixes may be listed
+    HTTP_CACHE_PATHS: List[str] = [
+        "/api/v1/charts/calculate",
+        "/api/v1/divisional/calculate",
+        "/api/v1/panchang/",
+        "/api/v1/dasha/vimshottari",
+        "/api/v1/dasha/window",
+        "/api/v1/ayanamsa/calculate",
+    ]
+    HTTP_CACHE_MAX_BYTES: int = int(os.getenv("HTTP_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    HTTP_CACHE_MAX_ENTRY_BYTES: int = int(os.getenv("HTTP_CACHE_MAX_ENTRY_BYTES", str(4 * 1024 * 1024)))
+    HTTP_CACHE_TTL_SECONDS: int = int(os.getenv("HTTP_CACHE_TTL_SECONDS", "300"))
+    # Smallest response body compressed with brotli/gzip
+    HTTP_COMPRESSION_MIN_BYTES: int = int(os.getenv("HTTP_COMPRESSION_MIN_BYTES", "1024"))
 
     # Cache Keys
     BIRTH_CHART_CACHE_KEY: str = "birth_chart:{user_id}:{chart_id}"
@@ -68,6 +97,19 @@ class Settings(BaseSettings):
         default=str(Path(__file__).parent.parent.parent.parent / "data" / "ephe"),
         description="Path to Swiss Ephemeris data files"
     )
+    # Worker processes per (ayanamsa, coordinate system); 0 runs ephemeris work in-process
+    EPHEMERIS_POOL_WORKERS: int = int(os.getenv("EPHEMERIS_POOL_WORKERS", "2"))
+    # Shared process pool for CPU-bound endpoints; 0 runs them on one background thread
+    COMPUTE_WORKERS: int = int(os.getenv("COMPUTE_WORKERS", "2"))
+    # Calculations queued beyond the running ones before new ones get 503
+    COMPUTE_MAX_QUEUE: int = int(os.getenv("COMPUTE_MAX_QUEUE", "64"))
+    # Per-endpoint in-flight limits as "name=limit,..."; requests beyond one get 429
+    COMPUTE_ENDPOINT_LIMITS: str = os.getenv(
+        "COMPUTE_ENDPOINT_LIMITS",
+        "horoscope.calculate=16,panchang.muhurta=8,panchang.rise_set=4"
+    )
+    # Optional Chebyshev table built with python -m app.core.astronomical.chebyshev
+    EPHEMERIS_TABLE_PATH: Optional[str] = os.getenv("EPHEMERIS_TABLE_PATH", None)
 
     model_config = SettingsConfigDict(env_file=env_file, case_sensitive=True)
 
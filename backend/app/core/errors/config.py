@@ -41,6 +41,7 @@ ERROR_MESSAGES: Dict[ErrorCode, str] = {
     ErrorCode.INTERNAL_ERROR: "Internal server error occurred",
     ErrorCode.SERVICE_UNAVAILABLE: "Service is currently unavailable",
     ErrorCode.TIMEOUT: "Operation timed out",
+    ErrorCode.TOO_MANY_REQUESTS: "Rate limit exceeded",
     
     # External service errors
     ErrorCode.EXTERNAL_SERVICE_ERROR: "External service error occurred",
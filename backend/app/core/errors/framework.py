@@ -59,6 +59,7 @@ class ErrorCode(str, Enum):
     RESOURCE_NOT_FOUND = "ERR_4002"
     DUPLICATE_RESOURCE = "ERR_4003"
     CALCULATION_ERROR = "ERR_4004"
+    TOO_MANY_REQUESTS = "ERR_4005"
     
     # System errors (5xxx)
     INTERNAL_ERROR = "ERR_5001"
@@ -100,7 +100,8 @@ class ErrorHandler:
         
         return JSONResponse(
             status_code=exc.status_code,
-            content=jsonable_encoder(error)
+            content=jsonable_encoder(error),
+            headers=exc.headers
         )
     
     @staticmethod
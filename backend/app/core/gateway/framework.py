@@ -18,6 +18,12 @@ from starlette.middleware.base import BaseHTTPMiddleware
 import jwt
 import httpx
 import redis.asyncio as redis
+from ..rate_limit import (
+    RateLimit,
+    RateLimitResult,
+    RedisRateLimiter,
+    TokenBucketLimiter
+)
 from ..errors import (
     AppError,
     ErrorCode,
@@ -244,35 +250,25 @@ class RateLimiter:
         self.redis = redis_client
         self.window_size = window_size
         self.max_requests = max_requests
+        self.limiter = TokenBucketLimiter(RedisRateLimiter(redis_client))
     
     async def check_rate_limit(
         self,
         key: str,
-        limit_type: RateLimitType
-    ) -> bool:
-        """Check if rate limit is exceeded"""
-        redis_key = f"rate_limit:{limit_type}:{key}"
-        
-        pipe = self.redis.pipeline()
-        now = datetime.utcnow().timestamp()
-        window_start = now - self.window_size
-        
-        # Remove old requests
-        await pipe.zremrangebyscore(redis_key, 0, window_start)
-        
-        # Add current request
-        await pipe.zadd(redis_key, {str(now): now})
-        
-        # Get request count
-        await pipe.zcard(redis_key)
-        
-        # Set expiry
-        await pipe.expire(redis_key, self.window_size)
-        
-        results = await pipe.execute()
-        request_count = results[2]
-        
-        return request_count <= self.max_requests
+        limit_type: RateLimitType,
+        max_requests: Optional[int] = None
+    ) -> RateLimitResult:
+        """Check if rate limit is exceeded
+
+        Returns:
+            Result whose allowed is False once the limit is exceeded
+        """
+        rate = RateLimit(max_requests or self.max_requests, self.window_size)
+        return await self.limiter.check(f"{limit_type.value}:{key}", rate)
+
+    def stats(self) -> Dict[str, Any]:
+        """Check counts and latency percentiles"""
+        return self.limiter.stats.as_dict()
 
 class APIGateway:
     """API Gateway"""
@@ -398,15 +394,19 @@ class APIGateway:
         else:  # GLOBAL
             key = "*"
         
-        if not await self.rate_limiter.check_rate_limit(
+        result = await self.rate_limiter.check_rate_limit(
             key,
-            route.rate_limit_type
-        ):
+            route.rate_limit_type,
+            route.rate_limit
+        )
+        if not result.allowed:
             raise AppError(
                 code=ErrorCode.TOO_MANY_REQUESTS,
                 message="Rate limit exceeded",
                 category=ErrorCategory.SYSTEM,
-                severity=ErrorSeverity.MEDIUM
+                severity=ErrorSeverity.MEDIUM,
+                details={"retry_after": round(result.retry_after, 3)},
+                status_code=429
             )
     
     async def _gateway_middleware(
@@ -0,0 +1,84 @@
+"""
+Lazy Imports and Singletons
+PGF Protocol: LAZY_001
+Gate: GATE_4
+Version: 1.0.0
+
+Deferred loading for heavy optional stacks (pandas, SciPy) and for
+module-level singletons of routers. Each worker then pays for them on the
+first request that needs them, not at startup, so /health and chart
+calculation come up without loading the analysis dependencies.
+"""
+
+import importlib
+import sys
+import threading
+from types import ModuleType
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class LazyModule:
+    """Module proxy that imports on first attribute access"""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module: Optional[ModuleType] = None
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None or self._name in sys.modules
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Stand-in for `import name` that defers the import to first use
+
+    Example:
+        pd = lazy_import("pandas")  # nothing imported yet
+        pd.Series([1, 2])           # pandas imported here
+    """
+    return LazyModule(name)
+
+
+class LazySingleton(Generic[T]):
+    """Instance built by factory on first call and shared afterwards
+
+    Calling it returns the instance, so it also works as a FastAPI
+    dependency: Depends(pattern_detector).
+    """
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._instance: Optional[T] = None
+        self._lock = threading.Lock()
+
+    def __call__(self) -> T:
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._factory()
+                instance = self._instance
+        return instance
+
+    @property
+    def loaded(self) -> bool:
+        return self._instance is not None
+
+    def reset(self) -> None:
+        """Drop the instance; the next call builds a new one"""
+        with self._lock:
+            self._instance = None
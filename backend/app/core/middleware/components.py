@@ -40,47 +40,6 @@ class MetricsMiddleware(BaseMiddleware):
             self.metrics[datetime.utcnow().isoformat()] = metrics
         return response
 
-class CacheMiddleware(BaseMiddleware):
-    """Response caching middleware"""
-    
-    def __init__(self, cache_timeout: int = 300):
-        super().__init__(priority=MiddlewarePriority.HIGH)
-        self.cache: Dict[str, Any] = {}
-        self.cache_timeout = cache_timeout
-    
-    async def process_request(self, request: Request) -> Request:
-        cache_key = f"{request.method}:{request.url.path}"
-        if cache_key in self.cache:
-            cached_data = self.cache[cache_key]
-            if time.time() - cached_data["timestamp"] < self.cache_timeout:
-                request.state.cached_response = cached_data["response"]
-        return request
-    
-    async def process_response(self, response: Response) -> Response:
-        if response.status_code == 200 and not hasattr(response.request.state, "cached_response"):
-            cache_key = f"{response.request.method}:{response.request.url.path}"
-            self.cache[cache_key] = {
-                "response": response,
-                "timestamp": time.time()
-            }
-        return response
-
-class CompressionMiddleware(BaseMiddleware):
-    """Response compression middleware"""
-    
-    def __init__(self, min_size: int = 1024):
-        super().__init__(priority=MiddlewarePriority.MEDIUM)
-        self.min_size = min_size
-    
-    async def process_request(self, request: Request) -> Request:
-        return request
-    
-    async def process_response(self, response: Response) -> Response:
-        if len(response.body) > self.min_size:
-            response.headers["Content-Encoding"] = "gzip"
-            # Add compression logic here
-        return response
-
 class CorrelationMiddleware(BaseMiddleware):
     """Request correlation tracking middleware"""
     
@@ -10,11 +10,11 @@ from fastapi import FastAPI
 from .base import MiddlewareChain
 from .components import (
     MetricsMiddleware,
-    CacheMiddleware,
-    CompressionMiddleware,
     CorrelationMiddleware,
     ErrorHandlingMiddleware
 )
+from .http_cache import HTTPCacheMiddleware, ResponseCache
+from ..config import settings
 from ..security.middleware import AuthenticationMiddleware, SecurityMiddleware
 from ..performance.middleware import PerformanceMiddleware
 
@@ -24,6 +24,10 @@ class MiddlewareConfig:
     def __init__(self, app: FastAPI):
         self.app = app
         self.middleware_chain = MiddlewareChain()
+        self.response_cache = ResponseCache(
+            max_bytes=settings.HTTP_CACHE_MAX_BYTES,
+            ttl=settings.HTTP_CACHE_TTL_SECONDS
+        )
     
     def configure_middleware(self) -> None:
         """Configure all middleware components"""
@@ -33,12 +37,18 @@ class MiddlewareConfig:
         self.middleware_chain.add_middleware(PerformanceMiddleware())
         self.middleware_chain.add_middleware(ErrorHandlingMiddleware())
         self.middleware_chain.add_middleware(CorrelationMiddleware())
-        self.middleware_chain.add_middleware(CacheMiddleware())
         self.middleware_chain.add_middleware(MetricsMiddleware())
-        self.middleware_chain.add_middleware(CompressionMiddleware())
         
         # Build and add middleware chain to app
         self.app.middleware("http")(self.middleware_chain.build_chain())
+        # Response caching and compression operate on raw ASGI messages
+        self.app.add_middleware(
+            HTTPCacheMiddleware,
+            cache=self.response_cache,
+            paths=settings.HTTP_CACHE_PATHS,
+            min_compress_size=settings.HTTP_COMPRESSION_MIN_BYTES,
+            max_entry_bytes=settings.HTTP_CACHE_MAX_ENTRY_BYTES
+        )
     
     @property
     def metrics(self) -> dict:
@@ -51,10 +61,4 @@ class MiddlewareConfig:
     @property
     def cache_stats(self) -> dict:
         """Get cache statistics"""
-        for middleware in self.middleware_chain._middlewares.values():
-            if isinstance(middleware, CacheMiddleware):
-                return {
-                    "size": len(middleware.cache),
-                    "items": middleware.cache
-                }
-        return {}
+        return self.response_cache.stats()
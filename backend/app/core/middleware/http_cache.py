@@ -0,0 +1,362 @@
+"""
+HTTP Response Cache Middleware
+PGF Protocol: MIDDLEWARE_004
+Gate: GATE_4
+Version: 1.0.0
+
+ASGI middleware caching complete responses under a hash of the method,
+path, query, credentials and normalized request body, so different POST
+bodies never collide while equivalent JSON bodies share one entry.
+Entries live in a byte-bounded LRU. Every buffered 200 response carries
+a strong ETag, If-None-Match is answered with 304, and large text
+payloads are compressed with brotli or gzip. Encoded variants are kept
+with the cache entry so repeat hits are not recompressed. Streaming
+responses pass through untouched.
+"""
+
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from starlette.datastructures import Headers
+
+from ..cache.tiered_cache import L1Cache
+
+try:
+    import brotli
+except Exception:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+Scope = Dict[str, Any]
+Message = Dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/", "application/xml")
+# Headers recomputed for each representation sent
+_REPRESENTATION_HEADERS = {b"content-length", b"content-encoding", b"etag", b"vary"}
+# Headers a 304 repeats from the full response
+_NOT_MODIFIED_HEADERS = {b"cache-control", b"content-location", b"date", b"expires"}
+
+
+def canonical_body(body: bytes, content_type: str) -> bytes:
+    """JSON bodies re-serialized with sorted keys and no whitespace; others unchanged"""
+    if not body or "json" not in content_type:
+        return body
+    if orjson is not None:
+        try:
+            return orjson.dumps(orjson.loads(body), option=orjson.OPT_SORT_KEYS)
+        except (orjson.JSONDecodeError, TypeError):
+            pass
+    try:
+        value = json.loads(body)
+    except ValueError:
+        return body
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def cache_key(scope: Scope, headers: Headers, body: bytes) -> str:
+    """Hash of everything that selects a response, except Accept-Encoding"""
+    digest = hashlib.sha256()
+    for part in (
+        scope["method"].encode(),
+        scope["path"].encode(),
+        scope.get("query_string", b""),
+        headers.get("authorization", "").encode(),
+        canonical_body(body, headers.get("content-type", "")),
+    ):
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Preferred supported content coding of an Accept-Encoding header"""
+    qualities: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[name.strip().lower()] = quality
+    wildcard = qualities.get("*", 0.0)
+    supported = (["br"] if brotli is not None else []) + ["gzip"]
+    # Ties go to the earlier (denser) coding
+    best = max(supported, key=lambda name: qualities.get(name, wildcard))
+    return best if qualities.get(best, wildcard) > 0 else None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6)
+
+
+def _opaque_tag(tag: str) -> str:
+    """Entity tag without weakness prefix or content-coding suffix"""
+    tag = tag.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    for suffix in ('-gzip"', '-br"'):
+        if tag.endswith(suffix):
+            return tag[:-len(suffix)] + '"'
+    return tag
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of If-None-Match against an entity's ETag"""
+    if if_none_match.strip() == "*":
+        return True
+    target = _opaque_tag(etag)
+    return any(_opaque_tag(tag) == target for tag in if_none_match.split(","))
+
+
+@dataclass
+class CachedResponse:
+    """A complete 200 response and its encoded variants"""
+    status: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+    etag: str
+    compressible: bool
+    variants: Dict[str, bytes] = field(default_factory=dict)
+
+    def __sizeof__(self) -> int:
+        # Lets the byte-bounded L1 account for the payloads it holds
+        headers = sum(len(name) + len(value) for name, value in self.headers)
+        return 256 + headers + len(self.body) + sum(len(v) for v in self.variants.values())
+
+    def representation(self, encoding: Optional[str]) -> Tuple[bytes, str]:
+        """Body and ETag for a content coding, compressing on first use"""
+        if encoding is None:
+            return self.body, self.etag
+        if encoding not in self.variants:
+            self.variants[encoding] = compress(self.body, encoding)
+        return self.variants[encoding], f'{self.etag[:-1]}-{encoding}"'
+
+
+class ResponseCache:
+    """Byte-bounded LRU of complete responses with hit counters"""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, ttl: int = 300):
+        self.entries = L1Cache(max_bytes=max_bytes, ttl=ttl)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def set(self, key: str, entry: CachedResponse) -> bool:
+        return self.entries.set(key, entry)
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "bytes": self.entries.size_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class HTTPCacheMiddleware:
+    """Response cache, ETag validation and compression for an ASGI app"""
+
+    def __init__(
+        self,
+        app: Callable,
+        cache: Optional[ResponseCache] = None,
+        paths: Sequence[str] = (),
+        methods: Sequence[str] = ("GET", "POST"),
+        min_compress_size: int = 1024,
+        max_entry_bytes: int = 4 * 1024 * 1024
+    ):
+        """Initialize the middleware
+
+        Args:
+            app: Wrapped ASGI application
+            cache: Response store; a fresh 64 MiB cache if omitted
+            paths: Path prefixes whose responses may be cached. Only
+                side-effect-free endpoints belong here; every other
+                response still gets ETags and compression.
+            methods: Methods whose responses may be cached
+            min_compress_size: Smallest body in bytes worth compressing
+            max_entry_bytes: Largest body in bytes stored in the cache
+        """
+        self.app = app
+        self.cache = cache if cache is not None else ResponseCache()
+        self.paths = tuple(paths)
+        self.methods = {method.upper() for method in methods}
+        self.min_compress_size = min_compress_size
+        self.max_entry_bytes = max_entry_bytes
+
+    def _cacheable(self, scope: Scope, headers: Headers) -> bool:
+        return (
+            scope["method"] in self.methods
+            and scope["path"].startswith(self.paths)
+            and "no-store" not in headers.get("cache-control", "")
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # HEAD bodies are empty, so neither ETags nor lengths can be derived
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        key = None
+        if self._cacheable(scope, headers):
+            body, receive = await _buffer_request(receive)
+            key = cache_key(scope, headers, body)
+            if "no-cache" not in headers.get("cache-control", ""):
+                entry = self.cache.get(key)
+                if entry is not None:
+                    await self._send(entry, headers, send, key, b"HIT")
+                    return
+
+        start: Optional[Message] = None
+        streaming = False
+
+        async def capture(message: Message) -> None:
+            nonlocal start, streaming
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if streaming or message["type"] != "http.response.body":
+                await send(message)
+                return
+            if message.get("more_body", False):
+                # Streamed responses are forwarded as they are produced
+                streaming = True
+                await send(start)
+                await send(message)
+                return
+            entry = self._entry(start, message.get("body", b""))
+            if entry is None:
+                await send(start)
+                await send(message)
+                return
+            stored = (
+                key is not None
+                and len(entry.body) <= self.max_entry_bytes
+                and self._storable(start)
+                and self.cache.set(key, entry)
+            )
+            await self._send(
+                entry, headers, send, key if stored else None, b"MISS" if key is not None else None
+            )
+
+        await self.app(scope, receive, capture)
+
+    def _entry(self, start: Message, body: bytes) -> Optional[CachedResponse]:
+        """Wrap a complete 200 response, or None to pass it through"""
+        if start["status"] != 200:
+            return None
+        response_headers = Headers(raw=start["headers"])
+        if "content-encoding" in response_headers:
+            return None
+        etag = response_headers.get("etag") or f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        content_type = response_headers.get("content-type", "")
+        vary = [v.strip() for v in response_headers.get("vary", "").split(",") if v.strip()]
+        compressible = content_type.startswith(COMPRESSIBLE_TYPES) and len(body) >= self.min_compress_size
+        if compressible and "accept-encoding" not in {v.lower() for v in vary}:
+            vary.append("Accept-Encoding")
+        kept = [(name, value) for name, value in start["headers"] if name.lower() not in _REPRESENTATION_HEADERS]
+        if vary:
+            kept.append((b"vary", ", ".join(vary).encode("latin-1")))
+        return CachedResponse(
+            status=start["status"],
+            headers=kept,
+            body=body,
+            etag=etag,
+            compressible=compressible,
+        )
+
+    @staticmethod
+    def _storable(start: Message) -> bool:
+        response_headers = Headers(raw=start["headers"])
+        cache_control = response_headers.get("cache-control", "")
+        return (
+            "set-cookie" not in response_headers
+            and "no-store" not in cache_control
+            and "private" not in cache_control
+        )
+
+    async def _send(
+        self,
+        entry: CachedResponse,
+        request_headers: Headers,
+        send: Send,
+        key: Optional[str],
+        cache_status: Optional[bytes]
+    ) -> None:
+        encoding = choose_encoding(request_headers.get("accept-encoding", "")) if entry.compressible else None
+        had_variant = encoding is None or encoding in entry.variants
+        body, etag = entry.representation(encoding)
+        if key is not None and not had_variant:
+            # Re-insert so the LRU accounts for the new variant
+            self.cache.set(key, entry)
+
+        extra = [(b"etag", etag.encode("latin-1"))]
+        if cache_status is not None:
+            extra.append((b"x-cache", cache_status))
+
+        if etag_matches(request_headers.get("if-none-match", ""), etag):
+            kept = [(n, v) for n, v in entry.headers if n.lower() in _NOT_MODIFIED_HEADERS or n.lower() == b"vary"]
+            await send({"type": "http.response.start", "status": 304, "headers": kept + extra})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        extra.append((b"content-length", str(len(body)).encode("latin-1")))
+        if encoding is not None:
+            extra.append((b"content-encoding", encoding.encode("latin-1")))
+        await send({"type": "http.response.start", "status": entry.status, "headers": entry.headers + extra})
+        await send({"type": "http.response.body", "body": body})
+
+
+async def _buffer_request(receive: Receive) -> Tuple[bytes, Receive]:
+    """Read the whole request body and return a receive that replays it"""
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            # Disconnected before the body arrived; let the app see it
+            pending: Optional[Message] = message
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            pending = None
+            break
+    body = b"".join(chunks)
+    replayed = False
+
+    async def replay() -> Message:
+        nonlocal replayed
+        if not replayed:
+            replayed = True
+            if pending is not None:
+                return pending
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return body, replay
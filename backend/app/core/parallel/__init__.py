@@ -1,5 +1,25 @@
 """Parallel processing module initialization"""
+from app.core.config import settings
 from .batch_processor import BatchProcessor
+from app.core.astronomical.worker_pool import (
+    EphemerisRequest,
+    EphemerisResult,
+    EphemerisWorkerPool,
+)
+from .compute_executor import ComputeExecutor, ComputeRejected, parse_limits
 
 # Global batch processor instance
 batch_processor = BatchProcessor()
+
+# Global ephemeris pool; worker processes start lazily per routing key
+ephemeris_pool = EphemerisWorkerPool(
+    workers_per_config=settings.EPHEMERIS_POOL_WORKERS,
+    table_path=settings.EPHEMERIS_TABLE_PATH
+)
+
+# Global compute executor for CPU-bound endpoints; workers start on first use
+compute_executor = ComputeExecutor(
+    workers=settings.COMPUTE_WORKERS,
+    max_queue=settings.COMPUTE_MAX_QUEUE,
+    limits=parse_limits(settings.COMPUTE_ENDPOINT_LIMITS)
+)
@@ -0,0 +1,287 @@
+"""
+Compute Executor
+PGF Protocol: COMPUTE_001
+Gate: GATE_15
+Version: 1.0.0
+
+CPU-bound endpoint work runs in a shared process pool instead of on the
+event loop, so one slow calculation no longer stalls health checks, cache
+hits and every other request of the worker. Admission is bounded: once
+the running and queued calculations fill the pool plus its queue, new
+work is refused with 503, and an endpoint over its own in-flight limit
+gets 429, both with a Retry-After estimated from recent run times. Queue
+and run times are kept per endpoint. Each pool process runs one
+calculation at a time, so swe's process-global settings are never shared
+between concurrent calculations.
+"""
+
+import asyncio
+import logging
+import math
+import multiprocessing
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Mapping, Optional, Tuple
+
+from fastapi import HTTPException
+
+from ..rate_limit import LATENCY_SAMPLES, latency_percentiles
+
+logger = logging.getLogger(__name__)
+
+
+class ComputeRejected(HTTPException):
+    """Work refused because the executor or an endpoint is saturated"""
+
+    def __init__(self, status_code: int, detail: str, retry_after: float):
+        super().__init__(
+            status_code=status_code,
+            detail=detail,
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+        )
+        self.retry_after = retry_after
+
+
+@dataclass
+class EndpointStats:
+    """Admission counts and latencies of one endpoint"""
+    in_flight: int = 0
+    submitted: int = 0
+    rejected: int = 0
+    completed: int = 0
+    failed: int = 0
+    _queue_time: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+    _run_time: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+
+    def record(self, ok: bool, queue_time: Optional[float], run_time: Optional[float]) -> None:
+        if ok:
+            self.completed += 1
+        else:
+            self.failed += 1
+        if queue_time is not None:
+            self._queue_time.append(max(queue_time, 0.0))
+        if run_time is not None:
+            self._run_time.append(max(run_time, 0.0))
+
+    def median_run_time(self) -> float:
+        """Seconds; 0 before anything has run"""
+        if not self._run_time:
+            return 0.0
+        return sorted(self._run_time)[len(self._run_time) // 2]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "in_flight": self.in_flight,
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            "completed": self.completed,
+            "failed": self.failed,
+            "queue_time": latency_percentiles(self._queue_time),
+            "run_time": latency_percentiles(self._run_time),
+        }
+
+
+def parse_limits(spec: str) -> Dict[str, int]:
+    """Per-endpoint limits from "name=limit,name=limit" """
+    limits = {}
+    for item in spec.split(","):
+        name, _, value = item.partition("=")
+        if name.strip() and value.strip():
+            limits[name.strip()] = int(value)
+    return limits
+
+
+def _invoke(fn: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[bool, Any, float, float]:
+    """Run in a worker: call fn and report its outcome and wall-clock span
+
+    Wall-clock time is shared between processes, so the parent can
+    measure queueing against its own submission time.
+    """
+    started = time.time()
+    try:
+        value, ok = fn(*args, **kwargs), True
+    except Exception as exc:
+        value, ok = exc, False
+    return ok, value, started, time.time()
+
+
+class ComputeExecutor:
+    """Bounded process pool shared by CPU-bound endpoints"""
+
+    def __init__(
+        self,
+        workers: int = 2,
+        max_queue: int = 64,
+        limits: Optional[Mapping[str, int]] = None
+    ):
+        """Initialize the executor
+
+        Args:
+            workers: Worker processes. 0 runs all work serially on one
+                background thread in this process.
+            max_queue: Calculations admitted beyond those that can run at
+                once before new ones are refused with 503
+            limits: Most in-flight calculations per endpoint name before
+                new ones are refused with 429
+        """
+        self.workers = max(0, workers)
+        self.max_queue = max(0, max_queue)
+        self.limits = dict(limits or {})
+        self._executor: Optional[Executor] = None
+        self._in_flight = 0
+        self._endpoints: Dict[str, EndpointStats] = {}
+        # Work finishes on pool threads, so counters are shared across threads
+        self._lock = threading.Lock()
+
+    @property
+    def inline(self) -> bool:
+        return self.workers == 0
+
+    @property
+    def capacity(self) -> int:
+        """Calculations admitted at once, running or queued"""
+        return max(1, self.workers) + self.max_queue
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.inline:
+                    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="compute")
+                else:
+                    # spawn: workers must not inherit the parent's event loop or threads
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn")
+                    )
+                    logger.info("Started compute pool with %d workers", self.workers)
+            return self._executor
+
+    def _reset(self, executor: Executor) -> None:
+        """Drop a broken pool so the next calculation starts a fresh one"""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
+
+    def _retry_after(self, stats: EndpointStats) -> float:
+        """Seconds until the queue ahead has likely drained"""
+        return stats.median_run_time() * self._in_flight / max(1, self.workers)
+
+    def _admit(self, name: str, limit: Optional[int]) -> EndpointStats:
+        limit = limit if limit is not None else self.limits.get(name)
+        with self._lock:
+            stats = self._endpoints.setdefault(name, EndpointStats())
+            if self._in_flight >= self.capacity:
+                stats.rejected += 1
+                raise ComputeRejected(503, "Calculation capacity exhausted, retry later", self._retry_after(stats))
+            if limit is not None and stats.in_flight >= limit:
+                stats.rejected += 1
+                raise ComputeRejected(429, f"Too many concurrent {name} calculations", self._retry_after(stats))
+            stats.in_flight += 1
+            stats.submitted += 1
+            self._in_flight += 1
+            return stats
+
+    def _release(
+        self,
+        stats: EndpointStats,
+        ok: bool,
+        queue_time: Optional[float] = None,
+        run_time: Optional[float] = None
+    ) -> None:
+        with self._lock:
+            stats.in_flight -= 1
+            self._in_flight -= 1
+            stats.record(ok, queue_time, run_time)
+
+    def _finished(self, stats: EndpointStats, submitted: float, future: Future) -> None:
+        """Release the slot when the work ends, even if its caller went away"""
+        if future.cancelled() or future.exception() is not None:
+            self._release(stats, ok=False)
+            return
+        ok, _, started, finished = future.result()
+        self._release(stats, ok, started - submitted, finished - started)
+
+    async def run(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        limit: Optional[int] = None,
+        **kwargs: Any
+    ) -> Any:
+        """Run fn(*args, **kwargs) in the pool and await its result
+
+        fn and its arguments are pickled to the worker, so fn must be a
+        module-level function or a method of a picklable object.
+
+        Args:
+            name: Endpoint name for limits and metrics
+            fn: Calculation to run
+            limit: In-flight limit overriding the configured one
+
+        Raises:
+            ComputeRejected: If the executor or the endpoint is saturated
+        """
+        stats = self._admit(name, limit)
+        submitted = time.time()
+        executor = self._get_executor()
+        try:
+            future = executor.submit(_invoke, fn, args, kwargs)
+        except BaseException:
+            self._release(stats, ok=False)
+            if isinstance(executor, ProcessPoolExecutor):
+                self._reset(executor)
+            raise
+        future.add_done_callback(partial(self._finished, stats, submitted))
+        try:
+            ok, value, _, _ = await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            logger.error("Compute worker died running %s; restarting the pool", name)
+            self._reset(executor)
+            raise ComputeRejected(503, "Calculation worker restarted, retry the request", 1.0)
+        if not ok:
+            raise value
+        return value
+
+    @asynccontextmanager
+    async def admit(self, name: str, limit: Optional[int] = None) -> AsyncIterator[None]:
+        """Admission and run time for work dispatched elsewhere
+
+        For calculations that already leave the event loop through another
+        pool (e.g. the ephemeris pool) but should share the same limits.
+
+        Raises:
+            ComputeRejected: If the executor or the endpoint is saturated
+        """
+        stats = self._admit(name, limit)
+        started = time.time()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self._release(stats, ok, run_time=time.time() - started)
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool occupancy and per-endpoint counters"""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "capacity": self.capacity,
+                "in_flight": self._in_flight,
+                "endpoints": {name: stats.as_dict() for name, stats in self._endpoints.items()},
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the pool; it restarts on the next calculation"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
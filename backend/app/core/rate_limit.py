@@ -0,0 +1,291 @@
+"""
+Rate Limiting
+PGF Protocol: SECURITY_003
+Gate: GATE_5
+Version: 1.0.0
+
+Limits are enforced with GCRA (generic cell rate algorithm) in a Redis
+Lua script, so a check is one atomic round trip storing one timestamp
+per key. In front of it, each process leases small batches of tokens
+and serves most checks from memory; unused tokens are returned with the
+next lease and denials are remembered until the client may retry. The
+global limit therefore holds across processes while Redis sees roughly
+one call per lease instead of one per request.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterable, Optional, Tuple
+
+import redis.asyncio as aioredis
+from redis.exceptions import NoScriptError, RedisError
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1]: limiter key holding the theoretical arrival time (TAT)
+# ARGV: seconds per token, window in seconds, tokens requested, tokens refunded
+# Returns {tokens granted, seconds until one more token as a string}
+GCRA_SCRIPT = """
+local now = redis.call('TIME')
+now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+local interval = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local refund = tonumber(ARGV[4])
+
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+tat = math.max(tat - refund * interval, now)
+local available = math.floor((window - (tat - now)) / interval + 1e-9)
+local granted = math.max(math.min(requested, available), 0)
+tat = tat + granted * interval
+
+redis.call('SET', KEYS[1], tostring(tat), 'PX', math.ceil((tat - now) * 1000) + 1)
+local retry_after = math.max(tat + interval - window - now, 0)
+return {granted, tostring(retry_after)}
+"""
+
+GCRA_SHA = hashlib.sha1(GCRA_SCRIPT.encode()).hexdigest()
+
+# Recent latencies kept for percentiles
+LATENCY_SAMPLES = 1024
+
+
+def latency_percentiles(samples: Iterable[float]) -> Dict[str, float]:
+    """p50, p99 and max in milliseconds of latencies in seconds"""
+    ordered = sorted(samples)
+    if not ordered:
+        return {"p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    last = len(ordered) - 1
+    return {
+        "p50_ms": ordered[last // 2] * 1000,
+        "p99_ms": ordered[round(last * 0.99)] * 1000,
+        "max_ms": ordered[last] * 1000,
+    }
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """limit requests per window seconds"""
+    limit: int
+    window: float
+
+    @property
+    def interval(self) -> float:
+        """Seconds per token"""
+        return self.window / self.limit
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    """Outcome of one check"""
+    allowed: bool
+    # Seconds until a request would be allowed, 0 if allowed now
+    retry_after: float = 0.0
+
+
+@dataclass
+class LimiterStats:
+    """Check counts and latency of a limiter"""
+    checks: int = 0
+    denied: int = 0
+    local: int = 0
+    redis_calls: int = 0
+    errors: int = 0
+    _check_latency: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+    _redis_latency: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+
+    def record_check(self, started: float, result: RateLimitResult) -> None:
+        self.checks += 1
+        if not result.allowed:
+            self.denied += 1
+        self._check_latency.append(time.perf_counter() - started)
+
+    def record_redis(self, started: float) -> None:
+        self.redis_calls += 1
+        self._redis_latency.append(time.perf_counter() - started)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "checks": self.checks,
+            "denied": self.denied,
+            "local_hit_rate": self.local / self.checks if self.checks else 0.0,
+            "redis_calls": self.redis_calls,
+            "errors": self.errors,
+            "check_latency": latency_percentiles(self._check_latency),
+            "redis_latency": latency_percentiles(self._redis_latency),
+        }
+
+
+class RedisRateLimiter:
+    """GCRA token grants from Redis in one round trip"""
+
+    def __init__(self, client: Any, prefix: str = "rate_limit"):
+        """Initialize the limiter
+
+        Args:
+            client: asyncio Redis client
+            prefix: Namespace of limiter keys
+        """
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "RedisRateLimiter":
+        """Create a limiter with its own Redis client
+
+        The client is not shared with the chart cache, so cache flushes and
+        eviction or a saturated cache pool do not affect limiter state.
+        """
+        options: Dict[str, Any] = dict(
+            socket_timeout=settings.REDIS_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_TIMEOUT,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+        )
+        if settings.RATE_LIMIT_REDIS_URL:
+            return cls(aioredis.from_url(settings.RATE_LIMIT_REDIS_URL, **options))
+        return cls(aioredis.Redis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            username=settings.REDIS_USERNAME,
+            password=settings.REDIS_PASSWORD,
+            ssl=settings.REDIS_SSL,
+            **options
+        ))
+
+    async def acquire(
+        self,
+        key: str,
+        rate: RateLimit,
+        requested: int = 1,
+        refund: int = 0
+    ) -> Tuple[int, float]:
+        """Take up to requested tokens, first returning refund unused ones
+
+        Returns:
+            (tokens granted, seconds until one more token is available)
+
+        Raises:
+            RedisError: If Redis is unreachable
+        """
+        keys_and_args = (
+            f"{self.prefix}:{key}", repr(rate.interval), repr(float(rate.window)), requested, refund
+        )
+        try:
+            granted, retry_after = await self.client.evalsha(GCRA_SHA, 1, *keys_and_args)
+        except NoScriptError:
+            # First call against this server: EVAL also caches the script
+            granted, retry_after = await self.client.eval(GCRA_SCRIPT, 1, *keys_and_args)
+        return int(granted), float(retry_after)
+
+
+@dataclass
+class _Lease:
+    tokens: int
+    expires_at: float
+    # Redis refused tokens; checks are denied locally until expires_at
+    denied: bool = False
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class TokenBucketLimiter:
+    """Per-process token leases in front of a RedisRateLimiter"""
+
+    def __init__(
+        self,
+        backend: RedisRateLimiter,
+        lease_fraction: float = 0.1,
+        max_lease: int = 100,
+        sync_interval: float = 1.0,
+        max_keys: int = 100_000,
+        fail_open: bool = True
+    ):
+        """Initialize the limiter
+
+        Args:
+            backend: Shared limiter the leases are taken from
+            lease_fraction: Share of a key's limit leased at once. Smaller
+                leases spread tokens more evenly across processes, larger
+                ones save round trips.
+            max_lease: Upper bound on tokens per lease
+            sync_interval: Seconds a lease is used before unused tokens are
+                returned and a fresh one is taken
+            max_keys: Keys tracked in memory, least recently used dropped
+            fail_open: Allow requests when Redis is unreachable
+        """
+        self.backend = backend
+        self.lease_fraction = lease_fraction
+        self.max_lease = max_lease
+        self.sync_interval = sync_interval
+        self.max_keys = max_keys
+        self.fail_open = fail_open
+        self.stats = LimiterStats()
+        self._leases: "OrderedDict[str, _Lease]" = OrderedDict()
+
+    def lease_size(self, rate: RateLimit) -> int:
+        return max(1, min(self.max_lease, int(rate.limit * self.lease_fraction)))
+
+    async def check(self, key: str, rate: RateLimit) -> RateLimitResult:
+        """Consume one token for key, from the local lease when possible"""
+        started = time.perf_counter()
+        lease = self._lease(key)
+        result = self._take(lease)
+        if result is not None:
+            self.stats.local += 1
+        else:
+            async with lease.lock:
+                # Another check may have renewed the lease while we waited
+                result = self._take(lease) or await self._renew(key, rate, lease)
+        self.stats.record_check(started, result)
+        return result
+
+    def _lease(self, key: str) -> _Lease:
+        lease = self._leases.get(key)
+        if lease is None:
+            lease = self._leases[key] = _Lease(tokens=0, expires_at=0.0)
+            if len(self._leases) > self.max_keys:
+                self._leases.popitem(last=False)
+        else:
+            self._leases.move_to_end(key)
+        return lease
+
+    @staticmethod
+    def _take(lease: _Lease) -> Optional[RateLimitResult]:
+        """Serve a check from the lease, or None if Redis must be asked"""
+        now = time.monotonic()
+        if lease.expires_at <= now:
+            return None
+        if lease.denied:
+            return RateLimitResult(allowed=False, retry_after=lease.expires_at - now)
+        if lease.tokens > 0:
+            lease.tokens -= 1
+            return RateLimitResult(allowed=True)
+        return None
+
+    async def _renew(self, key: str, rate: RateLimit, lease: _Lease) -> RateLimitResult:
+        refund = lease.tokens
+        started = time.perf_counter()
+        try:
+            granted, retry_after = await self.backend.acquire(
+                key, rate, self.lease_size(rate), refund
+            )
+        except (RedisError, OSError) as exc:
+            self.stats.errors += 1
+            logger.warning("Rate limiter unavailable for %s: %s", key, exc)
+            return RateLimitResult(allowed=self.fail_open)
+        finally:
+            self.stats.record_redis(started)
+
+        now = time.monotonic()
+        lease.denied = granted == 0
+        if lease.denied:
+            lease.tokens = 0
+            lease.expires_at = now + min(retry_after, self.sync_interval)
+            return RateLimitResult(allowed=False, retry_after=retry_after)
+        lease.tokens = granted - 1
+        lease.expires_at = now + self.sync_interval
+        return RateLimitResult(allowed=True)
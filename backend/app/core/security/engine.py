@@ -2,6 +2,7 @@
 Enhanced Security Engine for Kundli Calculation Service
 Implements JWT authentication, rate limiting, and RBAC
 """
+import hashlib
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List
 from fastapi import HTTPException, Security, Depends
@@ -11,6 +12,7 @@ from passlib.context import CryptContext
 from pydantic import BaseModel
 from app.core.config.settings import settings
 from app.core.cache import RedisCache
+from app.core.rate_limit import RateLimit, RedisRateLimiter, TokenBucketLimiter
 from app.core.models.user import User
 
 class SecurityScope(BaseModel):
@@ -31,6 +33,16 @@ class SecurityEngine:
         self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
         self.oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
         self.redis_cache = RedisCache()
+        # Dedicated Redis client; one Lua call per token lease
+        self.rate_limiter = TokenBucketLimiter(
+            RedisRateLimiter.from_settings(settings),
+            lease_fraction=settings.RATE_LIMIT_LEASE_FRACTION,
+            sync_interval=settings.RATE_LIMIT_SYNC_SECONDS
+        )
+        self.rate_limit = RateLimit(
+            settings.RATE_LIMIT_MAX_REQUESTS,
+            settings.RATE_LIMIT_WINDOW_SECONDS
+        )
         
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify password hash"""
@@ -88,15 +100,10 @@ class SecurityEngine:
         
     async def check_rate_limit(self, token: str) -> bool:
         """Check rate limiting for the token"""
-        key = f"rate_limit:{token}"
-        current_count = await self.redis_cache.get(key) or 0
-        
-        if current_count >= settings.RATE_LIMIT_MAX_REQUESTS:
-            return False
-            
-        await self.redis_cache.incr(key)
-        await self.redis_cache.expire(key, settings.RATE_LIMIT_WINDOW_SECONDS)
-        return True
+        # Tokens are credentials; only their digest is used as a key
+        key = "token:" + hashlib.sha256(token.encode()).hexdigest()
+        result = await self.rate_limiter.check(key, self.rate_limit)
+        return result.allowed
         
     async def verify_scope(self, user: User, required_scope: SecurityScope) -> bool:
         """Verify user has required scope"""
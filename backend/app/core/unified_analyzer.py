@@ -92,10 +92,9 @@ class UnifiedAnalyzer:
         # 2. Generate divisional charts
         divisions = [1, 2, 3, 4, 7, 9, 10, 12, 16, 20, 24, 27, 30, 40, 45, 60]
         location = {'lat': latitude, 'lon': longitude}
-        divisional_charts = {
-            d: self.divisional_calc.calculate_chart(birth_time, d, location)
-            for d in divisions
-        }
+        divisional_charts = self.divisional_calc.calculate_charts(
+            birth_time, divisions, location
+        )
         
         # 3. Calculate planetary strengths
         planetary_strengths = {}
@@ -110,28 +109,21 @@ class UnifiedAnalyzer:
         
         # 4. Analyze house strengths
         house_positions = self._get_house_positions(planet_positions)
-        house_strengths = {}
-        
-        for house in range(1, 13):
-            occupants = [
-                {'name': p, **d}
+        house_strengths = self.house_analyzer.analyze_chart(
+            planets={
+                p: {**d, 'house': int(d['longitude'] / 30) + 1}
                 for p, d in planet_positions.items()
-                if int(d['longitude'] / 30) + 1 == house
-            ]
-            
-            # Get aspects to this house
-            aspects = self._get_aspects_to_house(house, planet_positions)
-            
-            # Get house lord
-            lord = self._get_house_lord(house, planet_positions)
-            
-            analysis = self.house_analyzer.analyze_house(
-                house=house,
-                occupants=occupants,
-                aspects=aspects,
-                lord=lord
-            )
-            house_strengths[house] = analysis
+            },
+            aspects=[
+                {**aspect, 'house': house}
+                for house in range(1, 13)
+                for aspect in self._get_aspects_to_house(house, planet_positions)
+            ],
+            house_lords={
+                house: self._get_house_lord(house, planet_positions)
+                for house in range(1, 13)
+            }
+        )
         
         # 5. Calculate aspects
         aspects = self.aspect_analyzer.calculate_all_aspects(planet_positions)
@@ -18,6 +18,9 @@ from .api.endpoints import (
 )
 from .core.config import settings
 from .core.errors.handlers import ErrorHandler
+from .core.cache import chart_cache
+from .core.parallel import compute_executor, ephemeris_pool
+from .core.middleware.http_cache import HTTPCacheMiddleware, ResponseCache
 from .db.mongodb import MongoDB
 
 app = FastAPI(
@@ -27,6 +30,20 @@ app = FastAPI(
     redoc_url=f"{settings.API_V1_STR}/redoc",
 )
 
+# Response cache, ETags and compression. Added before CORS so that CORS
+# headers are computed per request instead of replayed from the cache.
+response_cache = ResponseCache(
+    max_bytes=settings.HTTP_CACHE_MAX_BYTES,
+    ttl=settings.HTTP_CACHE_TTL_SECONDS,
+)
+app.add_middleware(
+    HTTPCacheMiddleware,
+    cache=response_cache,
+    paths=settings.HTTP_CACHE_PATHS,
+    min_compress_size=settings.HTTP_COMPRESSION_MIN_BYTES,
+    max_entry_bytes=settings.HTTP_CACHE_MAX_ENTRY_BYTES,
+)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -110,8 +127,11 @@ async def startup_event():
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Close MongoDB connection on shutdown."""
+    """Close MongoDB, the chart cache pool, ephemeris and compute workers on shutdown."""
     await MongoDB.close_database_connection()
+    await chart_cache.close()
+    ephemeris_pool.shutdown(wait=False)
+    compute_executor.shutdown(wait=False)
 
 @app.get("/")
 async def root():
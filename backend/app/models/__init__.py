@@ -1,9 +1,17 @@
 """Models package."""
-from .database_models import User, BirthChart, HouseSystem, PlanetaryPosition
 
+# Database models pull in SQLAlchemy and the driver; load them on first
+# access so that importing a plain pydantic model stays cheap.
 __all__ = [
     "User",
     "BirthChart",
     "HouseSystem",
     "PlanetaryPosition",
 ]
+
+
+def __getattr__(name):
+    if name in __all__:
+        from . import database_models
+        return getattr(database_models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
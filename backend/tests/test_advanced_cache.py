@@ -83,11 +83,12 @@ async def test_eviction_policies(cache):
     await cache.get("key1")
     await cache.get("key3")
     
-    # Force eviction
-    for i in range(5, 15):
+    # Force eviction of three items (max_size is 10)
+    for i in range(5, 13):
         await cache.put(f"key{i}", f"value{i}")
     
-    # Recently used items should still be present
+    # Least recently used items go first; recently used ones stay
+    assert [await cache.get(f"key{i}") for i in (0, 2, 4)] == [None, None, None]
     assert await cache.get("key1") is not None
     assert await cache.get("key3") is not None
     
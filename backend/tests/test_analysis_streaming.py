@@ -0,0 +1,108 @@
+"""
+Test Suite for Streaming Result Aggregates
+PGF Protocol: STAT_001
+Gate: GATE_3
+Version: 1.0.0
+"""
+
+import random
+import tracemalloc
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.core.analysis.streaming import ResultStream, RunningStats, TopK
+from app.core.analysis.correlation_engine import CorrelationAnalyzer, CorrelationResult, CorrelationType
+
+
+def test_running_stats_matches_numpy():
+    rng = random.Random(7)
+    values = [rng.uniform(-50, 150) for _ in range(5000)]
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+
+    assert stats.count == len(values)
+    assert stats.mean == pytest.approx(np.mean(values), abs=1e-9)
+    assert stats.std == pytest.approx(np.std(values), abs=1e-9)
+    assert stats.min == min(values)
+    assert stats.max == max(values)
+
+
+def test_top_k_keeps_highest_and_earliest_ties():
+    top = TopK(3)
+    for score, item in [(0.2, "a"), (0.9, "b"), (0.5, "c"), (0.9, "d"), (0.1, "e"), (0.7, "f")]:
+        top.add(score, item)
+
+    assert top.items() == [(0.9, "b"), (0.9, "d"), (0.7, "f")]
+
+
+def test_result_stream_bounds_history_but_not_aggregates():
+    stream = ResultStream(history_size=5, top_k=2)
+    start = datetime(2024, 1, 1)
+    for i in range(100):
+        stream.add(
+            i,
+            counts={"parity": i % 2},
+            values={"value": i},
+            score=i,
+            summary={"index": i},
+            timestamp=start + timedelta(minutes=i)
+        )
+
+    assert list(stream.recent) == [95, 96, 97, 98, 99]
+    assert stream.total == 100
+    assert stream.count("parity") == {0: 50, 1: 50}
+    assert stream.mean("value") == pytest.approx(49.5)
+    assert stream.top() == [{"score": 99, "index": 99}, {"score": 98, "index": 98}]
+    assert stream.latest == start + timedelta(minutes=99)
+
+    stream.clear()
+    assert stream.total == 0
+    assert not stream.recent
+    assert stream.mean("value") == 0.0
+
+
+def test_correlation_metrics_memory_stays_flat():
+    """Folding many results keeps memory bounded by the history size"""
+    analyzer = CorrelationAnalyzer(history_size=100)
+    rng = random.Random(3)
+    types = list(CorrelationType)
+    timestamp = datetime(2024, 1, 1)
+    significant = 0
+
+    def feed(n):
+        nonlocal significant
+        for _ in range(n):
+            corr = CorrelationResult(
+                correlation_type=rng.choice(types),
+                source="Sun",
+                target="Moon",
+                strength=rng.random(),
+                confidence=rng.random(),
+                timestamp=timestamp,
+                significance=rng.random() / 10,
+                details={}
+            )
+            significant += corr.significance < analyzer.significance_threshold
+            analyzer._record(corr)
+
+    feed(10_000)
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        feed(100_000)
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    metrics = analyzer.get_correlation_metrics()
+    assert metrics["total_correlations"] == 110_000
+    assert len(analyzer.correlations) == 100
+    assert sum(metrics["correlation_types"].values()) == 110_000
+    assert metrics["significant_correlations"] == significant
+    assert 0.45 < metrics["average_strength"] < 0.55
+    assert len(metrics["strongest"]) == 10
+    # 100k retained Correlation objects would take tens of megabytes
+    assert current - baseline < 256 * 1024
@@ -0,0 +1,107 @@
+"""Tests for the shared pairwise aspect kernel"""
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from app.core.calculations.aspect_kernel import (
+    MAJOR_ASPECTS,
+    AspectTable,
+    separations,
+    upper_triangle,
+)
+from app.core.calculations.aspects import EnhancedAspectCalculator
+from app.core.calculations.astronomical import AstronomicalCalculator
+from app.core.calculations.prediction_engine import PredictionEngine
+
+
+def test_separations_fold_to_smallest_angle():
+    result = separations([350.0, 10.0], [10.0, 190.0, 170.0])
+
+    assert result.shape == (2, 3)
+    np.testing.assert_allclose(result, [[20.0, 160.0, 180.0], [0.0, 180.0, 160.0]])
+
+
+def test_separations_broadcast_over_a_series():
+    series = np.array([[0.0, 90.0], [30.0, 120.0], [60.0, 150.0]])
+    result = separations(series, [0.0, 180.0])
+
+    assert result.shape == (3, 2, 2)
+    np.testing.assert_allclose(result[1], [[30.0, 150.0], [120.0, 60.0]])
+
+
+def test_match_reports_overlapping_aspects_in_table_order():
+    table = AspectTable(["Conjunction", "Semisextile", "Parallel"], [0, 30, 0], [10, 2, 1])
+    separation = np.array([[0.0, 0.5], [29.0, 12.0]])
+
+    matches = table.match(separation)
+
+    cells = list(zip(*[c.tolist() for c in matches.cells], matches.aspects.tolist()))
+    assert cells == [(0, 0, 0), (0, 0, 2), (0, 1, 0), (0, 1, 2), (1, 0, 1)]
+    np.testing.assert_allclose(matches.orbs, [0.0, 0.0, 0.5, 0.5, 1.0])
+
+    masked = table.match(separation, upper_triangle(2))
+    assert masked.aspects.tolist() == [0, 2]
+
+
+def test_first_and_last_match():
+    table = AspectTable.from_angles(MAJOR_ASPECTS, 35)
+
+    assert table.first(np.array([30.0, 75.0, 250.0])).tolist() == [0, 1, -1]
+    assert table.first(np.array([30.0, 75.0, 250.0]), last=True).tolist() == [1, 2, -1]
+
+
+def test_natal_and_synastry_aspects_agree():
+    calculator = EnhancedAspectCalculator()
+    chart = {
+        "Sun": {"longitude": 10.0, "speed": 1.0, "house": 1, "dignity": "exalted"},
+        "Moon": {"longitude": 130.5, "speed": 13.2, "house": 5},
+        "Saturn": {"longitude": 190.0, "speed": -0.05, "is_retrograde": True, "house": 7},
+    }
+
+    natal = calculator.calculate_aspects(chart)
+    synastry = calculator.calculate_synastry_aspects(chart, chart)
+
+    pairs = [(a.planet1, a.planet2, a.aspect.name) for a in natal]
+    assert pairs == [
+        ("Sun", "Moon", "Trine"),
+        ("Sun", "Saturn", "Opposition"),
+        ("Sun", "Saturn", "Contraparallel"),
+        ("Moon", "Saturn", "Sextile"),
+    ]
+    cross = {(a.planet1, a.planet2, a.aspect.name): a for a in synastry}
+    for aspect in natal:
+        assert cross[(aspect.planet1, aspect.planet2, aspect.aspect.name)] == aspect
+    # Every planet is conjunct itself across two copies of a chart
+    assert cross[("Moon", "Moon", "Conjunction")].orb == 0.0
+
+
+def test_astronomical_calculator_aspects():
+    positions = {
+        "Sun": {"longitude": 10.0},
+        "Moon": {"longitude": 75.0},
+        "Mars": {"longitude": 300.0},
+    }
+
+    aspects = AstronomicalCalculator().calculate_aspects(positions)
+
+    assert aspects["Mars"] == {}
+    assert aspects["Moon"] == {"Sun": {"type": "Sextile", "angle": 65.0, "orb": 5.0}}
+    assert aspects["Sun"] == {}
+
+
+def test_transit_series_uses_the_kernel():
+    start = datetime(2024, 1, 1)
+    series = [(start + timedelta(days=d), 100.0 + d * 30.0) for d in range(6)]
+
+    result = PredictionEngine.analyze_transit_period(
+        start, start + timedelta(days=5), "mars", 100.0, series
+    )
+
+    assert [(a["time"][:10], a["type"], a["angle"]) for a in result["aspects"]] == [
+        ("2024-01-01", "Conjunction", 0.0),
+        ("2024-01-03", "Sextile", 60.0),
+        ("2024-01-04", "Square", 90.0),
+        ("2024-01-05", "Trine", 120.0),
+    ]
+    assert PredictionEngine._get_aspect_type(186.0) == "Opposition"
+    assert PredictionEngine._get_aspect_type(30.0) is None
@@ -0,0 +1,175 @@
+"""
+Test Suite for Aspect Pattern Engine
+PGF Protocol: PAT_002
+Gate: GATE_3
+Version: 1.0.0
+"""
+
+import random
+import time
+from itertools import combinations, permutations
+
+import pytest
+
+from app.core.analysis.aspect_patterns import AspectPatternEngine, aspect_components
+from app.core.analysis.pattern_detector import PatternDetector, PatternSignature, PatternType
+
+
+@pytest.fixture
+def engine():
+    return AspectPatternEngine()
+
+
+def names(patterns):
+    return sorted((p.name, p.bodies, p.focus) for p in patterns)
+
+
+def test_grand_trine_found_once(engine):
+    graph = engine.graph_from_longitudes({"Sun": 10, "Moon": 130, "Mars": 251, "Venus": 40})
+
+    assert names(engine.grand_trines(graph)) == [("grand_trine", ("Sun", "Moon", "Mars"), None)]
+
+
+def test_grand_cross_contains_four_t_squares(engine):
+    graph = engine.graph_from_longitudes({"Sun": 0, "Moon": 90, "Mars": 180, "Saturn": 271})
+
+    assert names(engine.grand_crosses(graph)) == [
+        ("grand_cross", ("Sun", "Moon", "Mars", "Saturn"), None)
+    ]
+    t_squares = engine.t_squares(graph)
+    assert len(t_squares) == 4
+    assert {p.focus for p in t_squares} == {"Sun", "Moon", "Mars", "Saturn"}
+
+
+def test_yod_kite_and_stellium(engine):
+    yod = engine.graph_from_longitudes({"Sun": 0, "Moon": 60, "Mars": 210})
+    assert names(engine.yods(yod)) == [("yod", ("Sun", "Moon", "Mars"), "Mars")]
+
+    kite = engine.graph_from_longitudes({"Sun": 0, "Moon": 120, "Mars": 240, "Jupiter": 300})
+    assert names(engine.kites(kite)) == [
+        ("kite", ("Sun", "Moon", "Mars", "Jupiter"), "Jupiter")
+    ]
+
+    stellium = engine.graph_from_longitudes(
+        {"Sun": 100, "Mercury": 104, "Venus": 107, "Mars": 112, "Moon": 200}
+    )
+    assert [p.bodies for p in engine.stelliums(stellium)] == [
+        ("Sun", "Mercury", "Venus"),
+        ("Mercury", "Venus", "Mars"),
+    ]
+
+
+def test_body_set_limits_graph():
+    engine = AspectPatternEngine(bodies=["Sun", "Moon", "Mars"])
+    graph = engine.graph_from_longitudes({"Sun": 10, "Moon": 130, "Mars": 250, "Pluto": 10})
+
+    assert graph.bodies == ("Sun", "Moon", "Mars")
+    assert len(engine.grand_trines(graph)) == 1
+    assert engine.stelliums(graph) == []
+
+
+def test_matches_brute_force_on_random_charts(engine):
+    rng = random.Random(11)
+    for _ in range(50):
+        longitudes = {f"P{i}": rng.choice(range(0, 360, 30)) + rng.uniform(-3, 3) for i in range(14)}
+        graph = engine.graph_from_longitudes(longitudes)
+        bodies = graph.bodies
+
+        def has(aspect, a, b):
+            return graph.masks(aspect)[graph.index[a]] >> graph.index[b] & 1
+
+        trines = {
+            c for c in combinations(bodies, 3)
+            if all(has("trine", a, b) for a, b in combinations(c, 2))
+        }
+        assert {p.bodies for p in engine.grand_trines(graph)} == trines
+
+        t_squares = {
+            (frozenset((a, b)), apex) for a, b, apex in permutations(bodies, 3)
+            if has("opposition", a, b) and has("square", a, apex) and has("square", b, apex)
+        }
+        found = [(frozenset(p.bodies[:2]), p.focus) for p in engine.t_squares(graph)]
+        assert len(found) == len(set(found))
+        assert set(found) == t_squares
+
+        crosses = {
+            frozenset(c) for c in combinations(bodies, 4)
+            if sum(has("opposition", a, b) for a, b in combinations(c, 2)) == 2
+            and sum(has("square", a, b) for a, b in combinations(c, 2)) == 4
+        }
+        found = [frozenset(p.bodies) for p in engine.grand_crosses(graph)]
+        assert len(found) == len(set(found))
+        assert set(found) == crosses
+
+
+def test_dense_synastry_grid_stays_bounded(engine):
+    """Two 16-point charts on a 30 degree grid make a dense aspect graph"""
+    rng = random.Random(5)
+    charts = {
+        label: {f"B{i}": rng.choice(range(0, 360, 30)) + rng.uniform(-1, 1) for i in range(16)}
+        for label in ("natal", "partner")
+    }
+    graph = engine.graph_from_longitudes(engine.merge_charts(charts))
+
+    start = time.perf_counter()
+    patterns = engine.find_patterns(graph)
+    elapsed = time.perf_counter() - start
+
+    assert len(graph.bodies) == 32
+    assert len(patterns) == len(set(patterns))
+    assert elapsed < 5
+
+
+def test_aspect_components_reports_each_group_once(engine):
+    graph = engine.graph_from_aspects([
+        {"type": "trine", "planets": ["Sun", "Mars"]},
+        {"type": "trine", "planets": ["Mars", "Jupiter"]},
+        {"type": "trine", "planets": ["Jupiter", "Sun"]},
+        {"type": "trine", "planets": ["Moon", "Venus"]},
+        {"type": "square", "planets": ["Sun", "Moon"]},
+    ])
+
+    assert aspect_components(graph, "trine") == [("Sun", "Mars", "Jupiter"), ("Moon", "Venus")]
+
+
+@pytest.mark.asyncio
+async def test_detector_reports_configurations():
+    detector = PatternDetector()
+    aspects = [
+        {"type": "trine", "planets": [a, b]}
+        for a, b in combinations(["Sun", "Moon", "Mars"], 2)
+    ] + [
+        {"type": "opposition", "planets": ["Sun", "Saturn"]},
+        {"type": "sextile", "planets": ["Saturn", "Moon"]},
+        {"type": "sextile", "planets": ["Saturn", "Mars"]},
+    ]
+
+    patterns = await detector.detect_patterns({"aspects": aspects})
+    found = {p.name: p for p in patterns}
+
+    assert set(found) == {"Grand Trine", "Kite"}
+    assert {c["planet"] for c in found["Kite"].components if c["focus"]} == {"Saturn"}
+
+
+@pytest.mark.asyncio
+async def test_detector_builds_one_graph_and_matches_any_case(engine, monkeypatch):
+    detector = PatternDetector(aspect_engine=engine)
+    detector.signatures["Trine Chain"] = PatternSignature(
+        name="Trine Chain",
+        pattern_type=PatternType.ASPECT,
+        conditions=[{"type": "aspect_chain", "aspect": "Trine", "min_planets": 3}],
+        effects={"harmony": 0.8}
+    )
+    built = []
+    graph_from_aspects = engine.graph_from_aspects
+    monkeypatch.setattr(engine, "graph_from_aspects", lambda aspects: built.append(1) or graph_from_aspects(aspects))
+    aspects = [
+        {"type": "Trine", "planets": [a, b]}
+        for a, b in [("Sun", "Mars"), ("Mars", "Jupiter")]
+    ]
+
+    patterns = await detector.detect_patterns({"aspects": aspects})
+
+    assert built == [1]
+    chains = [p for p in patterns if p.name == "Trine Chain"]
+    assert [[c["planet"] for c in p.components] for p in chains] == [["Sun", "Mars", "Jupiter"]]
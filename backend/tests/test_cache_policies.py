@@ -0,0 +1,114 @@
+"""Tests for constant-time cache eviction"""
+import asyncio
+import pytest
+
+from app.core.benchmarks.cache_benchmark import run_insert_benchmark
+from app.core.cache.calculation_cache import CalculationCache
+from app.core.caching.engine import CacheBackend, CacheConfig, CacheEngine, CacheStrategy
+from app.core.caching.policies import ExpiryQueue, LFUIndex
+
+
+def _engine(strategy: CacheStrategy, max_size: int = 3, ttl: int = 300) -> CacheEngine:
+    return CacheEngine(CacheConfig(
+        backend=CacheBackend.MEMORY,
+        strategy=strategy,
+        ttl=ttl,
+        max_size=max_size,
+        namespace="test",
+    ))
+
+
+def test_lfu_index_evicts_least_frequent_then_oldest():
+    index = LFUIndex()
+    for key in "abc":
+        index.add(key)
+    index.touch("a")
+    index.touch("c")
+
+    assert index.pop_victim() == "b"
+    assert index.pop_victim() == "a"
+    index.remove("c")
+    assert index.victim() is None
+
+
+def test_expiry_queue_pops_only_expired():
+    queue = ExpiryQueue()
+    queue.push(5.0, "late")
+    queue.push(1.0, "early")
+
+    assert list(queue.pop_expired(2.0)) == ["early"]
+    assert queue.peek() == (5.0, "late")
+
+
+@pytest.mark.asyncio
+async def test_engine_lru_refreshes_on_get():
+    engine = _engine(CacheStrategy.LRU)
+    for key in "abc":
+        await engine.set(key, key)
+    await engine.get("a")
+    await engine.set("d", "d")
+
+    assert await engine.get("b") is None
+    assert await engine.get("a") == "a"
+
+
+@pytest.mark.asyncio
+async def test_engine_lfu_evicts_least_used():
+    engine = _engine(CacheStrategy.LFU)
+    for key in "abc":
+        await engine.set(key, key)
+    for key in "ab":
+        await engine.get(key)
+    await engine.set("d", "d")
+
+    assert await engine.get("c") is None
+    assert await engine.get("a") == "a"
+
+
+@pytest.mark.asyncio
+async def test_engine_sweeps_expired_entries_lazily():
+    engine = _engine(CacheStrategy.LRU, max_size=10, ttl=1)
+    await engine.set("a", 1)
+    await engine.set("b", 2, ttl=60)
+    await asyncio.sleep(1.1)
+    await engine.set("c", 3)
+
+    assert set(engine._cache) == {"test:b", "test:c"}
+
+
+@pytest.mark.asyncio
+async def test_engine_ttl_evicts_soonest_expiry():
+    engine = _engine(CacheStrategy.TTL)
+    await engine.set("a", 1, ttl=100)
+    await engine.set("b", 2, ttl=10)
+    await engine.set("c", 3, ttl=50)
+    await engine.set("d", 4, ttl=100)
+
+    assert await engine.get("b") is None
+    assert await engine.get("c") == 3
+
+
+def test_calculation_cache_refreshes_on_get():
+    cache = CalculationCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.contains("a")
+    assert not cache.contains("b")
+
+
+def test_insert_cost_stays_flat_at_capacity():
+    results = run_insert_benchmark(
+        sizes=(1_000, 100_000),
+        inserts=2_000,
+        caches=("CacheEngine[lru]", "CacheEngine[lfu]", "AdvancedCache[adaptive]"),
+    )
+    by_cache = {}
+    for result in results:
+        by_cache.setdefault(result.cache, []).append(result.us_per_insert)
+
+    for small, large in by_cache.values():
+        # A linear victim scan would be ~100x slower at 100k entries
+        assert large < small * 10
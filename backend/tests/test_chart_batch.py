@@ -0,0 +1,141 @@
+"""Tests for the streaming batch chart endpoint"""
+import json
+import pytest
+
+from app.api.endpoints import charts
+from app.api.models import ChartBatchRequest, ChartRequest
+from app.core.astronomical.framework import GeoLocation
+from app.core.astronomical.worker_pool import EphemerisRequest, EphemerisWorkerPool
+from app.core.cache.chart_cache import AsyncRedisCache
+from app.core.cache.tiered_cache import L1Cache, TieredCache
+
+
+class FakePipeline:
+    def __init__(self, store):
+        self.store = store
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def set(self, key, value, ex=None):
+        self.ops.append((key, value))
+
+    async def execute(self):
+        self.store.update(self.ops)
+        return [True] * len(self.ops)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.mgets = 0
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+        return True
+
+    async def mget(self, keys):
+        self.mgets += 1
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self.store)
+
+
+@pytest.fixture
+def batch_env(monkeypatch):
+    pool = EphemerisWorkerPool(workers_per_config=0, max_batch_size=2)
+    fake = FakeRedis()
+    monkeypatch.setattr(charts, "ephemeris_pool", pool)
+    monkeypatch.setattr(charts, "chart_cache", TieredCache(L1Cache(), AsyncRedisCache(client=fake)))
+    yield pool, fake
+    pool.shutdown()
+
+
+async def _run_batch(charts_in):
+    response = await charts.calculate_charts_batch(ChartBatchRequest(charts=charts_in))
+    assert response.media_type == "application/x-ndjson"
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    lines = [json.loads(line) for line in body.splitlines()]
+    return {line["index"]: line for line in lines}
+
+
+def _chart(hour: int, **kwargs) -> ChartRequest:
+    return ChartRequest(date_time=f"1990-05-17T{hour:02d}:30:00", latitude=28.6, longitude=77.2, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_batch_dedupes_and_matches_single_charts(batch_env, monkeypatch):
+    pool, _ = batch_env
+    computed = []
+    iter_many = pool.iter_many
+
+    def counting(requests, *args, **kwargs):
+        computed.extend(requests)
+        return iter_many(requests, *args, **kwargs)
+
+    monkeypatch.setattr(pool, "iter_many", counting)
+    inputs = [_chart(6), _chart(7), _chart(6), _chart(8), _chart(7)]
+    results = await _run_batch(inputs)
+
+    assert sorted(results) == [0, 1, 2, 3, 4]
+    assert len(computed) == 3
+    assert results[0]["chart"] == results[2]["chart"]
+    single = await charts.calculate_chart(_chart(8), response_mode="fast")
+    assert results[3]["chart"] == json.loads(single.body)
+
+
+@pytest.mark.asyncio
+async def test_batch_serves_cached_charts_in_one_lookup(batch_env, monkeypatch):
+    pool, fake = batch_env
+    first = await _run_batch([_chart(6), _chart(7)])
+    assert not any(line["cached"] for line in first.values())
+
+    charts.chart_cache.l1.clear()
+    fake.mgets = 0
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached charts should not be recalculated")
+
+    monkeypatch.setattr(pool, "_submit", fail)
+    second = await _run_batch([_chart(7), _chart(6)])
+
+    assert fake.mgets == 1
+    assert all(line["cached"] for line in second.values())
+    assert second[0]["chart"] == first[1]["chart"]
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_errors_per_chart(batch_env):
+    results = await _run_batch([_chart(6), _chart(7, divisions=[999])])
+
+    assert "chart" in results[0]
+    assert "error" in results[1]
+
+
+@pytest.mark.asyncio
+async def test_iter_many_yields_every_index_once(batch_env):
+    pool, _ = batch_env
+    location = GeoLocation(latitude=28.6, longitude=77.2)
+    requests = [
+        EphemerisRequest(timestamp=_chart(h).date_time, location=location) for h in range(5)
+    ]
+
+    seen = []
+    async for chunk in pool.iter_many(requests, _julian_day, max_in_flight=1):
+        assert len(chunk) <= pool.max_batch_size
+        seen.extend(chunk)
+
+    assert sorted(i for i, _ in seen) == list(range(5))
+    assert all(isinstance(value, float) for _, value in seen)
+
+
+def _julian_day(request, result, arg):
+    return result.julian_day
@@ -0,0 +1,166 @@
+"""Tests for the async chart cache"""
+import asyncio
+import pytest
+import redis
+from datetime import datetime, timedelta, timezone
+
+from app.core.astronomical import AyanamsaSystem
+from app.core.cache.chart_cache import AsyncRedisCache, chart_cache_key
+
+
+class FakeRedis:
+    """In-memory stand-in for redis.asyncio.Redis"""
+
+    def __init__(self, fail: bool = False):
+        self.store = {}
+        self.fail = fail
+
+    async def get(self, key):
+        if self.fail:
+            raise redis.ConnectionError("down")
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        if self.fail:
+            raise redis.ConnectionError("down")
+        self.store[key] = value
+        return True
+
+    async def delete(self, key):
+        return int(self.store.pop(key, None) is not None)
+
+
+def _key(**overrides):
+    args = dict(
+        date_time=datetime(1990, 5, 17, 6, 30),
+        latitude=28.6139,
+        longitude=77.209,
+        altitude=0,
+        ayanamsa=AyanamsaSystem.LAHIRI,
+        house_system="PLACIDUS",
+        divisions=[9, 10],
+    )
+    args.update(overrides)
+    return chart_cache_key(**args)
+
+
+def test_key_is_canonical():
+    base = _key()
+    ist = timezone(timedelta(hours=5, minutes=30))
+
+    assert _key(date_time=datetime(1990, 5, 17, 12, 0, tzinfo=ist)) == base
+    assert _key(date_time=datetime(1990, 5, 17, 6, 30, 0, 400000)) == base
+    assert _key(latitude=28.61391, longitude="77.20900") == base
+    assert _key(divisions=[10, 9, 9]) == base
+    assert _key(ayanamsa="lahiri") == base
+
+
+def test_key_separates_distinct_charts():
+    base = _key()
+
+    assert _key(latitude=28.6140) != base
+    assert _key(ayanamsa=AyanamsaSystem.RAMAN) != base
+    assert _key(house_system="WHOLE_SIGN") != base
+    assert _key(divisions=[9]) != base
+    assert _key(mode="fast") != base
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_compute_once():
+    fake = FakeRedis()
+    cache = AsyncRedisCache(client=fake)
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return b"chart"
+
+    results = await asyncio.gather(*(cache.get_or_compute("k", compute) for _ in range(10)))
+
+    assert calls == 1
+    assert results == [b"chart"] * 10
+    assert fake.store["k"] == b"chart"
+    assert await cache.get_or_compute("k", compute) == b"chart"
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_computation_propagates_and_is_retried():
+    cache = AsyncRedisCache(client=FakeRedis())
+
+    async def broken():
+        await asyncio.sleep(0.01)
+        raise ValueError("bad chart")
+
+    results = await asyncio.gather(
+        *(cache.get_or_compute("k", broken) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(r, ValueError) for r in results)
+
+    async def fixed():
+        return b"chart"
+
+    assert await cache.get_or_compute("k", fixed) == b"chart"
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_fall_back_to_computing():
+    cache = AsyncRedisCache(client=FakeRedis(fail=True))
+
+    async def compute():
+        return b"chart"
+
+    assert await cache.get("k") is None
+    assert await cache.set("k", b"chart") is False
+    assert await cache.get_or_compute("k", compute) == b"chart"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_followers():
+    cache = AsyncRedisCache(client=FakeRedis())
+    started = asyncio.Event()
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        started.set()
+        await asyncio.sleep(0.05)
+        return b"chart"
+
+    leader = asyncio.create_task(cache.get_or_compute("k", compute))
+    await started.wait()
+    follower = asyncio.create_task(cache.get_or_compute("k", compute))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == b"chart"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_computation_cancelled_once_every_caller_leaves():
+    cache = AsyncRedisCache(client=FakeRedis())
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def compute():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    callers = [asyncio.create_task(cache.get_or_compute("k", compute)) for _ in range(2)]
+    await started.wait()
+    for caller in callers:
+        caller.cancel()
+    await asyncio.gather(*callers, return_exceptions=True)
+
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert await cache.get_or_compute("k", lambda: asyncio.sleep(0, b"fresh")) == b"fresh"
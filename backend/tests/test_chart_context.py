@@ -0,0 +1,60 @@
+"""Tests for per-instant chart context reuse in AstronomicalCalculator"""
+import pytest
+from unittest.mock import patch
+from datetime import datetime
+from app.core.astronomical import (
+    AstronomicalCalculator,
+    CelestialBody,
+    ChartContext,
+    GeoLocation,
+)
+
+
+@pytest.fixture
+def mock_swe():
+    with patch('app.core.astronomical.framework.swe') as mock_swe:
+        mock_swe.julday.return_value = 2460311.0
+        mock_swe.houses.return_value = (
+            [0, 30, 60, 90, 120, 150, 180, 210, 240, 270, 300, 330],
+            [15.0, 285.0, 280.0, 195.0]
+        )
+        mock_swe.calc_ut.return_value = ([100.0, 1.0, 1.0, 0.5, 0, 0], 0)
+        yield mock_swe
+
+
+@pytest.fixture
+def location():
+    return GeoLocation(latitude=28.6139, longitude=77.2090)
+
+
+def test_all_positions_compute_houses_once(mock_swe, location):
+    calc = AstronomicalCalculator()
+    positions = calc.calculate_all_positions(datetime(2024, 1, 1, 12, 0), location)
+
+    assert len(positions) == len(CelestialBody)
+    assert mock_swe.houses.call_count == 1
+    # Rahu and Ketu share one mean node calculation
+    assert mock_swe.calc_ut.call_count == len(CelestialBody) - 1
+
+
+def test_ketu_derived_from_shared_node(mock_swe, location):
+    calc = AstronomicalCalculator()
+    context = calc.create_chart_context(datetime(2024, 1, 1, 12, 0), location)
+    rahu = calc.calculate_position_from_context(CelestialBody.RAHU, context)
+    ketu = calc.calculate_position_from_context(CelestialBody.KETU, context)
+
+    assert isinstance(context, ChartContext)
+    assert context.ascendant == 15.0
+    assert ketu.longitude == (rahu.longitude + 180) % 360
+    assert ketu.speed == -rahu.speed
+    assert mock_swe.calc_ut.call_count == 1
+
+
+def test_single_position_matches_context(mock_swe, location):
+    calc = AstronomicalCalculator()
+    dt = datetime(2024, 1, 1, 12, 0)
+    single = calc.calculate_planet_position(CelestialBody.MOON, dt, location)
+    context = calc.create_chart_context(dt, location)
+    from_context = calc.calculate_position_from_context(CelestialBody.MOON, context)
+
+    assert single == from_context
@@ -0,0 +1,84 @@
+"""Tests for the pre-serialized fast response mode of the chart endpoint"""
+import json
+import pytest
+from fastapi.responses import Response
+
+from app.api import serialization
+from app.api.endpoints import charts
+from app.api.models import ChartRequest, ChartResponse
+from app.core.astronomical.worker_pool import EphemerisWorkerPool
+from app.core.cache.chart_cache import AsyncRedisCache
+from app.core.cache.tiered_cache import L1Cache, TieredCache
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+        return True
+
+
+@pytest.fixture
+def chart_env(monkeypatch):
+    pool = EphemerisWorkerPool(workers_per_config=0)
+    fake = FakeRedis()
+    monkeypatch.setattr(charts, "ephemeris_pool", pool)
+    monkeypatch.setattr(charts, "chart_cache", TieredCache(L1Cache(), AsyncRedisCache(client=fake)))
+    yield fake
+    pool.shutdown()
+
+
+@pytest.fixture
+def chart_request():
+    return ChartRequest(date_time="1990-05-17T06:30:00", latitude=28.6, longitude=77.2)
+
+
+@pytest.mark.asyncio
+async def test_fast_mode_matches_standard_payload(chart_env, chart_request):
+    standard = await charts.calculate_chart(chart_request, response_mode="standard")
+    fast = await charts.calculate_chart(chart_request, response_mode="fast")
+
+    assert isinstance(standard, ChartResponse)
+    assert isinstance(fast, Response)
+    assert fast.media_type == "application/json"
+
+    body = json.loads(fast.body)
+    expected = standard.model_dump()
+    assert set(body) == set(expected)
+    assert isinstance(body["ayanamsa_value"], float)
+    for name, pos in expected["planetary_positions"].items():
+        assert body["planetary_positions"][name]["longitude"] == pytest.approx(float(pos["longitude"]), abs=1e-8)
+        assert body["planetary_positions"][name]["house"] == pos["house"]
+    assert body["houses"]["cusps"] == pytest.approx([float(c) for c in expected["houses"]["cusps"]], abs=1e-8)
+    assert set(body["divisional_charts"]) == {"D9", "D10"}
+
+
+@pytest.mark.asyncio
+async def test_fast_mode_serves_cached_bytes(chart_env, chart_request, monkeypatch):
+    calculate = charts.ephemeris_pool.calculate_transformed
+    calls = []
+
+    async def counting(*args, **kwargs):
+        calls.append(args)
+        return await calculate(*args, **kwargs)
+
+    monkeypatch.setattr(charts.ephemeris_pool, "calculate_transformed", counting)
+    first = await charts.calculate_chart(chart_request, response_mode="fast")
+    assert [k for k in chart_env.store if ":fast:" in k]
+    second = await charts.calculate_chart(chart_request, response_mode="fast")
+
+    # The second response is the cached bytes; nothing was recalculated
+    assert len(calls) == 1
+    assert second.body == first.body
+
+
+def test_dumps_without_orjson(monkeypatch):
+    payload = {"longitude": serialization.round_float(32.377155408618385), "sign": "Taurus"}
+    monkeypatch.setattr(serialization, "orjson", None)
+
+    assert serialization.dumps(payload) == b'{"longitude":32.37715541,"sign":"Taurus"}'
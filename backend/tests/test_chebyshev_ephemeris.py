@@ -0,0 +1,68 @@
+"""Tests for Chebyshev ephemeris tables"""
+import numpy as np
+import pytest
+import swisseph as swe
+from unittest.mock import patch
+from datetime import datetime
+from app.core.astronomical import (
+    AstronomicalCalculator,
+    AyanamsaSystem,
+    CelestialBody,
+    GeoLocation,
+)
+from app.core.astronomical.chebyshev import ChebyshevEphemeris, main
+from app.core.errors import AppError
+
+JD_START = 2460310.5  # 2024-01-01
+JD_END = JD_START + 64
+
+
+@pytest.fixture(scope="module")
+def table_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("ephe") / "lahiri.cheb"
+    ChebyshevEphemeris.build(JD_START, JD_END, AyanamsaSystem.LAHIRI).save(str(path))
+    return str(path)
+
+
+@pytest.fixture
+def table(table_path):
+    AstronomicalCalculator(ayanamsa_system=AyanamsaSystem.LAHIRI)
+    return ChebyshevEphemeris.load(table_path)
+
+
+def test_table_accuracy(table):
+    for planet_id, errors in table.verify(samples=200).items():
+        assert errors["longitude_arcsec"] < 1.0, swe.get_planet_name(planet_id)
+        assert errors["latitude_arcsec"] < 1.0, swe.get_planet_name(planet_id)
+
+
+def test_batch_evaluation_falls_back_outside_range(table):
+    jds = np.array([JD_START - 10, JD_START + 5.25, JD_END + 10])
+    values = table.evaluate(swe.MOON, jds)
+
+    assert values.shape == (3, 4)
+    for jd, row in zip(jds, values):
+        exact = swe.calc_ut(float(jd), swe.MOON, table.flags)[0]
+        assert abs((row[0] - exact[0] + 180) % 360 - 180) < 1e-6
+
+
+def test_calculator_uses_provider(table):
+    location = GeoLocation(latitude=13.0827, longitude=80.2707)
+    dt = datetime(2024, 1, 20, 6, 0)
+    plain = AstronomicalCalculator().calculate_all_positions(dt, location)
+    with patch.object(table, "lookup", wraps=table.lookup) as lookup:
+        tabled = AstronomicalCalculator(position_provider=table).calculate_all_positions(dt, location)
+
+    assert lookup.call_count == len(CelestialBody) - 1
+    for body, position in plain.items():
+        assert abs((tabled[body].longitude - position.longitude + 180) % 360 - 180) < 1 / 3600
+        assert tabled[body].sign == position.sign
+
+
+def test_mismatched_provider_rejected(table):
+    with pytest.raises(AppError):
+        AstronomicalCalculator(ayanamsa_system=AyanamsaSystem.RAMAN, position_provider=table)
+
+
+def test_cli_check(table_path):
+    assert main(["check", table_path, "--samples", "50"]) == 0
@@ -0,0 +1,140 @@
+"""Tests for the shared compute executor and its backpressure"""
+import asyncio
+import os
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from app.api.endpoints import dasha, divisional
+from app.core.parallel.compute_executor import ComputeExecutor, ComputeRejected, parse_limits
+
+
+def _busy(seconds):
+    """CPU-bound for roughly seconds"""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+    return os.getpid()
+
+
+def _fail():
+    raise ValueError("bad input")
+
+
+@pytest.mark.asyncio
+async def test_runs_off_the_event_loop_and_records_metrics():
+    executor = ComputeExecutor(workers=0)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.ensure_future(ticker())
+    try:
+        assert await executor.run("busy", _busy, 0.3) == os.getpid()
+    finally:
+        task.cancel()
+    executor.shutdown()
+
+    # The loop kept serving while the calculation ran
+    assert ticks >= 10
+    stats = executor.stats()["endpoints"]["busy"]
+    assert stats["completed"] == 1 and stats["in_flight"] == 0
+    assert stats["run_time"]["max_ms"] >= 250
+    assert set(stats["queue_time"]) == {"p50_ms", "p99_ms", "max_ms"}
+
+
+@pytest.mark.asyncio
+async def test_worker_exceptions_propagate():
+    executor = ComputeExecutor(workers=0)
+    with pytest.raises(ValueError, match="bad input"):
+        await executor.run("fail", _fail)
+    assert executor.stats()["endpoints"]["fail"]["failed"] == 1
+    assert executor.stats()["in_flight"] == 0
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_saturation_and_endpoint_limits_are_rejected():
+    release = threading.Event()
+    executor = ComputeExecutor(workers=0, max_queue=1, limits={"slow": 1})
+
+    first = asyncio.ensure_future(executor.run("slow", release.wait, 5))
+    await asyncio.sleep(0)
+    with pytest.raises(ComputeRejected) as exc:
+        await executor.run("slow", release.wait, 5)
+    assert exc.value.status_code == 429
+    assert int(exc.value.headers["Retry-After"]) >= 1
+
+    second = asyncio.ensure_future(executor.run("other", release.wait, 5))
+    await asyncio.sleep(0)
+    with pytest.raises(ComputeRejected) as exc:
+        await executor.run("other", release.wait, 5)
+    assert exc.value.status_code == 503
+
+    release.set()
+    assert await first and await second
+    stats = executor.stats()
+    assert stats["in_flight"] == 0
+    assert stats["endpoints"]["slow"]["rejected"] == 1
+    assert stats["endpoints"]["other"]["rejected"] == 1
+    # Capacity is free again
+    assert await executor.run("slow", _busy, 0) == os.getpid()
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_admit_shares_limits_with_dispatched_work():
+    executor = ComputeExecutor(workers=0, limits={"chart": 1})
+    async with executor.admit("chart"):
+        with pytest.raises(ComputeRejected):
+            async with executor.admit("chart"):
+                pass
+    async with executor.admit("chart"):
+        pass
+    assert executor.stats()["endpoints"]["chart"]["completed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_process_pool_runs_in_other_processes(monkeypatch):
+    # Workers load settings afresh; keep them off the test database config
+    monkeypatch.setenv("ENV", "development")
+    executor = ComputeExecutor(workers=2)
+    try:
+        pids = await asyncio.gather(*(executor.run("busy", _busy, 0.05) for _ in range(4)))
+    finally:
+        executor.shutdown()
+    assert os.getpid() not in pids
+    assert executor.stats()["endpoints"]["busy"]["completed"] == 4
+
+
+def test_parse_limits():
+    assert parse_limits("a.b=4, c=2,,bad") == {"a.b": 4, "c": 2}
+    assert parse_limits("") == {}
+
+
+@pytest.mark.asyncio
+async def test_endpoints_dispatch_and_surface_rejections(monkeypatch):
+    executor = ComputeExecutor(workers=0)
+    monkeypatch.setattr(dasha, "compute_executor", executor)
+    request = dasha.BulkCurrentDashaRequest(
+        natives=[dasha.DashaRequest(birth_date=datetime(1990, 5, 17, 4, 30), moon_longitude=125.5)],
+        at=datetime(2024, 1, 1),
+    )
+    result = await dasha.get_current_dasha_bulk(request)
+    assert "mahadasha" in result["results"][0]
+    assert executor.stats()["endpoints"]["dasha.current_bulk"]["completed"] == 1
+
+    saturated = ComputeExecutor(workers=0, limits={"divisional.calculate": 0})
+    monkeypatch.setattr(divisional, "compute_executor", saturated)
+    with pytest.raises(ComputeRejected) as exc:
+        await divisional.calculate_divisional_chart(divisional.DivisionalRequest(
+            date_time=datetime(1990, 5, 17, 4, 30), latitude=28.6, longitude=77.2, division=9
+        ))
+    assert exc.value.status_code == 429
+    executor.shutdown()
@@ -0,0 +1,73 @@
+"""Tests for the current dasha endpoints"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.endpoints import dasha
+from app.core.parallel.compute_executor import ComputeExecutor
+
+BIRTH = datetime(2000, 1, 1, 12, 0)
+
+
+@pytest.fixture(autouse=True)
+def inline_executor(monkeypatch):
+    monkeypatch.setattr(dasha, "compute_executor", ComputeExecutor(workers=0))
+
+
+@pytest.mark.asyncio
+async def test_current_defaults_to_now():
+    result = await dasha.get_current_dasha(BIRTH, 0.0, at=None)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    assert set(result) == {"mahadasha", "antardasha", "pratyantardasha"}
+    for period in result.values():
+        assert datetime.fromisoformat(period["start_date"]) <= now < datetime.fromisoformat(period["end_date"])
+
+
+@pytest.mark.asyncio
+async def test_current_at_explicit_instant():
+    at = datetime(2024, 12, 27, 4, 40, 19)
+    result = await dasha.get_current_dasha(BIRTH, 0.0, at=at)
+
+    assert result["mahadasha"]["planet"] == "Venus"
+    with pytest.raises(HTTPException) as exc:
+        await dasha.get_current_dasha(BIRTH, 0.0, at=BIRTH - timedelta(days=1))
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_bulk_returns_one_result_per_native_in_order():
+    at = datetime(2024, 12, 27, tzinfo=timezone.utc)
+    request = dasha.BulkCurrentDashaRequest(
+        natives=[
+            {"birth_date": BIRTH, "moon_longitude": 0.0},
+            {"birth_date": BIRTH, "moon_longitude": 400.0},
+            {"birth_date": "1990-05-17T06:30:00", "moon_longitude": 295.74},
+        ],
+        at=at,
+    )
+    response = await dasha.get_current_dasha_bulk(request)
+
+    assert response["at"] == at.isoformat()
+    results = response["results"]
+    assert len(results) == 3
+    assert results[0] == await dasha.get_current_dasha(BIRTH, 0.0, at=at)
+    assert "error" in results[1]
+    assert results[2]["mahadasha"]["planet"] == "Jupiter"
+
+
+@pytest.mark.asyncio
+async def test_periods_quantized_to_arc_seconds_and_whole_seconds():
+    at = datetime(2024, 12, 27, 4, 40, 19)
+    result = await dasha.get_current_dasha(BIRTH, 123.456789, at=at)
+
+    # Float noise below an arc-second does not change the periods
+    assert result == await dasha.get_current_dasha(BIRTH, 123.456789 + 1e-7, at=at)
+    assert await dasha.get_current_dasha(BIRTH, 359.99999999, at=at) == await dasha.get_current_dasha(BIRTH, 0.0, at=at)
+    with pytest.raises(HTTPException):
+        await dasha.get_current_dasha(BIRTH, -1e-7, at=at)
+
+    for period in result.values():
+        for field in ("start_date", "end_date"):
+            assert datetime.fromisoformat(period[field]).microsecond == 0
@@ -0,0 +1,92 @@
+"""Tests for the lazy Vimshottari dasha timeline"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.calculations.dasha_system import DASHA_LEVELS, DashaTimeline, VimshottariDasha
+
+BIRTH = datetime(1990, 5, 17, 6, 30)
+MOON = 295.74346968
+
+
+@pytest.fixture
+def timeline():
+    return DashaTimeline(BIRTH, MOON)
+
+
+def _flatten(periods, level=0):
+    for period in periods:
+        yield level, period
+        children = period.get(DASHA_LEVELS[level + 1]) if level + 1 < len(DASHA_LEVELS) else None
+        if children:
+            yield from _flatten(children, level + 1)
+
+
+def test_query_matches_linear_scan_of_full_tree(timeline):
+    tree = VimshottariDasha().calculate_all_dasha_levels(BIRTH, MOON)["periods"]
+    for days in range(0, 120 * 365, 997):
+        at = BIRTH + timedelta(days=days, hours=5)
+        chain = timeline.query(at, depth=3)
+        if not chain:
+            assert at >= timeline.end
+            continue
+        expected, periods = [], tree
+        for level in DASHA_LEVELS[:3]:
+            period = next(
+                p for p in periods
+                if datetime.fromisoformat(p["start_date"]) <= at < datetime.fromisoformat(p["end_date"])
+            )
+            expected.append(period["planet"])
+            periods = period.get(DASHA_LEVELS[len(expected)], [])
+        assert [p.planet for p in chain] == expected
+
+
+def test_query_resolves_nested_levels(timeline):
+    at = datetime(2024, 12, 27, 4, 40, 19)
+    chain = timeline.query(at, depth=5)
+
+    assert [p.level for p in chain] == list(DASHA_LEVELS)
+    for parent, child in zip(chain, chain[1:]):
+        assert parent.start <= child.start <= at < child.end <= parent.end
+        assert child.lords[:-1] == parent.lords
+    assert timeline.query(BIRTH - timedelta(days=1)) == []
+
+
+def test_window_only_materializes_overlapping_periods(timeline):
+    start = datetime(2024, 12, 1)
+    end = start + timedelta(days=30)
+    periods = list(_flatten(timeline.window(start, end, depth=5)))
+
+    assert len(periods) < 200  # of 9**5 prana periods in the full cycle
+    assert {level for level, _ in periods} == set(range(5))
+    for _, period in periods:
+        assert datetime.fromisoformat(period["start_date"]) < end
+        assert datetime.fromisoformat(period["end_date"]) > start
+
+
+def test_full_window_is_continuous(timeline):
+    periods = timeline.window(depth=2)
+
+    assert len(periods) == 9
+    assert periods[0]["start_date"] == BIRTH.isoformat()
+    for period in periods:
+        antar = period["antardasha"]
+        assert len(antar) == 9
+        assert antar[0]["start_date"] == period["start_date"]
+        assert antar[-1]["end_date"] == period["end_date"]
+        for current, following in zip(antar, antar[1:]):
+            assert current["end_date"] == following["start_date"]
+
+
+def test_aware_instants_against_naive_birth(timeline):
+    at = datetime(2024, 12, 27, 4, 40, 19)
+    aware = at.replace(tzinfo=timezone.utc)
+
+    assert timeline.query(aware) == timeline.query(at)
+
+
+def test_invalid_inputs():
+    with pytest.raises(ValueError):
+        DashaTimeline(BIRTH, 400.0)
+    with pytest.raises(ValueError):
+        DashaTimeline(BIRTH, MOON).query(BIRTH, depth=6)
@@ -113,3 +113,39 @@ def test_default_location(chart_engine, test_date):
     """Test chart calculation with default location"""
     chart = chart_engine.calculate_chart(test_date, division=1)
     assert chart.location == chart_engine.default_location
+
+@pytest.fixture
+def precomputed_engine():
+    """Engine used only with precomputed positions, so no ephemeris mocks are needed"""
+    return DivisionalChartEngine(cache=CalculationCache())
+
+def test_charts_from_precomputed_positions(precomputed_engine, test_date, test_location):
+    """Test all vargas derived from one precomputed D1 position set"""
+    planets = {"Sun": 15.5, "Moon": 123.4, "Mars": 301.9}
+    charts = precomputed_engine.calculate_charts_from_positions(
+        planets, 200.0, 23.15, test_date, test_location
+    )
+    assert sorted(charts) == precomputed_engine.supported_divisions
+    assert charts[1].planets == planets
+    assert charts[9].planets["Sun"] == 160.0
+    assert charts[9].houses[0] == 240.0
+    assert all(chart.ayanamsa == 23.15 for chart in charts.values())
+
+def test_precomputed_positions_match_single_division(precomputed_engine, test_date, test_location):
+    """Test batched vargas agree with the single-division path"""
+    planets = {"Sun": 15.5, "Moon": 123.4}
+    single = precomputed_engine.calculate_from_positions(
+        planets, 200.0, 10, 23.15, test_date, test_location
+    )
+    batched = precomputed_engine.calculate_charts_from_positions(
+        planets, 200.0, 23.15, test_date, test_location, divisions=[9, 10]
+    )
+    assert list(batched) == [9, 10]
+    assert batched[10] == single
+
+def test_precomputed_positions_invalid_division(precomputed_engine, test_date, test_location):
+    """Test unsupported divisions are rejected before any work is done"""
+    with pytest.raises(ValueError):
+        precomputed_engine.calculate_charts_from_positions(
+            {"Sun": 15.5}, 200.0, 23.15, test_date, test_location, divisions=[9, 11]
+        )
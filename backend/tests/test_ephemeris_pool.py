@@ -0,0 +1,72 @@
+"""Tests for the ephemeris worker pool"""
+import asyncio
+import pytest
+from datetime import datetime
+from app.core.astronomical import (
+    AstronomicalCalculator,
+    AyanamsaSystem,
+    CelestialBody,
+    GeoLocation,
+)
+from app.core.astronomical.worker_pool import EphemerisRequest, EphemerisWorkerPool
+
+BIRTH = datetime(1990, 5, 17, 6, 30)
+DELHI = GeoLocation(latitude=28.6139, longitude=77.2090)
+
+
+def _expected_sun(ayanamsa: AyanamsaSystem) -> float:
+    calc = AstronomicalCalculator(ayanamsa_system=ayanamsa)
+    return calc.calculate_planet_position(CelestialBody.SUN, BIRTH, DELHI).longitude
+
+
+@pytest.fixture
+def inline_pool():
+    pool = EphemerisWorkerPool(workers_per_config=0)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_calculate_returns_positions_houses_and_ayanamsa(inline_pool):
+    result = await inline_pool.calculate(BIRTH, DELHI, AyanamsaSystem.LAHIRI)
+
+    assert len(result.positions) == len(CelestialBody)
+    assert len(result.houses["cusps"]) == 12
+    assert 23 < result.ayanamsa < 24
+    assert result.positions[CelestialBody.SUN].longitude == pytest.approx(
+        _expected_sun(AyanamsaSystem.LAHIRI)
+    )
+
+
+@pytest.mark.asyncio
+async def test_mixed_ayanamsa_requests_do_not_interfere(inline_pool):
+    requests = [
+        EphemerisRequest(BIRTH, DELHI, ayanamsa)
+        for ayanamsa in [AyanamsaSystem.LAHIRI, AyanamsaSystem.RAMAN] * 10
+    ]
+    results = await inline_pool.calculate_many(requests)
+
+    lahiri = _expected_sun(AyanamsaSystem.LAHIRI)
+    raman = _expected_sun(AyanamsaSystem.RAMAN)
+    assert lahiri != pytest.approx(raman)
+    for request, result in zip(requests, results):
+        expected = lahiri if request.ayanamsa == AyanamsaSystem.LAHIRI else raman
+        assert result.positions[CelestialBody.SUN].longitude == pytest.approx(expected)
+
+
+def test_process_pool_routes_by_ayanamsa():
+    pool = EphemerisWorkerPool(workers_per_config=1, max_batch_size=2)
+    try:
+        requests = [
+            EphemerisRequest(BIRTH, DELHI, ayanamsa)
+            for ayanamsa in [AyanamsaSystem.KRISHNAMURTI, AyanamsaSystem.LAHIRI] * 3
+        ]
+        results = asyncio.run(pool.calculate_many(requests))
+    finally:
+        pool.shutdown()
+
+    kp = _expected_sun(AyanamsaSystem.KRISHNAMURTI)
+    lahiri = _expected_sun(AyanamsaSystem.LAHIRI)
+    assert [r.positions[CelestialBody.SUN].longitude for r in results] == pytest.approx(
+        [kp, lahiri] * 3
+    )
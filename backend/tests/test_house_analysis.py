@@ -155,3 +155,33 @@ def test_house_relationships(house_analyzer):
     
     # Test neutral relationship (no special combination)
     assert house_analyzer._get_house_relationship(2, 3) == 'neutral'  # Regular houses
+
+@pytest.mark.asyncio
+async def test_analyze_chart_matches_per_house_analysis(house_analyzer):
+    """Whole-chart analysis agrees with analyzing each house separately"""
+    from app.core.benchmarks.house_analysis_benchmark import sample_chart
+
+    chart = sample_chart()
+    # Mars rules 1 and 8 and sits in 1: mutual reception for house 8's lord
+    chart["lords"][8]["temporary_ruler"] = True
+
+    result = house_analyzer.analyze_chart(chart["planets"], chart["aspects"], chart["lords"], 'night')
+
+    assert sorted(result) == list(range(1, 13))
+    for house in range(1, 13):
+        occupants = [
+            {'name': name, **planet}
+            for name, planet in chart["planets"].items()
+            if planet["house"] == house
+        ]
+        aspects = [aspect for aspect in chart["aspects"] if aspect["house"] == house]
+        expected = await house_analyzer.analyze_house(
+            house, occupants, aspects, chart["lords"][house], 'night', chart["lords"]
+        )
+        assert result[house] == expected
+    assert result[8].dispositorship_strength > 50
+
+def test_engine_holds_no_thread_pool(house_analyzer):
+    """Engines are cheap to construct and keep no executor"""
+    assert not hasattr(house_analyzer, 'executor')
+    assert house_analyzer._calculate_natural_strength(1) == 100
@@ -0,0 +1,126 @@
+"""Tests for the HTTP response cache middleware"""
+import gzip
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.middleware.http_cache import (
+    HTTPCacheMiddleware,
+    ResponseCache,
+    canonical_body,
+    choose_encoding,
+    etag_matches,
+)
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    calls = []
+
+    @app.post("/api/calc")
+    async def calc(request: Request):
+        payload = await request.json()
+        calls.append(payload)
+        return {"echo": payload, "padding": "x" * 4000}
+
+    @app.post("/other")
+    async def other():
+        calls.append("other")
+        return {"small": True}
+
+    @app.get("/api/stream")
+    async def stream():
+        return StreamingResponse(iter([b"a\n", b"b\n"]), media_type="application/x-ndjson")
+
+    cache = ResponseCache(max_bytes=1024 * 1024)
+    app.add_middleware(HTTPCacheMiddleware, cache=cache, paths=["/api/"])
+    with TestClient(app) as test_client:
+        test_client.calls = calls
+        test_client.cache = cache
+        yield test_client
+
+
+def test_cache_keys_on_normalized_body(client):
+    first = client.post("/api/calc", content=b'{"a": 1, "b": 2}', headers={"content-type": "application/json"})
+    same = client.post("/api/calc", content=b'{"b":2,"a":1}', headers={"content-type": "application/json"})
+    different = client.post("/api/calc", json={"a": 2, "b": 2})
+
+    assert first.headers["x-cache"] == "MISS"
+    assert same.headers["x-cache"] == "HIT"
+    assert same.json() == first.json()
+    assert different.headers["x-cache"] == "MISS"
+    assert different.json()["echo"] == {"a": 2, "b": 2}
+    assert len(client.calls) == 2
+
+
+def test_if_none_match_returns_304(client):
+    first = client.post("/api/calc", json={"a": 1})
+    etag = first.headers["etag"]
+
+    revalidated = client.post("/api/calc", json={"a": 1}, headers={"if-none-match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+
+    changed = client.post("/api/calc", json={"a": 3}, headers={"if-none-match": etag})
+    assert changed.status_code == 200
+
+
+def test_large_responses_are_gzipped_once(client):
+    response = client.post("/api/calc", json={"a": 1}, headers={"accept-encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < 4000
+    assert response.json()["echo"] == {"a": 1}
+
+    entry = next(iter(client.cache.entries._entries.values()))[0]
+    assert gzip.decompress(entry.variants["gzip"]) == entry.body
+
+    identity = client.post("/api/calc", json={"a": 1}, headers={"accept-encoding": "identity"})
+    assert "content-encoding" not in identity.headers
+    assert identity.headers["etag"] != response.headers["etag"]
+    assert etag_matches(response.headers["etag"], identity.headers["etag"])
+
+
+def test_uncached_paths_and_streams_pass_through(client):
+    client.post("/other")
+    second = client.post("/other")
+    assert client.calls == ["other", "other"]
+    assert "x-cache" not in second.headers
+    assert "etag" in second.headers
+
+    stream = client.get("/api/stream")
+    assert stream.text == "a\nb\n"
+    assert "etag" not in stream.headers
+
+
+def test_cache_is_bounded_by_bytes():
+    cache = ResponseCache(max_bytes=20000)
+    app = FastAPI()
+
+    @app.post("/api/calc")
+    async def calc(request: Request):
+        return {"echo": await request.json(), "padding": "x" * 4000}
+
+    app.add_middleware(HTTPCacheMiddleware, cache=cache, paths=["/api/"])
+    with TestClient(app) as test_client:
+        for i in range(20):
+            test_client.post("/api/calc", json={"i": i})
+
+    assert 0 < cache.stats()["entries"] < 20
+    assert cache.stats()["bytes"] <= 20000
+
+
+def test_helpers():
+    assert canonical_body(b'{"b": [1, 2], "a": null}', "application/json") == b'{"a":null,"b":[1,2]}'
+    assert canonical_body(b"not json", "application/json") == b"not json"
+    assert choose_encoding("gzip;q=0.5, deflate") == "gzip"
+    assert choose_encoding("gzip;q=0") is None
+    assert choose_encoding("") is None
+    assert etag_matches('W/"abc", "def"', '"abc-gzip"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"abd"', '"abc"')
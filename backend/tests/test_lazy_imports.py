@@ -0,0 +1,104 @@
+"""
+Test Suite for Lazy Imports and Startup Import Budget
+PGF Protocol: LAZY_001
+Gate: GATE_4
+Version: 1.0.0
+"""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from app.core.lazy import LazySingleton, lazy_import
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Routers app.main mounts, importable without the database driver
+STARTUP_MODULES = [
+    "app.api.endpoints.health",
+    "app.api.endpoints.charts",
+    "app.api.endpoints.ayanamsa",
+    "app.api.endpoints.panchang",
+    "app.api.endpoints.dasha",
+    "app.api.endpoints.geo",
+    "app.api.endpoints.divisional",
+]
+
+# Stacks only analysis requests need
+HEAVY_MODULES = ["pandas", "scipy", "sklearn", "sqlalchemy"]
+
+# Cumulative import time allowed for app startup, in seconds
+IMPORT_BUDGET = float(os.environ.get("STARTUP_IMPORT_BUDGET_SECONDS", "2.5"))
+
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": str(BACKEND_DIR)}
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, timeout=120
+    )
+
+
+def app_import_seconds(modules: List[str]) -> float:
+    """Cumulative -X importtime of the top-level app imports"""
+    result = run_python("-X", "importtime", "-c", f"import {', '.join(modules)}")
+    if result.returncode != 0:
+        missing = re.search(r"No module named '([^']+)'", result.stderr)
+        if missing:
+            pytest.skip(f"{missing.group(1)} is not installed")
+        pytest.fail(result.stderr[-2000:])
+    total = 0
+    for match in IMPORT_TIME_LINE.finditer(result.stderr):
+        _, cumulative, indent, name = match.groups()
+        if not indent and name.split(".")[0] == "app":
+            total += int(cumulative)
+    return total / 1e6
+
+
+def test_lazy_import_defers_until_first_use():
+    module = lazy_import("json.tool")
+    sys.modules.pop("json.tool", None)
+
+    assert not module.loaded
+    assert callable(module.main)
+    assert module.loaded
+
+
+def test_lazy_singleton_builds_once():
+    built = []
+    singleton = LazySingleton(lambda: built.append(1) or object())
+
+    assert not singleton.loaded
+    first = singleton()
+    assert singleton() is first
+    assert built == [1]
+
+    singleton.reset()
+    assert singleton() is not first
+    assert built == [1, 1]
+
+
+def test_startup_does_not_load_analysis_stacks():
+    modules = STARTUP_MODULES + ["app.core.analysis.prediction_engine"]
+    result = run_python("-c", (
+        f"import sys, {', '.join(modules)}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    ))
+
+    assert result.returncode == 0, result.stderr[-2000:]
+    assert result.stdout.strip() == ""
+
+
+def test_startup_routers_within_import_budget():
+    assert app_import_seconds(STARTUP_MODULES) < IMPORT_BUDGET
+
+
+def test_app_startup_within_import_budget():
+    assert app_import_seconds(["app.main"]) < IMPORT_BUDGET
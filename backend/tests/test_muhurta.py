@@ -0,0 +1,224 @@
+"""Tests for the muhurta window search and endpoint"""
+import json
+import time
+from datetime import datetime, timedelta
+
+import pytest
+import swisseph as swe
+from fastapi import HTTPException
+
+from app.api.endpoints import panchang, prediction
+from app.core.cache.chart_cache import AsyncRedisCache
+from app.core.cache.tiered_cache import L1Cache, TieredCache
+from app.core.parallel.compute_executor import ComputeExecutor
+from app.core.calculations.muhurta import MUHURTA_RULES, SIGNS, MuhurtaSearch, lagna_intervals
+from app.core.calculations.panchang import NAKSHATRAS, to_julian_day
+from app.core.calculations.prediction_engine import PredictionEngine
+
+START = datetime(2024, 1, 1)
+END = datetime(2024, 4, 1)
+DELHI = (28.61, 77.21)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+        return True
+
+
+@pytest.fixture(scope="module")
+def quarter():
+    return MuhurtaSearch(START, END, *DELHI)
+
+
+def _jd(value):
+    return to_julian_day(datetime.fromisoformat(value))
+
+
+@pytest.mark.parametrize("latitude", [-45.0, 0.0, 28.61, 60.0])
+def test_lagna_intervals_match_houses(latitude):
+    start = to_julian_day(START)
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+    ayanamsa = swe.get_ayanamsa_ut(start + 1)
+    spans = lagna_intervals(start, start + 2, latitude, DELHI[1], ayanamsa)
+
+    for sign, begin, end in spans:
+        # Within 30 s of each boundary the ascendant is already in its sign
+        for jd in (max(begin, start) + 30 / 86400, min(end, start + 2) - 30 / 86400):
+            ascendant = swe.houses_ex(jd, latitude, DELHI[1], b"P", swe.FLG_SIDEREAL)[1][0]
+            assert int(ascendant // 30) == sign
+    assert all(b[0] == (a[0] + 1) % 12 for a, b in zip(spans, spans[1:]))
+
+
+def test_lagna_rejects_polar_latitudes():
+    with pytest.raises(ValueError):
+        MuhurtaSearch(START, END, 70.0, 0.0)
+
+
+def test_windows_satisfy_rules(quarter):
+    rule = MUHURTA_RULES["marriage"]
+    windows = quarter.windows("marriage")
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+
+    assert windows
+    assert [w["score"] for w in windows] == sorted((w["score"] for w in windows), reverse=True)
+    for window in windows:
+        assert window["duration_minutes"] >= 30
+        assert 0 < window["score"] <= 100
+        assert window["parts"][0]["start"] == window["start"]
+        assert window["parts"][-1]["end"] == window["end"]
+        for part, following in zip(window["parts"], window["parts"][1:]):
+            assert part["end"] == following["start"]
+        for part in window["parts"]:
+            assert part["nakshatra"] in rule.nakshatras
+            assert part["lagna"] in rule.lagnas
+
+            # Spot-check the part's middle against the ephemeris
+            middle = (_jd(part["start"]) + _jd(part["end"])) / 2
+            moon = swe.calc_ut(middle, swe.MOON, swe.FLG_SWIEPH | swe.FLG_SIDEREAL)[0][0]
+            assert NAKSHATRAS[int(moon // (360 / 27))] == part["nakshatra"]
+
+
+def test_adjacent_segments_merge_before_duration_filter(quarter):
+    windows = quarter.windows("marriage", min_duration_minutes=1)
+    spans = sorted((w["start"], w["end"]) for w in windows)
+
+    # No window abuts another; some span several limb changes
+    assert all(a[1] < b[0] for a, b in zip(spans, spans[1:]))
+    merged = [w for w in windows if len(w["parts"]) > 1]
+    assert merged
+
+    # A window is kept on its total length even when every part is shorter
+    def minutes(part):
+        return (_jd(part["end"]) - _jd(part["start"])) * 1440
+    window = max(merged, key=lambda w: w["duration_minutes"] - max(minutes(p) for p in w["parts"]))
+    longest_part = max(minutes(p) for p in window["parts"])
+    threshold = (longest_part + window["duration_minutes"]) / 2
+    assert window in quarter.windows("marriage", min_duration_minutes=threshold)
+
+
+def test_windows_are_pruned_by_duration_and_limit(quarter):
+    all_windows = quarter.windows("travel", min_duration_minutes=1)
+    long_windows = quarter.windows("travel", min_duration_minutes=90)
+    top = quarter.windows("travel", limit=3)
+
+    assert len(long_windows) < len(all_windows)
+    assert all(w["duration_minutes"] >= 90 for w in long_windows)
+    assert top == quarter.windows("travel")[:3]
+
+
+def test_quarter_search_is_fast():
+    started = time.perf_counter()
+    search = MuhurtaSearch(START, END, *DELHI)
+    for activity in MUHURTA_RULES:
+        search.windows(activity)
+    elapsed = time.perf_counter() - started
+
+    # Boundaries are found once and shared by every activity,
+    # about three evaluations each (~830 for the quarter)
+    assert search.evaluations < 900
+    evaluations = search.evaluations
+    search.intervals()
+    search.windows("travel")
+    assert search.evaluations == evaluations
+    assert elapsed < 2.0
+
+
+def test_unknown_activity():
+    with pytest.raises(ValueError):
+        MuhurtaSearch(START, START + timedelta(days=1), *DELHI).windows("skydiving")
+
+
+@pytest.mark.asyncio
+async def test_muhurta_endpoint_is_cached(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(panchang, "chart_cache", TieredCache(L1Cache(), AsyncRedisCache(client=fake)))
+    monkeypatch.setattr(panchang, "compute_executor", ComputeExecutor(workers=0))
+    request = panchang.MuhurtaRequest(
+        start=START, end=START + timedelta(days=10), latitude=DELHI[0], longitude=DELHI[1], activity="Business"
+    )
+
+    first = await panchang.calculate_muhurta_windows(request)
+    assert len(fake.store) == 1
+
+    def fail(self, *args):
+        raise AssertionError("cached search should not run again")
+
+    monkeypatch.setattr(MuhurtaSearch, "windows", fail)
+    second = await panchang.calculate_muhurta_windows(request)
+
+    body = json.loads(first.body)
+    assert second.body == first.body
+    assert body["activity"] == "business"
+    assert all(part["lagna"] in SIGNS for w in body["windows"] for part in w["parts"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kwargs", [
+    {"end": START + timedelta(days=400)},
+    {"end": START - timedelta(days=1)},
+    {"activity": "skydiving"},
+    {"ayanamsa": "unknown"},
+])
+async def test_muhurta_endpoint_rejects_bad_input(kwargs):
+    fields = {"start": START, "end": END, "latitude": DELHI[0], "longitude": DELHI[1], "activity": "travel"}
+    fields.update(kwargs)
+    with pytest.raises(HTTPException) as exc:
+        await panchang.calculate_muhurta_windows(panchang.MuhurtaRequest(**fields))
+    assert exc.value.status_code == 400
+
+
+def test_find_next_suitable_time_uses_window_search():
+    strengths = {"mercury": 0.8, "jupiter": 0.8, "sun": 0.8}
+    result = PredictionEngine.find_next_suitable_time(
+        START, "business", {"sun": 280.0, "moon": 100.0}, strengths, max_days=3,
+        latitude=DELHI[0], longitude=DELHI[1]
+    )
+    windows = MuhurtaSearch(START, START + timedelta(days=3), *DELHI).windows("business")
+
+    assert result["window"] == min(windows, key=lambda w: w["start"])
+    assert result["datetime"] == datetime.fromisoformat(result["window"]["start"]).replace(tzinfo=None).isoformat()
+    # Fields keep the calculate_muhurta types; limb names live under "window"
+    assert isinstance(result["tithi"], int) and isinstance(result["nakshatra"], int)
+    for part in result["window"]["parts"]:
+        assert part["nakshatra"] in MUHURTA_RULES["business"].nakshatras
+        assert part["lagna"] in MUHURTA_RULES["business"].lagnas
+
+    weak = {"mercury": 0.1, "jupiter": 0.1, "sun": 0.1}
+    assert PredictionEngine.find_next_suitable_time(START, "business", {"sun": 280.0, "moon": 100.0}, weak, max_days=3) is None
+
+
+@pytest.mark.asyncio
+async def test_next_suitable_endpoint_runs_in_compute_executor(monkeypatch):
+    executor = ComputeExecutor(workers=0)
+    monkeypatch.setattr(prediction, "compute_executor", executor)
+    fields = {
+        "datetime_utc": START.isoformat(), "activity_type": "business", "max_days": 3,
+        "planet_positions": {"sun": 280.0, "moon": 100.0},
+    }
+
+    result = await prediction.find_next_suitable_time(prediction.NextSuitableTimeRequest(
+        **fields, planet_strengths={"mercury": 0.8, "jupiter": 0.8, "sun": 0.8}
+    ))
+    assert result["window"]["parts"][0]["lagna"] in MUHURTA_RULES["business"].lagnas
+    assert executor.stats()["endpoints"]["prediction.next_suitable"]["completed"] == 1
+
+    with pytest.raises(HTTPException) as exc:
+        await prediction.find_next_suitable_time(prediction.NextSuitableTimeRequest(
+            **fields, planet_strengths={"mercury": 0.1, "jupiter": 0.1, "sun": 0.1}
+        ))
+    assert exc.value.status_code == 404
+
+
+def test_find_next_suitable_time_leaves_positions_untouched():
+    positions = {"sun": 10.0, "moon": 100.0}
+    PredictionEngine.find_next_suitable_time(
+        START, "business", positions, {"sun": 0.5, "moon": 0.5}, max_days=1
+    )
+    assert positions == {"sun": 10.0, "moon": 100.0}
@@ -0,0 +1,118 @@
+"""Tests for the panchang transition search and range endpoint"""
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.endpoints import panchang
+from app.core.cache.chart_cache import AsyncRedisCache
+from app.core.cache.tiered_cache import L1Cache, TieredCache
+from app.core.parallel.compute_executor import ComputeExecutor
+from app.core.calculations.panchang import PanchangSearch, karana_name, tithi_name
+
+START = datetime(2024, 3, 1)
+END = datetime(2024, 4, 1)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+        return True
+
+
+@pytest.fixture
+def month():
+    search = PanchangSearch(START, END, "tropical")
+    return search, search.transitions()
+
+
+def _midpoint(interval):
+    start = datetime.fromisoformat(interval["start"]).replace(tzinfo=None)
+    end = datetime.fromisoformat(interval["end"]).replace(tzinfo=None)
+    return start + (end - start) / 2
+
+
+@pytest.mark.asyncio
+async def test_intervals_agree_with_instant_panchang(month):
+    _, result = month
+    for tithi in result["tithi"]:
+        at = await panchang.calculate_panchang(panchang.PanchangRequest(date_time=_midpoint(tithi)))
+        assert at.tithi_number == tithi["number"]
+    for nakshatra in result["nakshatra"]:
+        at = await panchang.calculate_panchang(panchang.PanchangRequest(date_time=_midpoint(nakshatra)))
+        assert at.nakshatra_name == nakshatra["name"]
+    for yoga in result["yoga"]:
+        at = await panchang.calculate_panchang(panchang.PanchangRequest(date_time=_midpoint(yoga)))
+        assert at.yoga_number == yoga["number"]
+
+
+def test_intervals_are_contiguous_and_cover_range(month):
+    _, result = month
+    for intervals in result.values():
+        assert datetime.fromisoformat(intervals[0]["start"]).replace(tzinfo=None) <= START
+        assert datetime.fromisoformat(intervals[-1]["end"]).replace(tzinfo=None) >= END
+        for current, following in zip(intervals, intervals[1:]):
+            assert current["end"] == following["start"]
+
+
+def test_search_uses_few_evaluations_per_transition(month):
+    search, result = month
+    transitions = sum(len(intervals) for intervals in result.values())
+
+    assert search.evaluations < 4 * transitions
+
+
+def test_sidereal_shifts_nakshatra_not_tithi(month):
+    _, tropical = month
+    sidereal = PanchangSearch(START, END, "lahiri").transitions()
+
+    assert sidereal["tithi"] == tropical["tithi"]
+    assert sidereal["nakshatra"][0]["number"] != tropical["nakshatra"][0]["number"]
+
+
+def test_names():
+    assert tithi_name(0) == "Shukla Pratipada"
+    assert tithi_name(14) == "Purnima"
+    assert tithi_name(29) == "Amavasya"
+    assert karana_name(0) == "Kimstughna"
+    assert karana_name(8) == "Bava"
+    assert karana_name(59) == "Naga"
+
+
+@pytest.mark.asyncio
+async def test_range_endpoint_is_cached(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(panchang, "chart_cache", TieredCache(L1Cache(), AsyncRedisCache(client=fake)))
+    monkeypatch.setattr(panchang, "compute_executor", ComputeExecutor(workers=0))
+    request = panchang.PanchangRangeRequest(start=START, end=START + timedelta(days=3))
+
+    first = await panchang.calculate_panchang_range(request)
+    assert list(fake.store) == ["panchang:v1:range:2024-03-01T00:00:00:2024-03-04T00:00:00:lahiri"]
+
+    def fail(self):
+        raise AssertionError("cached range should not be searched again")
+
+    monkeypatch.setattr(PanchangSearch, "transitions", fail)
+    second = await panchang.calculate_panchang_range(request)
+
+    assert second.body == first.body
+    assert set(json.loads(first.body)) == {"start", "end", "ayanamsa", "tithi", "nakshatra", "yoga", "karana"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kwargs", [
+    {"end": START + timedelta(days=400)},
+    {"end": START - timedelta(days=1)},
+    {"end": END, "ayanamsa": "unknown"},
+])
+async def test_range_endpoint_rejects_bad_input(kwargs):
+    with pytest.raises(HTTPException) as exc:
+        await panchang.calculate_panchang_range(panchang.PanchangRangeRequest(start=START, **kwargs))
+    assert exc.value.status_code == 400
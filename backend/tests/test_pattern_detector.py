@@ -60,6 +60,11 @@ def sample_chart_data():
                 "type": "trine",
                 "planets": ["Mars", "Jupiter"],
                 "orb": 3
+            },
+            {
+                "type": "trine",
+                "planets": ["Jupiter", "Sun"],
+                "orb": 4
             }
         ],
         "temporal": {
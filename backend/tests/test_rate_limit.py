@@ -0,0 +1,145 @@
+"""Tests for the GCRA rate limiter and its local token leases"""
+import math
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError, NoScriptError
+
+from app.core.rate_limit import (
+    GCRA_SCRIPT,
+    GCRA_SHA,
+    RateLimit,
+    RedisRateLimiter,
+    TokenBucketLimiter,
+)
+
+
+class FakeRedis:
+    """Runs the GCRA script's arithmetic in Python against a manual clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.tats = {}
+        self.scripts = set()
+        self.calls = 0
+        self.down = False
+
+    async def evalsha(self, sha, numkeys, key, *args):
+        if sha not in self.scripts:
+            raise NoScriptError("NOSCRIPT")
+        return self._run(key, *args)
+
+    async def eval(self, script, numkeys, key, *args):
+        assert script == GCRA_SCRIPT
+        self.scripts.add(GCRA_SHA)
+        return self._run(key, *args)
+
+    def _run(self, key, interval, window, requested, refund):
+        if self.down:
+            raise RedisConnectionError("down")
+        self.calls += 1
+        interval, window = float(interval), float(window)
+        tat = max(self.tats.get(key, self.now) - refund * interval, self.now)
+        available = math.floor((window - (tat - self.now)) / interval + 1e-9)
+        granted = max(min(requested, available), 0)
+        tat += granted * interval
+        self.tats[key] = tat
+        return [granted, str(max(tat + interval - window - self.now, 0)).encode()]
+
+
+RATE = RateLimit(limit=100, window=60)
+
+
+@pytest.mark.asyncio
+async def test_backend_loads_script_once_and_enforces_window():
+    fake = FakeRedis()
+    backend = RedisRateLimiter(fake)
+
+    assert await backend.acquire("k", RATE, requested=60) == (60, 0.0)
+    granted, retry_after = await backend.acquire("k", RATE, requested=60)
+    assert granted == 40
+    assert retry_after == pytest.approx(0.6)
+    assert fake.scripts == {GCRA_SHA}
+
+    fake.now += 6
+    assert (await backend.acquire("k", RATE, requested=60))[0] == 10
+
+
+@pytest.mark.asyncio
+async def test_checks_are_served_from_local_leases():
+    fake = FakeRedis()
+    limiter = TokenBucketLimiter(RedisRateLimiter(fake), sync_interval=60)
+
+    results = [await limiter.check("client", RATE) for _ in range(105)]
+
+    assert sum(r.allowed for r in results) == 100
+    assert fake.calls == 11
+    # Further denials are remembered locally until a token frees up
+    denied = await limiter.check("client", RATE)
+    assert not denied.allowed and denied.retry_after > 0
+    assert fake.calls == 11
+
+    stats = limiter.stats.as_dict()
+    assert stats["checks"] == 106
+    assert stats["denied"] == 6
+    assert stats["redis_calls"] == 11
+    assert stats["local_hit_rate"] > 0.8
+    assert set(stats["check_latency"]) == {"p50_ms", "p99_ms", "max_ms"}
+
+
+@pytest.mark.asyncio
+async def test_processes_share_the_global_limit():
+    fake = FakeRedis()
+    processes = [TokenBucketLimiter(RedisRateLimiter(fake), sync_interval=60) for _ in range(4)]
+
+    allowed = 0
+    for _ in range(60):
+        for limiter in processes:
+            allowed += (await limiter.check("client", RATE)).allowed
+
+    assert allowed == 100
+
+
+@pytest.mark.asyncio
+async def test_unused_tokens_are_refunded_on_renewal(monkeypatch):
+    fake = FakeRedis()
+    clock = [0.0]
+    monkeypatch.setattr("app.core.rate_limit.time.monotonic", lambda: clock[0])
+    limiter = TokenBucketLimiter(RedisRateLimiter(fake), sync_interval=1.0)
+
+    assert (await limiter.check("client", RATE)).allowed
+    assert fake.tats["rate_limit:client"] == pytest.approx(fake.now + 10 * RATE.interval)
+
+    clock[0] += 2.0
+    assert (await limiter.check("client", RATE)).allowed
+    # Nine unused tokens went back before ten more were leased
+    assert fake.tats["rate_limit:client"] == pytest.approx(fake.now + 11 * RATE.interval)
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_fail_open_or_closed():
+    fake = FakeRedis()
+    fake.down = True
+
+    open_limiter = TokenBucketLimiter(RedisRateLimiter(fake))
+    closed_limiter = TokenBucketLimiter(RedisRateLimiter(fake), fail_open=False)
+
+    assert (await open_limiter.check("client", RATE)).allowed
+    assert not (await closed_limiter.check("client", RATE)).allowed
+    assert open_limiter.stats.errors == 1
+
+
+def test_limiter_gets_its_own_redis_client():
+    from types import SimpleNamespace
+    from app.core.cache import chart_cache
+
+    config = SimpleNamespace(
+        REDIS_HOST="localhost", REDIS_PORT=6379, REDIS_DB=0, REDIS_USERNAME=None,
+        REDIS_PASSWORD=None, REDIS_SSL=False, REDIS_TIMEOUT=5, REDIS_MAX_CONNECTIONS=20,
+        RATE_LIMIT_REDIS_URL="redis://limiter:6380/3"
+    )
+
+    limiter = RedisRateLimiter.from_settings(config)
+    options = limiter.client.connection_pool.connection_kwargs
+
+    assert limiter.client is not chart_cache.l2.client
+    assert (options["host"], options["port"], options["db"]) == ("limiter", 6380, 3)
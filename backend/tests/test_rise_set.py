@@ -0,0 +1,88 @@
+"""Tests for the batched rise/set/transit engine"""
+import json
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+import swisseph as swe
+
+from app.api.endpoints import panchang
+from app.core.astronomical.rise_set import RiseSetEngine, julian_day, single_day
+from app.core.parallel.compute_executor import ComputeExecutor
+
+LOCATIONS = [(28.6139, 77.2090), (51.5072, -0.1276), (-33.8688, 151.2093), (78.2232, 15.6267)]
+SWE_EVENTS = {"rise": swe.CALC_RISE, "set": swe.CALC_SET, "transit": swe.CALC_MTRANSIT}
+
+
+@pytest.fixture(scope="module")
+def month():
+    lats, lons = zip(*LOCATIONS)
+    return RiseSetEngine().compute(lats, lons, date(2024, 6, 1), 30)
+
+
+@pytest.mark.parametrize("body,body_id", [("sun", swe.SUN), ("moon", swe.MOON)])
+def test_matches_swiss_ephemeris(month, body, body_id):
+    # Grazing events near the poles are too sensitive to the horizon model
+    for loc, (lat, lon) in enumerate(LOCATIONS[:3]):
+        for day in range(30):
+            day_start = julian_day(date(2024, 6, 1)) + day - lon / 360.0
+            for event, flag in SWE_EVENTS.items():
+                status, times = swe.rise_trans(day_start, body_id, flag, (lon, lat, 0), 0, 0)
+                expected = times[0] if status == 0 and times[0] < day_start + 1 else np.nan
+                got = month[body][event][loc, day]
+                assert np.isnan(got) == np.isnan(expected), (body, event, loc, day)
+                if not np.isnan(got):
+                    # Transits agree to the second; rise/set differ only by the
+                    # refraction convention (standard -0.8333 deg horizon here)
+                    tolerance = 2 if event == "transit" else 90
+                    assert abs(got - expected) * 86400 < tolerance
+
+
+def test_polar_day_has_no_sunrise(month):
+    svalbard = LOCATIONS.index((78.2232, 15.6267))
+
+    assert np.isnan(month["sun"]["rise"][svalbard]).all()
+    assert not np.isnan(month["sun"]["transit"][svalbard]).any()
+
+
+def test_utc_offset_shifts_the_local_day():
+    mean_time = RiseSetEngine().compute([28.6139], [77.2090], date(2024, 6, 21), 1, bodies=("sun",))
+    ist = RiseSetEngine().compute([28.6139], [77.2090], date(2024, 6, 21), 1, bodies=("sun",), utc_offsets=[5.5])
+
+    assert abs(mean_time["sun"]["transit"][0, 0] - ist["sun"]["transit"][0, 0]) < 1e-3
+
+
+def test_single_day_sunrise():
+    events = single_day(28.6139, 77.2090, date(2024, 6, 21))
+
+    assert datetime(2024, 6, 20, 23, 53) <= events["rise"] <= datetime(2024, 6, 20, 23, 55)
+    assert events["rise"] < events["transit"] < events["set"]
+
+
+@pytest.mark.asyncio
+async def test_rise_set_endpoint_streams_one_line_per_location(monkeypatch):
+    monkeypatch.setattr(panchang, "compute_executor", ComputeExecutor(workers=0))
+    request = panchang.RiseSetRequest(
+        locations=[{"latitude": lat, "longitude": lon} for lat, lon in LOCATIONS],
+        start_date=date(2024, 6, 1),
+        days=3,
+        bodies=["sun"],
+    )
+    response = await panchang.calculate_rise_set(request)
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    lines = [json.loads(line) for line in body.splitlines()]
+
+    assert [line["index"] for line in lines] == [0, 1, 2, 3]
+    assert lines[0]["dates"] == ["2024-06-01", "2024-06-02", "2024-06-03"]
+    assert set(lines[0]) == {"index", "dates", "sun"}
+    assert lines[0]["sun"]["rise"][0].startswith("2024-05-31T23:5")
+    assert lines[3]["sun"]["rise"] == [None, None, None]
+
+
+@pytest.mark.asyncio
+async def test_sun_times_uses_engine():
+    response = await panchang.calculate_sun_times(
+        panchang.SunTimesRequest(date=datetime(2024, 6, 21), latitude=28.6139, longitude=77.2090)
+    )
+
+    assert response.sunrise_utc == single_day(28.6139, 77.2090, date(2024, 6, 21))["rise"]
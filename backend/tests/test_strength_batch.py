@@ -0,0 +1,68 @@
+"""Tests for the batched planetary strength engine"""
+import random
+
+import numpy as np
+import pytest
+
+from app.core.calculations.strength import EnhancedPlanetaryStrengthEngine
+from app.core.calculations.strength_batch import PLANETS, BatchStrengthEngine
+
+
+def _random_chart(rng):
+    chart = {}
+    for name in PLANETS:
+        chart[name] = {
+            "name": name,
+            "longitude": rng.uniform(0, 360),
+            "speed": rng.uniform(-1.5, 14),
+            "house": rng.randint(1, 12),
+        }
+    return chart
+
+
+def _assert_close(batch, scalar):
+    assert batch.keys() == scalar.keys()
+    for key, expected in scalar.items():
+        if isinstance(expected, dict):
+            _assert_close(batch[key], expected)
+        else:
+            assert batch[key] == pytest.approx(expected, abs=1e-9), key
+
+
+def test_matches_scalar_engine():
+    rng = random.Random(7)
+    charts = [_random_chart(rng) for _ in range(200)]
+    # Tight conjunctions, exact aspects and sign boundaries
+    edge = _random_chart(rng)
+    for name, longitude in zip(PLANETS, [10.0, 10.5, 70.0, 130.0, 190.0, 30.0, 359.5]):
+        edge[name]["longitude"] = longitude
+    charts.append(edge)
+
+    scalar = EnhancedPlanetaryStrengthEngine()
+    results = BatchStrengthEngine().calculate_charts(charts)
+
+    assert len(results) == len(charts)
+    for chart, result in zip(charts, results):
+        for name, planet in chart.items():
+            expected = scalar.calculate_complete_strengths(planet, {"planets": chart})
+            _assert_close(result[name], expected)
+
+
+def test_calculate_returns_chart_by_planet_arrays():
+    rng = np.random.default_rng(3)
+    longitudes = rng.uniform(0, 360, (50, 7))
+    result = BatchStrengthEngine().calculate(longitudes, np.ones((50, 7)), np.ones((50, 7), dtype=int))
+
+    assert result["total"].shape == (50, 7)
+    assert result["naisargika_bala"][0].tolist() == [100, 85, 70, 60, 75, 65, 50]
+    assert np.all((result["total"] >= 0) & (result["total"] <= 100))
+
+
+def test_rejects_malformed_input():
+    engine = BatchStrengthEngine()
+    with pytest.raises(ValueError):
+        engine.calculate([[0.0] * 6], [[0.0] * 6], [[1] * 6])
+    with pytest.raises(ValueError, match="Saturn"):
+        chart = {name: {"longitude": 0.0} for name in PLANETS[:-1]}
+        engine.calculate_charts([chart])
+    assert engine.calculate_charts([]) == []
@@ -0,0 +1,127 @@
+"""Tests for the two-tier chart cache"""
+import asyncio
+import pytest
+
+from app.core.cache.chart_cache import AsyncRedisCache
+from app.core.cache.tiered_cache import L1Cache, NegativeCacheHit, TieredCache
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.gets = 0
+
+    async def get(self, key):
+        self.gets += 1
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+        return True
+
+    async def delete(self, key):
+        return int(self.store.pop(key, None) is not None)
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def cache(redis):
+    return TieredCache(L1Cache(max_bytes=1024 * 1024), AsyncRedisCache(client=redis))
+
+
+def test_l1_is_bounded_by_bytes():
+    l1 = L1Cache(max_bytes=3000)
+    for i in range(5):
+        l1.set(f"k{i}", b"x" * 900)
+
+    assert l1.size_bytes <= 3000
+    assert l1.get("k0") is None
+    assert l1.get("k4") == b"x" * 900
+    assert l1.set("huge", b"x" * 4000) is False
+
+
+@pytest.mark.asyncio
+async def test_hot_keys_are_served_from_l1(cache, redis):
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        return b"chart"
+
+    for _ in range(5):
+        assert await cache.get_or_compute("k", compute) == b"chart"
+
+    assert calls == 1
+    assert redis.store["k"] == b"chart"
+    assert redis.gets == 1
+    stats = cache.stats()
+    assert stats["l1"]["hits"] == 4
+    assert stats["l1"]["misses"] == 1
+    assert stats["l2"]["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_l2_hit_is_promoted(cache, redis):
+    redis.store["k"] = b"from-redis"
+
+    assert await cache.get("k") == b"from-redis"
+    assert cache.l1.get("k") == b"from-redis"
+    assert cache.stats()["l2"]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_write_through_and_delete(cache, redis):
+    await cache.set("k", b"v")
+    assert cache.l1.get("k") == b"v"
+    assert redis.store["k"] == b"v"
+
+    assert await cache.delete("k")
+    assert await cache.get("k") is None
+
+
+@pytest.mark.asyncio
+async def test_invalid_input_is_negatively_cached(cache, redis):
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        raise ValueError("Unsupported division D5")
+
+    with pytest.raises(ValueError):
+        await cache.get_or_compute("k", compute, negative_errors=(ValueError,))
+    with pytest.raises(NegativeCacheHit, match="D5"):
+        await cache.get_or_compute("k", compute, negative_errors=(ValueError,))
+
+    # Another process sees the negative entry through Redis
+    other = TieredCache(L1Cache(), AsyncRedisCache(client=redis))
+    with pytest.raises(NegativeCacheHit):
+        await other.get("k")
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_other_errors_are_not_cached(cache, redis):
+    async def compute():
+        raise RuntimeError("ephemeris down")
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_compute("k", compute, negative_errors=(ValueError,))
+    assert "k" not in redis.store
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_lookup(cache, redis):
+    async def compute():
+        await asyncio.sleep(0.01)
+        return b"chart"
+
+    results = await asyncio.gather(*(cache.get_or_compute("k", compute) for _ in range(10)))
+
+    assert results == [b"chart"] * 10
+    assert redis.gets == 1
@@ -0,0 +1,149 @@
+"""Tests for the transit timeline search and endpoint"""
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+import swisseph as swe
+from fastapi import HTTPException
+
+from app.api.endpoints import prediction
+from app.core.calculations.muhurta import SIGNS
+from app.core.calculations.panchang import to_julian_day
+from app.core.calculations.transits import BODIES, TransitSearch
+from app.core.parallel.compute_executor import ComputeExecutor
+
+START = datetime(2024, 1, 1)
+END = datetime(2025, 1, 1)
+NATAL = {"sun": 100.0, "moon": 215.3, "ascendant": 7.7}
+
+
+@pytest.fixture(scope="module")
+def year():
+    search = TransitSearch(START, END, NATAL)
+    return search, search.timeline()
+
+
+def _sidereal(body, value):
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+    jd = to_julian_day(datetime.fromisoformat(value))
+    values = swe.calc_ut(jd, BODIES[body].planet, swe.FLG_SWIEPH | swe.FLG_SPEED | swe.FLG_SIDEREAL)[0]
+    return (values[0] + BODIES[body].offset) % 360.0, values[3]
+
+
+def test_events_are_in_time_order(year):
+    _, events = year
+    times = [event["time"] for event in events]
+    assert times == sorted(times)
+    assert {event["type"] for event in events} == {"ingress", "nakshatra", "station", "aspect"}
+
+
+def test_stations_of_2024(year):
+    _, events = year
+    stations = [(e["body"], e["direction"], e["time"][:10]) for e in events if e["type"] == "station"]
+
+    assert ("mercury", "retrograde", "2024-04-01") in stations
+    assert ("mercury", "direct", "2024-04-25") in stations
+    assert ("saturn", "retrograde", "2024-06-29") in stations
+    assert ("jupiter", "retrograde", "2024-10-09") in stations
+    assert ("mars", "retrograde", "2024-12-06") in stations
+    assert sum(body == "mercury" for body, _, _ in stations) == 7
+    assert not any(body in ("sun", "moon", "rahu", "ketu") for body, _, _ in stations)
+
+
+def test_ingresses_and_aspects_are_exact(year):
+    _, events = year
+    for event in events[::7]:
+        longitude, speed = _sidereal(event["body"], event["time"])
+        if event["type"] == "ingress":
+            cusp = 30.0 * SIGNS.index(event["sign"])
+            if event["retrograde"]:
+                cusp += 30.0
+            assert abs((longitude - cusp + 180) % 360 - 180) < 0.01
+        elif event["type"] == "aspect":
+            natal = NATAL[event["natal_point"]]
+            separation = abs((longitude - natal + 180) % 360 - 180)
+            angle = {"Conjunction": 0, "Sextile": 60, "Square": 90, "Trine": 120, "Opposition": 180}
+            assert separation == pytest.approx(angle[event["aspect"]], abs=0.01)
+            assert event["retrograde"] == (speed < 0)
+
+
+@pytest.mark.parametrize("body", ["moon", "mercury", "mars"])
+def test_no_aspect_perfections_are_missed(body):
+    search = TransitSearch(START, END, {"point": 125.0}, bodies=[body], events=["aspect"])
+    found = search.timeline()
+
+    # Brute force: sign changes of the distance to each target on a fine grid
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+    start = to_julian_day(START)
+    longitudes = np.array([
+        swe.calc_ut(jd, BODIES[body].planet, swe.FLG_SIDEREAL)[0][0]
+        for jd in np.arange(start, start + 366, 0.02)
+    ])
+    expected = 0
+    for target in {125, 185, 65, 215, 35, 245, 5, 305}:
+        distance = (longitudes - target + 180) % 360 - 180
+        expected += np.sum((np.sign(distance[:-1]) != np.sign(distance[1:])) & (np.abs(distance[:-1]) < 90))
+    assert len(found) == expected
+
+
+def test_year_for_one_subscriber_is_fast():
+    natal = {name: 36.0 * i + 5 for i, name in enumerate(BODIES)}
+    natal["ascendant"] = 77.0
+    started = time.perf_counter()
+    search = TransitSearch(START, END, natal)
+    events = search.timeline()
+    elapsed = time.perf_counter() - started
+
+    assert len(events) > 1000
+    assert search.evaluations < 15 * len(events)
+    assert elapsed < 5.0
+
+
+def test_filters_and_validation():
+    events = TransitSearch(START, START + timedelta(days=60), bodies=["Sun"], events=["ingress"]).timeline()
+    assert [event["sign"] for event in events] == ["Capricorn", "Aquarius"]
+
+    for kwargs in ({"bodies": ["pluto"]}, {"events": ["eclipse"]}, {"ayanamsa": "unknown"}):
+        with pytest.raises(ValueError):
+            TransitSearch(START, END, **kwargs)
+    with pytest.raises(ValueError):
+        TransitSearch(END, START)
+
+
+def _collect(response):
+    async def read():
+        return b"".join([chunk async for chunk in response.body_iterator])
+    return [json.loads(line) for line in asyncio.run(read()).splitlines()]
+
+
+def test_timeline_endpoint_streams_ndjson(monkeypatch):
+    executor = ComputeExecutor(workers=0)
+    monkeypatch.setattr(prediction, "compute_executor", executor)
+    request = prediction.TransitTimelineRequest(
+        start=START, end=START + timedelta(days=90), natal_points=NATAL, bodies=["mars", "jupiter"]
+    )
+    response = asyncio.run(prediction.transit_timeline(request))
+
+    assert response.media_type == "application/x-ndjson"
+    events = _collect(response)
+    assert events
+    assert {event["body"] for event in events} <= {"mars", "jupiter"}
+    assert [event["time"] for event in events] == sorted(event["time"] for event in events)
+    # The search is admitted and run by the compute executor
+    assert executor.stats()["endpoints"]["prediction.transit_timeline"]["completed"] == 1
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"end": START + timedelta(days=400)},
+    {"end": START - timedelta(days=1)},
+    {"bodies": ["pluto"]},
+])
+def test_timeline_endpoint_rejects_bad_input(kwargs):
+    fields = {"start": START, "end": END}
+    fields.update(kwargs)
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(prediction.transit_timeline(prediction.TransitTimelineRequest(**fields)))
+    assert exc.value.status_code == 400
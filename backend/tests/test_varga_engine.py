@@ -0,0 +1,66 @@
+"""
+Vectorized Varga Engine Test Suite
+PGF Protocol: VCI_002
+Gate: GATE_3
+Version: 1.0.0
+"""
+
+import numpy as np
+import pytest
+from app.core.calculations.divisional_charts import DivisionalChartEngine
+from app.core.calculations.varga_engine import VectorizedVargaEngine, SUPPORTED_DIVISIONS
+from app.core.cache.calculation_cache import CalculationCache
+
+@pytest.fixture
+def engine():
+    return VectorizedVargaEngine()
+
+@pytest.fixture
+def longitudes():
+    rng = np.random.default_rng(42)
+    return rng.uniform(0, 360, size=(50, 9))
+
+def test_supported_divisions_match_scalar_engine():
+    scalar = DivisionalChartEngine(cache=CalculationCache())
+    assert list(SUPPORTED_DIVISIONS) == scalar.supported_divisions
+
+def test_matches_scalar_engine(engine, longitudes):
+    scalar = DivisionalChartEngine(cache=CalculationCache())
+    results = engine.calculate(longitudes)
+
+    assert sorted(results) == list(SUPPORTED_DIVISIONS)
+    for division, arrays in results.items():
+        assert arrays.longitudes.shape == longitudes.shape
+        for row, chart in zip(longitudes, arrays.longitudes):
+            planets = {str(i): float(lon) for i, lon in enumerate(row)}
+            expected = scalar.division_map[division](planets)
+            np.testing.assert_allclose(
+                chart, [expected[str(i)] for i in range(len(row))], atol=1e-9
+            )
+
+def test_integer_signs_and_degrees(engine):
+    arrays = engine.calculate_division(np.array([[15.5, 359.9, 45.0]]), 9)
+    assert arrays.signs.dtype == np.int16
+    assert arrays.degrees.dtype == np.int16
+    assert arrays.longitudes.tolist() == [[160.0, 320.0, 160.0]]
+    assert arrays.signs.tolist() == [[5, 10, 5]]
+    assert arrays.degrees.tolist() == [[10, 20, 10]]
+
+def test_house_cusps(engine):
+    cusps = engine.house_cusps(np.array([200.0, 15.0]), 9)
+    assert cusps.shape == (2, 12)
+    assert cusps[0, 0] == 240.0
+    assert cusps[0, 1] == 270.0
+    assert cusps[1, 0] == 150.0
+
+def test_stack_positions(engine):
+    names, array = engine.stack_positions(
+        [{"Sun": 10.0, "Moon": 20.0}, {"Sun": 30.0, "Moon": 40.0}]
+    )
+    assert names == ["Sun", "Moon"]
+    assert array.shape == (2, 2)
+    assert engine.calculate(array, [1])[1].longitudes.tolist() == [[10.0, 20.0], [30.0, 40.0]]
+
+def test_invalid_division(engine, longitudes):
+    with pytest.raises(ValueError):
+        engine.calculate(longitudes, [9, 11])